@@ -5,6 +5,8 @@ from __future__ import annotations
 from typing import Any, Dict, List, Optional
 
 from ..core.adapters import ORMAdapter
+from ..core.errors import BadRequestError
+from ..utils.pagination import KeysetPlan, plan_keyset
 
 
 class BaseORMAdapter(ORMAdapter):
@@ -23,16 +25,46 @@ class BaseORMAdapter(ORMAdapter):
         self.model = model
         self.session_factory = session_factory
 
+    def _nulls_last(self) -> bool:
+        """Whether the database sorts NULL after every value in ascending order"""
+        return False
+
+    def _keyset_plan(
+        self, sorts: Dict[str, Any], pagination: Dict[str, Any]
+    ) -> Optional[KeysetPlan]:
+        """Resolve cursor pagination for get_all
+
+        Args:
+            sorts: Sort conditions
+            pagination: Pagination info
+
+        Returns:
+            KeysetPlan in cursor mode, None for offset pagination
+
+        Raises:
+            BadRequestError: If the cursor is invalid
+        """
+        try:
+            return plan_keyset(
+                sorts, pagination, getattr(self, "pk_field", "id"), self._nulls_last()
+            )
+        except ValueError as e:
+            raise BadRequestError(str(e))
+
     async def get_all(
         self,
         filters: Dict[str, Any],
         sorts: Dict[str, Any],
         pagination: Dict[str, Any],
+        fields: Optional[List[str]] = None,
+        include: Optional[List[str]] = None,
     ) -> List[Any]:
         """Get all items - to be implemented by subclasses"""
         raise NotImplementedError("Subclasses must implement get_all()")
 
-    async def get_one(self, id: Any) -> Optional[Any]:
+    async def get_one(
+        self, id: Any, fields: Optional[List[str]] = None, include: Optional[List[str]] = None
+    ) -> Optional[Any]:
         """Get single item - to be implemented by subclasses"""
         raise NotImplementedError("Subclasses must implement get_one()")
 
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
 
-from ..core.errors import AppError, ConflictError, ErrorCode
+from ..core.errors import AppError, BadRequestError, ConflictError, ErrorCode
+from ..utils.pagination import KeysetPlan
 from .base import BaseORMAdapter
 
 try:
@@ -14,9 +15,11 @@ except ImportError:
     AsyncIOMotorCollection = Any  # type: ignore
 
 try:
-    from pymongo.errors import DuplicateKeyError
+    from pymongo import InsertOne, UpdateOne
+    from pymongo.errors import BulkWriteError, DuplicateKeyError
 except ImportError:
-    DuplicateKeyError = Exception  # type: ignore
+    InsertOne = UpdateOne = None  # type: ignore
+    BulkWriteError = DuplicateKeyError = Exception  # type: ignore
 
 
 class MongoAdapter(BaseORMAdapter):
@@ -33,6 +36,7 @@ class MongoAdapter(BaseORMAdapter):
         collection: Union[str, AsyncIOMotorCollection],
         database: Optional[AsyncIOMotorDatabase] = None,
         pk_field: str = "_id",
+        relations: Optional[Dict[str, Dict[str, Any]]] = None,
     ):
         """Initialize MongoDB adapter
 
@@ -40,6 +44,10 @@ class MongoAdapter(BaseORMAdapter):
             collection: Collection name (str) or Motor collection object
             database: Motor database object (required if collection is str)
             pk_field: Primary key field name (default: "_id")
+            relations: Relationships that can be eager-loaded with ``$lookup``,
+                keyed by name. Each value holds the ``$lookup`` keys ``from``,
+                ``localField`` and ``foreignField``, plus ``many=True`` to keep
+                the joined documents as a list instead of a single document.
         """
         if isinstance(collection, str):
             if database is None:
@@ -53,6 +61,7 @@ class MongoAdapter(BaseORMAdapter):
         # BaseORMAdapter stores them as self.model and self.session_factory.
         super().__init__(model=None, session_factory=None)
         self.pk_field = pk_field
+        self.relations = relations or {}
 
     def _apply_filters(self, filters: Dict[str, Any]) -> Dict[str, Any]:
         """Convert generic filters to MongoDB query
@@ -98,17 +107,148 @@ class MongoAdapter(BaseORMAdapter):
 
         return query
 
+    def _apply_keyset(self, query: Dict[str, Any], plan: KeysetPlan) -> Dict[str, Any]:
+        """Combine a MongoDB query with the keyset seek predicate
+
+        Args:
+            query: MongoDB query dictionary
+            plan: Keyset plan from ``_keyset_plan``
+
+        Returns:
+            MongoDB query restricted to documents past the cursor
+        """
+        if not plan.terms:
+            return query
+
+        def condition(operator: str, value: Any) -> Any:
+            if operator == "exact":
+                return value
+            if operator == "isnull":
+                # None also matches documents missing the field, which sort with null
+                return None if value else {"$ne": None}
+            return {f"${operator}": value}
+
+        seek = {
+            "$or": [
+                {name: condition(operator, value) for name, operator, value in term}
+                for term in plan.terms
+            ]
+        }
+        return {"$and": [query, seek]} if query else seek
+
+    def _find_options(self, fields: Optional[List[str]]) -> Dict[str, Any]:
+        """Build ``find``/``find_one`` options for a sparse fieldset
+
+        The projection excludes ``_id`` unless it is requested explicitly.
+        """
+        if not fields:
+            return {}
+
+        projection = {field_name: 1 for field_name in fields}
+        if "_id" not in projection:
+            projection["_id"] = 0
+        return {"projection": projection}
+
+    def _lookup_stages(self, include: Optional[List[str]]) -> List[Dict[str, Any]]:
+        """Build ``$lookup`` stages for the requested relations
+
+        Raises:
+            BadRequestError: If a relation was not configured
+        """
+        stages = []
+        for name in include or ():
+            relation = self.relations.get(name)
+            if relation is None:
+                raise BadRequestError(f"Unknown relationship: {name}")
+
+            stages.append(
+                {
+                    "$lookup": {
+                        "from": relation["from"],
+                        "localField": relation["localField"],
+                        "foreignField": relation["foreignField"],
+                        "as": name,
+                    }
+                }
+            )
+            if not relation.get("many", False):
+                stages.append({"$unwind": {"path": f"${name}", "preserveNullAndEmptyArrays": True}})
+        return stages
+
+    async def _aggregate(
+        self,
+        match: Dict[str, Any],
+        sort: List[Any],
+        skip: int,
+        limit: int,
+        lookups: List[Dict[str, Any]],
+        fields: Optional[List[str]],
+    ) -> List[Any]:
+        """Run a page query as an aggregation so related documents are joined
+
+        Lookups run after ``$skip``/``$limit`` so only the page is joined.
+        """
+        pipeline: List[Dict[str, Any]] = [{"$match": match}]
+        if sort:
+            pipeline.append({"$sort": dict(sort)})
+        if skip:
+            pipeline.append({"$skip": skip})
+        pipeline.append({"$limit": limit})
+        pipeline.extend(lookups)
+        if fields:
+            pipeline.append({"$project": self._find_options(fields)["projection"]})
+
+        cursor = self.collection.aggregate(pipeline)
+        return await cursor.to_list(length=limit)
+
     async def get_all(
         self,
         filters: Dict[str, Any],
         sorts: Dict[str, Any],
         pagination: Dict[str, Any],
+        fields: Optional[List[str]] = None,
+        include: Optional[List[str]] = None,
     ) -> List[Any]:
-        """Get all items with filtering, sorting, and pagination"""
+        """Get all items with filtering, sorting, and pagination
+
+        Relations named in ``include`` are joined with ``$lookup``.
+        """
+        plan = self._keyset_plan(sorts, pagination)
+        options = self._find_options(fields)
+        lookups = self._lookup_stages(include)
+
         try:
             query = self._apply_filters(filters)
 
-            cursor = self.collection.find(query)
+            # Keyset pagination seeks past the cursor instead of using skip()
+            if plan is not None:
+                limit = pagination.get("limit", 10)
+                if lookups:
+                    sort = [(name, -1 if d == "desc" else 1) for name, d in plan.ordering]
+                    items = await self._aggregate(
+                        self._apply_keyset(query, plan), sort, 0, limit, lookups, fields
+                    )
+                    return list(reversed(items)) if plan.reverse else items
+                cursor = self.collection.find(self._apply_keyset(query, plan), **options)
+                cursor.sort(
+                    [(name, -1 if direction == "desc" else 1) for name, direction in plan.ordering]
+                )
+                cursor.limit(limit)
+                items = await cursor.to_list(length=limit)
+                return list(reversed(items)) if plan.reverse else items
+
+            if lookups:
+                sort = [(name, 1 if d == "asc" else -1) for name, d in sorts.items()]
+                return await self._aggregate(
+                    query,
+                    sort,
+                    pagination.get("skip", 0),
+                    pagination.get("limit", 10),
+                    lookups,
+                    fields,
+                )
+
+            cursor = self.collection.find(query, **options)
 
             # Apply sorting
             if sorts:
@@ -140,12 +280,54 @@ class MongoAdapter(BaseORMAdapter):
                 code=ErrorCode.INTERNAL_ERROR, status_code=500, message=f"Database error: {e!s}"
             )
 
-    async def get_one(self, id: Any) -> Optional[Any]:
+    async def stream(
+        self,
+        filters: Dict[str, Any],
+        sorts: Dict[str, Any],
+        batch_size: int = 1000,
+    ) -> AsyncIterator[Any]:
+        """Iterate over matching documents with a Motor cursor
+
+        The cursor fetches ``batch_size`` documents per round-trip, so the
+        whole collection is never held in memory.
+        """
+        try:
+            cursor = self.collection.find(self._apply_filters(filters))
+            if sorts:
+                cursor.sort(
+                    [
+                        (field_name, 1 if direction == "asc" else -1)
+                        for field_name, direction in sorts.items()
+                    ]
+                )
+            cursor.batch_size(batch_size)
+
+            async for document in cursor:
+                yield document
+        except (ValueError, TypeError) as e:
+            raise AppError(
+                code=ErrorCode.INTERNAL_ERROR,
+                status_code=500,
+                message=f"Database error (validation): {e!s}",
+            )
+        except Exception as e:
+            raise AppError(
+                code=ErrorCode.INTERNAL_ERROR, status_code=500, message=f"Database error: {e!s}"
+            )
+
+    async def get_one(
+        self, id: Any, fields: Optional[List[str]] = None, include: Optional[List[str]] = None
+    ) -> Optional[Any]:
         """Get single item by id"""
+        lookups = self._lookup_stages(include)
+
         try:
             # Note: User is responsible for converting id to ObjectId if needed
             # or we could try to auto-detect. For now, pass as is.
-            return await self.collection.find_one({self.pk_field: id})
+            if lookups:
+                items = await self._aggregate({self.pk_field: id}, [], 0, 1, lookups, fields)
+                return items[0] if items else None
+            return await self.collection.find_one({self.pk_field: id}, **self._find_options(fields))
         except Exception as e:
             raise AppError(
                 code=ErrorCode.INTERNAL_ERROR, status_code=500, message=f"Database error: {e!s}"
@@ -221,6 +403,74 @@ class MongoAdapter(BaseORMAdapter):
                 code=ErrorCode.INTERNAL_ERROR, status_code=500, message=f"Database error: {e!s}"
             )
 
+    async def bulk_create(self, items: List[Dict[str, Any]]) -> List[Any]:
+        """Create many documents with a single ordered ``bulk_write``"""
+        if not items:
+            return []
+
+        try:
+            # InsertOne sets "_id" on each document, so no read-back is needed
+            await self.collection.bulk_write([InsertOne(item) for item in items], ordered=True)
+            return items
+        except BulkWriteError as e:
+            if any(error.get("code") == 11000 for error in e.details.get("writeErrors", [])):
+                raise ConflictError(f"Item already exists: {e!s}")
+            raise AppError(
+                code=ErrorCode.INTERNAL_ERROR, status_code=500, message=f"Database error: {e!s}"
+            )
+        except Exception as e:
+            raise AppError(
+                code=ErrorCode.INTERNAL_ERROR, status_code=500, message=f"Database error: {e!s}"
+            )
+
+    async def bulk_update(self, updates: List[Dict[str, Any]]) -> List[Any]:
+        """Update many documents with a single unordered ``bulk_write``"""
+        if not updates:
+            return []
+
+        ids = []
+        operations = []
+        for data in updates:
+            if self.pk_field not in data:
+                raise BadRequestError(f"Missing {self.pk_field} in bulk update item")
+            ids.append(data[self.pk_field])
+            values = {key: value for key, value in data.items() if key != self.pk_field}
+            if values:
+                operations.append(UpdateOne({self.pk_field: data[self.pk_field]}, {"$set": values}))
+
+        try:
+            if operations:
+                await self.collection.bulk_write(operations, ordered=False)
+
+            documents = await self.collection.find({self.pk_field: {"$in": ids}}).to_list(
+                length=None
+            )
+            found = {document[self.pk_field]: document for document in documents}
+            return [found[id] for id in dict.fromkeys(ids) if id in found]
+        except BulkWriteError as e:
+            if any(error.get("code") == 11000 for error in e.details.get("writeErrors", [])):
+                raise ConflictError(f"Update conflict: {e!s}")
+            raise AppError(
+                code=ErrorCode.INTERNAL_ERROR, status_code=500, message=f"Database error: {e!s}"
+            )
+        except Exception as e:
+            raise AppError(
+                code=ErrorCode.INTERNAL_ERROR, status_code=500, message=f"Database error: {e!s}"
+            )
+
+    async def bulk_delete(self, ids: List[Any]) -> int:
+        """Delete many documents with one ``delete_many`` on ``$in``"""
+        if not ids:
+            return 0
+
+        try:
+            result = await self.collection.delete_many({self.pk_field: {"$in": list(ids)}})
+            return result.deleted_count
+        except Exception as e:
+            raise AppError(
+                code=ErrorCode.INTERNAL_ERROR, status_code=500, message=f"Database error: {e!s}"
+            )
+
     async def count(self, filters: Dict[str, Any]) -> int:
         """Count items"""
         try:
@@ -3,23 +3,302 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Callable, Dict, List, Optional, Type
+import sqlite3
+import uuid
+from dataclasses import dataclass
+from datetime import date, datetime, time
+from decimal import Decimal
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Callable, Dict, List, Mapping, Optional, Tuple, Type
 
-from sqlalchemy import delete, func, select
-from sqlalchemy.exc import IntegrityError, SQLAlchemyError
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy import and_, bindparam, delete, func, insert, or_, select, text, update
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.exc import IntegrityError, NoInspectionAvailable, SQLAlchemyError
+from sqlalchemy.orm import MANYTOONE, DeclarativeBase, joinedload, selectinload
+from sqlalchemy.pool import SingletonThreadPool, StaticPool
 
-from ..core.errors import AppError, ConflictError, ErrorCode
-from ..security.validation.input_validator import SecurityValidator
+from ..core.errors import AppError, BadRequestError, ConflictError, ErrorCode
+from ..core.unit_of_work import (
+    commit_or_flush,
+    is_request_session,
+    rollback_if_owned,
+    savepoint,
+    session_scope,
+)
+from ..security.validation.input_validator import InputValidationError, SecurityValidator
+from ..utils.pagination import KeysetPlan
 from .base import BaseORMAdapter
 
 logger = logging.getLogger(__name__)
 
+# Keeps "pk IN (...)" lists below SQLite's default bound-parameter limit
+BULK_CHUNK_SIZE = 500
+
+# Dialects that sort NULL after every value in ascending order
+NULLS_LAST_DIALECTS = frozenset({"postgresql", "oracle"})
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _to_bool(value: Any) -> bool:
+    if isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered in ("true", "1", "yes", "on"):
+            return True
+        if lowered in ("false", "0", "no", "off"):
+            return False
+        raise ValueError(f"Invalid boolean: {value}")
+    return bool(value)
+
+
+def _from_iso(python_type: Type) -> Callable[[Any], Any]:
+    def coerce(value: Any) -> Any:
+        return python_type.fromisoformat(value) if isinstance(value, str) else value
+
+    return coerce
+
+
+def _to_type(python_type: Type) -> Callable[[Any], Any]:
+    def coerce(value: Any) -> Any:
+        return value if type(value) is python_type else python_type(value)
+
+    return coerce
+
+
+# Column Python type -> request value coercer
+_COERCERS: Mapping[Any, Callable[[Any], Any]] = MappingProxyType(
+    {
+        int: _to_type(int),
+        float: _to_type(float),
+        Decimal: lambda v: v if isinstance(v, Decimal) else Decimal(str(v)),
+        str: _to_type(str),
+        bool: _to_bool,
+        datetime: _from_iso(datetime),
+        date: _from_iso(date),
+        time: _from_iso(time),
+        uuid.UUID: lambda v: v if isinstance(v, uuid.UUID) else uuid.UUID(str(v)),
+    }
+)
+
+# Filter operator -> SQL expression builder
+_FILTER_OPERATORS: Mapping[str, Callable[[Any, Any], Any]] = MappingProxyType(
+    {
+        "exact": lambda f, v: f == v,
+        "ne": lambda f, v: f != v,
+        "gt": lambda f, v: f > v,
+        "gte": lambda f, v: f >= v,
+        "lt": lambda f, v: f < v,
+        "lte": lambda f, v: f <= v,
+        "in": lambda f, v: f.in_(v),
+        "like": lambda f, v: f.like(f"%{v}%"),  # Automatically add wildcards for safety
+        "ilike": lambda f, v: f.ilike(f"%{v}%"),  # Automatically add wildcards for safety
+    }
+)
+
+
+def _chunks(values: List[Any], size: int = BULK_CHUNK_SIZE):
+    for start in range(0, len(values), size):
+        yield values[start : start + size]
+
+
+def supports_returning(bind: Any, statement: str) -> bool:
+    """Whether single-statement ``UPDATE``/``DELETE ... RETURNING`` can be used
+
+    Args:
+        bind: Engine or connection the session is bound to
+        statement: ``"update"`` or ``"delete"``
+
+    Returns:
+        True if the dialect supports RETURNING for the statement. SQLite
+        engines sharing one connection between sessions (in-memory databases)
+        are excluded: a RETURNING statement stays open until its rows are
+        fetched and would block a concurrent session's COMMIT.
+    """
+    dialect = bind.dialect
+    if not getattr(dialect, f"{statement}_returning", False):
+        return False
+    pool = getattr(bind, "pool", None)
+    return not (dialect.name == "sqlite" and isinstance(pool, (StaticPool, SingletonThreadPool)))
+
+
+def _result_items(result: Any, as_mappings: bool) -> List[Any]:
+    if as_mappings:
+        return [dict(row) for row in result.mappings()]
+    return list(result.scalars().all())
+
+
+def _has_filters(filters: Dict[str, Any]) -> bool:
+    return any(isinstance(value, dict) for value in filters.values())
+
+
+def supports_window_functions(dialect: Any) -> bool:
+    """Check whether a dialect can compute ``COUNT(*) OVER ()``
+
+    Args:
+        dialect: SQLAlchemy dialect
+
+    Returns:
+        True if window functions are available
+    """
+    version = getattr(dialect, "server_version_info", None) or ()
+
+    if dialect.name == "sqlite":
+        return sqlite3.sqlite_version_info >= (3, 25)
+    if dialect.name in ("mysql", "mariadb"):
+        if getattr(dialect, "is_mariadb", False):
+            return version >= (10, 2)
+        return version >= (8,)
+    return dialect.name in ("postgresql", "oracle", "mssql")
+
+
+async def fetch_page_with_total(
+    session: Any, query: Any, skip: int, limit: int, as_mappings: bool = False
+) -> Tuple[List[Any], int]:
+    """Fetch a page of a ``select(Model)`` query with the unpaginated total
+
+    Uses a single ``COUNT(*) OVER ()`` statement when the dialect supports it.
+    A separate count query is only issued on other dialects or when the page
+    is past the end (no row is left to carry the total).
+
+    Args:
+        session: Async session
+        query: Filtered and sorted ``select(Model)`` query without offset/limit
+        skip: Number of rows to skip
+        limit: Page size
+        as_mappings: The query selects labelled columns; return each row as a
+            dict instead of the first entity
+
+    Returns:
+        Tuple of (items, total)
+    """
+    items = None
+
+    if supports_window_functions(session.get_bind().dialect):
+        windowed = query.add_columns(func.count().over().label("total_count"))
+        rows = (await session.execute(windowed.offset(skip).limit(limit))).all()
+        if rows:
+            total = rows[0][-1]
+            if as_mappings:
+                return [dict(zip(row._fields[:-1], row[:-1])) for row in rows], total
+            return [row[0] for row in rows], total
+        if skip == 0:
+            return [], 0
+        items = []
+
+    if items is None:
+        result = await session.execute(query.offset(skip).limit(limit))
+        items = _result_items(result, as_mappings)
+
+    total = await session.scalar(select(func.count()).select_from(query.order_by(None).subquery()))
+    return items, total
+
+
+async def estimate_row_count(session: Any, table: Any) -> Optional[int]:
+    """Read the planner's row estimate for a table
+
+    Supported on PostgreSQL (``pg_class.reltuples``), MySQL/MariaDB
+    (``information_schema.TABLES``) and SQLite (``sqlite_stat1`` after
+    ``ANALYZE``).
+
+    Args:
+        session: Async session
+        table: SQLAlchemy Table
+
+    Returns:
+        Estimated row count, or None if no statistics are available
+    """
+    dialect = session.get_bind().dialect.name
+
+    try:
+        if dialect == "postgresql":
+            value = await session.scalar(
+                text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:name)"),
+                {"name": table.fullname},
+            )
+        elif dialect in ("mysql", "mariadb"):
+            value = await session.scalar(
+                text(
+                    "SELECT TABLE_ROWS FROM information_schema.TABLES "
+                    "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :name"
+                ),
+                {"name": table.name},
+            )
+        elif dialect == "sqlite":
+            stat = await session.scalar(
+                text("SELECT stat FROM sqlite_stat1 WHERE tbl = :name LIMIT 1"),
+                {"name": table.name},
+            )
+            value = int(stat.split()[0]) if stat else None
+        else:
+            return None
+    except SQLAlchemyError as e:
+        logger.debug(f"No planner statistics for {table.name}: {e!s}")
+        return None
+
+    # PostgreSQL reports -1 for tables that were never analyzed
+    if value is None or value < 0:
+        return None
+    return int(value)
+
+
+@dataclass(frozen=True)
+class CompiledFilterField:
+    """Filterable column resolved once per adapter
+
+    Attributes:
+        attribute: ORM attribute used to build expressions
+        coerce: Converts request values to the column's Python type
+        scan: Whether values still need the SQL injection scan (text columns
+            and columns whose type could not be resolved)
+    """
+
+    attribute: Any
+    coerce: Callable[[Any], Any]
+    scan: bool
+
+    def prepare(self, operator: str, value: Any) -> Any:
+        """Convert a raw filter value for an operator
+
+        Args:
+            operator: Filter operator
+            value: Raw filter value
+
+        Returns:
+            Value ready to bind
+
+        Raises:
+            ValueError: If the value cannot be coerced
+            InputValidationError: If the value is suspicious
+        """
+        if operator in ("like", "ilike"):
+            value = str(value)
+            if self.scan:
+                SecurityValidator.validate_sql_value(value)
+            # Escape special SQL wildcard characters to prevent pattern injection
+            return value.replace("%", "\\%").replace("_", "\\_")
+
+        if operator == "in":
+            values = value.split(",") if isinstance(value, str) else value
+            values = [self.coerce(item) for item in values]
+            if self.scan:
+                SecurityValidator.validate_sql_value(values)
+            return values
+
+        value = self.coerce(value)
+        if self.scan:
+            SecurityValidator.validate_sql_value(value)
+        return value
+
 
 class SQLAlchemyAdapter(BaseORMAdapter):
     """SQLAlchemy async ORM adapter
 
-    Supports SQLAlchemy 2.0+ with async/await.
+    Supports SQLAlchemy 2.0+ with async/await. Inside a
+    :class:`~fastapi_easy.core.unit_of_work.UnitOfWork` opened with the same
+    session factory, calls share the request's session and flush instead of
+    committing.
     """
 
     # Supported filter operators
@@ -40,9 +319,48 @@ class SQLAlchemyAdapter(BaseORMAdapter):
         """
         super().__init__(model, session_factory)
         self.pk_field = pk_field
+        self._filter_plan = self._compile_filter_plan()
+        self._column_keys = frozenset(self._filter_plan)
+        # Relationships may be configured after the adapter, so loaders are built lazily
+        self._loader_cache: Dict[Tuple[str, ...], List[Any]] = {}
+
+    def _compile_filter_plan(self) -> Mapping[str, CompiledFilterField]:
+        """Resolve filterable columns once per adapter
+
+        Every mapped column is stored with its ORM attribute and a coercer to
+        the column's Python type, so request-time filtering is reduced to dict
+        lookups. Only names in this table can be filtered on, which replaces
+        per-request field name validation.
+
+        Returns:
+            Read-only mapping of attribute name -> CompiledFilterField
+        """
+        try:
+            mapper = sa_inspect(self.model)
+        except NoInspectionAvailable:
+            logger.warning(f"{self.model!r} is not a mapped class; filtering is disabled")
+            return MappingProxyType({})
+
+        plan = {}
+        for prop in mapper.column_attrs:
+            column = prop.columns[0]
+            try:
+                python_type = column.type.python_type
+            except NotImplementedError:
+                python_type = None
+
+            coerce = _COERCERS.get(python_type)
+            plan[prop.key] = CompiledFilterField(
+                attribute=getattr(self.model, prop.key),
+                coerce=coerce or _identity,
+                # Coerced numbers, dates and booleans cannot carry SQL text
+                scan=coerce is None or python_type is str,
+            )
+
+        return MappingProxyType(plan)
 
     def _apply_filters(self, query, filters: Dict[str, Any]):
-        """Apply filter conditions to query with security validation (DRY principle)
+        """Apply filter conditions to query using the precompiled filter plan
 
         Args:
             query: SQLAlchemy query object
@@ -63,15 +381,14 @@ class SQLAlchemyAdapter(BaseORMAdapter):
             if not field_name or not isinstance(field_name, str):
                 raise ValueError(f"Invalid field name: {field_name}")
 
-            # Security: Validate field name to prevent injection
-            try:
-                field_name = SecurityValidator.validate_field_name(field_name)
-            except Exception:
-                logger.warning(f"Invalid field name in filter: {field_name}")
-                raise ValueError(f"Invalid field name: {field_name}")
+            # Security: only columns resolved at construction can be filtered on
+            compiled = self._filter_plan.get(field_name)
+            if compiled is None:
+                raise ValueError(f"Field not found on model: {field_name}")
 
             operator = filter_value.get("operator", "exact")
-            if operator not in self.SUPPORTED_OPERATORS:
+            handler = _FILTER_OPERATORS.get(operator)
+            if handler is None:
                 raise ValueError(
                     f"Unsupported operator: {operator}. Supported: {self.SUPPORTED_OPERATORS}"
                 )
@@ -80,76 +397,207 @@ class SQLAlchemyAdapter(BaseORMAdapter):
             if value is None:
                 raise ValueError(f"Filter value cannot be None for field: {field_name}")
 
-            # Security: Validate filter value
             try:
-                value = SecurityValidator.validate_sql_value(value)
-            except Exception as e:
-                logger.warning(
-                    f"Suspicious filter value detected for field {field_name}: {str(e)[:100]}"
-                )
+                value = compiled.prepare(operator, value)
+            except (ValueError, TypeError, ArithmeticError, InputValidationError) as e:
+                logger.warning(f"Invalid filter value for field {field_name}: {str(e)[:100]}")
                 raise ValueError(f"Invalid filter value for field: {field_name}")
 
-            # Get model field (safe as field_name is validated)
+            query = query.where(handler(compiled.attribute, value))
+
+        return query
+
+    def _nulls_last(self) -> bool:
+        """Whether the database sorts NULL last, read from the factory's bind"""
+        bind = getattr(self.session_factory, "kw", {}).get("bind")
+        dialect = getattr(bind, "dialect", None)
+        return getattr(dialect, "name", None) in NULLS_LAST_DIALECTS
+
+    def _apply_keyset(self, query, plan: KeysetPlan):
+        """Apply keyset ordering and seek predicate to query
+
+        Args:
+            query: SQLAlchemy query object
+            plan: Keyset plan from ``_keyset_plan``
+
+        Returns:
+            Query ordered by the keyset and restricted to rows past the cursor
+
+        Raises:
+            BadRequestError: If a keyset field does not exist on the model
+        """
+        for name, _ in plan.ordering:
+            if not hasattr(self.model, name):
+                raise BadRequestError(f"Cannot paginate by unknown field: {name}")
+
+        operator_map = {
+            "exact": lambda f, v: f == v,
+            "gt": lambda f, v: f > v,
+            "lt": lambda f, v: f < v,
+            "isnull": lambda f, v: f.is_(None) if v else f.is_not(None),
+        }
+
+        if plan.terms:
+            query = query.where(
+                or_(
+                    *[
+                        and_(
+                            *[
+                                operator_map[operator](getattr(self.model, name), value)
+                                for name, operator, value in term
+                            ]
+                        )
+                        for term in plan.terms
+                    ]
+                )
+            )
+
+        for name, direction in plan.ordering:
+            field = getattr(self.model, name)
+            query = query.order_by(field.desc() if direction == "desc" else field.asc())
+
+        return query
+
+    def _apply_sorts(self, query, sorts: Dict[str, Any]):
+        """Apply sort conditions to query, skipping unknown fields
+
+        Args:
+            query: SQLAlchemy query object
+            sorts: Sort conditions
+
+        Returns:
+            Query with ordering applied
+        """
+        for field_name, direction in sorts.items():
             field = getattr(self.model, field_name, None)
             if field is None:
-                raise ValueError(f"Field not found on model: {field_name}")
+                continue
 
-            # Apply filter using operator mapping with additional safety
-            operator_map = {
-                "exact": lambda f, v: f == v,
-                "ne": lambda f, v: f != v,
-                "gt": lambda f, v: f > v,
-                "gte": lambda f, v: f >= v,
-                "lt": lambda f, v: f < v,
-                "lte": lambda f, v: f <= v,
-                "in": lambda f, v: f.in_(v.split(",") if isinstance(v, str) else v),
-                "like": lambda f, v: f.like(f"%{v}%"),  # Automatically add wildcards for safety
-                "ilike": lambda f, v: f.ilike(f"%{v}%"),  # Automatically add wildcards for safety
-            }
-
-            if operator in operator_map:
-                # Additional validation for LIKE operators to prevent pattern injection
-                if operator in ["like", "ilike"] and isinstance(value, str):
-                    # Escape special SQL wildcard characters
-                    value = value.replace("%", "\\%").replace("_", "\\_")
-
-                query = query.where(operator_map[operator](field, value))
+            if direction == "desc":
+                query = query.order_by(field.desc())
+            else:
+                query = query.order_by(field.asc())
 
         return query
 
+    def _select(self, fields: Optional[List[str]] = None):
+        """Build ``select(Model)``, or a column-only select for a sparse fieldset
+
+        Args:
+            fields: Column attribute names to read, or None for whole objects
+
+        Returns:
+            SQLAlchemy select statement
+
+        Raises:
+            BadRequestError: If a field is not a column of the model
+        """
+        if not fields:
+            return select(self.model)
+
+        for field_name in fields:
+            if field_name not in self._column_keys:
+                raise BadRequestError(f"Unknown field: {field_name}")
+
+        return select(*[getattr(self.model, name).label(name) for name in fields])
+
+    def _loader_options(self, include: Optional[List[str]]) -> List[Any]:
+        """Build eager-loading options for relationship paths
+
+        Many-to-one relationships are joined into the main query; collections
+        are loaded with one extra ``SELECT ... IN`` each, which keeps LIMIT
+        correct. Dotted paths such as ``"author.company"`` load nested
+        relationships.
+
+        Args:
+            include: Relationship paths to load
+
+        Returns:
+            Loader options for ``select().options()``
+
+        Raises:
+            BadRequestError: If a path does not name a relationship
+        """
+        key = tuple(include or ())
+        options = self._loader_cache.get(key)
+        if options is not None:
+            return options
+
+        options = []
+        for path in key:
+            mapper = sa_inspect(self.model)
+            loader = None
+            for name in path.split("."):
+                relationship = mapper.relationships.get(name)
+                if relationship is None:
+                    raise BadRequestError(f"Unknown relationship: {path}")
+
+                attribute = relationship.class_attribute
+                if loader is None:
+                    loader = (selectinload if relationship.uselist else joinedload)(attribute)
+                elif relationship.uselist:
+                    loader = loader.selectinload(attribute)
+                else:
+                    loader = loader.joinedload(attribute)
+                mapper = relationship.mapper
+            options.append(loader)
+
+        self._loader_cache[key] = options
+        return options
+
+    def _entity_select(
+        self, fields: Optional[List[str]] = None, include: Optional[List[str]] = None
+    ):
+        """Build the base select, eager-loading ``include`` for whole objects
+
+        Relationships cannot be loaded into a column-only select, so
+        ``include`` is ignored for sparse fieldsets.
+        """
+        query = self._select(fields)
+        if include and not fields:
+            query = query.options(*self._loader_options(include))
+        return query
+
     async def get_all(
         self,
         filters: Dict[str, Any],
         sorts: Dict[str, Any],
         pagination: Dict[str, Any],
+        fields: Optional[List[str]] = None,
+        include: Optional[List[str]] = None,
     ) -> List[Any]:
         """Get all items with filtering, sorting, and pagination
 
         Args:
             filters: Filter conditions
             sorts: Sort conditions
-            pagination: Pagination info (skip, limit)
+            pagination: Pagination info (skip, limit, or after/before cursors)
+            fields: Sparse fieldset; only these columns are selected and rows
+                are returned as dicts
+            include: Relationship paths to eager-load
 
         Returns:
             List of items
         """
+        plan = self._keyset_plan(sorts, pagination)
+        base_query = self._entity_select(fields, include)
+
         try:
-            async with self.session_factory() as session:
-                query = select(self.model)
+            async with session_scope(self.session_factory) as session:
+                query = base_query
 
                 # Apply filters (using extracted method)
                 query = self._apply_filters(query, filters)
 
-                # Apply sorting
-                for field_name, direction in sorts.items():
-                    field = getattr(self.model, field_name, None)
-                    if field is None:
-                        continue
+                # Keyset pagination seeks past the cursor instead of using OFFSET
+                if plan is not None:
+                    query = self._apply_keyset(query, plan).limit(pagination.get("limit", 10))
+                    result = await session.execute(query)
+                    items = _result_items(result, bool(fields))
+                    return list(reversed(items)) if plan.reverse else items
 
-                    if direction == "desc":
-                        query = query.order_by(field.desc())
-                    else:
-                        query = query.order_by(field.asc())
+                # Apply sorting
+                query = self._apply_sorts(query, sorts)
 
                 # Apply pagination
                 skip = pagination.get("skip", 0)
@@ -157,6 +605,8 @@ class SQLAlchemyAdapter(BaseORMAdapter):
                 query = query.offset(skip).limit(limit)
 
                 result = await session.execute(query)
+                if fields:
+                    return _result_items(result, True)
                 return result.scalars().all()
         except ValueError as e:
             raise AppError(
@@ -169,20 +619,127 @@ class SQLAlchemyAdapter(BaseORMAdapter):
                 code=ErrorCode.INTERNAL_ERROR, status_code=500, message=f"Database error: {e!s}"
             )
 
-    async def get_one(self, id: Any) -> Optional[Any]:
+    async def get_all_with_total(
+        self,
+        filters: Dict[str, Any],
+        sorts: Dict[str, Any],
+        pagination: Dict[str, Any],
+        estimate: bool = False,
+        fields: Optional[List[str]] = None,
+        include: Optional[List[str]] = None,
+    ) -> Tuple[List[Any], int]:
+        """Get a page of items and the total matching count in one round-trip
+
+        The total is computed with ``COUNT(*) OVER ()`` on the page query where
+        the dialect supports window functions. Cursor pages and other dialects
+        fall back to a separate count query.
+
+        Args:
+            filters: Filter conditions
+            sorts: Sort conditions
+            pagination: Pagination info (skip, limit, or after/before cursors)
+            estimate: Use planner statistics instead of an exact count when no
+                filters are applied (for very large tables)
+            fields: Sparse fieldset, see ``get_all``
+            include: Relationship paths to eager-load
+
+        Returns:
+            Tuple of (items, total)
+        """
+        if self._keyset_plan(sorts, pagination) is not None:
+            items = await self.get_all(filters, sorts, pagination, fields=fields, include=include)
+            return items, await self.count(filters, estimate=estimate)
+
+        base_query = self._entity_select(fields, include)
+
+        try:
+            async with session_scope(self.session_factory) as session:
+                query = self._apply_sorts(self._apply_filters(base_query, filters), sorts)
+                skip = pagination.get("skip", 0)
+                limit = pagination.get("limit", 10)
+
+                if estimate and not _has_filters(filters):
+                    total = await estimate_row_count(session, self.model.__table__)
+                    if total is not None:
+                        result = await session.execute(query.offset(skip).limit(limit))
+                        return _result_items(result, bool(fields)), total
+
+                return await fetch_page_with_total(
+                    session, query, skip, limit, as_mappings=bool(fields)
+                )
+        except ValueError as e:
+            raise AppError(
+                code=ErrorCode.INTERNAL_ERROR,
+                status_code=500,
+                message=f"Database error (validation): {e!s}",
+            )
+        except SQLAlchemyError as e:
+            raise AppError(
+                code=ErrorCode.INTERNAL_ERROR, status_code=500, message=f"Database error: {e!s}"
+            )
+
+    async def stream(
+        self,
+        filters: Dict[str, Any],
+        sorts: Dict[str, Any],
+        batch_size: int = 1000,
+    ) -> AsyncIterator[Any]:
+        """Iterate over matching items with a server-side cursor
+
+        Rows are fetched ``batch_size`` at a time via ``stream_scalars`` so
+        memory use stays constant regardless of the table size.
+
+        Args:
+            filters: Filter conditions
+            sorts: Sort conditions
+            batch_size: Number of rows buffered from the cursor at a time
+
+        Yields:
+            Items in sort order
+        """
+        try:
+            query = self._apply_sorts(self._apply_filters(select(self.model), filters), sorts)
+            query = query.execution_options(yield_per=batch_size)
+
+            # Not session_scope(): the export body outlives the request's unit of work
+            async with self.session_factory() as session:
+                result = await session.stream_scalars(query)
+                async for item in result:
+                    yield item
+        except ValueError as e:
+            raise AppError(
+                code=ErrorCode.INTERNAL_ERROR,
+                status_code=500,
+                message=f"Database error (validation): {e!s}",
+            )
+        except SQLAlchemyError as e:
+            raise AppError(
+                code=ErrorCode.INTERNAL_ERROR, status_code=500, message=f"Database error: {e!s}"
+            )
+
+    async def get_one(
+        self, id: Any, fields: Optional[List[str]] = None, include: Optional[List[str]] = None
+    ) -> Optional[Any]:
         """Get single item by id
 
         Args:
             id: Item id
+            fields: Sparse fieldset; only these columns are selected and the
+                row is returned as a dict
+            include: Relationship paths to eager-load
 
         Returns:
             Item or None
         """
-        async with self.session_factory() as session:
+        query = self._entity_select(fields, include)
+
+        async with session_scope(self.session_factory) as session:
             try:
                 pk_field = getattr(self.model, self.pk_field)
-                query = select(self.model).where(pk_field == id)
-                result = await session.execute(query)
+                result = await session.execute(query.where(pk_field == id))
+                if fields:
+                    row = result.mappings().one_or_none()
+                    return dict(row) if row is not None else None
                 return result.scalar_one_or_none()
             except SQLAlchemyError as e:
                 raise AppError(
@@ -204,41 +761,105 @@ class SQLAlchemyAdapter(BaseORMAdapter):
             ConflictError: If item already exists (unique constraint violation)
             AppError: For other database errors
         """
-        async with self.session_factory() as session:
+        async with session_scope(self.session_factory) as session, savepoint(session):
             try:
                 item = self.model(**data)
                 session.add(item)
-                await session.commit()
+                await commit_or_flush(session)
                 await session.refresh(item)
                 return item
             except IntegrityError as e:
-                await session.rollback()
+                await rollback_if_owned(session)
                 raise ConflictError(f"Item already exists: {e!s}")
             except SQLAlchemyError as e:
-                await session.rollback()
+                await rollback_if_owned(session)
                 raise AppError(
                     code=ErrorCode.INTERNAL_ERROR,
                     status_code=500,
                     message=f"Database error: {e!s}",
                 )
 
+    def _are_columns(self, data: Dict[str, Any]) -> bool:
+        """Whether every key in ``data`` is a mapped column attribute"""
+        return self._column_keys.issuperset(data)
+
+    def _has_write_hooks(self, events: Tuple[str, ...], keys: Any = ()) -> bool:
+        """Whether ORM validators or listeners would run for a write
+
+        ``UPDATE``/``DELETE ... RETURNING`` statements bypass ``@validates``,
+        mapper events and attribute ``set`` events, so the fast paths are only
+        taken for models without them. Checked per call, since listeners may
+        be registered after the adapter is created.
+
+        Args:
+            events: Mapper events the write would fire, e.g. ``("before_update",)``
+            keys: Attributes the write assigns
+        """
+        mapper = sa_inspect(self.model)
+        if any(getattr(mapper.dispatch, event) for event in events):
+            return True
+        return any(
+            key in mapper.validators or getattr(self.model, key).dispatch.set for key in keys
+        )
+
+    def _has_delete_cascades(self) -> bool:
+        """Whether deleting an item through the ORM acts on related rows
+
+        ``session.delete()`` cascades to children (``cascade="delete"`` or
+        ``"delete-orphan"``), nulls out their foreign keys and removes
+        association rows; ``DELETE ... RETURNING`` does none of this.
+        """
+        for relationship in sa_inspect(self.model).relationships:
+            if relationship.cascade.delete or relationship.cascade.delete_orphan:
+                return True
+            if relationship.direction is not MANYTOONE and relationship.passive_deletes != "all":
+                return True
+        return False
+
     async def update(self, id: Any, data: Dict[str, Any]) -> Any:
         """Update item
 
+        Uses a single ``UPDATE ... RETURNING`` on dialects that support it
+        (PostgreSQL, SQLite 3.35+) when every key is a mapped column;
+        otherwise loads, modifies and refreshes the instance.
+
         Args:
             id: Item id
             data: Updated data
 
         Returns:
-            Updated item
+            Updated item, or None if it does not exist
 
         Raises:
             ConflictError: If unique constraint violation
             AppError: For other database errors
         """
-        async with self.session_factory() as session:
+        async with session_scope(self.session_factory) as session, savepoint(session):
             try:
                 pk_field = getattr(self.model, self.pk_field)
+
+                # Fast path: one UPDATE ... RETURNING round-trip
+                if (
+                    data
+                    and self._are_columns(data)
+                    and not self._has_write_hooks(("before_update", "after_update"), data)
+                    and supports_returning(session.get_bind(), "update")
+                ):
+                    statement = (
+                        update(self.model)
+                        .where(pk_field == id)
+                        .values(data)
+                        .returning(self.model)
+                        # Refresh an instance the session already holds
+                        .execution_options(synchronize_session=False, populate_existing=True)
+                    )
+                    item = (await session.execute(statement)).scalar_one_or_none()
+                    if item is not None and not is_request_session(session):
+                        # Detach so commit does not expire the returned row
+                        session.expunge(item)
+                    await commit_or_flush(session)
+                    return item
+
                 query = select(self.model).where(pk_field == id)
                 result = await session.execute(query)
                 item = result.scalar_one_or_none()
@@ -249,14 +870,14 @@ class SQLAlchemyAdapter(BaseORMAdapter):
                 for key, value in data.items():
                     setattr(item, key, value)
 
-                await session.commit()
+                await commit_or_flush(session)
                 await session.refresh(item)
                 return item
             except IntegrityError as e:
-                await session.rollback()
+                await rollback_if_owned(session)
                 raise ConflictError(f"Update conflict: {e!s}")
             except SQLAlchemyError as e:
-                await session.rollback()
+                await rollback_if_owned(session)
                 raise AppError(
                     code=ErrorCode.INTERNAL_ERROR,
                     status_code=500,
@@ -266,18 +887,45 @@ class SQLAlchemyAdapter(BaseORMAdapter):
     async def delete_one(self, id: Any) -> Any:
         """Delete single item
 
+        Uses a single ``DELETE ... RETURNING`` on dialects that support it
+        (PostgreSQL, SQLite 3.35+, MariaDB), else SELECT then delete.
+
         Args:
             id: Item id
 
         Returns:
-            Deleted item
+            Deleted item, or None if it does not exist
 
         Raises:
             AppError: For database errors
         """
-        async with self.session_factory() as session:
+        async with session_scope(self.session_factory) as session, savepoint(session):
             try:
                 pk_field = getattr(self.model, self.pk_field)
+
+                # Fast path: one DELETE ... RETURNING round-trip
+                if (
+                    not self._has_write_hooks(("before_delete", "after_delete"))
+                    and not self._has_delete_cascades()
+                    and supports_returning(session.get_bind(), "delete")
+                ):
+                    shared = is_request_session(session)
+                    statement = (
+                        delete(self.model)
+                        .where(pk_field == id)
+                        .returning(self.model)
+                        # A shared session must forget the deleted instance
+                        .execution_options(
+                            synchronize_session="fetch" if shared else False,
+                            populate_existing=True,
+                        )
+                    )
+                    item = (await session.execute(statement)).scalar_one_or_none()
+                    if item is not None and not shared:
+                        session.expunge(item)
+                    await commit_or_flush(session)
+                    return item
+
                 query = select(self.model).where(pk_field == id)
                 result = await session.execute(query)
                 item = result.scalar_one_or_none()
@@ -286,10 +934,10 @@ class SQLAlchemyAdapter(BaseORMAdapter):
                     return None
 
                 await session.delete(item)
-                await session.commit()
+                await commit_or_flush(session)
                 return item
             except SQLAlchemyError as e:
-                await session.rollback()
+                await rollback_if_owned(session)
                 raise AppError(
                     code=ErrorCode.INTERNAL_ERROR,
                     status_code=500,
@@ -305,7 +953,7 @@ class SQLAlchemyAdapter(BaseORMAdapter):
         Raises:
             AppError: For database errors
         """
-        async with self.session_factory() as session:
+        async with session_scope(self.session_factory) as session, savepoint(session):
             try:
                 # Get all items first
                 query = select(self.model)
@@ -315,28 +963,264 @@ class SQLAlchemyAdapter(BaseORMAdapter):
                 # Delete all
                 delete_query = delete(self.model)
                 await session.execute(delete_query)
-                await session.commit()
+                await commit_or_flush(session)
 
                 return items
             except SQLAlchemyError as e:
-                await session.rollback()
+                await rollback_if_owned(session)
                 raise AppError(
                     code=ErrorCode.INTERNAL_ERROR,
                     status_code=500,
                     message=f"Database error: {e!s}",
                 )
 
-    async def count(self, filters: Dict[str, Any]) -> int:
+    async def _fetch_by_ids(self, session, ids: List[Any]) -> List[Any]:
+        """Load items by primary key in chunks, preserving the order of ``ids``
+
+        Ids that do not exist are skipped.
+        """
+        pk_column = getattr(self.model, self.pk_field)
+        found = {}
+        for chunk in _chunks(list(dict.fromkeys(ids))):
+            result = await session.execute(select(self.model).where(pk_column.in_(chunk)))
+            for item in result.scalars():
+                found[getattr(item, self.pk_field)] = item
+
+        return [found[id] for id in dict.fromkeys(ids) if id in found]
+
+    async def bulk_create(self, items: List[Dict[str, Any]]) -> List[Any]:
+        """Create many items with a multi-row INSERT
+
+        Uses ``INSERT ... VALUES (...), (...) RETURNING`` on dialects that
+        support RETURNING for multi-row inserts (PostgreSQL, SQLite 3.35+,
+        MariaDB). Other dialects, and models with validators or insert
+        listeners, insert through the unit of work, which batches into
+        executemany, and reload the rows by primary key.
+
+        Args:
+            items: Item data, one dictionary per item
+
+        Returns:
+            Created items in input order
+
+        Raises:
+            ConflictError: If a unique constraint is violated
+            AppError: For other database errors
+        """
+        if not items:
+            return []
+
+        async with session_scope(self.session_factory) as session, savepoint(session):
+            try:
+                dialect = session.get_bind().dialect
+                keys = {key for data in items for key in data}
+                if dialect.insert_executemany_returning_sort_by_parameter_order and (
+                    not self._has_write_hooks(("before_insert", "after_insert"), keys)
+                ):
+                    statement = insert(self.model).returning(
+                        self.model, sort_by_parameter_order=True
+                    )
+                    result = await session.scalars(statement, items)
+                    created = list(result.all())
+                    if not is_request_session(session):
+                        # Detach before commit so the returned rows are not expired
+                        for item in created:
+                            session.expunge(item)
+                    await commit_or_flush(session)
+                    return created
+
+                objects = [self.model(**data) for data in items]
+                session.add_all(objects)
+                await session.flush()
+                ids = [getattr(item, self.pk_field) for item in objects]
+                await commit_or_flush(session)
+                return await self._fetch_by_ids(session, ids)
+            except IntegrityError as e:
+                await rollback_if_owned(session)
+                raise ConflictError(f"Item already exists: {e!s}")
+            except SQLAlchemyError as e:
+                await rollback_if_owned(session)
+                raise AppError(
+                    code=ErrorCode.INTERNAL_ERROR,
+                    status_code=500,
+                    message=f"Database error: {e!s}",
+                )
+
+    async def bulk_update(self, updates: List[Dict[str, Any]]) -> List[Any]:
+        """Update many items with as few statements as possible
+
+        Updates are grouped by the set of columns they change. Items that set
+        identical values share one ``UPDATE ... WHERE pk IN (...)``; the rest
+        of each group is sent as a single executemany UPDATE by primary key.
+        Models with validators or update listeners are updated through the
+        ORM instead.
+
+        Args:
+            updates: Update data, each dictionary including the primary key
+
+        Returns:
+            Updated items in input order; ids that do not exist are skipped
+
+        Raises:
+            BadRequestError: If an update does not include the primary key or
+                sets an unknown field
+            ConflictError: If a unique constraint is violated
+            AppError: For other database errors
+        """
+        if not updates:
+            return []
+
+        ids = []
+        same_values: Dict[Tuple[Tuple[str, Any], ...], List[Any]] = {}
+        by_columns: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+        for data in updates:
+            if self.pk_field not in data:
+                raise BadRequestError(f"Missing {self.pk_field} in bulk update item")
+            for key in data:
+                if key not in self._column_keys:
+                    raise BadRequestError(f"Unknown field: {key}")
+            ids.append(data[self.pk_field])
+
+            values = tuple(sorted((k, v) for k, v in data.items() if k != self.pk_field))
+            if not values:
+                continue
+            try:
+                same_values.setdefault(values, []).append(data[self.pk_field])
+            except TypeError:
+                # Unhashable values (e.g. JSON) cannot be grouped by value
+                by_columns.setdefault(tuple(k for k, _ in values), []).append(data)
+
+        # Value groups of a single row are cheaper as part of an executemany
+        for values, group_ids in list(same_values.items()):
+            if len(group_ids) == 1:
+                del same_values[values]
+                row = dict(values, **{self.pk_field: group_ids[0]})
+                by_columns.setdefault(tuple(k for k, _ in values), []).append(row)
+
+        pk_column = getattr(self.model, self.pk_field)
+        keys = {key for data in updates for key in data if key != self.pk_field}
+        async with session_scope(self.session_factory) as session, savepoint(session):
+            try:
+                if self._has_write_hooks(("before_update", "after_update"), keys):
+                    await self._bulk_update_orm(session, updates, ids)
+                    await commit_or_flush(session)
+                    return await self._fetch_by_ids(session, ids)
+
+                for values, group_ids in same_values.items():
+                    for chunk in _chunks(group_ids):
+                        await session.execute(
+                            update(self.model)
+                            .where(pk_column.in_(chunk))
+                            .values(dict(values))
+                            .execution_options(synchronize_session=False)
+                        )
+
+                for columns, rows in by_columns.items():
+                    statement, params = self._bulk_update_by_pk(columns, rows)
+                    await session.execute(statement, params)
+
+                await commit_or_flush(session)
+                return await self._fetch_by_ids(session, ids)
+            except IntegrityError as e:
+                await rollback_if_owned(session)
+                raise ConflictError(f"Update conflict: {e!s}")
+            except SQLAlchemyError as e:
+                await rollback_if_owned(session)
+                raise AppError(
+                    code=ErrorCode.INTERNAL_ERROR,
+                    status_code=500,
+                    message=f"Database error: {e!s}",
+                )
+
+    async def _bulk_update_orm(
+        self, session: Any, updates: List[Dict[str, Any]], ids: List[Any]
+    ) -> None:
+        """Apply updates to loaded instances, so validators and listeners run"""
+        loaded = await self._fetch_by_ids(session, ids)
+        items = {getattr(item, self.pk_field): item for item in loaded}
+        for data in updates:
+            item = items.get(data[self.pk_field])
+            if item is None:
+                continue
+            for key, value in data.items():
+                if key != self.pk_field:
+                    setattr(item, key, value)
+
+    def _bulk_update_by_pk(
+        self, columns: Tuple[str, ...], rows: List[Dict[str, Any]]
+    ) -> Tuple[Any, List[Dict[str, Any]]]:
+        """Build an executemany ``UPDATE ... WHERE pk = :pk`` for one column set
+
+        A Core statement is used because ORM bulk updates by primary key
+        raise when an id does not exist, while missing ids are skipped here.
+        """
+        mapper_columns = sa_inspect(self.model).columns
+        statement = (
+            update(self.model.__table__)
+            .where(mapper_columns[self.pk_field] == bindparam("_pk"))
+            .values({mapper_columns[name]: bindparam(f"_{name}") for name in columns})
+        )
+        params = [
+            {"_pk": row[self.pk_field], **{f"_{name}": row[name] for name in columns}}
+            for row in rows
+        ]
+        return statement, params
+
+    async def bulk_delete(self, ids: List[Any]) -> int:
+        """Delete many items with ``DELETE ... WHERE pk IN (...)``
+
+        Args:
+            ids: Item ids
+
+        Returns:
+            Number of deleted items
+
+        Raises:
+            AppError: For database errors
+        """
+        if not ids:
+            return 0
+
+        pk_column = getattr(self.model, self.pk_field)
+        async with session_scope(self.session_factory) as session, savepoint(session):
+            try:
+                deleted = 0
+                for chunk in _chunks(list(dict.fromkeys(ids))):
+                    result = await session.execute(
+                        delete(self.model)
+                        .where(pk_column.in_(chunk))
+                        .execution_options(synchronize_session=False)
+                    )
+                    deleted += result.rowcount
+                await commit_or_flush(session)
+                return deleted
+            except SQLAlchemyError as e:
+                await rollback_if_owned(session)
+                raise AppError(
+                    code=ErrorCode.INTERNAL_ERROR,
+                    status_code=500,
+                    message=f"Database error: {e!s}",
+                )
+
+    async def count(self, filters: Dict[str, Any], estimate: bool = False) -> int:
         """Count items
 
         Args:
             filters: Filter conditions
+            estimate: Read planner statistics instead of counting rows when no
+                filters are applied; falls back to an exact count if the
+                database has no statistics
 
         Returns:
             Total count
         """
         try:
-            async with self.session_factory() as session:
+            async with session_scope(self.session_factory) as session:
+                if estimate and not _has_filters(filters):
+                    total = await estimate_row_count(session, self.model.__table__)
+                    if total is not None:
+                        return total
+
                 query = select(func.count()).select_from(self.model)
 
                 # Apply filters (using extracted method - DRY!)
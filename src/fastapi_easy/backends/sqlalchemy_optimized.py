@@ -8,7 +8,7 @@ import time
 import weakref
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Type
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple, Type
 
 from sqlalchemy import and_, func, select, text
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
@@ -16,9 +16,12 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_asyn
 from sqlalchemy.orm import DeclarativeBase
 from sqlalchemy.pool import QueuePool
 
-from ..core.cache import QueryCache
+from ..core.cache import NOT_FOUND, QueryCache
+from ..core.cache_tags import field_tag, item_tag, list_tag, query_tags
 from ..core.errors import AppError, ConflictError, ErrorCode
+from ..core.invalidation_bus import InvalidationBus
 from ..core.optimization_config import OptimizationConfig
+from .sqlalchemy import estimate_row_count, fetch_page_with_total
 
 logger = logging.getLogger(__name__)
 
@@ -53,8 +56,13 @@ class OptimizedSQLAlchemyAdapter:
         database_url: str,
         pk_field: str = "id",
         optimization_config: Optional[OptimizationConfig] = None,
+        invalidation_bus: Optional[InvalidationBus] = None,
     ):
-        """Initialize optimized adapter"""
+        """Initialize optimized adapter
+
+        ``invalidation_bus`` carries cache invalidations to and from the
+        other workers.
+        """
         self.model = model
         self.pk_field = pk_field
         self.optimization_config = optimization_config or OptimizationConfig()
@@ -96,6 +104,7 @@ class OptimizedSQLAlchemyAdapter:
         self.cache = QueryCache(
             max_size=self.optimization_config.cache_size,
             default_ttl=self.optimization_config.cache_ttl,
+            invalidation_bus=invalidation_bus,
         )
 
         # Performance metrics
@@ -209,6 +218,19 @@ class OptimizedSQLAlchemyAdapter:
 
         return query
 
+    def _apply_sorting(self, query: Any, sorts: Dict[str, Any]) -> Any:
+        """Apply sort conditions, skipping invalid or unknown fields"""
+        for field_name, direction in sorts.items():
+            if not field_name.isidentifier():
+                continue
+            field = getattr(self.model, field_name, None)
+            if field is not None:
+                if direction == "desc":
+                    query = query.order_by(field.desc())
+                else:
+                    query = query.order_by(field.asc())
+        return query
+
     async def get_all(
         self,
         filters: Dict[str, Any],
@@ -239,15 +261,7 @@ class OptimizedSQLAlchemyAdapter:
                 query = self._build_filter_query(filters)
 
                 # Apply sorting
-                for field_name, direction in sorts.items():
-                    if not field_name.isidentifier():
-                        continue
-                    field = getattr(self.model, field_name, None)
-                    if field is not None:
-                        if direction == "desc":
-                            query = query.order_by(field.desc())
-                        else:
-                            query = query.order_by(field.asc())
+                query = self._apply_sorting(query, sorts)
 
                 # Apply pagination
                 skip = pagination.get("skip", 0)
@@ -263,7 +277,12 @@ class OptimizedSQLAlchemyAdapter:
 
                 # Cache result
                 if use_cache and self.optimization_config.enable_cache:
-                    await self.cache.set(cache_key, items)
+                    item_ids = [getattr(item, self.pk_field, None) for item in items]
+                    await self.cache.set(
+                        cache_key,
+                        items,
+                        tags=query_tags(self.model.__name__, filters, sorts, item_ids),
+                    )
 
                 # Update metrics
                 self.metrics.query_count += 1
@@ -278,6 +297,65 @@ class OptimizedSQLAlchemyAdapter:
                 code=ErrorCode.INTERNAL_ERROR, status_code=500, message=f"Database error: {e!s}"
             )
 
+    async def get_all_with_total(
+        self,
+        filters: Dict[str, Any],
+        sorts: Dict[str, Any],
+        pagination: Dict[str, Any],
+        estimate: bool = False,
+    ) -> Tuple[List[Any], int]:
+        """Get a page of items and the total count with a single window-function query"""
+        start_time = time.time()
+
+        try:
+            async with self.get_session() as session:
+                query = self._apply_sorting(self._build_filter_query(filters), sorts)
+                skip = pagination.get("skip", 0)
+                limit = pagination.get("limit", 10)
+
+                total = None
+                if estimate and not filters:
+                    total = await estimate_row_count(session, self.model.__table__)
+
+                if total is None:
+                    items, total = await asyncio.wait_for(
+                        fetch_page_with_total(session, query, skip, limit),
+                        timeout=self.optimization_config.query_timeout,
+                    )
+                else:
+                    result = await asyncio.wait_for(
+                        session.execute(query.offset(skip).limit(limit)),
+                        timeout=self.optimization_config.query_timeout,
+                    )
+                    items = list(result.scalars().all())
+
+                self.metrics.query_count += 1
+                self.metrics.total_time += time.time() - start_time
+
+                return items, total
+
+        except asyncio.TimeoutError:
+            raise AppError(code=ErrorCode.TIMEOUT, status_code=504, message="Query timeout")
+        except SQLAlchemyError as e:
+            raise AppError(
+                code=ErrorCode.INTERNAL_ERROR, status_code=500, message=f"Database error: {e!s}"
+            )
+
+    async def stream(
+        self,
+        filters: Dict[str, Any],
+        sorts: Dict[str, Any],
+        batch_size: int = 1000,
+    ) -> AsyncIterator[Any]:
+        """Iterate over matching items with a server-side cursor (never cached)"""
+        query = self._apply_sorting(self._build_filter_query(filters), sorts)
+        query = query.execution_options(yield_per=batch_size)
+
+        async with self.get_session() as session:
+            result = await session.stream_scalars(query)
+            async for item in result:
+                yield item
+
     async def get_one(self, id: Any, use_cache: bool = True) -> Optional[Any]:
         """Get single item with caching"""
         start_time = time.time()
@@ -288,7 +366,7 @@ class OptimizedSQLAlchemyAdapter:
             cached = await self.cache.get(cache_key)
             if cached is not None:
                 self.metrics.cache_hits += 1
-                return cached
+                return None if cached is NOT_FOUND else cached
             self.metrics.cache_misses += 1
 
         try:
@@ -301,9 +379,19 @@ class OptimizedSQLAlchemyAdapter:
                 )
                 item = result.scalar_one_or_none()
 
-                # Cache result (including None)
+                # Cache result; a missing id gets a short-lived tombstone that
+                # creating the item invalidates through its tag
                 if use_cache and self.optimization_config.enable_cache:
-                    await self.cache.set(cache_key, item)
+                    tags = {item_tag(self.model.__name__, id)}
+                    if item is not None:
+                        await self.cache.set(cache_key, item, tags=tags)
+                    elif self.optimization_config.negative_ttl:
+                        await self.cache.set(
+                            cache_key,
+                            NOT_FOUND,
+                            ttl=self.optimization_config.negative_ttl,
+                            tags=tags,
+                        )
 
                 # Update metrics
                 self.metrics.query_count += 1
@@ -340,7 +428,9 @@ class OptimizedSQLAlchemyAdapter:
 
                 # Invalidate caches
                 if self.optimization_config.enable_cache:
-                    await self._invalidate_caches("create")
+                    await self._invalidate_caches(
+                        {list_tag(self.model.__name__), self._item_tag(item)}
+                    )
 
                 # Update metrics
                 self.metrics.query_count += 1
@@ -386,7 +476,9 @@ class OptimizedSQLAlchemyAdapter:
 
                 # Invalidate caches
                 if self.optimization_config.enable_cache:
-                    await self._invalidate_caches("create_batch")
+                    await self._invalidate_caches(
+                        {list_tag(self.model.__name__)} | {self._item_tag(obj) for obj in objects}
+                    )
 
                 # Update metrics
                 self.metrics.query_count += 1
@@ -436,8 +528,11 @@ class OptimizedSQLAlchemyAdapter:
 
                 # Invalidate caches
                 if self.optimization_config.enable_cache:
-                    await self.cache.delete(self._get_cache_key("get_one", id=id))
-                    await self._invalidate_caches("update")
+                    model_name = self.model.__name__
+                    await self._invalidate_caches(
+                        {item_tag(model_name, id)}
+                        | {field_tag(model_name, field) for field in data}
+                    )
 
                 # Update metrics
                 self.metrics.query_count += 1
@@ -478,8 +573,9 @@ class OptimizedSQLAlchemyAdapter:
 
                 # Invalidate caches
                 if self.optimization_config.enable_cache:
-                    await self.cache.delete(self._get_cache_key("get_one", id=id))
-                    await self._invalidate_caches("delete")
+                    await self._invalidate_caches(
+                        {item_tag(self.model.__name__, id), list_tag(self.model.__name__)}
+                    )
 
                 # Update metrics
                 self.metrics.query_count += 1
@@ -520,7 +616,9 @@ class OptimizedSQLAlchemyAdapter:
 
                 # Cache result
                 if self.optimization_config.enable_cache:
-                    await self.cache.set(cache_key, count)
+                    await self.cache.set(
+                        cache_key, count, tags=query_tags(self.model.__name__, filters)
+                    )
 
                 # Update metrics
                 self.metrics.query_count += 1
@@ -533,12 +631,14 @@ class OptimizedSQLAlchemyAdapter:
                 code=ErrorCode.INTERNAL_ERROR, status_code=500, message=f"Database error: {e!s}"
             )
 
-    async def _invalidate_caches(self, operation: str):
-        """Invalidate relevant caches"""
+    def _item_tag(self, item: Any) -> str:
+        """Cache tag of a model instance"""
+        return item_tag(self.model.__name__, getattr(item, self.pk_field, None))
+
+    async def _invalidate_caches(self, tags: Set[str]):
+        """Invalidate the cached results registered under ``tags``"""
         try:
-            # For now, clear all caches
-            # TODO: Implement fine-grained invalidation
-            await self.cache.clear()
+            await self.cache.invalidate_by_tags(tags)
         except Exception as e:
             logger.warning(f"Cache invalidation error: {e}")
 
@@ -584,6 +684,7 @@ def create_optimized_adapter(
     database_url: str,
     pk_field: str = "id",
     optimization_config: Optional[OptimizationConfig] = None,
+    invalidation_bus: Optional[InvalidationBus] = None,
 ) -> OptimizedSQLAlchemyAdapter:
     """Create optimized SQLAlchemy adapter"""
     return OptimizedSQLAlchemyAdapter(
@@ -591,4 +692,5 @@ def create_optimized_adapter(
         database_url=database_url,
         pk_field=pk_field,
         optimization_config=optimization_config,
+        invalidation_bus=invalidation_bus,
     )
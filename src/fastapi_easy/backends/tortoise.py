@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
-from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple, Type
 
 from tortoise import Model
 from tortoise.exceptions import IntegrityError
+from tortoise.expressions import Q
+from tortoise.transactions import in_transaction
 
-from ..core.errors import AppError, ConflictError, ErrorCode
+from ..core.errors import AppError, BadRequestError, ConflictError, ErrorCode
+from ..utils.pagination import KeysetPlan, get_item_value
+from ..utils.sorters import SortParser
 from .base import BaseORMAdapter
 
 
@@ -93,30 +97,104 @@ class TortoiseAdapter(BaseORMAdapter):
 
         return query, filter_kwargs
 
+    def _nulls_last(self) -> bool:
+        """Whether the database sorts NULL after every value in ascending order"""
+        return self.model._meta.db.capabilities.dialect in ("postgres", "oracle")
+
+    def _apply_keyset(self, query, plan: KeysetPlan):
+        """Apply keyset ordering and seek predicate to query
+
+        Args:
+            query: Tortoise query object
+            plan: Keyset plan from ``_keyset_plan``
+
+        Returns:
+            Query ordered by the keyset and restricted to rows past the cursor
+        """
+        if plan.terms:
+            conditions = []
+            for term in plan.terms:
+                term_kwargs = {}
+                for name, operator, value in term:
+                    lookup = name if operator == "exact" else f"{name}__{operator}"
+                    term_kwargs[lookup] = value
+                conditions.append(Q(**term_kwargs))
+            query = query.filter(Q(*conditions, join_type="OR"))
+
+        return query.order_by(
+            *[f"-{name}" if direction == "desc" else name for name, direction in plan.ordering]
+        )
+
+    def _check_fields(self, fields: Optional[List[str]]) -> None:
+        """Reject sparse fieldsets naming fields the model does not have
+
+        Raises:
+            BadRequestError: If a field is unknown
+        """
+        for field_name in fields or ():
+            if field_name not in self.model._meta.fields_map:
+                raise BadRequestError(f"Unknown field: {field_name}")
+
+    def _prefetch_paths(self, include: Optional[List[str]]) -> List[str]:
+        """Translate relationship paths into ``prefetch_related`` lookups
+
+        Dotted paths such as ``"author.company"`` become ``"author__company"``.
+
+        Raises:
+            BadRequestError: If a path does not name a relation
+        """
+        paths = []
+        for path in include or ():
+            model = self.model
+            for name in path.split("."):
+                if name not in model._meta.fetch_fields:
+                    raise BadRequestError(f"Unknown relationship: {path}")
+                model = model._meta.fields_map[name].related_model
+            paths.append(path.replace(".", "__"))
+        return paths
+
     async def get_all(
         self,
         filters: Dict[str, Any],
         sorts: Dict[str, Any],
         pagination: Dict[str, Any],
+        fields: Optional[List[str]] = None,
+        include: Optional[List[str]] = None,
     ) -> List[Any]:
         """Get all items with filtering, sorting, and pagination
 
         Args:
             filters: Filter conditions
             sorts: Sort conditions
-            pagination: Pagination info (skip, limit)
+            pagination: Pagination info (skip, limit, or after/before cursors)
+            fields: Sparse fieldset; only these columns are selected (via
+                ``.values()``) and rows are returned as dicts
+            include: Relationship paths to load with ``prefetch_related``
+                (ignored for sparse fieldsets)
 
         Returns:
             List of items
         """
+        plan = self._keyset_plan(sorts, pagination)
+        self._check_fields(fields)
+        prefetch = self._prefetch_paths(include)
+
         try:
             query = self.model.all()
+            if prefetch and not fields:
+                query = query.prefetch_related(*prefetch)
 
             # Apply filters (using extracted method)
             query, filter_kwargs = self._apply_filters(query, filters)
             if filter_kwargs:
                 query = query.filter(**filter_kwargs)
 
+            # Keyset pagination seeks past the cursor instead of using OFFSET
+            if plan is not None:
+                query = self._apply_keyset(query, plan).limit(pagination.get("limit", 10))
+                items = await (query.values(*fields) if fields else query)
+                return list(reversed(items)) if plan.reverse else items
+
             # Apply sorting
             order_by = []
             for field_name, direction in sorts.items():
@@ -133,6 +211,8 @@ class TortoiseAdapter(BaseORMAdapter):
             limit = pagination.get("limit", 10)
             query = query.offset(skip).limit(limit)
 
+            if fields:
+                return await query.values(*fields)
             return await query
         except ValueError as e:
             raise AppError(
@@ -145,17 +225,79 @@ class TortoiseAdapter(BaseORMAdapter):
                 code=ErrorCode.INTERNAL_ERROR, status_code=500, message=f"Database error: {e!s}"
             )
 
-    async def get_one(self, id: Any) -> Optional[Any]:
+    async def stream(
+        self,
+        filters: Dict[str, Any],
+        sorts: Dict[str, Any],
+        batch_size: int = 1000,
+    ) -> AsyncIterator[Any]:
+        """Iterate over matching items in keyset-paginated batches
+
+        Tortoise materialises a whole queryset when iterated, so rows are read
+        ``batch_size`` at a time, each batch seeking past the last row of the
+        previous one (primary key breaks ties in the sort order).
+
+        Args:
+            filters: Filter conditions
+            sorts: Sort conditions
+            batch_size: Number of rows fetched per query
+
+        Yields:
+            Items in sort order
+        """
+        keyset = SortParser.to_keyset(sorts, self.pk_field)
+        plan = KeysetPlan(ordering=keyset)
+
+        try:
+            query = self.model.all()
+            query, filter_kwargs = self._apply_filters(query, filters)
+            if filter_kwargs:
+                query = query.filter(**filter_kwargs)
+
+            while True:
+                batch = await self._apply_keyset(query, plan).limit(batch_size)
+                for item in batch:
+                    yield item
+                if len(batch) < batch_size:
+                    return
+
+                last = [get_item_value(batch[-1], name) for name, _ in keyset]
+                terms = SortParser.seek_terms(keyset, last, self._nulls_last())
+                plan = KeysetPlan(ordering=keyset, terms=terms)
+        except ValueError as e:
+            raise AppError(
+                code=ErrorCode.INTERNAL_ERROR,
+                status_code=500,
+                message=f"Database error (validation): {e!s}",
+            )
+        except Exception as e:
+            raise AppError(
+                code=ErrorCode.INTERNAL_ERROR, status_code=500, message=f"Database error: {e!s}"
+            )
+
+    async def get_one(
+        self, id: Any, fields: Optional[List[str]] = None, include: Optional[List[str]] = None
+    ) -> Optional[Any]:
         """Get single item by id
 
         Args:
             id: Item id
+            fields: Sparse fieldset; the row is returned as a dict
+            include: Relationship paths to load with ``prefetch_related``
 
         Returns:
             Item or None
         """
+        self._check_fields(fields)
+        prefetch = self._prefetch_paths(include)
+
         try:
             pk_field = self.pk_field
+            if fields:
+                return await self.model.filter(**{pk_field: id}).first().values(*fields)
+            if prefetch:
+                query = self.model.filter(**{pk_field: id}).prefetch_related(*prefetch)
+                return await query.first()
             return await self.model.get_or_none(**{pk_field: id})
         except Exception as e:
             raise AppError(
@@ -264,6 +406,114 @@ class TortoiseAdapter(BaseORMAdapter):
                 code=ErrorCode.INTERNAL_ERROR, status_code=500, message=f"Database error: {e!s}"
             )
 
+    async def bulk_create(self, items: List[Dict[str, Any]]) -> List[Any]:
+        """Create many items in one transaction
+
+        ``Model.bulk_create`` does not read back generated keys, so it is
+        only used when every item's primary key is known before the insert
+        (given in the data or set by a default, e.g. a UUID). Otherwise the
+        items are created one by one inside the transaction.
+
+        Args:
+            items: Item data, one dictionary per item
+
+        Returns:
+            Created items in input order
+
+        Raises:
+            ConflictError: If a unique constraint is violated
+            AppError: For other database errors
+        """
+        if not items:
+            return []
+
+        try:
+            objects = [self.model(**data) for data in items]
+            async with in_transaction(self.model._meta.default_connection) as connection:
+                if all(item.pk is not None for item in objects):
+                    await self.model.bulk_create(objects, using_db=connection)
+                    return objects
+
+                return [await self.model.create(**data, using_db=connection) for data in items]
+        except IntegrityError as e:
+            raise ConflictError(f"Item already exists: {e!s}")
+        except Exception as e:
+            raise AppError(
+                code=ErrorCode.INTERNAL_ERROR, status_code=500, message=f"Database error: {e!s}"
+            )
+
+    async def bulk_update(self, updates: List[Dict[str, Any]]) -> List[Any]:
+        """Update many items with ``Model.bulk_update``
+
+        Targets are loaded with one ``pk__in`` query, then written with one
+        ``bulk_update`` per distinct set of changed fields.
+
+        Args:
+            updates: Update data, each dictionary including the primary key
+
+        Returns:
+            Updated items in input order; ids that do not exist are skipped
+
+        Raises:
+            BadRequestError: If an update does not include the primary key
+            ConflictError: If a unique constraint is violated
+            AppError: For other database errors
+        """
+        if not updates:
+            return []
+
+        pk_field = self.pk_field
+        for data in updates:
+            if pk_field not in data:
+                raise BadRequestError(f"Missing {pk_field} in bulk update item")
+        ids = list(dict.fromkeys(data[pk_field] for data in updates))
+
+        try:
+            found = {
+                getattr(item, pk_field): item
+                for item in await self.model.filter(**{f"{pk_field}__in": ids})
+            }
+
+            groups: Dict[Tuple[str, ...], List[Any]] = {}
+            for data in updates:
+                item = found.get(data[pk_field])
+                values = {key: value for key, value in data.items() if key != pk_field}
+                if item is None or not values:
+                    continue
+                item.update_from_dict(values)
+                groups.setdefault(tuple(sorted(values)), []).append(item)
+
+            async with in_transaction(self.model._meta.default_connection) as connection:
+                for fields, items in groups.items():
+                    await self.model.bulk_update(items, fields=list(fields), using_db=connection)
+
+            return [found[id] for id in ids if id in found]
+        except IntegrityError as e:
+            raise ConflictError(f"Update conflict: {e!s}")
+        except Exception as e:
+            raise AppError(
+                code=ErrorCode.INTERNAL_ERROR, status_code=500, message=f"Database error: {e!s}"
+            )
+
+    async def bulk_delete(self, ids: List[Any]) -> int:
+        """Delete many items with a single ``pk__in`` delete
+
+        Args:
+            ids: Item ids
+
+        Returns:
+            Number of deleted items
+        """
+        if not ids:
+            return 0
+
+        try:
+            return await self.model.filter(**{f"{self.pk_field}__in": list(ids)}).delete()
+        except Exception as e:
+            raise AppError(
+                code=ErrorCode.INTERNAL_ERROR, status_code=500, message=f"Database error: {e!s}"
+            )
+
     async def count(self, filters: Dict[str, Any]) -> int:
         """Count items
 
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 
 class ORMAdapter(ABC):
@@ -23,13 +23,21 @@ class ORMAdapter(ABC):
         filters: Dict[str, Any],
         sorts: Dict[str, Any],
         pagination: Dict[str, Any],
+        fields: Optional[List[str]] = None,
+        include: Optional[List[str]] = None,
     ) -> List[Any]:
         """Get all items
 
         Args:
             filters: Filter conditions
             sorts: Sort conditions
-            pagination: Pagination info (skip, limit)
+            pagination: Pagination info (skip, limit). Cursor pagination is
+                used instead when it contains ``after``/``before`` keys, see
+                :func:`fastapi_easy.utils.pagination.plan_keyset`
+            fields: Sparse fieldset. When given, adapters should read only
+                these columns and return plain dicts instead of ORM objects
+            include: Relationship names to eager-load with the items, so
+                nested response schemas do not trigger one query per row
 
         Returns:
             List of items (never None, may be empty)
@@ -39,12 +47,80 @@ class ORMAdapter(ABC):
             RuntimeError: If database query fails
         """
 
+    async def get_all_with_total(
+        self,
+        filters: Dict[str, Any],
+        sorts: Dict[str, Any],
+        pagination: Dict[str, Any],
+        estimate: bool = False,
+        fields: Optional[List[str]] = None,
+        include: Optional[List[str]] = None,
+    ) -> Tuple[List[Any], int]:
+        """Get a page of items together with the total matching count
+
+        The default implementation calls ``get_all`` and ``count``. Adapters
+        that can compute both in a single statement should override it.
+
+        Args:
+            filters: Filter conditions
+            sorts: Sort conditions
+            pagination: Pagination info
+            estimate: Allow an estimated total where the backend supports it
+            fields: Sparse fieldset, see ``get_all``
+            include: Relationships to eager-load, see ``get_all``
+
+        Returns:
+            Tuple of (items, total)
+        """
+        # Only pass the optional arguments adapters were asked for
+        options = {}
+        if fields:
+            options["fields"] = fields
+        if include:
+            options["include"] = include
+        items = await self.get_all(filters, sorts, pagination, **options)
+        total = await self.count(filters)
+        return items, total
+
+    async def stream(
+        self,
+        filters: Dict[str, Any],
+        sorts: Dict[str, Any],
+        batch_size: int = 1000,
+    ) -> AsyncIterator[Any]:
+        """Iterate over every matching item without loading them all at once
+
+        The default implementation pages through ``get_all`` with
+        ``batch_size`` rows per query. Adapters should override it with a
+        server-side cursor where the backend provides one.
+
+        Args:
+            filters: Filter conditions
+            sorts: Sort conditions
+            batch_size: Number of rows fetched from the database at a time
+
+        Yields:
+            Items in sort order
+        """
+        skip = 0
+        while True:
+            batch = await self.get_all(filters, sorts, {"skip": skip, "limit": batch_size})
+            for item in batch:
+                yield item
+            if len(batch) < batch_size:
+                return
+            skip += batch_size
+
     @abstractmethod
-    async def get_one(self, id: Any) -> Optional[Any]:
+    async def get_one(
+        self, id: Any, fields: Optional[List[str]] = None, include: Optional[List[str]] = None
+    ) -> Optional[Any]:
         """Get single item by id
 
         Args:
             id: Item id
+            fields: Sparse fieldset, see ``get_all``
+            include: Relationships to eager-load, see ``get_all``
 
         Returns:
             Item or None if not found
@@ -92,6 +168,62 @@ class ORMAdapter(ABC):
             List of deleted items
         """
 
+    async def bulk_create(self, items: List[Dict[str, Any]]) -> List[Any]:
+        """Create many items
+
+        The default implementation calls ``create`` once per item. Adapters
+        should override it with a multi-row insert.
+
+        Args:
+            items: Item data, one dictionary per item
+
+        Returns:
+            Created items in input order
+        """
+        return [await self.create(data) for data in items]
+
+    async def bulk_update(self, updates: List[Dict[str, Any]]) -> List[Any]:
+        """Update many items
+
+        The default implementation calls ``update`` once per item.
+
+        Args:
+            updates: Update data, each dictionary including the primary key
+
+        Returns:
+            Updated items in input order; ids that do not exist are skipped
+
+        Raises:
+            ValueError: If an update does not include the primary key
+        """
+        pk_field = getattr(self, "pk_field", "id")
+        updated = []
+        for data in updates:
+            if pk_field not in data:
+                raise ValueError(f"Missing {pk_field} in bulk update item")
+            values = {key: value for key, value in data.items() if key != pk_field}
+            item = await self.update(data[pk_field], values)
+            if item is not None:
+                updated.append(item)
+        return updated
+
+    async def bulk_delete(self, ids: List[Any]) -> int:
+        """Delete many items by id
+
+        The default implementation calls ``delete_one`` once per id.
+
+        Args:
+            ids: Item ids
+
+        Returns:
+            Number of deleted items
+        """
+        deleted = 0
+        for id in ids:
+            if await self.delete_one(id) is not None:
+                deleted += 1
+        return deleted
+
     @abstractmethod
     async def count(self, filters: Dict[str, Any]) -> int:
         """Count items
@@ -12,17 +12,21 @@ This module provides a comprehensive caching solution with:
 from __future__ import annotations
 
 import asyncio
-import hashlib
-import json
 import logging
 import pickle
 import time
 from abc import ABC, abstractmethod
-from collections import OrderedDict, defaultdict
+from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Set, Tuple
+
+from .cache_core import LRUTTLCache
+from .cache_key_generator import make_cache_key
+from .cache_tags import TagIndex
+from .invalidation_bus import InvalidationBus
+from .shared_memory_cache import SharedMemoryCache
 
 try:
     import redis.asyncio as redis
@@ -212,8 +216,16 @@ class TTLEvictionPolicy(EvictionPolicy):
         raise NotImplementedError
 
 
+def _entry_size(entry: CacheEntry) -> int:
+    return entry.size_bytes
+
+
 class L1MemoryCache:
-    """Level 1 in-memory cache with advanced features"""
+    """Level 1 in-memory cache with advanced features
+
+    Entries are stored in an :class:`LRUTTLCache`, which gives O(1) lookups and
+    LRU eviction and expires entries through its TTL heap. Reads take no lock.
+    """
 
     def __init__(
         self,
@@ -222,6 +234,8 @@ class L1MemoryCache:
         eviction_policy: EvictionPolicy = None,
         enable_stats: bool = True,
         enable_compression: bool = False,
+        max_bytes: Optional[int] = None,
+        eviction: str = "lru",
     ):
         """
         Initialize L1 memory cache
@@ -229,19 +243,17 @@ class L1MemoryCache:
         Args:
             max_size: Maximum number of entries
             default_ttl: Default TTL in seconds
-            eviction_policy: Eviction policy to use
+            eviction_policy: Kept for compatibility; use ``eviction`` instead
             enable_stats: Enable statistics tracking
             enable_compression: Enable value compression
+            max_bytes: Maximum total size of the entries in bytes
+            eviction: ``"lru"``, size-aware ``"gdsf"`` or scan-resistant ``"tinylfu"``
         """
         self.max_size = max_size
         self.default_ttl = default_ttl
         self.enable_stats = enable_stats
         self.enable_compression = enable_compression
 
-        # Storage
-        self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
-        self._key_to_entry: Dict[str, CacheEntry] = {}
-
         # Eviction policy
         self.eviction_policy = eviction_policy or LRUEvictionPolicy()
 
@@ -249,8 +261,16 @@ class L1MemoryCache:
         self.stats = CacheStats()
         self.metrics = CacheMetrics()
 
-        # Locks
-        self._lock = asyncio.Lock()
+        # Storage, plus a reverse index from tag to keys
+        self._tags = TagIndex()
+        self._cache = LRUTTLCache(
+            max_size=max_size,
+            default_ttl=default_ttl,
+            on_evict=self._on_evict,
+            max_bytes=max_bytes,
+            eviction=eviction,
+            sizeof=_entry_size,
+        )
 
         # Background tasks
         self._cleanup_task: Optional[asyncio.Task] = None
@@ -259,17 +279,24 @@ class L1MemoryCache:
         # Start background tasks
         self._start_background_tasks()
 
+    @property
+    def total_bytes(self) -> int:
+        """Total size of the cached entries in bytes"""
+        return self._cache.total_bytes
+
     def _start_background_tasks(self):
         """Start background maintenance tasks"""
         self._cleanup_task = asyncio.create_task(self._cleanup_expired())
         self._stats_task = asyncio.create_task(self._update_stats())
 
+    def _on_evict(self, key: str, entry: CacheEntry) -> None:
+        """Count entries dropped by LRU eviction or expiry"""
+        self._tags.discard(key)
+        self.stats.evictions += 1
+
     def _generate_key(self, prefix: str, **kwargs) -> str:
         """Generate cache key from parameters"""
-        # Sort kwargs for consistent key generation
-        sorted_items = sorted(kwargs.items())
-        key_str = f"{prefix}:{json.dumps(sorted_items, sort_keys=True, default=str)}"
-        return hashlib.sha256(key_str.encode()).hexdigest()
+        return make_cache_key(prefix, kwargs)
 
     def _serialize_value(self, value: Any) -> bytes:
         """Serialize value for storage"""
@@ -284,6 +311,19 @@ class L1MemoryCache:
             logger.error(f"Value serialization failed: {e}")
             raise
 
+    def _value_size(self, value: Any) -> int:
+        """Size of a value in bytes
+
+        Bytes and objects exposing ``nbytes`` (such as cached responses) are
+        measured directly; only other values are pickled to find their size.
+        """
+        if isinstance(value, (bytes, bytearray)):
+            return len(value)
+        nbytes = getattr(value, "nbytes", None)
+        if isinstance(nbytes, int):
+            return nbytes
+        return len(self._serialize_value(value))
+
     def _deserialize_value(self, data: bytes) -> Any:
         """Deserialize value from storage"""
         try:
@@ -300,32 +340,18 @@ class L1MemoryCache:
         """Get value from cache"""
         start_time = time.perf_counter()
 
-        async with self._lock:
-            if key not in self._cache:
-                self.stats.misses += 1
-                self.metrics.operation_times["get"].append(time.perf_counter() - start_time)
-                return None
-
-            entry = self._cache[key]
-
-            # Check expiration
-            if entry.is_expired:
-                del self._cache[key]
-                self.stats.misses += 1
-                self.stats.evictions += 1
-                self.metrics.operation_times["get"].append(time.perf_counter() - start_time)
-                return None
-
-            # Update access
-            entry.touch()
-
-            # Move to end (for LRU)
-            self._cache.move_to_end(key)
-
-            self.stats.hits += 1
+        # Expired entries are dropped (and counted as evictions) by the core
+        entry = self._cache.get(key)
+        if entry is None:
+            self.stats.misses += 1
             self.metrics.operation_times["get"].append(time.perf_counter() - start_time)
+            return None
 
-            return entry.value
+        entry.touch()
+        self.stats.hits += 1
+        self.metrics.operation_times["get"].append(time.perf_counter() - start_time)
+
+        return entry.value
 
     async def set(
         self,
@@ -340,48 +366,39 @@ class L1MemoryCache:
         ttl = ttl or self.default_ttl
 
         try:
-            # Serialize value and calculate size
-            serialized_value = self._serialize_value(value)
-            value_size = len(serialized_value)
-
-            async with self._lock:
-                # Check if eviction is needed
-                if key not in self._cache:
-                    victim_key = self.eviction_policy.should_evict(
-                        list(self._cache.values()), value_size, self.max_size
-                    )
-                    if victim_key:
-                        del self._cache[victim_key]
-                        self.stats.evictions += 1
-
-                # Create cache entry
-                now = datetime.now()
-                entry = CacheEntry(
-                    value=value,
-                    ttl=ttl,
-                    created_at=now,
-                    last_accessed=now,
-                    size_bytes=value_size,
-                    tags=tags or set(),
-                    level=CacheLevel.L1_MEMORY,
-                    metadata=metadata or {},
-                )
+            value_size = self._value_size(value)
+
+            now = datetime.now()
+            entry = CacheEntry(
+                value=value,
+                ttl=ttl,
+                created_at=now,
+                last_accessed=now,
+                size_bytes=value_size,
+                tags=tags or set(),
+                level=CacheLevel.L1_MEMORY,
+                metadata=metadata or {},
+            )
 
-                self._cache[key] = entry
-                self._cache.move_to_end(key)
+            # Evicts the least recently used entry when full
+            stored = self._cache.set(key, entry, ttl)
+            if stored and entry.tags:
+                self._tags.add(key, entry.tags)
+            else:
+                self._tags.discard(key)
 
-                self.stats.sets += 1
-                self.metrics.operation_times["set"].append(time.perf_counter() - start_time)
+            self.stats.sets += 1
+            self.metrics.operation_times["set"].append(time.perf_counter() - start_time)
 
-                # Update tag usage
-                for tag in entry.tags:
-                    self.metrics.tag_usage[tag] += 1
+            # Update tag usage
+            for tag in entry.tags:
+                self.metrics.tag_usage[tag] += 1
 
-                # Update size distribution
-                size_category = self._categorize_size(value_size)
-                self.metrics.size_distribution[size_category] += 1
+            # Update size distribution
+            size_category = self._categorize_size(value_size)
+            self.metrics.size_distribution[size_category] += 1
 
-                return True
+            return True
 
         except Exception as e:
             self.stats.errors += 1
@@ -392,35 +409,31 @@ class L1MemoryCache:
         """Delete value from cache"""
         start_time = time.perf_counter()
 
-        async with self._lock:
-            if key in self._cache:
-                del self._cache[key]
-                self.stats.deletes += 1
-                self.metrics.operation_times["delete"].append(time.perf_counter() - start_time)
-                return True
-            return False
+        self._tags.discard(key)
+        if self._cache.delete(key):
+            self.stats.deletes += 1
+            self.metrics.operation_times["delete"].append(time.perf_counter() - start_time)
+            return True
+        return False
 
     async def clear(self) -> bool:
         """Clear all cache entries"""
-        async with self._lock:
-            count = len(self._cache)
-            self._cache.clear()
-            self.stats.deletes += count
-            return True
+        count = len(self._cache)
+        self._cache.clear()
+        self._tags.clear()
+        self.stats.deletes += count
+        return True
 
     async def invalidate_by_tags(self, tags: Set[str]) -> int:
         """Invalidate entries by tags"""
-        async with self._lock:
-            keys_to_delete = []
-            for key, entry in self._cache.items():
-                if entry.tags & tags:  # Intersection
-                    keys_to_delete.append(key)
+        removed = 0
+        for key in self._tags.keys_for(tags):
+            self._tags.discard(key)
+            if self._cache.delete(key):
+                removed += 1
 
-            for key in keys_to_delete:
-                del self._cache[key]
-
-            self.stats.deletes += len(keys_to_delete)
-            return len(keys_to_delete)
+        self.stats.deletes += removed
+        return removed
 
     async def warm_cache(self, entries: Dict[str, Tuple[Any, int, Set[str]]]):
         """Warm cache with multiple entries"""
@@ -447,12 +460,8 @@ class L1MemoryCache:
         """Background task to clean up expired entries"""
         while True:
             try:
-                async with self._lock:
-                    expired_keys = [key for key, entry in self._cache.items() if entry.is_expired]
-
-                    for key in expired_keys:
-                        del self._cache[key]
-                        self.stats.evictions += 1
+                # Evictions are counted by _on_evict
+                self._cache.purge_expired()
 
                 await asyncio.sleep(60)  # Check every minute
 
@@ -466,13 +475,10 @@ class L1MemoryCache:
         """Background task to update statistics"""
         while True:
             try:
-                async with self._lock:
-                    # Update basic stats
-                    self.stats.total_entries = len(self._cache)
-                    self.stats.total_size_bytes = sum(
-                        entry.size_bytes for entry in self._cache.values()
-                    )
-                    self.stats.memory_usage_mb = self.stats.total_size_bytes / 1024 / 1024
+                # Update basic stats
+                self.stats.total_entries = len(self._cache)
+                self.stats.total_size_bytes = self._cache.total_bytes
+                self.stats.memory_usage_mb = self.stats.total_size_bytes / 1024 / 1024
 
                 await asyncio.sleep(30)  # Update every 30 seconds
 
@@ -489,6 +495,8 @@ class L1MemoryCache:
             "miss_rate": self.stats.miss_rate,
             "total_entries": self.stats.total_entries,
             "memory_usage_mb": self.stats.memory_usage_mb,
+            "bytes": self._cache.total_bytes,
+            "max_bytes": self._cache.max_bytes,
             "hits": self.stats.hits,
             "misses": self.stats.misses,
             "sets": self.stats.sets,
@@ -520,6 +528,43 @@ class L1MemoryCache:
         await self.clear()
 
 
+class _TaggedValue(NamedTuple):
+    """Value stored in Redis together with its tags"""
+
+    value: Any
+    tags: Tuple[str, ...]
+
+
+# Stores a value and registers it in one set per tag. A tag set lives as long
+# as its longest-lived member; members that expired earlier are harmless to
+# delete later. TTL plus a conditional EXPIRE works on every Redis version.
+# KEYS: value key, then the tag sets; ARGV: ttl, pickled value
+_SET_TAGGED_SCRIPT = """
+local ttl = tonumber(ARGV[1])
+redis.call('SETEX', KEYS[1], ttl, ARGV[2])
+for i = 2, #KEYS do
+    redis.call('SADD', KEYS[i], KEYS[1])
+    if redis.call('TTL', KEYS[i]) < ttl then
+        redis.call('EXPIRE', KEYS[i], ttl)
+    end
+end
+return 1
+"""
+
+# Deletes every key in the tag sets and the sets themselves in one step, so a
+# key tagged meanwhile cannot survive. DEL is chunked to stay within Lua's
+# unpack() limit. KEYS: the tag sets; returns the number of keys deleted
+_INVALIDATE_TAGS_SCRIPT = """
+local keys = redis.call('SUNION', unpack(KEYS))
+local deleted = 0
+for i = 1, #keys, 1000 do
+    deleted = deleted + redis.call('DEL', unpack(keys, i, math.min(i + 999, #keys)))
+end
+redis.call('DEL', unpack(KEYS))
+return deleted
+"""
+
+
 class L2RedisCache:
     """Level 2 Redis cache implementation"""
 
@@ -553,6 +598,7 @@ class L2RedisCache:
 
         # Statistics
         self.stats = CacheStats()
+        self.metrics = CacheMetrics()
 
         # Locks
         self._lock = asyncio.Lock()
@@ -581,8 +627,17 @@ class L2RedisCache:
         """Create Redis key with prefix"""
         return f"{self.key_prefix}{key}"
 
+    def _make_tag_key(self, tag: str) -> str:
+        """Create Redis key of the set holding a tag's keys"""
+        return f"{self.key_prefix}tag:{tag}"
+
     async def get(self, key: str) -> Optional[Any]:
         """Get value from Redis"""
+        value, _ = await self.get_with_tags(key)
+        return value
+
+    async def get_with_tags(self, key: str) -> Tuple[Optional[Any], Set[str]]:
+        """Get value from Redis together with the tags it was stored under"""
         if self._redis is None:
             await self.connect()
 
@@ -594,18 +649,20 @@ class L2RedisCache:
 
             if data is None:
                 self.stats.misses += 1
-                return None
+                return None, set()
 
             # Deserialize value
             value = pickle.loads(data)
             self.stats.hits += 1
 
-            return value
+            if isinstance(value, _TaggedValue):
+                return value.value, set(value.tags)
+            return value, set()
 
         except Exception as e:
             self.stats.errors += 1
             logger.error(f"Redis get failed for key {key}: {e}")
-            return None
+            return None, set()
 
         finally:
             self.metrics.operation_times["get"].append(time.perf_counter() - start_time)
@@ -627,15 +684,18 @@ class L2RedisCache:
 
         try:
             redis_key = self._make_key(key)
-            data = pickle.dumps(value)
 
-            # Store with tags in metadata
-            if tags or metadata:
-                cache_meta = {"tags": list(tags or []), **(metadata or {})}
-                # Store metadata separately or as part of value
-                # For simplicity, we'll store as part of the pickled value
+            if not tags:
+                await self._redis.setex(redis_key, ttl, pickle.dumps(value))
+            else:
+                # Keep the tags with the value so promotions to L1 stay tagged
+                data = pickle.dumps(_TaggedValue(value, tuple(tags)))
+
+                tag_keys = [self._make_tag_key(tag) for tag in tags]
+                await self._redis.eval(
+                    _SET_TAGGED_SCRIPT, 1 + len(tag_keys), redis_key, *tag_keys, ttl, data
+                )
 
-            await self._redis.setex(redis_key, ttl, data)
             self.stats.sets += 1
             return True
 
@@ -668,6 +728,31 @@ class L2RedisCache:
         finally:
             self.metrics.operation_times["delete"].append(time.perf_counter() - start_time)
 
+    async def invalidate_by_tags(self, tags: Set[str]) -> int:
+        """Delete every key registered under any of the tags
+
+        Args:
+            tags: Tags to invalidate
+
+        Returns:
+            Number of keys deleted
+        """
+        if not tags:
+            return 0
+        if self._redis is None:
+            await self.connect()
+
+        try:
+            tag_keys = [self._make_tag_key(tag) for tag in tags]
+            deleted = await self._redis.eval(_INVALIDATE_TAGS_SCRIPT, len(tag_keys), *tag_keys)
+            self.stats.deletes += deleted
+            return deleted
+
+        except Exception as e:
+            self.stats.errors += 1
+            logger.error(f"Redis tag invalidation failed for tags {tags}: {e}")
+            return 0
+
 
 class AdvancedCacheManager:
     """Advanced multi-layer cache manager"""
@@ -677,6 +762,9 @@ class AdvancedCacheManager:
         l1_config: Optional[Dict[str, Any]] = None,
         l2_config: Optional[Dict[str, Any]] = None,
         enable_l2: bool = REDIS_AVAILABLE,
+        invalidation_bus: Optional[InvalidationBus] = None,
+        shared_config: Optional[Dict[str, Any]] = None,
+        enable_shared: bool = False,
     ):
         """
         Initialize advanced cache manager
@@ -685,6 +773,12 @@ class AdvancedCacheManager:
             l1_config: L1 cache configuration
             l2_config: L2 cache configuration
             enable_l2: Enable L2 Redis cache
+            invalidation_bus: Bus that carries deletes and tag invalidations
+                to the L1 caches of other workers; call ``start`` to begin
+                receiving
+            shared_config: Shared-memory tier configuration
+            enable_shared: Enable the shared-memory tier between L1 and L2,
+                shared by the worker processes of one host (Linux only)
         """
         l1_config = l1_config or {}
         l2_config = l2_config or {}
@@ -692,6 +786,14 @@ class AdvancedCacheManager:
         # Initialize L1 cache
         self.l1_cache = L1MemoryCache(**l1_config)
 
+        # Initialize shared-memory tier if enabled
+        self.shared_cache = None
+        if enable_shared:
+            try:
+                self.shared_cache = SharedMemoryCache(**(shared_config or {}))
+            except (RuntimeError, OSError) as e:
+                logger.warning(f"Shared memory cache disabled: {e}")
+
         # Initialize L2 cache if enabled
         self.l2_cache = None
         if enable_l2:
@@ -700,27 +802,57 @@ class AdvancedCacheManager:
             except ImportError:
                 logger.warning("Redis not available, L2 cache disabled")
 
+        # Cross-worker L1 invalidation
+        self.invalidation_bus = invalidation_bus
+        if invalidation_bus is not None:
+            invalidation_bus.subscribe(self.l1_cache)
+
         # Cache policies
         self.cache_warmup_policies: Dict[str, Callable] = {}
         self.invalidation_policies: Dict[str, Callable] = {}
 
+    async def start(self):
+        """Start receiving invalidations from other workers"""
+        if self.invalidation_bus is not None:
+            await self.invalidation_bus.start()
+
     async def get(self, key: str) -> Optional[Any]:
-        """Get value from cache (L1 first, then L2)"""
+        """Get value from cache (L1 first, then shared memory, then L2)"""
         # Try L1 cache first
         value = await self.l1_cache.get(key)
         if value is not None:
             return value
 
+        # Try the shared-memory tier
+        if self.shared_cache:
+            data, tags = await self.shared_cache.get_with_tags(key)
+            if data is not None:
+                value = pickle.loads(data)
+                await self.l1_cache.set(key, value, tags=tags)
+                return value
+
         # Try L2 cache if available
         if self.l2_cache:
-            value = await self.l2_cache.get(key)
+            value, tags = await self.l2_cache.get_with_tags(key)
             if value is not None:
-                # Promote to L1 cache
-                await self.l1_cache.set(key, value)
+                # Promote to the upper tiers, keeping the entry's tags
+                await self.l1_cache.set(key, value, tags=tags)
+                if self.shared_cache:
+                    await self._set_shared(key, value, None, tags)
                 return value
 
         return None
 
+    async def _set_shared(
+        self, key: str, value: Any, ttl: Optional[int], tags: Optional[Set[str]]
+    ) -> bool:
+        try:
+            data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            logger.warning(f"Value for key {key} not stored in shared memory: {e}")
+            return False
+        return await self.shared_cache.set(key, data, ttl, tags)
+
     async def set(
         self,
         key: str,
@@ -733,6 +865,10 @@ class AdvancedCacheManager:
         # Always store in L1
         l1_success = await self.l1_cache.set(key, value, ttl, tags)
 
+        # The shared tier is best effort; oversized values are skipped
+        if self.shared_cache:
+            await self._set_shared(key, value, ttl, tags)
+
         # Store in L2 if enabled and requested
         l2_success = True
         if self.l2_cache and store_in_l2:
@@ -745,16 +881,29 @@ class AdvancedCacheManager:
         l1_success = await self.l1_cache.delete(key)
         l2_success = True
 
+        shared_success = False
+        if self.shared_cache:
+            shared_success = await self.shared_cache.delete(key)
+
         if self.l2_cache:
             l2_success = await self.l2_cache.delete(key)
 
-        return l1_success or l2_success
+        if self.invalidation_bus is not None:
+            self.invalidation_bus.publish(keys=(key,))
+
+        return l1_success or shared_success or l2_success
 
     async def invalidate_by_tags(self, tags: Set[str]) -> int:
         """Invalidate entries by tags across all layers"""
         l1_count = await self.l1_cache.invalidate_by_tags(tags)
-        # L2 tag invalidation would require additional metadata storage
-        return l1_count
+        if self.shared_cache:
+            await self.shared_cache.invalidate_by_tags(tags)
+        l2_count = 0
+        if self.l2_cache:
+            l2_count = await self.l2_cache.invalidate_by_tags(tags)
+        if self.invalidation_bus is not None:
+            self.invalidation_bus.publish(tags=tags)
+        return l1_count + l2_count
 
     async def warm_cache(self, cache_name: str):
         """Warm cache using predefined policies"""
@@ -769,6 +918,10 @@ class AdvancedCacheManager:
     def get_comprehensive_stats(self) -> Dict[str, Any]:
         """Get comprehensive cache statistics"""
         stats = {"l1": self.l1_cache.get_stats(), "l2": None}
+        if self.shared_cache:
+            stats["shared"] = self.shared_cache.get_stats()
+        if self.invalidation_bus is not None:
+            stats["invalidation_bus"] = dict(self.invalidation_bus.stats)
 
         if self.l2_cache:
             stats["l2"] = {
@@ -784,7 +937,11 @@ class AdvancedCacheManager:
 
     async def close(self):
         """Close cache manager and cleanup resources"""
+        if self.invalidation_bus is not None:
+            await self.invalidation_bus.close()
         await self.l1_cache.close()
+        if self.shared_cache:
+            self.shared_cache.close()
         if self.l2_cache:
             await self.l2_cache.disconnect()
 
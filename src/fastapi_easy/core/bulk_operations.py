@@ -4,6 +4,11 @@ from __future__ import annotations
 
 from typing import Any, Dict, List, Optional, Type
 
+from sqlalchemy import select
+
+# Maximum ids per "IN (...)" when prefetching rows
+PREFETCH_CHUNK_SIZE = 500
+
 
 class BulkOperationResult:
     """Result of a bulk operation"""
@@ -48,6 +53,22 @@ class BulkOperationAdapter:
         self.model = model
         self.session_factory = session_factory
 
+    async def _prefetch(self, session: Any, ids: List[Any], id_field: str) -> Dict[Any, Any]:
+        """Load the rows for ``ids`` with chunked ``IN`` queries
+
+        Returns:
+            Mapping of id -> loaded instance (missing ids are absent)
+        """
+        column = getattr(self.model, id_field)
+        unique_ids = list(dict.fromkeys(ids))
+        found: Dict[Any, Any] = {}
+        for start in range(0, len(unique_ids), PREFETCH_CHUNK_SIZE):
+            chunk = unique_ids[start : start + PREFETCH_CHUNK_SIZE]
+            result = await session.execute(select(self.model).where(column.in_(chunk)))
+            for item in result.scalars():
+                found[getattr(item, id_field)] = item
+        return found
+
     async def bulk_create(self, items: List[Dict[str, Any]]) -> BulkOperationResult:
         """Create multiple items
 
@@ -108,6 +129,11 @@ class BulkOperationAdapter:
         result = BulkOperationResult()
 
         async with self.session_factory() as session:
+            # One query for all targets instead of a session.get per row
+            items = await self._prefetch(
+                session, [data[id_field] for data in updates if id_field in data], id_field
+            )
+
             for idx, update_data in enumerate(updates):
                 try:
                     if id_field not in update_data:
@@ -117,7 +143,7 @@ class BulkOperationAdapter:
                     update_dict = {k: v for k, v in update_data.items() if k != id_field}
 
                     # Get the item
-                    item = await session.get(self.model, item_id)
+                    item = items.get(item_id)
                     if item is None:
                         raise ValueError(f"Item with {id_field}={item_id} not found")
 
@@ -167,9 +193,11 @@ class BulkOperationAdapter:
         result = BulkOperationResult()
 
         async with self.session_factory() as session:
+            items = await self._prefetch(session, ids, id_field)
+
             for idx, item_id in enumerate(ids):
                 try:
-                    item = await session.get(self.model, item_id)
+                    item = items.pop(item_id, None)
                     if item is None:
                         raise ValueError(f"Item with {id_field}={item_id} not found")
 
@@ -2,11 +2,33 @@
 
 from __future__ import annotations
 
-import asyncio
-import hashlib
-import json
 from datetime import datetime, timedelta
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from .cache_core import LRUTTLCache
+from .cache_key_generator import make_cache_key
+from .cache_tags import TagIndex
+from .invalidation_bus import InvalidationBus
+
+
+class _NotFound:
+    """Tombstone cached for ids that do not exist
+
+    Lets a cache tell "known to be missing" apart from "not cached", which
+    both read as None otherwise.
+    """
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "NOT_FOUND"
+
+    def __reduce__(self) -> str:
+        # Unpickles as the module singleton, so identity checks keep working
+        return "NOT_FOUND"
+
+
+NOT_FOUND = _NotFound()
 
 
 class CacheEntry:
@@ -29,19 +51,64 @@ class CacheEntry:
 
 
 class QueryCache:
-    """Simple query result cache with TTL support"""
+    """Query result cache with LRU eviction and TTL support
+
+    Backed by :class:`LRUTTLCache`, so get, set and eviction are O(1). No lock
+    is taken: none of the methods await, so each call is atomic on the event
+    loop.
+
+    Entries can be registered under tags (see :mod:`.cache_tags`) and dropped
+    together with ``invalidate_by_tags``.
+
+    With ``max_bytes`` the cache is bounded by the estimated size of its
+    values as well as by their number.
+
+    With an ``invalidation_bus``, deletes, tag invalidations and clears are
+    sent to the caches of other workers, and theirs are applied here.
+    """
 
-    def __init__(self, max_size: int = 1000, default_ttl: int = 300):
+    def __init__(
+        self,
+        max_size: int = 1000,
+        default_ttl: int = 300,
+        stale_ttl: int = 0,
+        max_bytes: Optional[int] = None,
+        eviction: str = "lru",
+        invalidation_bus: Optional[InvalidationBus] = None,
+    ):
         """Initialize query cache
 
         Args:
             max_size: Maximum number of cached entries
             default_ttl: Default time to live in seconds
+            stale_ttl: Seconds expired entries stay readable via ``get_stale``
+            max_bytes: Maximum estimated size of all values in bytes
+            eviction: ``"lru"``, size-aware ``"gdsf"`` or scan-resistant ``"tinylfu"``
+            invalidation_bus: Bus shared with the other workers' caches
         """
-        self._cache: Dict[str, CacheEntry] = {}
         self._max_size = max_size
         self._default_ttl = default_ttl
-        self._lock = asyncio.Lock()
+        self._tags = TagIndex()
+        self._store = LRUTTLCache(
+            max_size=max_size,
+            default_ttl=default_ttl,
+            on_evict=self._on_evict,
+            stale_ttl=stale_ttl,
+            max_bytes=max_bytes,
+            eviction=eviction,
+        )
+        self.invalidation_bus = invalidation_bus
+        if invalidation_bus is not None:
+            invalidation_bus.subscribe(self)
+
+    @property
+    def total_bytes(self) -> int:
+        """Estimated size of all values; 0 unless sizes are tracked"""
+        return self._store.total_bytes
+
+    def _on_evict(self, key: str, value: Any) -> None:
+        """Drop tags of entries removed by eviction or expiry"""
+        self._tags.discard(key)
 
     def _generate_key(self, prefix: str, **kwargs) -> str:
         """Generate cache key from parameters
@@ -53,10 +120,7 @@ class QueryCache:
         Returns:
             Cache key
         """
-        # Sort kwargs for consistent key generation
-        sorted_items = sorted(kwargs.items())
-        key_str = f"{prefix}:{json.dumps(sorted_items, sort_keys=True, default=str)}"
-        return hashlib.md5(key_str.encode()).hexdigest()
+        return make_cache_key(prefix, kwargs)
 
     async def get(self, key: str) -> Optional[Any]:
         """Get value from cache
@@ -67,32 +131,39 @@ class QueryCache:
         Returns:
             Cached value or None if not found/expired
         """
-        async with self._lock:
-            if key not in self._cache:
-                return None
+        return self._store.get(key)
 
-            entry = self._cache[key]
-            if entry.is_expired():
-                del self._cache[key]
-                return None
+    def get_stale(self, key: str) -> Optional[Any]:
+        """Get value even if it expired less than ``stale_ttl`` seconds ago
 
-            return entry.value
+        Args:
+            key: Cache key
 
-    async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
-        """Set value in cache
+        Returns:
+            Cached value or None
+        """
+        return self._store.get_stale(key)
+
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[int] = None,
+        tags: Optional[Iterable[str]] = None,
+    ) -> None:
+        """Set value in cache, evicting the least recently used entry if full
 
         Args:
             key: Cache key
             value: Value to cache
             ttl: Time to live in seconds (uses default if None)
+            tags: Tags to register the entry under, replacing previous ones
         """
-        async with self._lock:
-            # Evict oldest entry if cache is full
-            if len(self._cache) >= self._max_size:
-                oldest_key = min(self._cache.keys(), key=lambda k: self._cache[k].created_at)
-                del self._cache[oldest_key]
-
-            self._cache[key] = CacheEntry(value, ttl or self._default_ttl)
+        stored = self._store.set(key, value, self._default_ttl if ttl is None else ttl)
+        if stored and tags:
+            self._tags.add(key, tags)
+        else:
+            self._tags.discard(key)
 
     async def delete(self, key: str) -> None:
         """Delete value from cache
@@ -100,14 +171,40 @@ class QueryCache:
         Args:
             key: Cache key
         """
-        async with self._lock:
-            if key in self._cache:
-                del self._cache[key]
+        self._store.delete(key)
+        self._tags.discard(key)
+        if self.invalidation_bus is not None:
+            self.invalidation_bus.publish(keys=(key,))
 
     async def clear(self) -> None:
         """Clear all cache entries"""
-        async with self._lock:
-            self._cache.clear()
+        self._store.clear()
+        self._tags.clear()
+        if self.invalidation_bus is not None:
+            self.invalidation_bus.publish(clear=True)
+
+    async def invalidate_by_tags(self, tags: Iterable[str]) -> int:
+        """Delete every entry registered under any of the tags
+
+        Args:
+            tags: Tags to invalidate
+
+        Returns:
+            Number of entries removed
+        """
+        tags = list(tags)
+        removed = 0
+        for key in self._tags.keys_for(tags):
+            self._tags.discard(key)
+            if self._store.delete(key):
+                removed += 1
+        if self.invalidation_bus is not None:
+            self.invalidation_bus.publish(tags=tags)
+        return removed
+
+    def get_tags(self, key: str) -> Set[str]:
+        """Get the tags an entry is registered under"""
+        return self._tags.tags_for(key)
 
     async def cleanup_expired(self) -> int:
         """Remove expired entries from cache
@@ -115,11 +212,11 @@ class QueryCache:
         Returns:
             Number of entries removed
         """
-        async with self._lock:
-            expired_keys = [key for key, entry in self._cache.items() if entry.is_expired()]
-            for key in expired_keys:
-                del self._cache[key]
-            return len(expired_keys)
+        return self._store.purge_expired()
+
+    def keys(self) -> List[str]:
+        """Get cached keys, least recently used first"""
+        return self._store.keys()
 
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics
@@ -127,11 +224,14 @@ class QueryCache:
         Returns:
             Cache statistics
         """
+        size = len(self._store)
         return {
-            "size": len(self._cache),
+            "size": size,
             "max_size": self._max_size,
-            "usage_percent": (len(self._cache) / self._max_size) * 100,
+            "usage_percent": (size / self._max_size) * 100,
             "default_ttl": self._default_ttl,
+            "bytes": self._store.stats()["bytes"],
+            "max_bytes": self._store.max_bytes,
         }
 
 
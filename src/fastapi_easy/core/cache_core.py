@@ -0,0 +1,422 @@
+"""O(1) LRU cache core with TTL expiry and optional byte budget"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import sys
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, Tuple
+
+from .cache_eviction import WTinyLFU
+
+_MISSING = object()
+
+# Elements sampled per container by estimate_size
+_SAMPLE_SIZE = 8
+
+_SCALARS = (str, int, float, bool, type(None))
+
+EVICTION_POLICIES = ("lru", "gdsf", "tinylfu")
+
+
+def estimate_size(value: Any, depth: int = 3) -> int:
+    """Approximate the memory footprint of a value in bytes
+
+    Bytes and objects exposing an integer ``nbytes`` are measured exactly.
+    Other values are walked with ``sys.getsizeof``; each container samples
+    at most eight elements and scales their size by its length, so the
+    cost is bounded regardless of how large the value is. Attributes whose
+    name starts with an underscore (e.g. ORM instance state) are skipped.
+
+    Args:
+        value: Value to measure
+        depth: Container levels to descend into
+
+    Returns:
+        Estimated size in bytes
+    """
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    nbytes = getattr(value, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+
+    size = sys.getsizeof(value)
+    if depth <= 0 or isinstance(value, _SCALARS):
+        return size
+
+    if isinstance(value, dict):
+        children = [item for pair in itertools.islice(value.items(), _SAMPLE_SIZE) for item in pair]
+        count = 2 * len(value)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        children = list(itertools.islice(value, _SAMPLE_SIZE))
+        count = len(value)
+    else:
+        attrs = getattr(value, "__dict__", None)
+        if not isinstance(attrs, dict):
+            return size
+        # The instance dict is part of the object, not a nesting level
+        owned = [item for name, item in attrs.items() if not name.startswith("_")]
+        sample = owned[:_SAMPLE_SIZE]
+        return size + sys.getsizeof(attrs) + _sampled_size(sample, len(owned), depth - 1)
+
+    return size + _sampled_size(children, count, depth - 1)
+
+
+def _sampled_size(sample: List[Any], count: int, depth: int) -> int:
+    if not sample:
+        return 0
+    total = sum(estimate_size(item, depth) for item in sample)
+    return total * count // len(sample)
+
+
+class LRUTTLCache:
+    """Bounded LRU map whose entries expire after a TTL
+
+    Entries live in an ``OrderedDict`` kept in recency order, so lookups,
+    inserts and evicting the least recently used entry are all O(1). Expiry
+    times go on a min-heap; expired entries are dropped lazily when read and
+    in bulk by ``purge_expired``, which pops only the heap entries that are
+    due instead of scanning the whole map.
+
+    With ``stale_ttl``, expired entries are kept for that many more seconds.
+    ``get`` no longer returns them, but ``get_stale`` does, so callers can
+    serve a stale value while they refresh it.
+
+    With ``max_bytes``, entries are sized by ``sizeof`` (``estimate_size`` by
+    default) and evicted until the total fits the budget; a value larger
+    than the whole budget is not stored. The ``"gdsf"`` policy (Greedy-Dual
+    Size Frequency) evicts the entry with the lowest
+    ``inflation + hits / size`` instead of the least recently used one, so
+    large, rarely read results go first. Its priorities live on a heap, which
+    makes reads and evictions O(log n).
+
+    The ``"tinylfu"`` policy (W-TinyLFU) admits a new entry into the main
+    area only if it is requested more often than the entry it would
+    displace, using a frequency sketch fed by every ``get``. One-off keys,
+    such as a full-table scan, then pass through a small window without
+    evicting the hot set.
+
+    The class takes no locks. Every method runs to completion without
+    awaiting, so it is safe to share between coroutines on one event loop,
+    but not between threads.
+    """
+
+    __slots__ = (
+        "max_size",
+        "max_bytes",
+        "default_ttl",
+        "stale_ttl",
+        "on_evict",
+        "eviction",
+        "sizeof",
+        "total_bytes",
+        "_data",
+        "_expiry",
+        "_counter",
+        "_clock",
+        "_hits",
+        "_priority",
+        "_queue",
+        "_inflation",
+        "_admission",
+    )
+
+    def __init__(
+        self,
+        max_size: int = 1000,
+        default_ttl: Optional[float] = 300,
+        on_evict: Optional[Callable[[Hashable, Any], None]] = None,
+        clock: Callable[[], float] = time.monotonic,
+        stale_ttl: float = 0,
+        max_bytes: Optional[int] = None,
+        eviction: str = "lru",
+        sizeof: Optional[Callable[[Any], int]] = None,
+    ):
+        """Initialize cache
+
+        Args:
+            max_size: Maximum number of entries
+            default_ttl: Default time to live in seconds (None never expires)
+            on_evict: Called with ``(key, value)`` for entries removed by
+                eviction or expiry, but not by ``delete``/``clear``
+            clock: Monotonic time source in seconds
+            stale_ttl: Seconds expired entries stay readable via ``get_stale``
+            max_bytes: Maximum total size of the values (None for no budget)
+            eviction: ``"lru"``, ``"gdsf"`` or ``"tinylfu"``
+            sizeof: Size function for values; defaults to ``estimate_size``
+                when a byte budget or GDSF is used, otherwise sizes are not
+                tracked
+        """
+        if max_size <= 0:
+            raise ValueError("max_size must be positive")
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        if eviction not in EVICTION_POLICIES:
+            raise ValueError(f"eviction must be one of {EVICTION_POLICIES}")
+        if sizeof is None and (max_bytes is not None or eviction == "gdsf"):
+            sizeof = estimate_size
+
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.stale_ttl = stale_ttl
+        self.on_evict = on_evict
+        self.eviction = eviction
+        self.sizeof = sizeof
+        self.total_bytes = 0
+        # key -> (value, expires_at, size); expires_at is None for entries without TTL
+        self._data: OrderedDict[Hashable, Tuple[Any, Optional[float], int]] = OrderedDict()
+        self._expiry: List[Tuple[float, int, Hashable]] = []
+        # Tie-breaker so heap items never compare keys
+        self._counter = itertools.count()
+        self._clock = clock
+        # GDSF state: hit counts, current priorities and a lazily pruned heap
+        self._hits: Dict[Hashable, int] = {}
+        self._priority: Dict[Hashable, float] = {}
+        self._queue: List[Tuple[float, int, Hashable]] = []
+        self._inflation = 0.0
+        # W-TinyLFU state: segments and frequency sketch over the keys
+        self._admission = WTinyLFU(max_size) if eviction == "tinylfu" else None
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.peek(key, _MISSING) is not _MISSING
+
+    def keys(self) -> List[Hashable]:
+        """Snapshot of keys from least to most recently used"""
+        return list(self._data)
+
+    def items(self) -> Iterator[Tuple[Hashable, Any]]:
+        """Iterate over ``(key, value)`` pairs, including not yet purged ones"""
+        for key, entry in list(self._data.items()):
+            yield key, entry[0]
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get a value and mark it as most recently used
+
+        Args:
+            key: Cache key
+            default: Returned when the key is missing or expired
+
+        Returns:
+            Cached value or ``default``
+        """
+        admission = self._admission
+        if admission is not None:
+            # Misses count too: they are what earns a new key admission
+            admission.record(key)
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        expires_at = entry[1]
+        if expires_at is not None and expires_at <= self._clock():
+            self._expire_if_past_grace(key, entry)
+            return default
+        self._data.move_to_end(key)
+        if self.eviction == "gdsf":
+            self._hits[key] += 1
+            self._prioritize(key, entry[2])
+        elif admission is not None:
+            admission.touch(key)
+        return entry[0]
+
+    def get_stale(self, key: Hashable, default: Any = None) -> Any:
+        """Get a value even if it expired less than ``stale_ttl`` seconds ago
+
+        Recency is not changed.
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        expires_at = entry[1]
+        if expires_at is not None and expires_at + self.stale_ttl <= self._clock():
+            self._expire(key)
+            return default
+        return entry[0]
+
+    def peek(self, key: Hashable, default: Any = None) -> Any:
+        """Get a value without changing its recency"""
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        expires_at = entry[1]
+        if expires_at is not None and expires_at <= self._clock():
+            self._expire_if_past_grace(key, entry)
+            return default
+        return entry[0]
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = _MISSING) -> bool:
+        """Insert or replace a value, evicting entries until it fits
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Time to live in seconds; defaults to ``default_ttl``, and
+                None stores the entry without expiry
+
+        Returns:
+            False if the value was not stored: it exceeds ``max_bytes``, or
+            TinyLFU admission rejected the key (any previous value is gone too)
+        """
+        if ttl is _MISSING:
+            ttl = self.default_ttl
+        size = self.sizeof(value) if self.sizeof is not None else 0
+        data = self._data
+        old = data.pop(key, None)
+        if old is not None:
+            self.total_bytes -= old[2]
+
+        max_bytes = self.max_bytes
+        if max_bytes is not None:
+            if size > max_bytes:
+                # Would evict everything and still not fit
+                self._forget(key)
+                return False
+            while data and self.total_bytes + size > max_bytes:
+                self._evict()
+        admission = self._admission
+        if admission is None:
+            while len(data) >= self.max_size:
+                self._evict()
+
+        expires_at = None if ttl is None else self._clock() + ttl
+        data[key] = (value, expires_at, size)
+        self.total_bytes += size
+        if self.eviction == "gdsf":
+            self._hits[key] = self._hits.get(key, 0) + 1
+            self._prioritize(key, size)
+        elif admission is not None:
+            # The policy keeps at most max_size keys and names the ones to drop,
+            # which may be an older newcomer that lost admission
+            for victim in admission.admit(key):
+                if victim in data:
+                    self._expire(victim)
+            if key not in data:
+                return False
+        if expires_at is not None:
+            heapq.heappush(self._expiry, (expires_at, next(self._counter), key))
+            if len(self._expiry) > 2 * len(data) + 64:
+                self._compact()
+        return True
+
+    def delete(self, key: Hashable) -> bool:
+        """Remove a key
+
+        Returns:
+            True if the key was present
+        """
+        entry = self._data.pop(key, None)
+        if entry is None:
+            return False
+        self.total_bytes -= entry[2]
+        self._forget(key)
+        return True
+
+    def clear(self) -> None:
+        """Remove all entries"""
+        self._data.clear()
+        self._expiry.clear()
+        self._hits.clear()
+        self._priority.clear()
+        self._queue.clear()
+        self._inflation = 0.0
+        self.total_bytes = 0
+        if self._admission is not None:
+            self._admission.clear()
+
+    def purge_expired(self) -> int:
+        """Remove every entry that expired more than ``stale_ttl`` seconds ago
+
+        Pops only the due part of the expiry heap, so the cost is
+        proportional to the number of expired (or overwritten) entries.
+
+        Returns:
+            Number of entries removed
+        """
+        now = self._clock() - self.stale_ttl
+        heap = self._expiry
+        data = self._data
+        removed = 0
+        while heap and heap[0][0] <= now:
+            expires_at, _, key = heapq.heappop(heap)
+            entry = data.get(key)
+            # Skip heap items left behind by an overwrite or delete
+            if entry is not None and entry[1] == expires_at:
+                self._expire(key)
+                removed += 1
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        """Get size information"""
+        return {
+            "size": len(self._data),
+            "max_size": self.max_size,
+            "bytes": self.total_bytes if self.sizeof is not None else None,
+            "max_bytes": self.max_bytes,
+            "eviction": self.eviction,
+        }
+
+    def _expire_if_past_grace(self, key: Hashable, entry: Tuple[Any, Optional[float], int]) -> None:
+        if entry[1] + self.stale_ttl <= self._clock():
+            self._expire(key)
+
+    def _expire(self, key: Hashable) -> None:
+        value, _, size = self._data.pop(key)
+        self.total_bytes -= size
+        self._forget(key)
+        if self.on_evict is not None:
+            self.on_evict(key, value)
+
+    def _evict(self) -> None:
+        """Remove one entry chosen by the eviction policy"""
+        if self.eviction == "gdsf":
+            queue = self._queue
+            while True:
+                priority, _, key = heapq.heappop(queue)
+                # Skip heap items superseded by a later hit, overwrite or delete
+                if self._priority.get(key) == priority and key in self._data:
+                    break
+            self._inflation = priority
+            self._expire(key)
+            return
+        if self._admission is not None:
+            key = self._admission.victim()
+            if key in self._data:
+                self._expire(key)
+                return
+
+        # Least recently used
+        self._expire(next(iter(self._data)))
+
+    def _prioritize(self, key: Hashable, size: int) -> None:
+        priority = self._inflation + self._hits[key] / max(size, 1)
+        self._priority[key] = priority
+        heapq.heappush(self._queue, (priority, next(self._counter), key))
+        if len(self._queue) > 2 * len(self._data) + 64:
+            self._queue = [
+                (self._priority[k], next(self._counter), k)
+                for k in self._data
+                if k in self._priority
+            ]
+            heapq.heapify(self._queue)
+
+    def _forget(self, key: Hashable) -> None:
+        if self._admission is not None:
+            self._admission.remove(key)
+        if self._hits:
+            self._hits.pop(key, None)
+            self._priority.pop(key, None)
+
+    def _compact(self) -> None:
+        """Rebuild the expiry heap from live entries, dropping stale items"""
+        self._expiry = [
+            (entry[1], next(self._counter), key)
+            for key, entry in self._data.items()
+            if entry[1] is not None
+        ]
+        heapq.heapify(self._expiry)
@@ -8,7 +8,8 @@ from __future__ import annotations
 
 import logging
 import time
-from typing import Any, Dict
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, List, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -80,6 +81,8 @@ class LRUEvictionStrategy(EvictionStrategy):
         Args:
             key: Cache key
         """
+        # Re-insert so dict order breaks timestamp ties by recency
+        self.access_times.pop(key, None)
         self.access_times[key] = time.time()
 
     def remove_key(self, key: str) -> None:
@@ -213,14 +216,264 @@ class FIFOEvictionStrategy(EvictionStrategy):
         self.insertion_times.pop(key, None)
 
 
+class CountMinSketch:
+    """Approximate per-key frequency counter in fixed memory
+
+    Each of ``depth`` rows maps a key to one 4-bit counter; the estimate is
+    the smallest of the key's counters. After ``sample_size`` increments all
+    counters are halved, so old popularity fades.
+    """
+
+    # Odd 64-bit multipliers, one per row, to derive independent indexes
+    _SEEDS = (0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F, 0x165667B19E3779F9, 0x27D4EB2F165667C5)
+    _MAX_COUNT = 15
+
+    def __init__(self, capacity: int, sample_size: Optional[int] = None):
+        """Initialize sketch
+
+        Args:
+            capacity: Number of keys the cache holds; each row gets about
+                four counters per key, and at least 256, to keep collisions rare
+            sample_size: Increments between agings (default: 10 * capacity)
+        """
+        width = 1 << max(8, (4 * capacity - 1).bit_length())
+        self._mask = width - 1
+        self._rows = [bytearray(width) for _ in self._SEEDS]
+        self.sample_size = sample_size or 10 * capacity
+        self._additions = 0
+
+    def _indexes(self, key: Hashable) -> List[int]:
+        h = hash(key)
+        mask = self._mask
+        return [((h * seed) >> 20) & mask for seed in self._SEEDS]
+
+    def increment(self, key: Hashable) -> None:
+        """Count one occurrence of a key
+
+        Only the key's smallest counters are raised (conservative update),
+        which keeps collisions from inflating other keys' estimates.
+        """
+        cells = list(zip(self._rows, self._indexes(key)))
+        low = min(row[index] for row, index in cells)
+        if low < self._MAX_COUNT:
+            for row, index in cells:
+                if row[index] == low:
+                    row[index] += 1
+        self._additions += 1
+        if self._additions >= self.sample_size:
+            self._age()
+
+    def estimate(self, key: Hashable) -> int:
+        """Estimated number of recent occurrences of a key"""
+        return min(row[index] for row, index in zip(self._rows, self._indexes(key)))
+
+    def _age(self) -> None:
+        """Halve every counter"""
+        for row in self._rows:
+            row[:] = bytes(count >> 1 for count in row)
+        self._additions //= 2
+
+    def clear(self) -> None:
+        """Reset all counters"""
+        for row in self._rows:
+            row[:] = bytes(len(row))
+        self._additions = 0
+
+
+class WTinyLFU:
+    """W-TinyLFU admission and eviction bookkeeping for up to ``capacity`` keys
+
+    New keys enter a small LRU window. A key leaving the window is admitted
+    to the main area only if the frequency sketch rates it higher than the
+    main area's eviction victim; otherwise the newcomer itself is evicted.
+    The main area is a segmented LRU: keys start in probation and move to
+    the protected segment when read again. A scan of one-off keys therefore
+    churns the window instead of flushing the hot set.
+
+    The class only tracks keys; callers store the values and remove the keys
+    this policy returns.
+    """
+
+    def __init__(self, capacity: int, window_ratio: float = 0.01, protected_ratio: float = 0.8):
+        """Initialize policy
+
+        Args:
+            capacity: Maximum number of tracked keys
+            window_ratio: Share of the capacity used by the admission window
+            protected_ratio: Share of the main area used by the protected segment
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self.window_capacity = max(1, int(capacity * window_ratio))
+        self.main_capacity = capacity - self.window_capacity
+        self.protected_capacity = int(self.main_capacity * protected_ratio)
+        self.sketch = CountMinSketch(capacity)
+        self._window: OrderedDict[Hashable, None] = OrderedDict()
+        self._probation: OrderedDict[Hashable, None] = OrderedDict()
+        self._protected: OrderedDict[Hashable, None] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._window) + len(self._probation) + len(self._protected)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._window or key in self._probation or key in self._protected
+
+    def record(self, key: Hashable) -> None:
+        """Count a lookup of a key, whether it hit or missed"""
+        self.sketch.increment(key)
+
+    def touch(self, key: Hashable) -> None:
+        """Update recency of a tracked key after a hit"""
+        if key in self._window:
+            self._window.move_to_end(key)
+        elif key in self._protected:
+            self._protected.move_to_end(key)
+        elif key in self._probation:
+            # A second hit promotes the key; the protected segment's LRU
+            # key is demoted to probation to make room
+            del self._probation[key]
+            self._protected[key] = None
+            if len(self._protected) > self.protected_capacity:
+                demoted, _ = self._protected.popitem(last=False)
+                self._probation[demoted] = None
+
+    def admit(self, key: Hashable) -> List[Hashable]:
+        """Track a newly stored key
+
+        Args:
+            key: Key just inserted into the cache
+
+        Returns:
+            Keys the cache must evict to stay within capacity
+        """
+        if key in self:
+            self.touch(key)
+            return []
+
+        self._window[key] = None
+        if len(self._window) <= self.window_capacity:
+            return []
+
+        candidate, _ = self._window.popitem(last=False)
+        if len(self._probation) + len(self._protected) < self.main_capacity:
+            self._probation[candidate] = None
+            return []
+
+        segment = self._probation or self._protected
+        if not segment:
+            return [candidate]
+        victim = next(iter(segment))
+        if self.sketch.estimate(candidate) > self.sketch.estimate(victim):
+            del segment[victim]
+            self._probation[candidate] = None
+            return [victim]
+        return [candidate]
+
+    def victim(self) -> Optional[Hashable]:
+        """Key to evict when the cache must shrink for another reason"""
+        for segment in (self._probation, self._window, self._protected):
+            if segment:
+                return next(iter(segment))
+        return None
+
+    def remove(self, key: Hashable) -> None:
+        """Stop tracking a key"""
+        self._window.pop(key, None)
+        self._probation.pop(key, None)
+        self._protected.pop(key, None)
+
+    def clear(self) -> None:
+        """Stop tracking all keys and reset frequencies"""
+        self._window.clear()
+        self._probation.clear()
+        self._protected.clear()
+        self.sketch.clear()
+
+
+class TinyLFUEvictionStrategy(EvictionStrategy):
+    """W-TinyLFU eviction strategy
+
+    Admission is decided when a key is inserted; rejected newcomers and
+    displaced victims are removed on the next ``evict`` call. Unlike the
+    other strategies it never sorts the tracked keys.
+    """
+
+    def __init__(self, max_size: int = 1000):
+        """Initialize W-TinyLFU strategy
+
+        Args:
+            max_size: Maximum cache size the policy is sized for
+        """
+        # One slot stays free for the key being inserted; admission then
+        # decides which key gives it back before the next insert
+        self.policy = WTinyLFU(max(1, max_size - 1))
+        self.pending: List[Hashable] = []
+
+    async def evict(self, cache_dict: Dict[str, Any], max_size: int) -> int:
+        """Evict rejected and displaced items
+
+        Args:
+            cache_dict: Cache dictionary
+            max_size: Maximum cache size
+
+        Returns:
+            Number of items evicted
+        """
+        evicted = 0
+        for key in self.pending:
+            if cache_dict.pop(key, None) is not None:
+                evicted += 1
+        self.pending.clear()
+
+        # Make room for one insert, e.g. when the dict holds untracked keys
+        while len(cache_dict) >= max_size:
+            key = self.policy.victim()
+            if key is None:
+                key = next(iter(cache_dict))
+            self.policy.remove(key)
+            if cache_dict.pop(key, None) is not None:
+                evicted += 1
+
+        logger.debug(f"TinyLFU eviction: evicted {evicted} items")
+        return evicted
+
+    def record_access(self, key: str) -> None:
+        """Record a hit
+
+        Args:
+            key: Cache key
+        """
+        self.policy.record(key)
+        self.policy.touch(key)
+
+    def record_insertion(self, key: str) -> None:
+        """Record an insertion and queue the keys it displaces
+
+        Args:
+            key: Cache key
+        """
+        self.policy.record(key)
+        self.pending.extend(self.policy.admit(key))
+
+    def remove_key(self, key: str) -> None:
+        """Remove key from tracking
+
+        Args:
+            key: Cache key
+        """
+        self.policy.remove(key)
+
+
 class CacheEvictionManager:
     """Manage cache eviction with configurable strategies"""
 
-    def __init__(self, strategy: str = "lru"):
+    def __init__(self, strategy: str = "lru", max_size: int = 1000):
         """Initialize eviction manager
 
         Args:
-            strategy: Eviction strategy ('lru', 'lfu', 'fifo')
+            strategy: Eviction strategy ('lru', 'lfu', 'fifo', 'tinylfu')
+            max_size: Cache size the 'tinylfu' policy is sized for
         """
         self.strategy_name = strategy
 
@@ -230,6 +483,8 @@ class CacheEvictionManager:
             self.strategy = LFUEvictionStrategy()
         elif strategy == "fifo":
             self.strategy = FIFOEvictionStrategy()
+        elif strategy == "tinylfu":
+            self.strategy = TinyLFUEvictionStrategy(max_size)
         else:
             raise ValueError(f"Unknown eviction strategy: {strategy}")
 
@@ -295,3 +550,42 @@ class CacheEvictionManager:
             Statistics dictionary
         """
         return {"strategy": self.strategy_name, **self.eviction_stats}
+
+
+EVICTION_STRATEGIES = ("lru", "lfu", "fifo", "tinylfu")
+
+
+async def replay_trace(keys: Iterable[Hashable], strategy: str, max_size: int) -> Dict[str, Any]:
+    """Replay a recorded key sequence through an eviction strategy
+
+    Every key is looked up in a cache of ``max_size`` entries and inserted on
+    a miss, as a read-through cache would.
+
+    Args:
+        keys: Sequence of requested keys, e.g. read from an access log
+        strategy: Any strategy accepted by ``CacheEvictionManager``
+        max_size: Cache size
+
+    Returns:
+        Hits, misses and hit rate (percent)
+    """
+    manager = CacheEvictionManager(strategy, max_size=max_size)
+    cache: Dict[Hashable, bool] = {}
+    hits = misses = 0
+    for key in keys:
+        if key in cache:
+            hits += 1
+            manager.record_access(key)
+            continue
+        misses += 1
+        await manager.check_and_evict(cache, max_size)
+        cache[key] = True
+        manager.record_insertion(key)
+
+    total = hits + misses
+    return {
+        "strategy": strategy,
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": hits / total * 100 if total else 0.0,
+    }
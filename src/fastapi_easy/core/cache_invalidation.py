@@ -8,7 +8,9 @@ from __future__ import annotations
 
 import logging
 from enum import Enum
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, Optional
+
+from .cache_tags import field_tag, item_tag
 
 logger = logging.getLogger(__name__)
 
@@ -50,16 +52,46 @@ class CacheInvalidationManager:
         else:
             return await self._invalidate_selective(cache, operation)
 
-    async def invalidate_item_cache(self, cache, item_id: Any) -> int:
+    async def invalidate_tags(self, cache, tags: Iterable[str]) -> int:
+        """Invalidate every entry registered under any of the tags
+
+        Uses the cache's reverse tag index, so the cost is proportional to the
+        number of affected keys rather than the size of the cache.
+
+        Args:
+            cache: Cache instance supporting ``invalidate_by_tags``
+            tags: Tags to invalidate (see :mod:`.cache_tags`)
+
+        Returns:
+            Number of keys invalidated
+        """
+        tags = set(tags)
+        try:
+            deleted_count = await cache.invalidate_by_tags(tags)
+            self._log_invalidation("tags", ",".join(sorted(tags)), deleted_count)
+            return deleted_count
+        except Exception as e:
+            logger.error(f"Failed to invalidate by tags: {e!s}")
+            return 0
+
+    async def invalidate_item_cache(self, cache, item_id: Any, model: Optional[str] = None) -> int:
         """Invalidate single item cache
 
+        With ``model``, only entries tagged with the item are invalidated
+        through the tag index. Without it, keys containing the id are removed
+        by scanning every key, which also matches other ids (1 matches 10).
+
         Args:
             cache: Cache instance
             item_id: Item ID
+            model: Model name the entries were tagged with
 
         Returns:
             Number of keys invalidated
         """
+        if model is not None:
+            return await self.invalidate_tags(cache, {item_tag(model, item_id)})
+
         try:
             deleted_count = 0
 
@@ -88,16 +120,26 @@ class CacheInvalidationManager:
             logger.error(f"Failed to invalidate item cache: {e!s}")
             return 0
 
-    async def invalidate_by_filter(self, cache, filter_key: str) -> int:
+    async def invalidate_by_filter(
+        self, cache, filter_key: str, model: Optional[str] = None
+    ) -> int:
         """Invalidate caches related to specific filter
 
+        With ``model``, ``filter_key`` is a field name and only entries that
+        filter or sort on it are invalidated through the tag index. Without
+        it, keys containing ``filter_key`` are removed by scanning every key.
+
         Args:
             cache: Cache instance
             filter_key: Filter key to invalidate
+            model: Model name the entries were tagged with
 
         Returns:
             Number of keys invalidated
         """
+        if model is not None:
+            return await self.invalidate_tags(cache, {field_tag(model, filter_key)})
+
         try:
             deleted_count = 0
 
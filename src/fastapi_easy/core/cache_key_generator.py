@@ -1,36 +1,110 @@
 """Cache key generation with collision prevention
 
-This module provides secure cache key generation using JSON serialization
-and MD5 hashing to prevent key collisions.
+Parameters are canonicalized into a hashable tuple (dicts and sets sorted,
+values tagged with their type) and hashed with a 16-byte (128-bit) BLAKE2b
+digest. Digests are memoized on the tuple, so repeated parameter shapes skip
+the hashing entirely. Every cache class builds its keys here, so equal
+parameters give equal keys across caches and processes.
 """
 
 from __future__ import annotations
 
 import hashlib
-import json
 import logging
 from functools import lru_cache
-from typing import Any
+from typing import Any, Hashable, Mapping
 
 logger = logging.getLogger(__name__)
 
 
+_ATOMS = frozenset({str, int, type(None)})
+_EMPTY_DICT = ("dict",)
+
+
+def canonicalize(value: Any) -> Hashable:
+    """Hashable, order-independent form of a parameter value
+
+    Dicts and sets are sorted and sequences become tuples. Type tags keep
+    ``1``, ``1.0``, ``True`` and ``"1"`` apart; values of other types become
+    ``(type name, str(value))``.
+
+    Args:
+        value: Parameter value, e.g. a filters or sorts dict
+
+    Returns:
+        Nested tuple of builtins with a stable ``repr``
+    """
+    cls = type(value)
+    if cls in _ATOMS:
+        return value
+    if cls is dict:
+        if not value:
+            return _EMPTY_DICT
+        try:
+            keys = sorted(value)
+        except TypeError:
+            # Mixed key types
+            keys = sorted(value, key=repr)
+        atoms = _ATOMS
+        return ("dict",) + tuple(
+            [
+                (
+                    key if type(key) in atoms else canonicalize(key),
+                    item if type(item := value[key]) in atoms else canonicalize(item),
+                )
+                for key in keys
+            ]
+        )
+    if cls is list or cls is tuple:
+        atoms = _ATOMS
+        return ("list",) + tuple(
+            [item if type(item) in atoms else canonicalize(item) for item in value]
+        )
+    if cls is bool or cls is float:
+        return (cls.__name__, value)
+    if isinstance(value, dict):
+        return canonicalize(dict(value))
+    if isinstance(value, (list, tuple)):
+        return canonicalize(list(value))
+    if isinstance(value, (set, frozenset)):
+        items = [canonicalize(item) for item in value]
+        try:
+            items.sort()
+        except TypeError:
+            items.sort(key=repr)
+        return ("set",) + tuple(items)
+    return (cls.__name__, str(value))
+
+
+@lru_cache(maxsize=10000)
+def _digest(operation: str, canonical: Hashable) -> str:
+    digest = hashlib.blake2b(repr(canonical).encode(), digest_size=16).hexdigest()
+    return f"{operation}:{digest}"
+
+
+def make_cache_key(operation: str, params: Mapping[str, Any]) -> str:
+    """Build the cache key of an operation and its parameters
+
+    Args:
+        operation: Operation name or key prefix (e.g. 'get_all')
+        params: Operation parameters
+
+    Returns:
+        ``"<operation>:<32 hex digits>"``
+    """
+    return _digest(operation, canonicalize(params))
+
+
 class CacheKeyGenerator:
     """Generate consistent cache keys without collisions
 
-    Uses LRU cache to avoid memory leaks from unlimited key caching.
+    Thin wrapper over :func:`make_cache_key`; digests are memoized in a
+    bounded LRU shared by all instances.
     """
 
-    def __init__(self):
-        """Initialize with LRU cache for key generation"""
-        self._generate_cached = lru_cache(maxsize=10000)(self._generate_impl)
-
     def generate(self, operation: str, **kwargs) -> str:
         """Generate a cache key from operation and parameters
 
-        Uses JSON serialization with sorted keys to ensure consistency,
-        then applies MD5 hashing for compact representation.
-
         Args:
             operation: Operation name (e.g., 'get_one', 'get_all')
             **kwargs: Operation parameters
@@ -44,41 +118,7 @@ class CacheKeyGenerator:
             >>> key2 = gen.generate('get_one', id=1)
             >>> assert key1 == key2
         """
-        # Convert kwargs to JSON string for hashability
-        # This handles nested dicts and lists
-        try:
-            params_json = json.dumps(kwargs, sort_keys=True, default=str)
-        except (TypeError, ValueError) as e:
-            # Use fallback serialization for non-serializable objects
-            logger.warning(f"Failed to serialize params: {e!s}, using fallback")
-            try:
-                params_json = json.dumps({"params": str(kwargs)}, sort_keys=True)
-            except Exception as fallback_error:
-                logger.error(f"Fallback serialization failed: {fallback_error!s}")
-                # Last resort: use string representation
-                params_json = json.dumps({"params": repr(kwargs)}, sort_keys=True)
-
-        return self._generate_cached(operation, params_json)
-
-    @staticmethod
-    def _generate_impl(operation: str, params_json: str) -> str:
-        """Internal implementation for cached key generation
-
-        Args:
-            operation: Operation name
-            params_json: Parameters as JSON string
-
-        Returns:
-            Cache key
-        """
-        # Build key string with operation and params
-        key_str = f"{operation}:{params_json}"
-
-        # Generate MD5 hash for compact key
-        key_hash = hashlib.md5(key_str.encode()).hexdigest()
-
-        # Return prefixed key for debugging
-        return f"{operation}:{key_hash}"
+        return make_cache_key(operation, kwargs)
 
     def generate_list_key(self, operation: str, **kwargs) -> str:
         """Generate cache key for list operations
@@ -119,10 +159,6 @@ class CacheKeyGenerator:
         return f"{operation}:*"
 
 
-# Singleton instance
-_generator = CacheKeyGenerator()
-
-
 def generate_cache_key(operation: str, **kwargs) -> str:
     """Generate cache key (convenience function)
 
@@ -133,4 +169,4 @@ def generate_cache_key(operation: str, **kwargs) -> str:
     Returns:
         Cache key
     """
-    return _generator.generate(operation, **kwargs)
+    return make_cache_key(operation, kwargs)
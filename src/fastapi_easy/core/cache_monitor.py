@@ -85,6 +85,20 @@ class CacheMonitor:
         self.metrics = CacheMetrics()
         self.hit_rate_threshold = hit_rate_threshold
         self.alerts: List[Dict[str, Any]] = []
+        self._tiers: Dict[str, Any] = {}
+
+    def track_bytes(self, tier: str, cache: Any) -> None:
+        """Report the bytes held by a cache tier in ``get_report``
+
+        Args:
+            tier: Tier name, e.g. "l1"
+            cache: Cache exposing a ``total_bytes`` attribute
+        """
+        self._tiers[tier] = cache
+
+    def get_bytes(self) -> Dict[str, int]:
+        """Current bytes held by each tracked tier"""
+        return {tier: cache.total_bytes for tier, cache in self._tiers.items()}
 
     def record_hit(self) -> None:
         """Record cache hit"""
@@ -127,6 +141,7 @@ class CacheMonitor:
         return {
             "metrics": self.metrics.get_report(),
             "alerts": self.alerts[-10:],  # Last 10 alerts
+            "bytes": self.get_bytes(),
             "status": (
                 "healthy" if self.metrics.get_hit_rate() >= self.hit_rate_threshold else "warning"
             ),
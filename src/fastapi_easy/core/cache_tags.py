@@ -0,0 +1,123 @@
+"""Cache tags and the reverse index used for invalidation
+
+Cached entries are registered under structured tags describing what they
+depend on. A write then invalidates exactly the keys registered under the
+tags it affects, instead of scanning every key:
+
+- ``list_tag(model)``: every list and count result for the model
+- ``item_tag(model, id)``: the single-item read of ``id`` and every list that
+  returned it
+- ``field_tag(model, field)``: every list or count that filters or sorts on
+  ``field``
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, Optional, Set
+
+
+def list_tag(model: str) -> str:
+    """Tag for list and count results of a model"""
+    return f"list:{model}"
+
+
+def item_tag(model: str, item_id: Any) -> str:
+    """Tag for results that contain one item of a model"""
+    return f"item:{model}:{item_id}"
+
+
+def field_tag(model: str, field: str) -> str:
+    """Tag for results that filter or sort on a field of a model"""
+    return f"field:{model}:{field}"
+
+
+def query_tags(
+    model: str,
+    filters: Optional[Dict[str, Any]] = None,
+    sorts: Optional[Dict[str, Any]] = None,
+    item_ids: Iterable[Any] = (),
+) -> Set[str]:
+    """Tags of a list or count result
+
+    The result depends on inserts and deletes of the model, on writes to the
+    fields it filters or sorts on, and on writes to the items it returned.
+
+    Args:
+        model: Model name
+        filters: Filter conditions, either ``{name: {"field": ...}}`` or
+            ``{"field__op": value}``
+        sorts: Sort conditions keyed by field name
+        item_ids: Primary keys of the returned items
+
+    Returns:
+        Set of tags
+    """
+    tags = {list_tag(model)}
+    for key, value in (filters or {}).items():
+        if isinstance(value, dict):
+            name = value.get("field", key)
+        else:
+            name = key.split("__")[0]
+        tags.add(field_tag(model, name))
+    tags.update(field_tag(model, name) for name in sorts or {})
+    tags.update(item_tag(model, item_id) for item_id in item_ids if item_id is not None)
+    return tags
+
+
+class TagIndex:
+    """Reverse index from tag to the cache keys registered under it
+
+    A forward index from key to tags is kept as well, so dropping a key
+    (on delete, eviction or expiry) only touches that key's own tags.
+    """
+
+    def __init__(self):
+        """Initialize empty index"""
+        self._keys_by_tag: Dict[str, Set[str]] = {}
+        self._tags_by_key: Dict[str, Set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._keys_by_tag)
+
+    def add(self, key: str, tags: Iterable[str]) -> None:
+        """Register a key under tags, replacing its previous tags
+
+        Args:
+            key: Cache key
+            tags: Tags the cached value depends on
+        """
+        self.discard(key)
+        tags = set(tags)
+        if not tags:
+            return
+        self._tags_by_key[key] = tags
+        for tag in tags:
+            self._keys_by_tag.setdefault(tag, set()).add(key)
+
+    def discard(self, key: str) -> None:
+        """Remove a key from all of its tags"""
+        tags = self._tags_by_key.pop(key, None)
+        if not tags:
+            return
+        for tag in tags:
+            keys = self._keys_by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_tag[tag]
+
+    def tags_for(self, key: str) -> Set[str]:
+        """Get the tags a key is registered under"""
+        return set(self._tags_by_key.get(key, ()))
+
+    def keys_for(self, tags: Iterable[str]) -> Set[str]:
+        """Get the keys registered under any of the tags"""
+        keys: Set[str] = set()
+        for tag in tags:
+            keys.update(self._keys_by_tag.get(tag, ()))
+        return keys
+
+    def clear(self) -> None:
+        """Remove all keys and tags"""
+        self._keys_by_tag.clear()
+        self._tags_by_key.clear()
@@ -31,6 +31,26 @@ class CRUDConfig:
     # Pagination configuration
     default_limit: int = 10
     max_limit: int = 100
+    pagination_mode: str = "offset"  # "offset" (skip/limit) or "cursor" (keyset)
+    with_total: bool = False  # Return the total count in the X-Total-Count header
+    estimate_total: bool = False  # Use planner statistics for unfiltered totals
+
+    # Relationship loading configuration
+    eager_load: Optional[List[str]] = None  # Relationships always loaded with the items
+    include_fields: Optional[List[str]] = None  # Relationships allowed in ?include=
+
+    # Export configuration
+    enable_export: bool = False  # Adds GET /export (NDJSON or CSV stream)
+    export_batch_size: int = 1000
+
+    # Response cache configuration
+    response_cache: bool = False  # Cache serialized read responses (reads without hooks)
+    response_cache_size: int = 1000
+    response_cache_ttl: int = 60
+    response_cache_negative_ttl: int = 5  # Seconds a 404 is remembered (0 disables)
+
+    # Bulk operation configuration (enable_bulk_operations adds /bulk routes)
+    max_bulk_items: int = 10000
 
     # Soft delete configuration
     deleted_at_field: str = "deleted_at"
@@ -60,11 +80,35 @@ class CRUDConfig:
         if self.default_limit > self.max_limit:
             raise ValueError("default_limit cannot be greater than max_limit")
 
+        if self.pagination_mode not in ("offset", "cursor"):
+            raise ValueError("pagination_mode must be 'offset' or 'cursor'")
+
+        if self.export_batch_size <= 0:
+            raise ValueError("export_batch_size must be greater than 0")
+
+        if self.response_cache_size <= 0:
+            raise ValueError("response_cache_size must be greater than 0")
+
+        if self.response_cache_ttl <= 0:
+            raise ValueError("response_cache_ttl must be greater than 0")
+
+        if self.response_cache_negative_ttl < 0:
+            raise ValueError("response_cache_negative_ttl must not be negative")
+
+        if self.max_bulk_items <= 0:
+            raise ValueError("max_bulk_items must be greater than 0")
+
         if self.filter_fields is not None and not isinstance(self.filter_fields, list):
             raise ValueError("filter_fields must be a list or None")
 
         if self.sort_fields is not None and not isinstance(self.sort_fields, list):
             raise ValueError("sort_fields must be a list or None")
 
+        if self.eager_load is not None and not isinstance(self.eager_load, list):
+            raise ValueError("eager_load must be a list or None")
+
+        if self.include_fields is not None and not isinstance(self.include_fields, list):
+            raise ValueError("include_fields must be a list or None")
+
         if not isinstance(self.deleted_at_field, str) or not self.deleted_at_field:
             raise ValueError("deleted_at_field must be a non-empty string")
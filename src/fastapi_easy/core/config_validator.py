@@ -49,6 +49,30 @@ class ConfigValidator:
                 logger.error(f"Invalid l2_ttl: {l2_ttl}. Must be positive integer.")
                 return False
 
+            # Validate stale-while-revalidate window
+            stale_ttl = config.get("stale_ttl", 0)
+            if not isinstance(stale_ttl, int) or stale_ttl < 0:
+                logger.error(f"Invalid stale_ttl: {stale_ttl}. Must be non-negative integer.")
+                return False
+
+            # Validate negative cache TTL (0 disables)
+            negative_ttl = config.get("negative_ttl", 5)
+            if not isinstance(negative_ttl, int) or negative_ttl < 0:
+                logger.error(f"Invalid negative_ttl: {negative_ttl}. Must be non-negative integer.")
+                return False
+
+            # Validate byte budgets and eviction policy
+            for name in ("l1_max_bytes", "l2_max_bytes"):
+                max_bytes = config.get(name)
+                if max_bytes is not None and (not isinstance(max_bytes, int) or max_bytes <= 0):
+                    logger.error(f"Invalid {name}: {max_bytes}. Must be positive integer or None.")
+                    return False
+
+            eviction = config.get("eviction", "lru")
+            if eviction not in ("lru", "gdsf", "tinylfu"):
+                logger.error(f"Invalid eviction: {eviction}. Must be 'lru', 'gdsf' or 'tinylfu'.")
+                return False
+
             # Validate L2 >= L1
             if l2_size < l1_size:
                 logger.warning(f"L2 size ({l2_size}) should be >= L1 size ({l1_size})")
@@ -2,13 +2,22 @@
 
 from __future__ import annotations
 
+import csv
+import io
 import logging
-from typing import Any, List, Optional, Type
+from typing import Any, AsyncIterator, Dict, List, Optional, Type
 
-from fastapi import APIRouter, Body, HTTPException, Path, Query, Request
+from fastapi import APIRouter, Body, HTTPException, Path, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
+from ..utils.pagination import CursorParams, decode_cursor, encode_cursor
+from ..utils.sorters import SortParser
+
 from .adapters import ORMAdapter
+from .bulk_operations import BulkOperationResult
+from .cache import NOT_FOUND
+from .cache_tags import field_tag, item_tag, list_tag, query_tags
 from .config import CRUDConfig
 from .exceptions import (
     DatabaseConnectionException,
@@ -18,9 +27,21 @@ from .exceptions import (
     NotFoundError,
 )
 from .hooks import ExecutionContext, HookRegistry
+from .invalidation_bus import InvalidationBus
+from .query_projection import QueryProjection, parse_fields
+from .response_cache import ResponseCache
+from .serialization import ResponseSerializer
 
 logger = logging.getLogger(__name__)
 
+# Export responses are flushed to the client in chunks of roughly this size
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
 
 class CRUDRouter(APIRouter):
     """CRUD Router for automatic API generation
@@ -39,6 +60,7 @@ class CRUDRouter(APIRouter):
         id_type: Type = int,
         create_schema: Optional[Type[BaseModel]] = None,
         update_schema: Optional[Type[BaseModel]] = None,
+        invalidation_bus: Optional[InvalidationBus] = None,
         **kwargs: Any,
     ):
         """Initialize CRUD Router
@@ -52,6 +74,8 @@ class CRUDRouter(APIRouter):
             id_type: Type of the ID field (default: int)
             create_schema: Schema for creation (default: same as schema)
             update_schema: Schema for updates (default: same as schema)
+            invalidation_bus: Bus carrying response cache invalidations to
+                and from other workers (start it in the app's lifespan)
             **kwargs: Additional arguments passed to APIRouter
         """
         # Initialize configuration
@@ -77,6 +101,20 @@ class CRUDRouter(APIRouter):
         # Initialize hooks
         self.hooks = HookRegistry()
 
+        # Read responses are serialized once, straight to JSON bytes
+        self.serializer = ResponseSerializer(schema)
+
+        # Serialized read responses, replayed on hits without touching the adapter
+        self.response_cache = (
+            ResponseCache(
+                self.config.response_cache_size,
+                self.config.response_cache_ttl,
+                invalidation_bus=invalidation_bus,
+            )
+            if self.config.response_cache
+            else None
+        )
+
         # Set default prefix
         if prefix is None:
             prefix = f"/{schema.__name__.lower()}"
@@ -94,6 +132,12 @@ class CRUDRouter(APIRouter):
     def _generate_routes(self) -> None:
         """Generate FastAPI routes"""
         self._add_get_all_route()
+        if self.config.enable_export:
+            # Registered before /{id} so "export" is not taken as an ID
+            self._add_export_route()
+        if self.config.enable_bulk_operations:
+            # DELETE /bulk must be registered before DELETE /{id}
+            self._add_bulk_routes()
         self._add_get_one_route()
         self._add_create_route()
         self._add_update_route()
@@ -131,11 +175,282 @@ class CRUDRouter(APIRouter):
                 cause=e,
             ).with_context(**context.__dict__)
 
+    async def _execute_get_all(self, context: ExecutionContext) -> List[Any]:
+        """Run hooks and the adapter for a list request
+
+        Args:
+            context: Execution context with filters, sorts and pagination
+
+        Returns:
+            List of items as returned by the adapter
+        """
+        # Trigger hooks with error handling
+        try:
+            await self.hooks.trigger("before_get_all", context)
+        except Exception as e:
+            logger.error(f"Error in before_get_all hook: {e!s}", exc_info=True)
+            raise HTTPException(status_code=500, detail="Hook execution failed")
+
+        # Execute adapter method
+        result = []
+        if self.adapter:
+            try:
+                options = self._read_options(context)
+                if self.config.with_total:
+                    # Page and total in one round-trip where the adapter supports it
+                    result, context.metadata["total"] = await self.adapter.get_all_with_total(
+                        filters=context.filters,
+                        sorts=context.sorts,
+                        pagination=context.pagination,
+                        estimate=self.config.estimate_total,
+                        **options,
+                    )
+                else:
+                    result = await self.adapter.get_all(
+                        filters=context.filters,
+                        sorts=context.sorts,
+                        pagination=context.pagination,
+                        **options,
+                    )
+                if result is None:
+                    result = []
+                elif not isinstance(result, list):
+                    logger.error(f"Expected list from get_all, got {type(result)}")
+                    result = []
+            except Exception as e:
+                self._handle_error(e, "Failed to retrieve items", operation="get_all")
+
+        # Trigger hooks with error handling
+        context.result = result
+        try:
+            await self.hooks.trigger("after_get_all", context)
+        except Exception as e:
+            logger.error(f"Error in after_get_all hook: {e!s}", exc_info=True)
+            # Don't fail the request if after hook fails
+
+        return result
+
+    def _convert_items(self, result: List[Any]) -> List[Any]:
+        """Convert result items to the read schema where possible"""
+        # Convert result items to Pydantic models if they're not already
+        if result and isinstance(result, list):
+            converted_result = []
+            for item in result:
+                if item is not None and not isinstance(item, dict):
+                    # If it's a SQLAlchemy model or similar, convert using the schema
+                    try:
+                        item = self.schema.model_validate(item)
+                    except Exception:
+                        # If validation fails, try to convert to dict first
+                        try:
+                            if hasattr(item, 'model_dump'):
+                                item_dict = item.model_dump()
+                            elif hasattr(item, '__dict__'):
+                                item_dict = item.__dict__
+                            else:
+                                item_dict = dict(item)
+                            item = self.schema.model_validate(item_dict)
+                        except Exception:
+                            # If all else fails, keep as is
+                            pass
+                converted_result.append(item)
+            result = converted_result
+
+        return result
+
+    def _parse_fields(self, fields: Optional[str]) -> Optional[List[str]]:
+        """Validate a ``fields`` query parameter against the read schema"""
+        try:
+            return parse_fields(fields, list(self.schema.model_fields))
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    def _parse_include(self, include: Optional[str]) -> Optional[List[str]]:
+        """Combine ``eager_load`` with an ``include`` query parameter
+
+        Requested relationships must be listed in ``include_fields``.
+        """
+        try:
+            requested = parse_fields(include, self.config.include_fields or [], "relationships")
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        combined = list(dict.fromkeys([*(self.config.eager_load or []), *(requested or [])]))
+        return combined or None
+
+    @staticmethod
+    def _read_options(context: ExecutionContext) -> Dict[str, Any]:
+        """Optional adapter read arguments; only passed when requested"""
+        options = {}
+        if context.fields:
+            options["fields"] = context.fields
+        if context.include:
+            options["include"] = context.include
+        return options
+
+    @staticmethod
+    def _project(item: Any, projection: QueryProjection) -> Dict[str, Any]:
+        """Trim a single result item to a sparse fieldset"""
+        if isinstance(item, BaseModel):
+            item = item.model_dump()
+        elif not isinstance(item, dict):
+            item = {name: getattr(item, name, None) for name in projection.get_fields()}
+        return projection.apply_to_dict(item)
+
+    def _project_items(self, result: List[Any], fields: Optional[List[str]]) -> List[Any]:
+        """Trim result items to a sparse fieldset, if one was requested"""
+        if not fields:
+            return result
+        projection = QueryProjection(fields)
+        return [self._project(item, projection) for item in result]
+
+    def _render_items(
+        self,
+        result: List[Any],
+        fields: Optional[List[str]],
+        response: Response,
+        context: ExecutionContext,
+    ) -> Any:
+        """Build a list response, serializing ORM rows directly to JSON when possible
+
+        Args:
+            result: Items returned by ``_execute_get_all``
+            fields: Requested sparse fieldset, if any
+            response: Injected response carrying headers set by the route
+            context: Execution context of the request
+        """
+        if fields:
+            return self._project_items(self._convert_items(result), fields)
+
+        content = self.serializer.dump_list(result)
+        if content is None:
+            return self._convert_items(result)
+
+        tags = ()
+        if self._response_cache_for("get_all") is not None:
+            tags = query_tags(
+                self.schema.__name__, context.filters, context.sorts, self._item_ids(result)
+            )
+        return self._json_response(context.request, content, response, tags, "get_all")
+
+    def _response_cache_for(self, operation: str) -> Optional[ResponseCache]:
+        """Response cache usable by a read, or None
+
+        Hooks may authorize or scope a read per user, and a cached body would
+        skip them, so reads with hooks registered are never cached.
+
+        Args:
+            operation: ``"get_all"`` or ``"get_one"``
+        """
+        if self.response_cache is None:
+            return None
+        if self.hooks.get_hooks(f"before_{operation}") or self.hooks.get_hooks(
+            f"after_{operation}"
+        ):
+            return None
+        return self.response_cache
+
+    def _json_response(
+        self,
+        request: Request,
+        content: bytes,
+        response: Optional[Response],
+        tags: Any,
+        operation: str,
+    ) -> Response:
+        """Wrap serialized JSON in a response, caching it when enabled
+
+        Args:
+            request: Current request, used as the cache key
+            content: JSON body bytes
+            response: Injected response carrying headers set by the route
+            tags: Tags the response depends on
+            operation: Read that produced the body, ``"get_all"`` or ``"get_one"``
+        """
+        headers = tuple(response.headers.raw) if response is not None else ()
+        response_cache = self._response_cache_for(operation)
+        if response_cache is None:
+            json_response = Response(content=content, media_type="application/json")
+            json_response.headers.raw.extend(headers)
+            return json_response
+
+        entry = response_cache.set(ResponseCache.make_key(request), content, tags, headers)
+        return entry.render(request.headers.get("if-none-match"))
+
+    def _cached_response(self, request: Request, operation: str) -> Any:
+        """Answer a read from the response cache, if enabled and cached
+
+        Args:
+            request: Current request, used as the cache key
+            operation: ``"get_all"`` or ``"get_one"``
+
+        Returns:
+            Response, ``NOT_FOUND`` for a cached 404, or None
+        """
+        response_cache = self._response_cache_for(operation)
+        if response_cache is None:
+            return None
+        entry = response_cache.get(ResponseCache.make_key(request))
+        if entry is None or entry is NOT_FOUND:
+            return entry
+        return entry.render(request.headers.get("if-none-match"))
+
+    def _raise_not_found(self, id: Any) -> None:
+        """Raise the 404 of the get-one route"""
+        raise NotFoundError(
+            resource=self.schema.__name__,
+            identifier=id,
+        ).with_context(
+            resource=self.schema.__name__,
+            action="get_one",
+        )
+
+    def _invalidate_responses(self, tags: Any) -> None:
+        """Drop cached responses that depend on a write"""
+        if self.response_cache is not None:
+            self.response_cache.invalidate(tags)
+
+    def _item_ids(self, items: List[Any]) -> List[Any]:
+        """Primary keys of result items"""
+        pk_field = getattr(self.adapter, "pk_field", "id")
+        if not isinstance(pk_field, str):
+            pk_field = "id"
+        return [
+            item.get(pk_field) if isinstance(item, dict) else getattr(item, pk_field, None)
+            for item in items
+        ]
+
+    def _create_tags(self, items: List[Any]) -> List[str]:
+        """Tags invalidated by creating items: lists and cached 404s of their ids"""
+        name = self.schema.__name__
+        return [list_tag(name)] + [
+            item_tag(name, item_id)
+            for item_id in self._item_ids(items or [])
+            if item_id is not None
+        ]
+
+    def _update_tags(self, item_id: Any, data: Any) -> List[str]:
+        """Tags invalidated by a partial update of one item"""
+        name = self.schema.__name__
+        tags = [item_tag(name, item_id)]
+        if isinstance(data, dict):
+            tags.extend(field_tag(name, field) for field in data)
+        return tags
+
+    @staticmethod
+    def _set_total_header(response: Response, context: ExecutionContext) -> None:
+        """Expose the total count computed in ``with_total`` mode"""
+        if context.metadata.get("total") is not None:
+            response.headers["X-Total-Count"] = str(context.metadata["total"])
+
     def _add_get_all_route(self) -> None:
         """Add GET all items route"""
+        if self.config.pagination_mode == "cursor":
+            self._add_get_all_cursor_route()
+            return
 
         async def get_all(
             request: Request,
+            response: Response,
             skip: int = Query(0, ge=0, description="Number of items to skip"),
             limit: int = Query(
                 self.config.default_limit,
@@ -143,8 +458,18 @@ class CRUDRouter(APIRouter):
                 le=self.config.max_limit,
                 description="Number of items to return",
             ),
+            fields: Optional[str] = Query(
+                None, description="Comma-separated fields to return, e.g. 'id,name'"
+            ),
+            include: Optional[str] = Query(
+                None, description="Comma-separated relationships to load, e.g. 'author'"
+            ),
         ) -> List[Any]:
             """Get all items"""
+            cached = self._cached_response(request, "get_all")
+            if cached is not None:
+                return cached
+
             context = ExecutionContext(
                 schema=self.schema,
                 adapter=self.adapter,
@@ -152,73 +477,373 @@ class CRUDRouter(APIRouter):
                 filters={},
                 sorts={},
                 pagination={"skip": skip, "limit": limit},
+                fields=self._parse_fields(fields),
+                include=self._parse_include(include),
             )
 
-            # Trigger hooks with error handling
+            result = await self._execute_get_all(context)
+            self._set_total_header(response, context)
+            return self._render_items(result, context.fields, response, context)
+
+        self.add_api_route(
+            "/",
+            get_all,
+            methods=["GET"],
+            response_model=List[Any],
+            summary=f"Get all {self.schema.__name__} items",
+            description=f"Retrieve a list of {self.schema.__name__} items with pagination",
+        )
+
+    def _add_get_all_cursor_route(self) -> None:
+        """Add GET all items route with cursor (keyset) pagination
+
+        Cursors for the neighbouring pages are returned in the ``X-Next-Cursor``
+        and ``X-Prev-Cursor`` response headers so the body stays a plain list.
+        """
+        pk_field = getattr(self.adapter, "pk_field", "id")
+
+        async def get_all(
+            request: Request,
+            response: Response,
+            after: Optional[str] = Query(None, description="Cursor to read the page after"),
+            before: Optional[str] = Query(None, description="Cursor to read the page before"),
+            sort: Optional[str] = Query(
+                None, description="Sort fields, e.g. 'name,-price' (primary key breaks ties)"
+            ),
+            limit: int = Query(
+                self.config.default_limit,
+                ge=1,
+                le=self.config.max_limit,
+                description="Number of items to return",
+            ),
+            fields: Optional[str] = Query(
+                None, description="Comma-separated fields to return, e.g. 'id,name'"
+            ),
+            include: Optional[str] = Query(
+                None, description="Comma-separated relationships to load, e.g. 'author'"
+            ),
+        ) -> List[Any]:
+            """Get all items"""
+            cached = self._cached_response(request, "get_all")
+            if cached is not None:
+                return cached
+
+            requested_fields = self._parse_fields(fields)
+            relationships = self._parse_include(include)
+            params = CursorParams(after=after, before=before, limit=limit)
+            sorts = SortParser.parse(sort or self.config.default_sort, self.config.sort_fields)
+            keyset = SortParser.to_keyset(sorts, pk_field)
+
+            # Reject bad cursors before touching hooks or the database
+            try:
+                params.validate(max_limit=self.config.max_limit)
+                for token in (after, before):
+                    if token:
+                        decode_cursor(token, keyset)
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+
+            context = ExecutionContext(
+                schema=self.schema,
+                adapter=self.adapter,
+                request=request,
+                filters={},
+                sorts=sorts,
+                pagination=params.to_dict(),
+                # Cursors are built from the keyset columns, so always read them
+                fields=(
+                    requested_fields + [n for n, _ in keyset if n not in requested_fields]
+                    if requested_fields
+                    else None
+                ),
+                include=relationships,
+            )
+
+            result = await self._execute_get_all(context)
+
+            # Hooks may have changed the sort order, so rebuild the keyset
+            keyset = SortParser.to_keyset(context.sorts, pk_field)
+            raw = context.result or []
+            if raw:
+                full_page = len(raw) >= limit
+                if before:
+                    has_prev, has_next = full_page, True
+                else:
+                    has_prev, has_next = bool(after), full_page
+
+                if has_next:
+                    response.headers["X-Next-Cursor"] = encode_cursor(raw[-1], keyset)
+                if has_prev:
+                    response.headers["X-Prev-Cursor"] = encode_cursor(raw[0], keyset)
+
+            self._set_total_header(response, context)
+            return self._render_items(result, requested_fields, response, context)
+
+        self.add_api_route(
+            "/",
+            get_all,
+            methods=["GET"],
+            response_model=List[Any],
+            summary=f"Get all {self.schema.__name__} items",
+            description=f"Retrieve a list of {self.schema.__name__} items with cursor pagination",
+        )
+
+    async def _export_chunks(
+        self, rows: Optional[AsyncIterator[Any]], first: Any, export_format: str
+    ) -> AsyncIterator[str]:
+        """Serialize streamed rows as NDJSON or CSV text chunks
+
+        Args:
+            rows: Remaining rows from ``ORMAdapter.stream``
+            first: First row, already read to surface database errors early
+            export_format: ``"ndjson"`` or ``"csv"``
+
+        Yields:
+            Text chunks of about ``EXPORT_CHUNK_SIZE`` characters
+        """
+        buffer = io.StringIO()
+        writer = None
+        if export_format == "csv":
+            writer = csv.DictWriter(buffer, fieldnames=list(self.schema.model_fields))
+            writer.writeheader()
+
+        async def all_rows() -> AsyncIterator[Any]:
+            if first is not None:
+                yield first
+                async for row in rows:
+                    yield row
+
+        try:
+            async for row in all_rows():
+                item = self.schema.model_validate(row, from_attributes=True)
+                if writer is None:
+                    buffer.write(item.model_dump_json())
+                    buffer.write("\n")
+                else:
+                    writer.writerow(item.model_dump(mode="json"))
+
+                if buffer.tell() >= EXPORT_CHUNK_SIZE:
+                    yield buffer.getvalue()
+                    buffer.seek(0)
+                    buffer.truncate()
+
+            if buffer.tell():
+                yield buffer.getvalue()
+        except Exception as e:
+            # Headers are already sent, so the only option is to abort the body
+            logger.error(f"Export of {self.schema.__name__} failed: {e!s}", exc_info=True)
+            raise
+        finally:
+            # Release the database cursor even if the client disconnects early
+            if rows is not None:
+                await rows.aclose()
+
+    def _add_export_route(self) -> None:
+        """Add GET export route streaming all items as NDJSON or CSV
+
+        Rows come from ``ORMAdapter.stream`` and are written to the response as
+        they are read, so memory use does not grow with the collection size.
+        """
+
+        async def export(
+            request: Request,
+            format: str = Query(
+                "ndjson", pattern="^(ndjson|csv)$", description="Export format: ndjson or csv"
+            ),
+            sort: Optional[str] = Query(None, description="Sort fields, e.g. 'name,-price'"),
+        ) -> StreamingResponse:
+            """Export all items"""
+            context = ExecutionContext(
+                schema=self.schema,
+                adapter=self.adapter,
+                request=request,
+                filters={},
+                sorts=SortParser.parse(sort or self.config.default_sort, self.config.sort_fields),
+                metadata={"export_format": format},
+            )
+
+            # Exports are reads, so they share the get_all hooks (e.g. access checks)
             try:
                 await self.hooks.trigger("before_get_all", context)
             except Exception as e:
                 logger.error(f"Error in before_get_all hook: {e!s}", exc_info=True)
                 raise HTTPException(status_code=500, detail="Hook execution failed")
 
-            # Execute adapter method
+            rows = None
+            first = None
+            if self.adapter:
+                rows = self.adapter.stream(
+                    filters=context.filters,
+                    sorts=context.sorts,
+                    batch_size=self.config.export_batch_size,
+                )
+                # Read the first row now so database errors still get a proper status
+                try:
+                    first = await rows.__anext__()
+                except StopAsyncIteration:
+                    first = None
+                except Exception as e:
+                    self._handle_error(e, "Failed to export items", operation="export")
+
+            filename = f"{self.schema.__name__.lower()}.{format}"
+            return StreamingResponse(
+                self._export_chunks(rows, first, format),
+                media_type=EXPORT_MEDIA_TYPES[format],
+                headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+            )
+
+        self.add_api_route(
+            "/export",
+            export,
+            methods=["GET"],
+            response_class=StreamingResponse,
+            summary=f"Export {self.schema.__name__} items",
+            description=f"Stream all {self.schema.__name__} items as NDJSON or CSV",
+        )
+
+    def _check_bulk_size(self, items: List[Any]) -> None:
+        """Reject bulk requests above ``max_bulk_items``"""
+        if len(items) > self.config.max_bulk_items:
+            raise HTTPException(
+                status_code=413,
+                detail=f"Bulk requests are limited to {self.config.max_bulk_items} items",
+            )
+
+    async def _trigger_or_fail(self, event: str, context: ExecutionContext) -> None:
+        """Trigger a before_* hook, failing the request if it raises"""
+        try:
+            await self.hooks.trigger(event, context)
+        except Exception as e:
+            logger.error(f"Error in {event} hook: {e!s}", exc_info=True)
+            raise HTTPException(status_code=500, detail="Hook execution failed")
+
+    async def _trigger_and_log(self, event: str, context: ExecutionContext) -> None:
+        """Trigger an after_* hook, logging (not raising) failures"""
+        try:
+            await self.hooks.trigger(event, context)
+        except Exception as e:
+            logger.error(f"Error in {event} hook: {e!s}", exc_info=True)
+
+    def _add_bulk_routes(self) -> None:
+        """Add POST/PATCH/DELETE /bulk routes
+
+        Each request is handled by a single ``ORMAdapter.bulk_*`` call, which
+        backends implement with multi-row statements.
+        """
+        pk_field = getattr(self.adapter, "pk_field", "id")
+
+        async def bulk_create(
+            request: Request,
+            items: List[Dict[str, Any]] = Body(..., description="Items to create"),
+        ) -> List[Any]:
+            """Create many items"""
+            self._check_bulk_size(items)
+            context = ExecutionContext(
+                schema=self.schema, adapter=self.adapter, request=request, data=items
+            )
+            await self._trigger_or_fail("before_bulk_create", context)
+
             result = []
             if self.adapter:
                 try:
-                    result = await self.adapter.get_all(
-                        filters=context.filters,
-                        sorts=context.sorts,
-                        pagination=context.pagination,
+                    result = await self.adapter.bulk_create(context.data)
+                    self._invalidate_responses(self._create_tags(result))
+                except Exception as e:
+                    self._handle_error(e, "Failed to create items", operation="bulk_create")
+
+            context.result = result
+            await self._trigger_and_log("after_bulk_create", context)
+            return self._convert_items(result)
+
+        async def bulk_update(
+            request: Request,
+            items: List[Dict[str, Any]] = Body(
+                ..., description=f"Partial updates, each including '{pk_field}'"
+            ),
+        ) -> List[Any]:
+            """Update many items"""
+            self._check_bulk_size(items)
+            if any(pk_field not in item for item in items):
+                raise HTTPException(
+                    status_code=400, detail=f"Every bulk update item must include '{pk_field}'"
+                )
+
+            context = ExecutionContext(
+                schema=self.schema, adapter=self.adapter, request=request, data=items
+            )
+            await self._trigger_or_fail("before_bulk_update", context)
+
+            result = []
+            if self.adapter:
+                try:
+                    result = await self.adapter.bulk_update(context.data)
+                    self._invalidate_responses(
+                        [
+                            tag
+                            for item in context.data
+                            for tag in self._update_tags(item[pk_field], item)
+                        ]
                     )
-                    if result is None:
-                        result = []
-                    elif not isinstance(result, list):
-                        logger.error(f"Expected list from get_all, got {type(result)}")
-                        result = []
                 except Exception as e:
-                    self._handle_error(e, "Failed to retrieve items", operation="get_all")
+                    self._handle_error(e, "Failed to update items", operation="bulk_update")
 
-            # Trigger hooks with error handling
             context.result = result
-            try:
-                await self.hooks.trigger("after_get_all", context)
-            except Exception as e:
-                logger.error(f"Error in after_get_all hook: {e!s}", exc_info=True)
-                # Don't fail the request if after hook fails
+            await self._trigger_and_log("after_bulk_update", context)
+            return self._convert_items(result)
 
-            # Convert result items to Pydantic models if they're not already
-            if result and isinstance(result, list):
-                converted_result = []
-                for item in result:
-                    if item is not None and not isinstance(item, dict):
-                        # If it's a SQLAlchemy model or similar, convert using the schema
-                        try:
-                            item = self.schema.model_validate(item)
-                        except Exception:
-                            # If validation fails, try to convert to dict first
-                            try:
-                                if hasattr(item, 'model_dump'):
-                                    item_dict = item.model_dump()
-                                elif hasattr(item, '__dict__'):
-                                    item_dict = item.__dict__
-                                else:
-                                    item_dict = dict(item)
-                                item = self.schema.model_validate(item_dict)
-                            except Exception:
-                                # If all else fails, keep as is
-                                pass
-                    converted_result.append(item)
-                result = converted_result
+        async def bulk_delete(
+            request: Request,
+            ids: List[Any] = Body(..., description="IDs of the items to delete"),
+        ) -> Dict[str, Any]:
+            """Delete many items"""
+            self._check_bulk_size(ids)
+            context = ExecutionContext(
+                schema=self.schema, adapter=self.adapter, request=request, data=ids
+            )
+            await self._trigger_or_fail("before_bulk_delete", context)
 
-            return result
+            deleted = 0
+            if self.adapter:
+                try:
+                    deleted = await self.adapter.bulk_delete(context.data)
+                    self._invalidate_responses(
+                        [list_tag(self.schema.__name__)]
+                        + [item_tag(self.schema.__name__, item_id) for item_id in context.data]
+                    )
+                except Exception as e:
+                    self._handle_error(e, "Failed to delete items", operation="bulk_delete")
+
+            context.result = deleted
+            await self._trigger_and_log("after_bulk_delete", context)
+            return BulkOperationResult(
+                success_count=deleted, failure_count=len(context.data) - deleted
+            ).to_dict()
 
+        name = self.schema.__name__
         self.add_api_route(
-            "/",
-            get_all,
-            methods=["GET"],
+            "/bulk",
+            bulk_create,
+            methods=["POST"],
             response_model=List[Any],
-            summary=f"Get all {self.schema.__name__} items",
-            description=f"Retrieve a list of {self.schema.__name__} items with pagination",
+            status_code=201,
+            summary=f"Bulk create {name} items",
+            description=f"Create many {name} items in a single request",
+        )
+        self.add_api_route(
+            "/bulk",
+            bulk_update,
+            methods=["PATCH"],
+            response_model=List[Any],
+            summary=f"Bulk update {name} items",
+            description=f"Partially update many {name} items in a single request",
+        )
+        self.add_api_route(
+            "/bulk",
+            bulk_delete,
+            methods=["DELETE"],
+            response_model=Dict[str, Any],
+            summary=f"Bulk delete {name} items",
+            description=f"Delete many {name} items by ID in a single request",
         )
 
     def _add_get_one_route(self) -> None:
@@ -228,13 +853,27 @@ class CRUDRouter(APIRouter):
         async def get_one(
             request: Request,
             id: Any = Path(..., description="Item ID"),
+            fields: Optional[str] = Query(
+                None, description="Comma-separated fields to return, e.g. 'id,name'"
+            ),
+            include: Optional[str] = Query(
+                None, description="Comma-separated relationships to load, e.g. 'author'"
+            ),
         ) -> Any:
             """Get single item by ID"""
+            cached = self._cached_response(request, "get_one")
+            if cached is NOT_FOUND:
+                self._raise_not_found(id)
+            if cached is not None:
+                return cached
+
             context = ExecutionContext(
                 schema=self.schema,
                 adapter=self.adapter,
                 request=request,
                 metadata={"id": id},
+                fields=self._parse_fields(fields),
+                include=self._parse_include(include),
             )
 
             # Trigger hooks with error handling
@@ -248,19 +887,20 @@ class CRUDRouter(APIRouter):
             result = None
             if self.adapter:
                 try:
-                    result = await self.adapter.get_one(id)
+                    result = await self.adapter.get_one(id, **self._read_options(context))
                 except Exception as e:
                     self._handle_error(e, "Failed to retrieve item", operation="get_one")
 
-            # Return 404 if not found
+            # Return 404 if not found, remembering it briefly
             if result is None:
-                raise NotFoundError(
-                    resource=self.schema.__name__,
-                    identifier=id,
-                ).with_context(
-                    resource=self.schema.__name__,
-                    action="get_one",
-                )
+                response_cache = self._response_cache_for("get_one")
+                if response_cache is not None and self.config.response_cache_negative_ttl:
+                    response_cache.set_not_found(
+                        ResponseCache.make_key(request),
+                        [item_tag(self.schema.__name__, id)],
+                        self.config.response_cache_negative_ttl,
+                    )
+                self._raise_not_found(id)
 
             # Trigger hooks with error handling
             context.result = result
@@ -270,6 +910,13 @@ class CRUDRouter(APIRouter):
                 logger.error(f"Error in after_get_one hook: {e!s}", exc_info=True)
                 # Don't fail the request if after hook fails
 
+            if not context.fields:
+                content = self.serializer.dump_one(result)
+                if content is not None:
+                    return self._json_response(
+                        request, content, None, [item_tag(self.schema.__name__, id)], "get_one"
+                    )
+
             # Convert result to Pydantic model if it's not already
             if result is not None:
                 if not isinstance(result, dict):
@@ -289,6 +936,8 @@ class CRUDRouter(APIRouter):
                         except Exception:
                             # If all else fails, return as is
                             pass
+                if context.fields:
+                    result = self._project(result, QueryProjection(context.fields))
 
             return result
 
@@ -313,7 +962,11 @@ class CRUDRouter(APIRouter):
                 schema=self.schema,
                 adapter=self.adapter,
                 request=request,
-                data=data if isinstance(data, dict) else (data.model_dump() if hasattr(data, "model_dump") else data.dict()),
+                data=(
+                    data
+                    if isinstance(data, dict)
+                    else (data.model_dump() if hasattr(data, "model_dump") else data.dict())
+                ),
             )
 
             # Trigger hooks with error handling
@@ -328,6 +981,7 @@ class CRUDRouter(APIRouter):
             if self.adapter:
                 try:
                     result = await self.adapter.create(context.data)
+                    self._invalidate_responses(self._create_tags([result]))
                 except Exception as e:
                     self._handle_error(e, "Failed to create item", operation="create")
 
@@ -384,7 +1038,11 @@ class CRUDRouter(APIRouter):
                 schema=self.schema,
                 adapter=self.adapter,
                 request=request,
-                data=data if isinstance(data, dict) else (data.model_dump() if hasattr(data, "model_dump") else data.dict()),
+                data=(
+                    data
+                    if isinstance(data, dict)
+                    else (data.model_dump() if hasattr(data, "model_dump") else data.dict())
+                ),
                 metadata={"id": id},
             )
 
@@ -400,6 +1058,7 @@ class CRUDRouter(APIRouter):
             if self.adapter:
                 try:
                     result = await self.adapter.update(id, context.data)
+                    self._invalidate_responses(self._update_tags(id, context.data))
                 except Exception as e:
                     self._handle_error(e, "Failed to update item")
 
@@ -469,6 +1128,9 @@ class CRUDRouter(APIRouter):
             if self.adapter:
                 try:
                     result = await self.adapter.delete_one(id)
+                    self._invalidate_responses(
+                        [list_tag(self.schema.__name__), item_tag(self.schema.__name__, id)]
+                    )
                 except Exception as e:
                     self._handle_error(e, "Failed to delete item")
 
@@ -544,6 +1206,8 @@ class CRUDRouter(APIRouter):
             if self.adapter:
                 try:
                     result = await self.adapter.delete_all()
+                    if self.response_cache is not None:
+                        self.response_cache.clear()
                     if result is None:
                         result = []
                     elif not isinstance(result, list):
@@ -7,6 +7,8 @@ import logging
 from dataclasses import dataclass, field
 from typing import Any, Callable, Dict, List, Optional
 
+from .unit_of_work import get_request_session
+
 logger = logging.getLogger(__name__)
 
 
@@ -24,9 +26,13 @@ class ExecutionContext:
     filters: Dict[str, Any] = field(default_factory=dict)
     sorts: Dict[str, Any] = field(default_factory=dict)
     pagination: Dict[str, Any] = field(default_factory=dict)
+    fields: Optional[List[str]] = None  # Sparse fieldset (?fields=)
+    include: Optional[List[str]] = None  # Relationships to eager-load (eager_load + ?include=)
     data: Any = None  # Request data
     result: Any = None  # Operation result
     metadata: Dict[str, Any] = field(default_factory=dict)
+    # Request-scoped session when a unit of work is active, so hooks share its transaction
+    session: Any = field(default_factory=get_request_session)
 
 
 class HookRegistry:
@@ -47,6 +53,12 @@ class HookRegistry:
         "after_get_all": "After get all operation",
         "before_get_one": "Before get one operation",
         "after_get_one": "After get one operation",
+        "before_bulk_create": "Before bulk create operation",
+        "after_bulk_create": "After bulk create operation",
+        "before_bulk_update": "Before bulk update operation",
+        "after_bulk_update": "After bulk update operation",
+        "before_bulk_delete": "Before bulk delete operation",
+        "after_bulk_delete": "After bulk delete operation",
     }
 
     def __init__(self):
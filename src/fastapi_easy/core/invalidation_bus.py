@@ -0,0 +1,404 @@
+"""Cross-process invalidation bus for in-process cache tiers
+
+Every worker keeps its own L1 cache, so a write handled by one worker leaves
+stale entries in the others until their TTL runs out. The bus carries key
+deletions and tag invalidations between workers: the writer publishes them,
+and every other worker applies them to the caches it has subscribed.
+
+Outgoing invalidations are buffered for ``flush_interval`` seconds and
+deduplicated, so a burst of writes becomes a handful of messages. Transports
+are pluggable:
+
+- :class:`InMemoryTransport`: buses in one process, for tests
+- :class:`UnixSocketTransport`: workers on one host, via datagram sockets
+  in a shared directory
+- :class:`RedisTransport`: workers across hosts, via Redis pub/sub
+
+Delivery is best effort; TTLs still bound staleness if a message is lost.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import socket
+import stat
+import uuid
+from abc import ABC, abstractmethod
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set
+
+try:
+    import redis.asyncio as redis
+
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+MessageHandler = Callable[[bytes], Awaitable[None]]
+
+# Set while remote invalidations are applied, so caches that publish their
+# own invalidations do not echo them back to the other workers
+_applying_remote: ContextVar[bool] = ContextVar("applying_remote", default=False)
+
+
+class InvalidationTransport(ABC):
+    """Delivers published payloads to every bus on the same channel"""
+
+    @abstractmethod
+    async def start(self, handler: MessageHandler) -> None:
+        """Start receiving; ``handler`` is awaited with each payload"""
+
+    @abstractmethod
+    async def publish(self, payload: bytes) -> None:
+        """Send a payload to all subscribers, possibly including the sender"""
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Stop receiving and release resources"""
+
+
+class InMemoryTransport(InvalidationTransport):
+    """Transport between buses of one process, e.g. simulated workers in tests"""
+
+    _channels: Dict[str, List[MessageHandler]] = {}
+
+    def __init__(self, channel: str = "default"):
+        """Initialize transport
+
+        Args:
+            channel: Buses only hear publishes on their own channel
+        """
+        self.channel = channel
+        self._handler: Optional[MessageHandler] = None
+
+    async def start(self, handler: MessageHandler) -> None:
+        self._handler = handler
+        self._channels.setdefault(self.channel, []).append(handler)
+
+    async def publish(self, payload: bytes) -> None:
+        for handler in list(self._channels.get(self.channel, ())):
+            await handler(payload)
+
+    async def close(self) -> None:
+        handlers = self._channels.get(self.channel, [])
+        if self._handler in handlers:
+            handlers.remove(self._handler)
+        self._handler = None
+
+
+class UnixSocketTransport(InvalidationTransport):
+    """Transport between workers on one host over UNIX datagram sockets
+
+    Each bus binds a socket in ``directory`` and publishes by sending the
+    payload to every other socket there. Sockets of workers that died are
+    removed when a send to them is refused.
+
+    The directory is created with mode ``0700`` and rejected unless it is a
+    directory owned by the effective user that no one else can write, so
+    other local users can neither inject invalidations nor receive them.
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        """Initialize transport
+
+        Args:
+            directory: Directory shared by all workers of the deployment
+                (default: ``/tmp/fastapi_easy_invalidation-<euid>``)
+        """
+        self.directory = directory or f"/tmp/fastapi_easy_invalidation-{os.geteuid()}"
+        self.path = os.path.join(self.directory, f"{os.getpid()}-{uuid.uuid4().hex[:8]}.sock")
+        self._sock: Optional[socket.socket] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._handling: Set[asyncio.Task] = set()
+
+    def _check_directory(self) -> None:
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+        st = os.lstat(self.directory)
+        if (
+            not stat.S_ISDIR(st.st_mode)
+            or st.st_uid != os.geteuid()
+            or stat.S_IMODE(st.st_mode) & 0o077
+        ):
+            raise PermissionError(
+                f"{self.directory} must be a directory owned by uid {os.geteuid()} "
+                "and not accessible to other users"
+            )
+
+    async def start(self, handler: MessageHandler) -> None:
+        self._check_directory()
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        sock.bind(self.path)
+        sock.setblocking(False)
+        self._sock = sock
+        self._loop = asyncio.get_running_loop()
+        self._loop.add_reader(sock.fileno(), self._on_readable, handler)
+
+    def _on_readable(self, handler: MessageHandler) -> None:
+        while True:
+            try:
+                payload = self._sock.recv(1 << 20)
+            except (BlockingIOError, InterruptedError):
+                return
+            task = asyncio.ensure_future(handler(payload))
+            self._handling.add(task)
+            task.add_done_callback(self._handling.discard)
+
+    async def publish(self, payload: bytes) -> None:
+        if self._sock is None:
+            return
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            if path == self.path or not name.endswith(".sock"):
+                continue
+            try:
+                self._sock.sendto(payload, path)
+            except (ConnectionRefusedError, FileNotFoundError):
+                # Worker is gone; drop its socket file
+                try:
+                    os.unlink(path)
+                except OSError:
+                    pass
+            except (BlockingIOError, OSError) as e:
+                logger.warning(f"Invalidation to {path} dropped: {e!s}")
+
+    async def close(self) -> None:
+        if self._sock is None:
+            return
+        self._loop.remove_reader(self._sock.fileno())
+        self._sock.close()
+        self._sock = None
+        try:
+            os.unlink(self.path)
+        except OSError:
+            pass
+
+
+class RedisTransport(InvalidationTransport):
+    """Transport between workers on any host over Redis pub/sub"""
+
+    def __init__(
+        self,
+        redis_url: str = "redis://localhost:6379",
+        channel: str = "fastapi_easy:invalidation",
+    ):
+        """Initialize transport
+
+        Args:
+            redis_url: Redis connection URL
+            channel: Pub/sub channel shared by all workers
+        """
+        if not REDIS_AVAILABLE:
+            raise ImportError("redis package is required for RedisTransport")
+
+        self.redis_url = redis_url
+        self.channel = channel
+        self._redis: Optional[redis.Redis] = None
+        self._pubsub = None
+        self._reader: Optional[asyncio.Task] = None
+
+    async def start(self, handler: MessageHandler) -> None:
+        self._redis = redis.Redis.from_url(self.redis_url)
+        self._pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+        await self._pubsub.subscribe(self.channel)
+        self._reader = asyncio.create_task(self._read(handler))
+
+    async def _read(self, handler: MessageHandler) -> None:
+        async for message in self._pubsub.listen():
+            if message.get("type") == "message":
+                await handler(message["data"])
+
+    async def publish(self, payload: bytes) -> None:
+        if self._redis is None:
+            return
+        await self._redis.publish(self.channel, payload)
+
+    async def close(self) -> None:
+        if self._reader is not None:
+            self._reader.cancel()
+            try:
+                await self._reader
+            except asyncio.CancelledError:
+                pass
+            self._reader = None
+        if self._pubsub is not None:
+            await self._pubsub.unsubscribe(self.channel)
+            await self._pubsub.close()
+            self._pubsub = None
+        if self._redis is not None:
+            await self._redis.close()
+            self._redis = None
+
+
+class InvalidationBus:
+    """Batches local invalidations out and applies remote ones to caches
+
+    Subscribed caches need async ``delete(key)``, ``invalidate_by_tags(tags)``
+    and ``clear()``, as :class:`QueryCache`, :class:`MultiLayerCache` and
+    :class:`L1MemoryCache` have. Messages carry the id of the bus that sent
+    them, so a worker never re-applies its own invalidations, and publishes
+    made while a remote message is applied are dropped, so caches that both
+    publish and subscribe do not echo it back.
+
+    Caches, adapters and routers that accept an ``invalidation_bus`` publish
+    and subscribe on their own; the bus must be started to receive, e.g.
+    from the application's lifespan.
+
+    Usage:
+        bus = InvalidationBus(RedisTransport("redis://redis:6379"))
+        manager = AdvancedCacheManager(invalidation_bus=bus)
+        await manager.start()
+    """
+
+    def __init__(
+        self,
+        transport: InvalidationTransport,
+        flush_interval: float = 0.01,
+        max_batch: int = 500,
+    ):
+        """Initialize bus
+
+        Args:
+            transport: Transport carrying the messages
+            flush_interval: Seconds invalidations are buffered before sending
+            max_batch: Keys plus tags per message; a fuller buffer is sent
+                right away
+        """
+        self.transport = transport
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self.node_id = uuid.uuid4().hex
+        self._subscribers: List[Any] = []
+        self._keys: Set[str] = set()
+        self._tags: Set[str] = set()
+        self._clear = False
+        self._flush_task: Optional[asyncio.Task] = None
+        self._tasks: Set[asyncio.Task] = set()
+        self._started = False
+        self.stats = {
+            "published": 0,
+            "received": 0,
+            "deduplicated": 0,
+            "keys_sent": 0,
+            "tags_sent": 0,
+        }
+
+    def subscribe(self, cache: Any) -> None:
+        """Apply invalidations from other workers to a cache"""
+        self._subscribers.append(cache)
+
+    async def start(self) -> None:
+        """Start receiving invalidations"""
+        if not self._started:
+            await self.transport.start(self._receive)
+            self._started = True
+
+    def publish(
+        self, keys: Iterable[str] = (), tags: Iterable[str] = (), clear: bool = False
+    ) -> None:
+        """Queue invalidations for the other workers
+
+        Args:
+            keys: Deleted cache keys
+            tags: Invalidated tags
+            clear: Whether the whole cache was cleared
+        """
+        if _applying_remote.get():
+            return
+        keys, tags = list(keys), list(tags)
+        queued = len(self._keys) + len(self._tags)
+        self._keys.update(keys)
+        self._tags.update(tags)
+        self._clear = self._clear or clear
+        pending = len(self._keys) + len(self._tags)
+        self.stats["deduplicated"] += len(keys) + len(tags) - (pending - queued)
+        if not pending and not self._clear:
+            return
+
+        if pending >= self.max_batch:
+            self._spawn(0)
+        elif self._flush_task is None or self._flush_task.done():
+            self._flush_task = self._spawn(self.flush_interval)
+
+    def _spawn(self, delay: float) -> asyncio.Task:
+        task = asyncio.ensure_future(self._flush_after(delay))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def _flush_after(self, delay: float) -> None:
+        if delay > 0:
+            await asyncio.sleep(delay)
+        try:
+            # Shielded so cancelling the timer never drops a batch in flight
+            await asyncio.shield(self.flush())
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Invalidation publish failed: {e!s}")
+
+    async def flush(self) -> None:
+        """Send all queued invalidations now"""
+        keys, tags, clear = sorted(self._keys), sorted(self._tags), self._clear
+        self._keys, self._tags, self._clear = set(), set(), False
+        if clear:
+            # A clear supersedes every key and tag queued with it
+            keys, tags = [], []
+        elif not keys and not tags:
+            return
+
+        items = [("k", key) for key in keys] + [("t", tag) for tag in tags]
+        for start in range(0, max(len(items), 1), self.max_batch):
+            chunk = items[start : start + self.max_batch]
+            message = {
+                "origin": self.node_id,
+                "keys": [value for kind, value in chunk if kind == "k"],
+                "tags": [value for kind, value in chunk if kind == "t"],
+                "clear": clear,
+            }
+            await self.transport.publish(json.dumps(message).encode())
+            self.stats["published"] += 1
+            self.stats["keys_sent"] += len(message["keys"])
+            self.stats["tags_sent"] += len(message["tags"])
+
+    async def _receive(self, payload: bytes) -> None:
+        try:
+            message = json.loads(payload)
+        except ValueError:
+            logger.warning("Ignoring malformed invalidation message")
+            return
+        if message.get("origin") == self.node_id:
+            return
+
+        self.stats["received"] += 1
+        keys = message.get("keys") or ()
+        tags = set(message.get("tags") or ())
+        token = _applying_remote.set(True)
+        try:
+            for cache in self._subscribers:
+                try:
+                    if message.get("clear"):
+                        await cache.clear()
+                        continue
+                    for key in keys:
+                        await cache.delete(key)
+                    if tags:
+                        await cache.invalidate_by_tags(tags)
+                except Exception as e:
+                    logger.warning(f"Applying remote invalidation failed: {e!s}")
+        finally:
+            _applying_remote.reset(token)
+
+    async def close(self) -> None:
+        """Send queued invalidations and stop the transport"""
+        for task in list(self._tasks):
+            task.cancel()
+        await self.flush()
+        if self._started:
+            await self.transport.close()
+            self._started = False
@@ -3,11 +3,11 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Optional
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Union
 
 from .cache import QueryCache
-from .cache_eviction import CacheEvictionManager
-from .reentrant_lock import ReentrantAsyncLock
+from .invalidation_bus import InvalidationBus
+from .single_flight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
@@ -18,8 +18,16 @@ class MultiLayerCache:
     Features:
     - L1: Hot data cache with short TTL
     - L2: Cold data cache with long TTL
-    - Automatic eviction with LRU strategy
-    - Concurrent access protection
+    - O(1) LRU eviction in each tier
+    - Lock-free: tier operations never await, so each call is atomic on the
+      event loop
+    - ``get_or_load``: concurrent misses for a key share one loader call,
+      and with ``stale_ttl`` an expired value is served while one background
+      refresh runs
+    - Optional per-tier byte budgets (``l1_max_bytes``/``l2_max_bytes``) with
+      size-aware eviction
+    - Optional ``invalidation_bus`` carrying deletes, tag invalidations and
+      clears to and from the caches of other workers
     """
 
     def __init__(
@@ -28,6 +36,11 @@ class MultiLayerCache:
         l1_ttl: int = 60,
         l2_size: int = 10000,
         l2_ttl: int = 600,
+        stale_ttl: int = 0,
+        l1_max_bytes: Optional[int] = None,
+        l2_max_bytes: Optional[int] = None,
+        eviction: str = "lru",
+        invalidation_bus: Optional[InvalidationBus] = None,
     ):
         """Initialize multi-layer cache
 
@@ -36,19 +49,40 @@ class MultiLayerCache:
             l1_ttl: L1 cache TTL in seconds (short)
             l2_size: L2 cache max size (cold data)
             l2_ttl: L2 cache TTL in seconds (long)
+            stale_ttl: Seconds an expired entry may still be served by
+                ``get_or_load`` while it is refreshed (0 disables)
+            l1_max_bytes: L1 byte budget (None bounds L1 by entries only)
+            l2_max_bytes: L2 byte budget (None bounds L2 by entries only)
+            eviction: Eviction policy of both tiers, ``"lru"``, ``"gdsf"`` or
+                scan-resistant ``"tinylfu"``
+            invalidation_bus: Bus shared with the other workers' caches
         """
         # L1: Hot data cache (short TTL)
-        self.l1_cache = QueryCache(max_size=l1_size, default_ttl=l1_ttl)
+        self.l1_cache = QueryCache(
+            max_size=l1_size,
+            default_ttl=l1_ttl,
+            stale_ttl=stale_ttl,
+            max_bytes=l1_max_bytes,
+            eviction=eviction,
+        )
 
         # L2: Cold data cache (long TTL)
-        self.l2_cache = QueryCache(max_size=l2_size, default_ttl=l2_ttl)
-
-        # Eviction managers for each tier
-        self.l1_eviction = CacheEvictionManager(strategy="lru")
-        self.l2_eviction = CacheEvictionManager(strategy="lfu")
-
-        # Concurrent access protection
-        self.lock = ReentrantAsyncLock()
+        self.l2_cache = QueryCache(
+            max_size=l2_size,
+            default_ttl=l2_ttl,
+            stale_ttl=stale_ttl,
+            max_bytes=l2_max_bytes,
+            eviction=eviction,
+        )
+
+        # Coalesces concurrent loads of the same key
+        self.single_flight = SingleFlight()
+        self.stale_ttl = stale_ttl
+
+        # Cross-worker invalidation of both tiers
+        self.invalidation_bus = invalidation_bus
+        if invalidation_bus is not None:
+            invalidation_bus.subscribe(self)
 
         # Size limits
         self.l1_max_size = l1_size
@@ -58,88 +92,145 @@ class MultiLayerCache:
         self.l1_hits = 0
         self.l2_hits = 0
         self.misses = 0
+        self.stale_hits = 0
 
     async def get(self, key: str) -> Optional[Any]:
         """Get value from cache (L1 first, then L2)
 
-        Thread-safe with concurrent access protection.
-
         Args:
             key: Cache key
 
         Returns:
             Cached value or None if not found
         """
-        async with self.lock:
-            # Try L1 first (hot data)
-            result = await self.l1_cache.get(key)
-            if result is not None:
-                self.l1_hits += 1
-                # Record access for LRU eviction
-                self.l1_eviction.record_access(key)
-                return result
-
-            # Try L2 (cold data)
-            result = await self.l2_cache.get(key)
-            if result is not None:
-                self.l2_hits += 1
-                # Record access for LFU eviction
-                self.l2_eviction.record_access(key)
-                # Promote to L1 with eviction check
-                await self.l1_eviction.check_and_evict(self.l1_cache._cache, self.l1_max_size)
-                await self.l1_cache.set(key, result)
-                self.l1_eviction.record_insertion(key)
-                return result
-
-            # Cache miss
-            self.misses += 1
-            return None
-
-    async def set(self, key: str, value: Any, tier: str = "l1") -> None:
-        """Set value in cache with automatic eviction
-
-        Thread-safe with concurrent access protection.
+        # Try L1 first (hot data)
+        result = await self.l1_cache.get(key)
+        if result is not None:
+            self.l1_hits += 1
+            return result
+
+        # Try L2 (cold data) and promote hits to L1
+        result = await self.l2_cache.get(key)
+        if result is not None:
+            self.l2_hits += 1
+            await self.l1_cache.set(key, result, tags=self.l2_cache.get_tags(key))
+            return result
+
+        # Cache miss
+        self.misses += 1
+        return None
+
+    async def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        tier: str = "l1",
+        tags: Union[Iterable[str], Callable[[Any], Optional[Iterable[str]]], None] = None,
+    ) -> Any:
+        """Get value from cache, loading and storing it on a miss
+
+        Concurrent misses for the same key await a single ``loader`` call.
+        With ``stale_ttl``, an expired value is returned immediately and one
+        background call refreshes it.
+
+        Args:
+            key: Cache key, e.g. from ``CacheKeyGenerator``
+            loader: Zero-argument callable returning an awaitable value
+            tier: Which tier to store loaded values in ("l1", "l2" or "both")
+            tags: Tags for the stored value, or a callable computing them from
+                the value; a callable returning None skips caching
+
+        Returns:
+            Cached or loaded value (None results are not cached)
+        """
+        value = await self.get(key)
+        if value is not None:
+            return value
+
+        async def load_and_store() -> Any:
+            result = await loader()
+            if result is None:
+                return None
+            entry_tags = tags
+            if callable(tags):
+                entry_tags = tags(result)
+                if entry_tags is None:
+                    return result
+            await self.set(key, result, tier=tier, tags=entry_tags)
+            return result
+
+        if self.stale_ttl:
+            stale = self.l1_cache.get_stale(key)
+            if stale is None:
+                stale = self.l2_cache.get_stale(key)
+            if stale is not None:
+                self.stale_hits += 1
+                self.single_flight.spawn(key, load_and_store)
+                return stale
+
+        return await self.single_flight.do(key, load_and_store)
+
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        tier: str = "l1",
+        tags: Optional[Iterable[str]] = None,
+        ttl: Optional[int] = None,
+    ) -> None:
+        """Set value in cache
+
+        Each tier evicts its least recently used entry when full.
 
         Args:
             key: Cache key
             value: Value to cache
             tier: Which tier to set ("l1" or "l2")
+            tags: Tags to register the entry under (see :mod:`.cache_tags`)
+            ttl: Time to live in seconds (uses the tier's default if None)
         """
-        async with self.lock:
-            if tier == "l1":
-                # Check and evict if necessary
-                await self.l1_eviction.check_and_evict(self.l1_cache._cache, self.l1_max_size)
-                await self.l1_cache.set(key, value)
-                self.l1_eviction.record_insertion(key)
-            elif tier == "l2":
-                # Check and evict if necessary
-                await self.l2_eviction.check_and_evict(self.l2_cache._cache, self.l2_max_size)
-                await self.l2_cache.set(key, value)
-                self.l2_eviction.record_insertion(key)
-            else:
-                # Default: set in both tiers
-                await self.l1_eviction.check_and_evict(self.l1_cache._cache, self.l1_max_size)
-                await self.l2_eviction.check_and_evict(self.l2_cache._cache, self.l2_max_size)
-                await self.l1_cache.set(key, value)
-                await self.l2_cache.set(key, value)
-                self.l1_eviction.record_insertion(key)
-                self.l2_eviction.record_insertion(key)
+        if tier == "l1":
+            await self.l1_cache.set(key, value, ttl=ttl, tags=tags)
+        elif tier == "l2":
+            await self.l2_cache.set(key, value, ttl=ttl, tags=tags)
+        else:
+            # Default: set in both tiers
+            await self.l1_cache.set(key, value, ttl=ttl, tags=tags)
+            await self.l2_cache.set(key, value, ttl=ttl, tags=tags)
 
     async def delete(self, key: str) -> None:
-        """Delete value from both caches with lock protection
+        """Delete value from both caches
 
         Args:
             key: Cache key
         """
-        async with self.lock:
-            await self.l1_cache.delete(key)
-            await self.l2_cache.delete(key)
+        await self.l1_cache.delete(key)
+        await self.l2_cache.delete(key)
+        if self.invalidation_bus is not None:
+            self.invalidation_bus.publish(keys=(key,))
 
     async def clear(self) -> None:
         """Clear all caches"""
-        async with self.lock:
-            await self.l1_cache.clear()
-            await self.l2_cache.clear()
+        await self.l1_cache.clear()
+        await self.l2_cache.clear()
+        if self.invalidation_bus is not None:
+            self.invalidation_bus.publish(clear=True)
+
+    async def invalidate_by_tags(self, tags: Iterable[str]) -> int:
+        """Delete entries registered under any of the tags from both tiers
+
+        Args:
+            tags: Tags to invalidate
+
+        Returns:
+            Number of entries removed across both tiers
+        """
+        tags = list(tags)
+        l1_removed = await self.l1_cache.invalidate_by_tags(tags)
+        l2_removed = await self.l2_cache.invalidate_by_tags(tags)
+        if self.invalidation_bus is not None:
+            self.invalidation_bus.publish(tags=tags)
+        return l1_removed + l2_removed
 
     async def cleanup(self) -> None:
         """Clean up resources
@@ -156,24 +247,24 @@ class MultiLayerCache:
             List of all cache keys
         """
         try:
-            async with self.lock:
-                l1_keys = list(self.l1_cache._cache.keys())
-                l2_keys = list(self.l2_cache._cache.keys())
-                return l1_keys + l2_keys
+            return self.l1_cache.keys() + self.l2_cache.keys()
         except Exception as e:
             logger.error(f"Failed to get all keys: {e!s}")
             return []
 
     async def cleanup_expired(self) -> int:
-        """Clean up expired entries from both caches with lock protection
+        """Clean up expired entries from both caches
 
         Returns:
             Total number of entries removed
         """
-        async with self.lock:
-            l1_removed = await self.l1_cache.cleanup_expired()
-            l2_removed = await self.l2_cache.cleanup_expired()
-            return l1_removed + l2_removed
+        l1_removed = await self.l1_cache.cleanup_expired()
+        l2_removed = await self.l2_cache.cleanup_expired()
+        return l1_removed + l2_removed
+
+    def get_bytes(self) -> Dict[str, int]:
+        """Estimated bytes held by each tier"""
+        return {"l1": self.l1_cache.total_bytes, "l2": self.l2_cache.total_bytes}
 
     def get_stats(self) -> dict:
         """Get cache statistics
@@ -190,6 +281,8 @@ class MultiLayerCache:
             "misses": self.misses,
             "total_requests": total_requests,
             "hit_rate": f"{hit_rate:.1f}%",
+            "stale_hits": self.stale_hits,
+            "coalesced": self.single_flight.coalesced,
             "l1_stats": self.l1_cache.get_stats(),
             "l2_stats": self.l2_cache.get_stats(),
         }
@@ -200,6 +293,11 @@ def create_multilayer_cache(
     l1_ttl: int = 60,
     l2_size: int = 10000,
     l2_ttl: int = 600,
+    stale_ttl: int = 0,
+    l1_max_bytes: Optional[int] = None,
+    l2_max_bytes: Optional[int] = None,
+    eviction: str = "lru",
+    invalidation_bus: Optional[InvalidationBus] = None,
 ) -> MultiLayerCache:
     """Create a multi-layer cache instance
 
@@ -208,8 +306,23 @@ def create_multilayer_cache(
         l1_ttl: L1 cache TTL in seconds
         l2_size: L2 cache max size
         l2_ttl: L2 cache TTL in seconds
+        stale_ttl: Seconds expired entries may be served while refreshed
+        l1_max_bytes: L1 byte budget
+        l2_max_bytes: L2 byte budget
+        eviction: Eviction policy, ``"lru"``, ``"gdsf"`` or ``"tinylfu"``
+        invalidation_bus: Bus shared with the other workers' caches
 
     Returns:
         Multi-layer cache instance
     """
-    return MultiLayerCache(l1_size, l1_ttl, l2_size, l2_ttl)
+    return MultiLayerCache(
+        l1_size,
+        l1_ttl,
+        l2_size,
+        l2_ttl,
+        stale_ttl,
+        l1_max_bytes,
+        l2_max_bytes,
+        eviction,
+        invalidation_bus,
+    )
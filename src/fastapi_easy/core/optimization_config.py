@@ -25,6 +25,7 @@ class OptimizationConfig:
         pool_size: int = 5,
         max_overflow: int = 10,
         pool_timeout: int = 30,
+        negative_ttl: int = 5,
     ):
         """Initialize optimization config
 
@@ -41,6 +42,7 @@ class OptimizationConfig:
             pool_size: Database connection pool size
             max_overflow: Max overflow connections for pool
             pool_timeout: Pool timeout in seconds
+            negative_ttl: Seconds a "not found" result stays cached (0 disables)
         """
         self.enable_cache = enable_cache
         self.enable_async = enable_async
@@ -54,6 +56,7 @@ class OptimizationConfig:
         self.pool_size = pool_size
         self.max_overflow = max_overflow
         self.pool_timeout = pool_timeout
+        self.negative_ttl = negative_ttl
 
     @classmethod
     def from_env(cls) -> OptimizationConfig:
@@ -69,6 +72,7 @@ class OptimizationConfig:
         - FASTAPI_EASY_MAX_CONCURRENT (int)
         - FASTAPI_EASY_ENABLE_MONITORING (true/false)
         - FASTAPI_EASY_HIT_RATE_THRESHOLD (float)
+        - FASTAPI_EASY_NEGATIVE_TTL (int)
 
         Returns:
             Configuration instance
@@ -91,6 +95,7 @@ class OptimizationConfig:
             max_concurrent=int(os.getenv("FASTAPI_EASY_MAX_CONCURRENT", "10")),
             enable_monitoring=parse_bool(os.getenv("FASTAPI_EASY_ENABLE_MONITORING", "true"), True),
             hit_rate_threshold=float(os.getenv("FASTAPI_EASY_HIT_RATE_THRESHOLD", "50.0")),
+            negative_ttl=int(os.getenv("FASTAPI_EASY_NEGATIVE_TTL", "5")),
         )
 
     @classmethod
@@ -128,6 +133,7 @@ class OptimizationConfig:
             "max_concurrent": self.max_concurrent,
             "enable_monitoring": self.enable_monitoring,
             "hit_rate_threshold": self.hit_rate_threshold,
+            "negative_ttl": self.negative_ttl,
         }
 
     def to_json(self) -> str:
@@ -5,10 +5,13 @@ from __future__ import annotations
 import asyncio
 import logging
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Set
 
 from .async_batch import AsyncBatchProcessor
+from .cache import NOT_FOUND
 from .cache_key_generator import generate_cache_key
+from .cache_tags import field_tag, item_tag, list_tag, query_tags
+from .invalidation_bus import InvalidationBus
 from .lock_manager import LockManager
 from .multilayer_cache import MultiLayerCache
 
@@ -19,10 +22,15 @@ class OptimizedSQLAlchemyAdapter:
     """SQLAlchemy adapter with integrated performance optimizations
 
     Combines:
-    - Multi-layer caching (L1/L2)
+    - Multi-layer caching (L1/L2) with single-flight loading: concurrent
+      misses for the same key run one query, and with ``stale_ttl`` in the
+      cache config an expired entry is served while it is refreshed
     - Async batch processing
     - Query projection
-    - Automatic cache invalidation
+    - Tag-based cache invalidation: writes drop only the entries that depend
+      on the written items or fields (see :mod:`.cache_tags`)
+    - Negative caching: a missing id is remembered for ``negative_ttl``
+      seconds (cache config, default 5), until an item with that id is created
     """
 
     def __init__(
@@ -33,6 +41,7 @@ class OptimizedSQLAlchemyAdapter:
         cache_config: Optional[Dict[str, Any]] = None,
         async_config: Optional[Dict[str, Any]] = None,
         query_timeout: float = 30.0,
+        invalidation_bus: Optional[InvalidationBus] = None,
     ):
         """Initialize optimized adapter
 
@@ -43,6 +52,8 @@ class OptimizedSQLAlchemyAdapter:
             cache_config: Cache configuration
             async_config: Async configuration
             query_timeout: Query timeout in seconds (default: 30)
+            invalidation_bus: Bus carrying cache invalidations to and from
+                the other workers
         """
         from .config_validator import ConfigValidator
 
@@ -65,9 +76,16 @@ class OptimizedSQLAlchemyAdapter:
                 l1_ttl=cache_cfg.get("l1_ttl", 60),
                 l2_size=cache_cfg.get("l2_size", 10000),
                 l2_ttl=cache_cfg.get("l2_ttl", 600),
+                stale_ttl=cache_cfg.get("stale_ttl", 0),
+                l1_max_bytes=cache_cfg.get("l1_max_bytes"),
+                l2_max_bytes=cache_cfg.get("l2_max_bytes"),
+                eviction=cache_cfg.get("eviction", "lru"),
+                invalidation_bus=invalidation_bus,
             )
+            self.negative_ttl = cache_cfg.get("negative_ttl", 5)
         else:
             self.cache = None
+            self.negative_ttl = 0
 
         # Initialize async processor
         if enable_async:
@@ -83,6 +101,9 @@ class OptimizedSQLAlchemyAdapter:
 
         # Track model for cache invalidation
         self.model = base_adapter.model
+        self._model_name = getattr(self.model, "__name__", None) or str(self.model)
+        pk_field = getattr(base_adapter, "pk_field", "id")
+        self._pk_field = pk_field if isinstance(pk_field, str) else "id"
 
     async def _execute_with_timeout(self, coro, operation: str) -> Any:
         """Execute async operation with timeout
@@ -106,7 +127,8 @@ class OptimizedSQLAlchemyAdapter:
     def _get_cache_key(self, operation: str, **kwargs) -> str:
         """Generate cache key for operation
 
-        Uses secure MD5-based key generation to prevent collisions.
+        Parameters are canonicalized, so equal filters give equal keys
+        regardless of dict order.
 
         Args:
             operation: Operation name (get_all, get_one, etc.)
@@ -117,11 +139,36 @@ class OptimizedSQLAlchemyAdapter:
         """
         return generate_cache_key(operation, **kwargs)
 
+    def _item_ids(self, items: List[Any]) -> List[Any]:
+        """Primary keys of ``items`` (ORM instances or dicts)"""
+        return [
+            (
+                item.get(self._pk_field)
+                if isinstance(item, dict)
+                else getattr(item, self._pk_field, None)
+            )
+            for item in items
+        ]
+
+    def _item_tags(self, items: List[Any]) -> Set[str]:
+        """Item tags for the primary keys of ``items``"""
+        return {
+            item_tag(self._model_name, item_id)
+            for item_id in self._item_ids(items)
+            if item_id is not None
+        }
+
+    def _field_tags(self, fields: Iterable[str]) -> Set[str]:
+        """Field tags for ``fields``"""
+        return {field_tag(self._model_name, name) for name in fields}
+
     async def get_all(
         self,
         filters: Dict[str, Any],
         sorts: Dict[str, Any],
         pagination: Dict[str, Any],
+        fields: Optional[List[str]] = None,
+        include: Optional[List[str]] = None,
     ) -> List[Any]:
         """Get all items with caching
 
@@ -129,96 +176,129 @@ class OptimizedSQLAlchemyAdapter:
             filters: Filter conditions
             sorts: Sort conditions
             pagination: Pagination info
+            fields: Sparse fieldset passed to the base adapter
+            include: Relationships to eager-load, passed to the base adapter
 
         Returns:
             List of items
         """
-        # Try cache first
-        if self.enable_cache:
-            cache_key = self._get_cache_key(
-                "get_all",
-                filters=str(filters),
-                sorts=str(sorts),
-                pagination=str(pagination),
-            )
-            cached = await self.cache.get(cache_key)
-            if cached is not None:
-                return cached
+        # Only pass (and key on) the optional arguments that were requested
+        options = {}
+        if fields:
+            options["fields"] = fields
+        if include:
+            options["include"] = include
 
-        # Execute query with timeout
+        if not self.enable_cache:
+            return await self._query_all(filters, sorts, pagination, options)
+
+        cache_key = self._get_cache_key(
+            "get_all",
+            filters=str(filters),
+            sorts=str(sorts),
+            pagination=str(pagination),
+            **{name: str(value) for name, value in options.items()},
+        )
+        return await self.cache.get_or_load(
+            cache_key,
+            lambda: self._query_all(filters, sorts, pagination, options),
+            tags=lambda result: self._list_tags(filters, sorts, result),
+        )
+
+    async def _query_all(
+        self,
+        filters: Dict[str, Any],
+        sorts: Dict[str, Any],
+        pagination: Dict[str, Any],
+        options: Dict[str, Any],
+    ) -> List[Any]:
+        """Run get_all on the base adapter, returning [] on timeout"""
         try:
-            result = await self._execute_with_timeout(
-                self.base_adapter.get_all(filters, sorts, pagination), "get_all"
-            )
+            query = self.base_adapter.get_all(filters, sorts, pagination, **options)
+            return await self._execute_with_timeout(query, "get_all")
         except asyncio.TimeoutError:
             logger.error("Query timeout, not caching empty result")
-            # Don't cache timeout results, return empty list directly
             return []
 
-        # Cache result only if successful
-        if self.enable_cache and result:
-            await self.cache.set(cache_key, result)
+    def _list_tags(
+        self, filters: Dict[str, Any], sorts: Dict[str, Any], result: List[Any]
+    ) -> Optional[Set[str]]:
+        """Tags for a get_all result, or None if it should not be cached
 
-        return result
+        Empty results are not cached, nor results with rows lacking their
+        primary key: updates to such rows could not invalidate them.
+        """
+        if not result:
+            return None
+        item_ids = self._item_ids(result)
+        if None in item_ids:
+            return None
+        return query_tags(self._model_name, filters, sorts, item_ids)
 
-    async def get_one(self, id: Any) -> Optional[Any]:
+    async def stream(
+        self,
+        filters: Dict[str, Any],
+        sorts: Dict[str, Any],
+        batch_size: int = 1000,
+    ) -> AsyncIterator[Any]:
+        """Stream items from the base adapter, bypassing the cache
+
+        Args:
+            filters: Filter conditions
+            sorts: Sort conditions
+            batch_size: Number of rows fetched from the database at a time
+
+        Yields:
+            Items in sort order
+        """
+        async for item in self.base_adapter.stream(filters, sorts, batch_size):
+            yield item
+
+    async def get_one(
+        self, id: Any, fields: Optional[List[str]] = None, include: Optional[List[str]] = None
+    ) -> Optional[Any]:
         """Get single item with caching and avalanche prevention
 
-        Prevents cache avalanche by using distributed lock
-        when multiple requests query the same missing item.
+        Concurrent misses for the same id share one query.
 
         Args:
             id: Item id
+            fields: Sparse fieldset; such reads go straight to the base adapter
+            include: Relationships to eager-load; such reads also bypass the cache
 
         Returns:
             Item or None
         """
-        # Try cache first
-        if self.enable_cache:
-            cache_key = self._get_cache_key("get_one", id=id)
-            cached = await self.cache.get(cache_key)
-
-            # Check for cached None value (cache penetration prevention)
-            if cached is not None:
-                if cached == "__NULL__":
-                    return None
-                return cached
-
-        # Use lock to prevent cache avalanche
-        lock_key = f"get_one_{id}"
-        max_retries = 3
-
-        for attempt in range(max_retries):
-            if await self.lock_manager.acquire(lock_key):
-                try:
-                    # Double-check cache after acquiring lock
-                    if self.enable_cache:
-                        cached = await self.cache.get(cache_key)
-                        if cached is not None:
-                            if cached == "__NULL__":
-                                return None
-                            return cached
-
-                    # Execute query
-                    result = await self.base_adapter.get_one(id)
-
-                    # Cache result (including None values for cache penetration prevention)
-                    if self.enable_cache:
-                        cache_value = result if result is not None else "__NULL__"
-                        await self.cache.set(cache_key, cache_value)
+        if fields or include:
+            options = {"fields": fields} if fields else {}
+            if include:
+                options["include"] = include
+            return await self.base_adapter.get_one(id, **options)
 
-                    return result
-                finally:
-                    self.lock_manager.release(lock_key)
-            else:
-                # Lock acquisition failed, wait with exponential backoff
-                if attempt < max_retries - 1:
-                    await asyncio.sleep(0.05 * (2**attempt))
-                else:
-                    logger.error(
-                        f"Failed to acquire lock for get_one({id}) after {max_retries} attempts"
-                    )
-                    return None
+        if not self.enable_cache:
+            return await self.base_adapter.get_one(id)
+
+        cache_key = self._get_cache_key("get_one", id=id)
+        cached = await self.cache.get_or_load(
+            cache_key,
+            lambda: self._load_one(cache_key, id),
+            tags={item_tag(self._model_name, id)},
+        )
+        return None if cached is NOT_FOUND else cached
+
+    async def _load_one(self, cache_key: str, id: Any) -> Any:
+        """Load an item, caching a short-lived tombstone if it does not exist"""
+        result = await self.base_adapter.get_one(id)
+        if result is None and self.negative_ttl:
+            # Repeated lookups of a missing id skip the database until the
+            # tombstone expires or ``create`` drops the item's tag
+            await self.cache.set(
+                cache_key,
+                NOT_FOUND,
+                tags={item_tag(self._model_name, id)},
+                ttl=self.negative_ttl,
+            )
+        return result
 
     async def create(self, data: Dict[str, Any]) -> Any:
         """Create item and invalidate cache
@@ -232,9 +312,9 @@ class OptimizedSQLAlchemyAdapter:
         # Create item
         result = await self.base_adapter.create(data)
 
-        # Invalidate all get_all caches
+        # Lists and counts may now include it; also drop a cached miss for its id
         if self.enable_cache:
-            await self._invalidate_list_cache()
+            await self._invalidate_tags({list_tag(self._model_name)} | self._item_tags([result]))
 
         return result
 
@@ -261,12 +341,12 @@ class OptimizedSQLAlchemyAdapter:
                     # Update item
                     result = await self.base_adapter.update(id, data)
 
-                    # Invalidate specific item cache
+                    # Invalidate the item, the lists that returned it, and the
+                    # lists filtering or sorting on the changed fields
                     if self.enable_cache:
-                        cache_key = self._get_cache_key("get_one", id=id)
-                        await self.cache.delete(cache_key)
-                        # Also invalidate list caches
-                        await self._invalidate_list_cache()
+                        await self._invalidate_tags(
+                            {item_tag(self._model_name, id)} | self._field_tags(data)
+                        )
 
                     return result
                 finally:
@@ -293,12 +373,11 @@ class OptimizedSQLAlchemyAdapter:
         # Delete item
         result = await self.base_adapter.delete_one(id)
 
-        # Invalidate specific item cache
+        # Invalidate the item; every list and count may shift
         if self.enable_cache and result:
-            cache_key = self._get_cache_key("get_one", id=id)
-            await self.cache.delete(cache_key)
-            # Also invalidate list caches
-            await self._invalidate_list_cache()
+            await self._invalidate_tags(
+                {item_tag(self._model_name, id), list_tag(self._model_name)}
+            )
 
         return result
 
@@ -317,44 +396,89 @@ class OptimizedSQLAlchemyAdapter:
 
         return result
 
-    async def count(self, filters: Dict[str, Any]) -> int:
-        """Count items with caching
+    async def bulk_create(self, items: List[Dict[str, Any]]) -> List[Any]:
+        """Create many items and invalidate list caches
 
         Args:
-            filters: Filter conditions
+            items: Item data
 
         Returns:
-            Count
+            Created items
         """
-        # Try cache first
+        result = await self.base_adapter.bulk_create(items)
+
         if self.enable_cache:
-            cache_key = self._get_cache_key("count", filters=str(filters))
-            cached = await self.cache.get(cache_key)
-            if cached is not None:
-                return cached
+            await self._invalidate_tags({list_tag(self._model_name)} | self._item_tags(result))
+
+        return result
 
-        # Execute query
-        result = await self.base_adapter.count(filters)
+    async def bulk_update(self, updates: List[Dict[str, Any]]) -> List[Any]:
+        """Update many items and invalidate cache
+
+        Args:
+            updates: Update data including primary keys
+
+        Returns:
+            Updated items
+        """
+        result = await self.base_adapter.bulk_update(updates)
 
-        # Cache result
         if self.enable_cache:
-            await self.cache.set(cache_key, result)
+            tags = self._item_tags(updates)
+            for data in updates:
+                tags |= self._field_tags(name for name in data if name != self._pk_field)
+            await self._invalidate_tags(tags)
 
         return result
 
-    async def _invalidate_list_cache(self) -> None:
-        """Invalidate list-related caches with fine-grained control
+    async def bulk_delete(self, ids: List[Any]) -> int:
+        """Delete many items and invalidate cache
 
-        Clears all list-related caches to ensure data consistency.
+        Args:
+            ids: Item ids
+
+        Returns:
+            Number of deleted items
+        """
+        result = await self.base_adapter.bulk_delete(ids)
+
+        if self.enable_cache and result:
+            tags = {item_tag(self._model_name, item_id) for item_id in ids}
+            await self._invalidate_tags(tags | {list_tag(self._model_name)})
+
+        return result
+
+    async def count(self, filters: Dict[str, Any]) -> int:
+        """Count items with caching
+
+        Args:
+            filters: Filter conditions
+
+        Returns:
+            Count
+        """
+        if not self.enable_cache:
+            return await self.base_adapter.count(filters)
+
+        cache_key = self._get_cache_key("count", filters=filters)
+        return await self.cache.get_or_load(
+            cache_key,
+            lambda: self.base_adapter.count(filters),
+            tags=query_tags(self._model_name, filters),
+        )
+
+    async def _invalidate_tags(self, tags: Set[str]) -> None:
+        """Invalidate the cache entries registered under ``tags``
+
+        Args:
+            tags: Tags affected by a write
         """
         if not self.enable_cache:
             return
 
         try:
-            # Clear all caches to ensure consistency
-            # This is a conservative approach that guarantees correctness
-            await self.cache.clear()
-            logger.debug("Cleared all caches after data modification")
+            removed = await self.cache.invalidate_by_tags(tags)
+            logger.debug(f"Invalidated {removed} cache entries after data modification")
         except (ConnectionError, TimeoutError) as e:
             logger.error(f"Cache connection error during invalidation: {e!s}")
         except Exception as e:
@@ -507,7 +631,9 @@ class OptimizedSQLAlchemyAdapter:
 
                             if item_id:
                                 cache_key = self._get_cache_key("get_one", id=item_id)
-                                await self.cache.set(cache_key, item)
+                                await self.cache.set(
+                                    cache_key, item, tags={item_tag(self._model_name, item_id)}
+                                )
                                 count += 1
                         except Exception as e:
                             logger.warning(f"Failed to cache item: {e!s}")
@@ -554,6 +680,7 @@ def create_optimized_adapter(
     enable_async: bool = True,
     cache_config: Optional[Dict[str, Any]] = None,
     async_config: Optional[Dict[str, Any]] = None,
+    invalidation_bus: Optional[InvalidationBus] = None,
 ) -> OptimizedSQLAlchemyAdapter:
     """Create an optimized adapter
 
@@ -563,6 +690,7 @@ def create_optimized_adapter(
         enable_async: Enable async processing
         cache_config: Cache configuration
         async_config: Async configuration
+        invalidation_bus: Bus shared with the other workers' caches
 
     Returns:
         Optimized adapter instance
@@ -573,4 +701,5 @@ def create_optimized_adapter(
         enable_async=enable_async,
         cache_config=cache_config,
         async_config=async_config,
+        invalidation_bus=invalidation_bus,
     )
@@ -44,7 +44,9 @@ from sqlalchemy import Select, and_, asc, desc, func, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import DeclarativeBase
 
+from ..backends.sqlalchemy import fetch_page_with_total
 from .cache import QueryCache
+from .cache_tags import field_tag, item_tag, list_tag, query_tags
 from .errors import ConflictError
 from .optimized_database import get_db_manager, monitor_performance
 
@@ -198,6 +200,11 @@ class OptimizedCRUDRouter(APIRouter):
         key_parts = [self.model.__name__, operation, str(params or {})]
         return ":".join(key_parts)
 
+    async def _invalidate_cache(self, tags: Set[str]) -> None:
+        """Drop cached results registered under any of ``tags``"""
+        if self.cache:
+            await self.cache.invalidate_by_tags(tags)
+
     @monitor_performance
     async def _get_all(
         self,
@@ -231,16 +238,8 @@ class OptimizedCRUDRouter(APIRouter):
         # Apply sorting
         base_query = self._apply_sorting(base_query, query_params.sorts)
 
-        # Get total count
-        count_query = Select(func.count()).select_from(base_query.subquery())
-        total_count = await session.scalar(count_query)
-
-        # Apply pagination and fetch
-        query = base_query.offset(offset).limit(page_size)
-        result = await session.execute(query)
-        items = result.scalars().all()
-
-        return list(items), total_count
+        # Fetch the page and total count in one round-trip (COUNT(*) OVER ())
+        return await fetch_page_with_total(session, base_query, offset, page_size)
 
     def _apply_filters(self, query: Select, filters: Dict[str, Any]) -> Select:
         """Apply filters to query"""
@@ -381,7 +380,15 @@ class OptimizedCRUDRouter(APIRouter):
 
                 # Cache result
                 if self.cache:
-                    await self.cache.set(cache_key, result, self.cache_ttl)
+                    item_ids = [getattr(item, self.id_field, None) for item in items]
+                    await self.cache.set(
+                        cache_key,
+                        result,
+                        self.cache_ttl,
+                        tags=query_tags(
+                            self.model.__name__, query_params.filters, query_params.sorts, item_ids
+                        ),
+                    )
 
                 return result
 
@@ -430,7 +437,12 @@ class OptimizedCRUDRouter(APIRouter):
 
                 # Cache result
                 if self.cache:
-                    await self.cache.set(cache_key, serialized_item, self.cache_ttl)
+                    await self.cache.set(
+                        cache_key,
+                        serialized_item,
+                        self.cache_ttl,
+                        tags={item_tag(self.model.__name__, item_id)},
+                    )
 
                 return serialized_item
 
@@ -460,9 +472,8 @@ class OptimizedCRUDRouter(APIRouter):
                     await session.flush()  # Get the ID without committing
                     await session.commit()
 
-                    # Invalidate relevant cache
-                    if self.cache:
-                        await self.cache.invalidate_pattern("get_all")
+                    # Lists and counts may now include the new item
+                    await self._invalidate_cache({list_tag(self.model.__name__)})
 
                     # Refresh and serialize
                     await session.refresh(db_item)
@@ -524,10 +535,13 @@ class OptimizedCRUDRouter(APIRouter):
                 try:
                     await session.commit()
 
-                    # Invalidate cache
-                    if self.cache:
-                        await self.cache.invalidate_pattern(f"get_one:{item_id}")
-                        await self.cache.invalidate_pattern("get_all")
+                    # Invalidate the item, the lists that returned it, and the
+                    # lists filtering or sorting on the changed fields
+                    model_name = self.model.__name__
+                    await self._invalidate_cache(
+                        {item_tag(model_name, item_id)}
+                        | {field_tag(model_name, field) for field in update_data}
+                    )
 
                     # Refresh and serialize
                     await session.refresh(item)
@@ -586,10 +600,10 @@ class OptimizedCRUDRouter(APIRouter):
                 try:
                     await session.commit()
 
-                    # Invalidate cache
-                    if self.cache:
-                        await self.cache.invalidate_pattern(f"get_one:{item_id}")
-                        await self.cache.invalidate_pattern("get_all")
+                    # Invalidate the item; every list and count may shift
+                    await self._invalidate_cache(
+                        {item_tag(self.model.__name__, item_id), list_tag(self.model.__name__)}
+                    )
 
                     if self.enable_soft_delete and soft:
                         return {"message": f"{self.schema.__name__} soft deleted successfully"}
@@ -650,9 +664,8 @@ class OptimizedCRUDRouter(APIRouter):
                 try:
                     await session.commit()
 
-                    # Invalidate cache
-                    if self.cache:
-                        await self.cache.invalidate_pattern("get_all")
+                    # Lists and counts may now include the new items
+                    await self._invalidate_cache({list_tag(self.model.__name__)})
 
                     # Serialize results
                     serialized_items = [
@@ -721,9 +734,15 @@ class OptimizedCRUDRouter(APIRouter):
                 try:
                     await session.commit()
 
-                    # Invalidate cache
-                    if self.cache:
-                        await self.cache.invalidate_pattern("get_all")
+                    # Invalidate the updated items and lists on the changed fields
+                    model_name = self.model.__name__
+                    tags = set()
+                    for update_item in batch_data.items:
+                        tags.add(item_tag(model_name, update_item.get("id")))
+                        tags.update(
+                            field_tag(model_name, field) for field in update_item.get("data", {})
+                        )
+                    await self._invalidate_cache(tags)
 
                     # Serialize results
                     serialized_items = [
@@ -787,9 +806,12 @@ class OptimizedCRUDRouter(APIRouter):
                 try:
                     await session.commit()
 
-                    # Invalidate cache
-                    if self.cache:
-                        await self.cache.invalidate_pattern("get_all")
+                    # Invalidate the deleted items; every list and count may shift
+                    model_name = self.model.__name__
+                    await self._invalidate_cache(
+                        {item_tag(model_name, item_id) for item_id in batch_data.ids}
+                        | {list_tag(model_name)}
+                    )
 
                     response = {
                         "deleted_count": deleted_count,
@@ -883,14 +905,10 @@ class OptimizedCRUDRouter(APIRouter):
                         getattr(self.model, self.soft_delete_field).is_(None)
                     )
 
-                # Get count and paginated results
-                count_query = Select(func.count()).select_from(base_query.subquery())
-                total_count = await session.scalar(count_query)
-
-                offset = (page - 1) * page_size
-                query = base_query.offset(offset).limit(page_size)
-                result = await session.execute(query)
-                items = result.scalars().all()
+                # Get paginated results and total in one round-trip
+                items, total_count = await fetch_page_with_total(
+                    session, base_query, (page - 1) * page_size, page_size
+                )
 
                 # Serialize results
                 serialized_items = [self.response_schema.model_validate(item) for item in items]
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -201,6 +201,35 @@ class ProjectionBuilder:
         return QueryProjection(self.fields.copy())
 
 
+def parse_fields(
+    value: Optional[str], available_fields: List[str], kind: str = "fields"
+) -> Optional[List[str]]:
+    """Parse a ``fields`` query parameter into a sparse fieldset
+
+    Args:
+        value: Comma-separated field names, e.g. ``"id,name"``
+        available_fields: Field names that may be requested
+        kind: What the names refer to, used in the error message
+
+    Returns:
+        De-duplicated field names in request order, or None if none were given
+
+    Raises:
+        ValueError: If unknown fields are requested
+    """
+    if not value:
+        return None
+
+    fields = list(dict.fromkeys(name.strip() for name in value.split(",") if name.strip()))
+    if not fields:
+        return None
+
+    invalid = QueryProjection(fields).get_invalid_fields(available_fields)
+    if invalid:
+        raise ValueError(f"Unknown {kind}: {', '.join(invalid)}")
+    return fields
+
+
 def create_projection(*fields: str) -> QueryProjection:
     """Create a query projection
 
@@ -0,0 +1,231 @@
+"""Response-level cache of serialized JSON bodies
+
+Read routes store the final JSON bytes of a response together with an ETag
+computed once. A hit is answered straight from those bytes, skipping the
+database, validation and JSON encoding, and a matching ``If-None-Match``
+is answered with ``304 Not Modified``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from fastapi import Request, Response
+
+from .cache import NOT_FOUND
+from .cache_core import LRUTTLCache
+from .cache_tags import TagIndex
+from .invalidation_bus import InvalidationBus
+
+RawHeaders = Tuple[Tuple[bytes, bytes], ...]
+
+
+def make_etag(body: bytes) -> str:
+    """Strong ETag of a response body"""
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+def etag_matches(etag: str, if_none_match: Optional[str]) -> bool:
+    """Check an ``If-None-Match`` header against an ETag (weak comparison)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        candidate.strip().removeprefix("W/") == etag for candidate in if_none_match.split(",")
+    )
+
+
+class CachedResponse:
+    """Serialized body, ETag and extra headers of one response"""
+
+    __slots__ = ("body", "etag", "headers")
+
+    def __init__(self, body: bytes, etag: Optional[str] = None, headers: RawHeaders = ()):
+        """Initialize cached response
+
+        Args:
+            body: JSON body bytes
+            etag: ETag of the body; computed when omitted
+            headers: Extra raw headers set by the route, e.g. ``X-Total-Count``
+        """
+        self.body = body
+        self.etag = etag or make_etag(body)
+        self.headers = headers
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the body in bytes"""
+        return len(self.body)
+
+    def render(self, if_none_match: Optional[str] = None) -> Response:
+        """Build the response, or a 304 if the client already has this body
+
+        Args:
+            if_none_match: ``If-None-Match`` request header, if any
+        """
+        if etag_matches(self.etag, if_none_match):
+            return Response(status_code=304, headers={"ETag": self.etag})
+
+        response = Response(content=self.body, media_type="application/json")
+        response.headers.raw.append((b"etag", self.etag.encode("latin-1")))
+        response.headers.raw.extend(self.headers)
+        return response
+
+
+class ResponseCache:
+    """In-process cache of read responses, keyed by request path and query
+
+    Entries are registered under the same tags as :mod:`.cache_tags`, so a
+    write invalidates only the responses that depend on it. Reads of missing
+    items can be remembered with a short-lived ``NOT_FOUND`` tombstone.
+
+    A hit skips the route, so :class:`CRUDRouter` does not use the cache for
+    reads that have hooks registered.
+
+    With an ``invalidation_bus``, invalidations and clears are sent to the
+    response caches of other workers, and theirs are applied here.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1000,
+        ttl: Optional[float] = 60,
+        invalidation_bus: Optional[InvalidationBus] = None,
+    ):
+        """Initialize response cache
+
+        Args:
+            max_size: Maximum number of cached responses
+            ttl: Time to live in seconds (None never expires)
+            invalidation_bus: Bus shared with the other workers' caches
+        """
+        self._tags = TagIndex()
+        self._store = LRUTTLCache(max_size=max_size, default_ttl=ttl, on_evict=self._on_evict)
+        self.hits = 0
+        self.misses = 0
+        self.invalidation_bus = invalidation_bus
+        if invalidation_bus is not None:
+            invalidation_bus.subscribe(_RemoteInvalidations(self))
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def _on_evict(self, key: str, entry: CachedResponse) -> None:
+        self._tags.discard(key)
+
+    @staticmethod
+    def make_key(request: Request) -> str:
+        """Cache key of a request: method, path and sorted query parameters"""
+        query = "&".join(
+            f"{name}={value}" for name, value in sorted(request.query_params.multi_items())
+        )
+        return f"{request.method}:{request.url.path}?{query}"
+
+    def get(self, key: str) -> Any:
+        """Get a cached response, ``NOT_FOUND`` for a cached miss, or None"""
+        entry = self._store.get(key)
+        if entry is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return entry
+
+    def set(
+        self,
+        key: str,
+        body: bytes,
+        tags: Iterable[str] = (),
+        headers: RawHeaders = (),
+    ) -> CachedResponse:
+        """Cache a serialized response body
+
+        Args:
+            key: Cache key from ``make_key``
+            body: JSON body bytes
+            tags: Tags the response depends on
+            headers: Extra raw headers to replay on hits
+
+        Returns:
+            The cached response
+        """
+        entry = CachedResponse(body, headers=tuple(headers))
+        if self._store.set(key, entry):
+            self._tags.add(key, tags)
+        else:
+            self._tags.discard(key)
+        return entry
+
+    def set_not_found(self, key: str, tags: Iterable[str], ttl: float) -> None:
+        """Remember for ``ttl`` seconds that a request found nothing
+
+        Args:
+            key: Cache key from ``make_key``
+            tags: Tags whose invalidation drops the tombstone, e.g. the
+                item's tag so creating it is seen immediately
+            ttl: Time to live in seconds
+        """
+        if self._store.set(key, NOT_FOUND, ttl):
+            self._tags.add(key, tags)
+        else:
+            self._tags.discard(key)
+
+    def invalidate(self, tags: Iterable[str]) -> int:
+        """Drop every response registered under any of the tags
+
+        Returns:
+            Number of responses dropped
+        """
+        tags = list(tags)
+        removed = 0
+        for key in self._tags.keys_for(tags):
+            self._tags.discard(key)
+            if self._store.delete(key):
+                removed += 1
+        if self.invalidation_bus is not None:
+            self.invalidation_bus.publish(tags=tags)
+        return removed
+
+    def delete(self, key: str) -> None:
+        """Drop one response"""
+        self._store.delete(key)
+        self._tags.discard(key)
+
+    def clear(self) -> None:
+        """Drop all responses"""
+        self._store.clear()
+        self._tags.clear()
+        if self.invalidation_bus is not None:
+            self.invalidation_bus.publish(clear=True)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get hit, size and byte statistics"""
+        entries: List[CachedResponse] = [
+            entry for _, entry in self._store.items() if entry is not NOT_FOUND
+        ]
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total * 100 if total else 0.0,
+            "size": len(self._store),
+            "max_size": self._store.max_size,
+            "bytes": sum(entry.nbytes for entry in entries),
+        }
+
+
+class _RemoteInvalidations:
+    """Applies invalidations from other workers to a :class:`ResponseCache`"""
+
+    def __init__(self, cache: ResponseCache):
+        self.cache = cache
+
+    async def delete(self, key: str) -> None:
+        self.cache.delete(key)
+
+    async def invalidate_by_tags(self, tags: Iterable[str]) -> None:
+        self.cache.invalidate(tags)
+
+    async def clear(self) -> None:
+        self.cache.clear()
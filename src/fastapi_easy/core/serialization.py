@@ -0,0 +1,70 @@
+"""Fast-path JSON serialization for CRUD responses"""
+
+from __future__ import annotations
+
+from typing import Any, List, Optional, Type
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+
+class ResponseSerializer:
+    """Serialize read results straight to JSON bytes
+
+    Built once per schema. ORM rows are validated with ``from_attributes`` and
+    dumped by pydantic-core in one pass, so FastAPI does not validate and
+    encode the response a second time. Fields are written under their
+    aliases, as FastAPI does with its default ``response_model_by_alias``.
+
+    Results that cannot take the fast path (plain dicts, rows that do not
+    match the schema) are reported by returning None, and the caller falls
+    back to its per-item conversion.
+    """
+
+    def __init__(self, schema: Type[BaseModel]):
+        """Initialize serializer
+
+        Args:
+            schema: Pydantic schema used to read items
+        """
+        self.schema = schema
+        self._item_adapter = TypeAdapter(schema)
+        self._list_adapter = TypeAdapter(List[schema])
+
+    @staticmethod
+    def _is_eligible(item: Any) -> bool:
+        # Dicts are returned as-is by the router, so keep extra keys such as _id
+        return item is not None and not isinstance(item, dict)
+
+    def dump_list(self, items: List[Any]) -> Optional[bytes]:
+        """Serialize a list of items
+
+        Args:
+            items: ORM instances or schema instances
+
+        Returns:
+            JSON array bytes, or None if the items need the slow path
+        """
+        if not all(self._is_eligible(item) for item in items):
+            return None
+        try:
+            validated = self._list_adapter.validate_python(items, from_attributes=True)
+        except ValidationError:
+            return None
+        return self._list_adapter.dump_json(validated, by_alias=True)
+
+    def dump_one(self, item: Any) -> Optional[bytes]:
+        """Serialize a single item
+
+        Args:
+            item: ORM instance or schema instance
+
+        Returns:
+            JSON object bytes, or None if the item needs the slow path
+        """
+        if not self._is_eligible(item):
+            return None
+        try:
+            validated = self._item_adapter.validate_python(item, from_attributes=True)
+        except ValidationError:
+            return None
+        return self._item_adapter.dump_json(validated, by_alias=True)
@@ -0,0 +1,457 @@
+"""Shared-memory cache tier for worker processes on one host
+
+Every worker of a uvicorn deployment keeps its own L1, so hot entries are
+duplicated per worker and each worker warms its copy separately. This tier
+keeps one copy of pre-serialized values in a memory-mapped file under
+``/dev/shm`` that all workers on the host map, between the per-process L1
+and Redis.
+
+The file holds, in order:
+
+- a header with the geometry and the arena write position
+- a table of tag versions; invalidating a tag bumps its version, and entries
+  stored under an older version read as misses in every process
+- fixed-size slots forming an open-addressing hash table
+- an arena used as a ring buffer for the key, tags and value of each entry
+
+Readers take no lock: each slot is guarded by a seqlock, and an entry whose
+arena bytes were overwritten by a later write is detected from the arena
+position. Writers serialize on an ``flock`` of the file. Linux only.
+
+Values read back are unpickled by :class:`AdvancedCacheManager`, so the file
+must only be writable by the application: it is opened without following
+symlinks and rejected unless it is a regular file owned by the effective
+user with mode ``0600``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import mmap
+import os
+import stat
+import struct
+import sys
+import time
+from typing import Any, Dict, Iterable, Optional, Set, Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not POSIX
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+_MAGIC = b"FEZSHM01"
+# magic, slot count, tag version count, arena size, arena write position
+_HEADER = struct.Struct("<8sIIQQ")
+_HEADER_SIZE = 64
+_HEAD_OFFSET = 24
+# seq, key length, key hash, expires at, arena position, value length,
+# tags length, tag count
+_SLOT = struct.Struct("<IIQdQIIH")
+_SLOT_SIZE = 64
+_VERSION = struct.Struct("<Q")
+# Slots probed per key
+_PROBE = 8
+# Seqlock read attempts before reporting a miss
+_READ_RETRIES = 4
+
+
+def _hash(data: bytes) -> int:
+    # 0 marks an empty slot
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "little") or 1
+
+
+class SharedMemoryCache:
+    """Byte cache in a memory-mapped file shared by processes on one host
+
+    Values are bytes; callers serialize them. All processes must open the
+    same ``path`` with the same geometry. Entries are evicted when their
+    slots are reused or their arena bytes are overwritten, oldest first.
+
+    Usage:
+        cache = SharedMemoryCache("/dev/shm/myapp-cache", slots=65536)
+        await cache.set("user:1", pickle.dumps(user), ttl=60, tags={"item:user:1"})
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        slots: int = 4096,
+        arena_bytes: int = 64 * 1024 * 1024,
+        tag_slots: int = 4096,
+        default_ttl: float = 300,
+    ):
+        """Open or create the shared file
+
+        Args:
+            path: File to map; ``/dev/shm`` keeps it in memory (default:
+                ``/dev/shm/fastapi_easy_cache-<euid>``)
+            slots: Maximum number of entries
+            arena_bytes: Bytes for keys, tags and values
+            tag_slots: Size of the tag version table
+            default_ttl: Default time to live in seconds
+        """
+        if not sys.platform.startswith("linux") or fcntl is None:
+            raise RuntimeError("SharedMemoryCache requires Linux")
+        if slots <= 0 or arena_bytes <= 0 or tag_slots <= 0:
+            raise ValueError("slots, arena_bytes and tag_slots must be positive")
+
+        self.path = path or f"/dev/shm/fastapi_easy_cache-{os.geteuid()}"
+        self.slot_count = slots
+        self.tag_slots = tag_slots
+        self.arena_size = arena_bytes
+        self.default_ttl = default_ttl
+        # A single entry may use at most a quarter of the arena
+        self.max_entry_bytes = arena_bytes // 4
+
+        self._tags_offset = _HEADER_SIZE
+        self._slots_offset = self._tags_offset + tag_slots * _VERSION.size
+        self._arena_offset = self._slots_offset + slots * _SLOT_SIZE
+        size = self._arena_offset + arena_bytes
+
+        self._fd = self._open(self.path)
+        try:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                self._init_file(size)
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+            self._mm = mmap.mmap(self._fd, size)
+        except BaseException:
+            os.close(self._fd)
+            raise
+
+        self.hits = 0
+        self.misses = 0
+        self.sets = 0
+        self.errors = 0
+
+    @staticmethod
+    def _open(path: str) -> int:
+        """Open the file, refusing one another user could have written"""
+        flags = os.O_RDWR | os.O_NOFOLLOW | os.O_CLOEXEC
+        try:
+            fd = os.open(path, flags | os.O_CREAT | os.O_EXCL, 0o600)
+            # The umask may have cleared bits
+            os.fchmod(fd, 0o600)
+            return fd
+        except FileExistsError:
+            fd = os.open(path, flags)
+
+        st = os.fstat(fd)
+        if (
+            not stat.S_ISREG(st.st_mode)
+            or st.st_uid != os.geteuid()
+            or stat.S_IMODE(st.st_mode) != 0o600
+        ):
+            os.close(fd)
+            raise PermissionError(
+                f"{path} must be a regular file owned by uid {os.geteuid()} with mode 0600"
+            )
+        return fd
+
+    def _init_file(self, size: int) -> None:
+        if os.fstat(self._fd).st_size == 0:
+            os.ftruncate(self._fd, size)
+            header = _HEADER.pack(_MAGIC, self.slot_count, self.tag_slots, self.arena_size, 0)
+            os.pwrite(self._fd, header, 0)
+            return
+
+        header = os.pread(self._fd, _HEADER.size, 0)
+        magic, slots, tag_slots, arena, _ = _HEADER.unpack(header)
+        if (magic, slots, tag_slots, arena) != (
+            _MAGIC,
+            self.slot_count,
+            self.tag_slots,
+            self.arena_size,
+        ):
+            raise ValueError(f"{self.path} was created with a different layout")
+
+    # Low-level access
+
+    def _head(self) -> int:
+        return struct.unpack_from("<Q", self._mm, _HEAD_OFFSET)[0]
+
+    def _slot_offset(self, index: int) -> int:
+        return self._slots_offset + index * _SLOT_SIZE
+
+    def _read_slot(self, index: int) -> Tuple:
+        return _SLOT.unpack_from(self._mm, self._slot_offset(index))
+
+    def _write_slot(self, index: int, fields: Tuple) -> None:
+        offset = self._slot_offset(index)
+        seq = struct.unpack_from("<I", self._mm, offset)[0]
+        # Odd sequence: write in progress
+        struct.pack_into("<I", self._mm, offset, (seq + 1) & 0xFFFFFFFF)
+        _SLOT.pack_into(self._mm, offset, (seq + 1) & 0xFFFFFFFF, *fields)
+        struct.pack_into("<I", self._mm, offset, (seq + 2) & 0xFFFFFFFF)
+
+    def _tag_index(self, tag: str) -> int:
+        return _hash(tag.encode()) % self.tag_slots
+
+    def _tag_version(self, index: int) -> int:
+        return _VERSION.unpack_from(self._mm, self._tags_offset + index * _VERSION.size)[0]
+
+    def _probe(self, key_hash: int) -> Iterable[int]:
+        start = key_hash % self.slot_count
+        for step in range(min(_PROBE, self.slot_count)):
+            yield (start + step) % self.slot_count
+
+    def _live(self, slot: Tuple, head: int, now: float) -> bool:
+        """Whether a slot holds an unexpired entry whose bytes are intact"""
+        _, _, key_hash, expires_at, pos, _, _, _ = slot
+        return (
+            key_hash != 0
+            and (expires_at == 0 or expires_at > now)
+            and head <= pos + self.arena_size
+        )
+
+    def _read_payload(self, slot: Tuple) -> Optional[Tuple[bytes, bytes, bytes]]:
+        """Copy an entry's key, tag block and value out of the arena"""
+        _, key_len, _, _, pos, value_len, tags_len, ntags = slot
+        length = key_len + tags_len + ntags * _VERSION.size + value_len
+        start = self._arena_offset + pos % self.arena_size
+        data = self._mm[start : start + length]
+        # The writer moves the head before writing, so this catches overwrites
+        if self._head() > pos + self.arena_size:
+            return None
+        tags_end = key_len + tags_len + ntags * _VERSION.size
+        return data[:key_len], data[key_len:tags_end], data[tags_end:]
+
+    def _lookup(self, key: bytes) -> Optional[Tuple[bytes, Set[str]]]:
+        key_hash = _hash(key)
+        now = time.monotonic()
+        for index in self._probe(key_hash):
+            for _ in range(_READ_RETRIES):
+                slot = self._read_slot(index)
+                seq = slot[0]
+                if seq & 1:
+                    continue
+                if slot[2] != key_hash or not self._live(slot, self._head(), now):
+                    payload = None
+                else:
+                    payload = self._read_payload(slot)
+                if self._read_slot(index)[0] == seq:
+                    break
+            else:
+                continue
+
+            if payload is None or payload[0] != key:
+                continue
+            tags = self._check_tags(payload[1], slot[7], slot[6])
+            if tags is None:
+                return None
+            return payload[2], tags
+        return None
+
+    def _check_tags(self, block: bytes, ntags: int, tags_len: int) -> Optional[Set[str]]:
+        """Decode an entry's tags; None if any was invalidated since it was stored"""
+        if not ntags:
+            return set()
+        names = block[:tags_len].decode().split("\0")
+        for i, name in enumerate(names):
+            (stored,) = _VERSION.unpack_from(block, tags_len + i * _VERSION.size)
+            if self._tag_version(self._tag_index(name)) != stored:
+                return None
+        return set(names)
+
+    # Public API
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """Get the bytes stored for a key"""
+        value, _ = await self.get_with_tags(key)
+        return value
+
+    async def get_with_tags(self, key: str) -> Tuple[Optional[bytes], Set[str]]:
+        """Get the bytes stored for a key together with its tags"""
+        try:
+            found = self._lookup(key.encode())
+        except Exception as e:
+            self.errors += 1
+            logger.error(f"Shared memory get failed for key {key}: {e}")
+            found = None
+        if found is None:
+            self.misses += 1
+            return None, set()
+        self.hits += 1
+        return found
+
+    async def set(
+        self,
+        key: str,
+        value: bytes,
+        ttl: Optional[float] = None,
+        tags: Optional[Set[str]] = None,
+    ) -> bool:
+        """Store bytes for a key
+
+        Args:
+            key: Cache key
+            value: Serialized value
+            ttl: Time to live in seconds; defaults to ``default_ttl``, and 0
+                stores the entry without expiry
+            tags: Tags for ``invalidate_by_tags``
+
+        Returns:
+            False if the entry is larger than a quarter of the arena
+        """
+        key_bytes = key.encode()
+        names = sorted(tags or ())
+        tag_bytes = "\0".join(names).encode()
+        length = len(key_bytes) + len(tag_bytes) + len(names) * _VERSION.size + len(value)
+        if length > self.max_entry_bytes:
+            return False
+
+        ttl = self.default_ttl if ttl is None else ttl
+        # CLOCK_MONOTONIC is system-wide on Linux, so all processes agree
+        expires_at = time.monotonic() + ttl if ttl else 0.0
+        key_hash = _hash(key_bytes)
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            versions = b"".join(
+                _VERSION.pack(self._tag_version(self._tag_index(name))) for name in names
+            )
+            index = self._choose_slot(key_bytes, key_hash)
+            pos = self._allocate(length)
+            start = self._arena_offset + pos % self.arena_size
+            self._mm[start : start + length] = key_bytes + tag_bytes + versions + value
+            self._write_slot(
+                index,
+                (
+                    len(key_bytes),
+                    key_hash,
+                    expires_at,
+                    pos,
+                    len(value),
+                    len(tag_bytes),
+                    len(names),
+                ),
+            )
+        except Exception as e:
+            self.errors += 1
+            logger.error(f"Shared memory set failed for key {key}: {e}")
+            return False
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        self.sets += 1
+        return True
+
+    def _choose_slot(self, key: bytes, key_hash: int) -> int:
+        """Slot for a key: its current slot, a free one, or the oldest entry's"""
+        head = self._head()
+        now = time.monotonic()
+        free = None
+        oldest, oldest_pos = None, None
+        for index in self._probe(key_hash):
+            slot = self._read_slot(index)
+            if not self._live(slot, head, now):
+                if free is None:
+                    free = index
+                continue
+            if slot[2] == key_hash:
+                payload = self._read_payload(slot)
+                if payload is not None and payload[0] == key:
+                    return index
+            if oldest_pos is None or slot[4] < oldest_pos:
+                oldest, oldest_pos = index, slot[4]
+        return free if free is not None else oldest
+
+    def _allocate(self, length: int) -> int:
+        """Reserve ``length`` contiguous arena bytes and return their position"""
+        pos = self._head()
+        offset = pos % self.arena_size
+        if offset + length > self.arena_size:
+            # Skip the tail so the entry does not wrap around
+            pos += self.arena_size - offset
+        struct.pack_into("<Q", self._mm, _HEAD_OFFSET, pos + length)
+        return pos
+
+    async def delete(self, key: str) -> bool:
+        """Remove a key
+
+        Returns:
+            True if the key was present
+        """
+        key_bytes = key.encode()
+        key_hash = _hash(key_bytes)
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            for index in self._probe(key_hash):
+                slot = self._read_slot(index)
+                if slot[2] != key_hash:
+                    continue
+                payload = self._read_payload(slot)
+                if payload is not None and payload[0] == key_bytes:
+                    self._write_slot(index, (0, 0, 0.0, 0, 0, 0, 0))
+                    return True
+            return False
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    async def invalidate_by_tags(self, tags: Iterable[str]) -> int:
+        """Invalidate every entry stored under any of the tags, in all processes
+
+        Bumps each tag's shared version; affected entries then read as misses.
+        Unrelated tags sharing a version slot are invalidated too.
+
+        Returns:
+            Number of tags invalidated
+        """
+        indexes = {self._tag_index(tag) for tag in tags}
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            for index in indexes:
+                offset = self._tags_offset + index * _VERSION.size
+                version = _VERSION.unpack_from(self._mm, offset)[0]
+                _VERSION.pack_into(self._mm, offset, version + 1)
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        return len(indexes)
+
+    async def clear(self) -> None:
+        """Remove all entries, in all processes"""
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            for index in range(self.slot_count):
+                if self._read_slot(index)[2]:
+                    self._write_slot(index, (0, 0, 0.0, 0, 0, 0, 0))
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get this process's hit statistics and the shared occupancy"""
+        head = self._head()
+        now = time.monotonic()
+        entries = sum(
+            1 for index in range(self.slot_count) if self._live(self._read_slot(index), head, now)
+        )
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total * 100 if total else 0.0,
+            "sets": self.sets,
+            "errors": self.errors,
+            "entries": entries,
+            "slots": self.slot_count,
+            "arena_bytes": self.arena_size,
+        }
+
+    def close(self, unlink: bool = False) -> None:
+        """Unmap the file
+
+        Args:
+            unlink: Also remove the file, e.g. when the last worker stops
+        """
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+            os.close(self._fd)
+        if unlink:
+            try:
+                os.unlink(self.path)
+            except FileNotFoundError:
+                pass
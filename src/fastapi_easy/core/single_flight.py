@@ -0,0 +1,86 @@
+"""Single-flight request coalescing
+
+Concurrent cache misses for the same key share one call to the loader
+instead of each querying the database.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+logger = logging.getLogger(__name__)
+
+
+class SingleFlight:
+    """Run at most one call per key at a time
+
+    The first caller for a key starts the call as a task; callers arriving
+    while it runs await the same task and get the same result or exception.
+    Cancelling one caller does not cancel the shared call.
+
+    Usage:
+        flight = SingleFlight()
+        item = await flight.do(cache_key, lambda: adapter.get_one(1))
+    """
+
+    def __init__(self):
+        """Initialize with no calls in flight"""
+        self._calls: Dict[Hashable, asyncio.Task] = {}
+        self.coalesced = 0
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    def _start(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> asyncio.Task:
+        task = self._calls.get(key)
+        if task is not None:
+            self.coalesced += 1
+            return task
+
+        task = asyncio.ensure_future(func())
+        self._calls[key] = task
+        task.add_done_callback(lambda done: self._finish(key, done))
+        return task
+
+    def _finish(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        """Run ``func`` for ``key``, or join the call already in flight
+
+        Args:
+            key: Coalescing key, usually the cache key
+            func: Zero-argument callable returning an awaitable
+
+        Returns:
+            Result of the shared call
+        """
+        return await asyncio.shield(self._start(key, func))
+
+    def spawn(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> asyncio.Task:
+        """Start ``func`` for ``key`` in the background unless already in flight
+
+        Failures are logged instead of raised.
+
+        Args:
+            key: Coalescing key, usually the cache key
+            func: Zero-argument callable returning an awaitable
+
+        Returns:
+            The running task
+        """
+        task = self._start(key, func)
+        task.add_done_callback(_log_failure)
+        return task
+
+    def stats(self) -> Dict[str, int]:
+        """Get coalescing statistics"""
+        return {"in_flight": len(self._calls), "coalesced": self.coalesced}
+
+
+def _log_failure(task: asyncio.Task) -> None:
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning(f"Background refresh failed: {task.exception()!s}")
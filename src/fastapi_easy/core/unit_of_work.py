@@ -0,0 +1,150 @@
+"""Request-scoped unit of work for SQLAlchemy sessions"""
+
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from contextvars import ContextVar, Token
+from typing import Any, AsyncIterator, Callable, Optional
+
+_current_unit: ContextVar[Optional["UnitOfWork"]] = ContextVar("unit_of_work", default=None)
+
+
+class UnitOfWork:
+    """One session and transaction shared by everything in a request
+
+    While the block runs, adapters created with the same session factory
+    reuse its session and flush instead of committing. The unit of work
+    commits once on exit, or rolls back if the block raised or
+    ``rollback_only`` was set.
+
+    The session is not safe for concurrent use, so adapter calls inside one
+    unit of work must not run in parallel (e.g. with ``asyncio.gather``).
+
+    Usage:
+        async with UnitOfWork(session_factory) as session:
+            await adapter.create({...})
+            await adapter.count({})
+    """
+
+    def __init__(self, session_factory: Callable[[], Any]):
+        """Initialize unit of work
+
+        Args:
+            session_factory: Async session factory shared with the adapters
+        """
+        self.session_factory = session_factory
+        self.session: Any = None
+        self.rollback_only = False
+        self._token: Optional[Token] = None
+
+    async def __aenter__(self) -> Any:
+        self.session = self.session_factory()
+        self._token = _current_unit.set(self)
+        return self.session
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        try:
+            if exc_type is None and not self.rollback_only:
+                await self.session.commit()
+            else:
+                await self.session.rollback()
+        finally:
+            _current_unit.reset(self._token)
+            await self.session.close()
+
+
+def current_unit_of_work() -> Optional[UnitOfWork]:
+    """Get the unit of work bound to the current request, if any"""
+    return _current_unit.get()
+
+
+def get_request_session(session_factory: Optional[Callable[[], Any]] = None) -> Optional[Any]:
+    """Get the session of the current unit of work
+
+    Args:
+        session_factory: Only return the session if the unit of work was
+            opened with this factory
+
+    Returns:
+        AsyncSession or None
+    """
+    unit = _current_unit.get()
+    if unit is None or (
+        session_factory is not None and unit.session_factory is not session_factory
+    ):
+        return None
+    return unit.session
+
+
+@asynccontextmanager
+async def session_scope(session_factory: Callable[[], Any]) -> AsyncIterator[Any]:
+    """Yield the request's session for ``session_factory``, or a new one
+
+    A new session is closed on exit; the request's session is left open for
+    the unit of work to commit.
+    """
+    session = get_request_session(session_factory)
+    if session is not None:
+        yield session
+        return
+
+    async with session_factory() as session:
+        yield session
+
+
+def is_request_session(session: Any) -> bool:
+    """Whether a session belongs to the current unit of work"""
+    unit = _current_unit.get()
+    return unit is not None and unit.session is session
+
+
+async def _in_database_transaction(session: Any) -> bool:
+    """Whether the database connection of ``session`` has begun a transaction
+
+    SQLAlchemy emits BEGIN for most drivers, but the sqlite3 driver only
+    begins one before the first INSERT/UPDATE/DELETE. A SAVEPOINT outside
+    a transaction starts one of its own, which its RELEASE then commits.
+    """
+    connection = await session.connection()
+    if connection.dialect.name != "sqlite":
+        return True
+    raw = await connection.get_raw_connection()
+    return bool(getattr(raw.driver_connection, "in_transaction", True))
+
+
+@asynccontextmanager
+async def savepoint(session: Any) -> AsyncIterator[None]:
+    """Run a write in a SAVEPOINT if ``session`` belongs to a unit of work
+
+    A failed write then undoes only its own statements; earlier writes of
+    the request are left for the unit of work to commit or roll back.
+    """
+    if not is_request_session(session):
+        yield
+        return
+
+    if await _in_database_transaction(session):
+        async with session.begin_nested():
+            yield
+        return
+
+    # Nothing has been written yet, so the whole transaction is this write
+    try:
+        yield
+    except BaseException:
+        await session.rollback()
+        raise
+
+
+async def commit_or_flush(session: Any) -> None:
+    """Commit the session, or only flush it if it belongs to a unit of work"""
+    if is_request_session(session):
+        await session.flush()
+    else:
+        await session.commit()
+
+
+async def rollback_if_owned(session: Any) -> None:
+    """Roll back the session unless it belongs to a unit of work"""
+    if not is_request_session(session):
+        await session.rollback()
@@ -10,6 +10,7 @@ from .base import (
     MonitoringMiddleware,
 )
 from .csrf import CSRFMiddleware
+from .unit_of_work import UnitOfWorkMiddleware
 
 __all__ = [
     "BaseMiddleware",
@@ -18,4 +19,5 @@ __all__ = [
     "LoggingMiddleware",
     "MiddlewareChain",
     "MonitoringMiddleware",
+    "UnitOfWorkMiddleware",
 ]
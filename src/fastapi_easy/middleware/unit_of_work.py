@@ -0,0 +1,45 @@
+"""Unit-of-work middleware for FastAPI-Easy"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Callable
+
+from fastapi import FastAPI, Request
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from ..core.unit_of_work import UnitOfWork
+
+logger = logging.getLogger(__name__)
+
+
+class UnitOfWorkMiddleware(BaseHTTPMiddleware):
+    """Run each request in one session and transaction
+
+    Hooks and adapter calls made while handling the request share the
+    session (also exposed as ``ExecutionContext.session``). It is committed
+    once the endpoint has returned, or rolled back for error responses.
+
+    Streaming exports keep their own session, since their body is produced
+    after the request's transaction has ended.
+    """
+
+    def __init__(self, app: FastAPI, session_factory: Callable[[], Any]):
+        """Initialize unit-of-work middleware
+
+        Args:
+            app: FastAPI application
+            session_factory: Async session factory shared with the adapters
+        """
+        super().__init__(app)
+        self.session_factory = session_factory
+
+    async def dispatch(self, request: Request, call_next):
+        """Process request inside a unit of work"""
+        unit = UnitOfWork(self.session_factory)
+        async with unit:
+            response = await call_next(request)
+            if response.status_code >= 400:
+                unit.rollback_only = True
+                logger.debug(f"Rolling back unit of work for {response.status_code} response")
+        return response
@@ -0,0 +1,149 @@
+"""Bloom filters for fast negative membership checks"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import time
+from typing import Dict, List, Tuple
+
+
+def _hash_pair(item: str) -> Tuple[int, int]:
+    digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+    return int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little") | 1
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter
+
+    Answers "definitely absent" or "possibly present". Positions come from
+    double hashing one BLAKE2b digest, so each lookup hashes the item once.
+    """
+
+    def __init__(self, capacity: int = 1024, false_positive_rate: float = 0.001):
+        """Initialize filter
+
+        Args:
+            capacity: Items the filter holds at the target false positive rate
+            false_positive_rate: Target false positive rate at capacity
+
+        Raises:
+            ValueError: If capacity or false_positive_rate is invalid
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        if not 0 < false_positive_rate < 1:
+            raise ValueError("false_positive_rate must be between 0 and 1")
+
+        self.capacity = capacity
+        self.false_positive_rate = false_positive_rate
+        self.size = max(8, math.ceil(-capacity * math.log(false_positive_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, hashes: Tuple[int, int]) -> List[int]:
+        h1, h2 = hashes
+        return [(h1 + i * h2) % self.size for i in range(self.hash_count)]
+
+    def add(self, item: str) -> None:
+        """Add an item"""
+        self._add_hashes(_hash_pair(item))
+
+    def _add_hashes(self, hashes: Tuple[int, int]) -> None:
+        for position in self._positions(hashes):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return self._contains_hashes(_hash_pair(item))
+
+    def _contains_hashes(self, hashes: Tuple[int, int]) -> bool:
+        bits = self._bits
+        return all(bits[p >> 3] & (1 << (p & 7)) for p in self._positions(hashes))
+
+    @property
+    def is_full(self) -> bool:
+        """Whether the filter holds its capacity"""
+        return self.count >= self.capacity
+
+
+class TimePartitionedBloomFilter:
+    """Bloom filter whose items expire, partitioned by expiry time
+
+    Items are placed in the bucket covering their expiry time. A bucket is
+    dropped whole once its last expiry has passed, so the filter only holds
+    live items and never needs deletions. A bucket that fills up gets another
+    filter, keeping the false positive rate near its target.
+    """
+
+    def __init__(
+        self,
+        bucket_seconds: int = 3600,
+        bucket_capacity: int = 1024,
+        false_positive_rate: float = 0.001,
+    ):
+        """Initialize filter
+
+        Args:
+            bucket_seconds: Expiry range covered by one bucket
+            bucket_capacity: Items per Bloom filter in a bucket
+            false_positive_rate: Target false positive rate per filter
+
+        Raises:
+            ValueError: If bucket_seconds is not positive
+        """
+        if bucket_seconds <= 0:
+            raise ValueError("bucket_seconds must be positive")
+
+        self.bucket_seconds = bucket_seconds
+        self.bucket_capacity = bucket_capacity
+        self.false_positive_rate = false_positive_rate
+        self._buckets: Dict[int, List[BloomFilter]] = {}
+
+    def _expire(self, now: float) -> None:
+        # Bucket n holds expiries up to n * bucket_seconds
+        oldest_live = int(now // self.bucket_seconds) + 1
+        for index in [index for index in self._buckets if index < oldest_live]:
+            del self._buckets[index]
+
+    def add(self, item: str, expires_at: float) -> None:
+        """Add an item until its expiry
+
+        Args:
+            item: Item to add
+            expires_at: Unix time after which the item may be forgotten
+        """
+        now = time.time()
+        if expires_at <= now:
+            return
+        self._expire(now)
+
+        index = math.ceil(expires_at / self.bucket_seconds)
+        filters = self._buckets.setdefault(index, [])
+        if not filters or filters[-1].is_full:
+            filters.append(BloomFilter(self.bucket_capacity, self.false_positive_rate))
+        filters[-1]._add_hashes(_hash_pair(item))
+
+    def might_contain(self, item: str) -> bool:
+        """Check whether an unexpired item may have been added
+
+        Returns:
+            False if the item was definitely not added or has expired
+        """
+        self._expire(time.time())
+        if not self._buckets:
+            return False
+        hashes = _hash_pair(item)
+        return any(
+            bloom._contains_hashes(hashes)
+            for filters in self._buckets.values()
+            for bloom in filters
+        )
+
+    def clear(self) -> None:
+        """Remove all items"""
+        self._buckets.clear()
+
+    def __len__(self) -> int:
+        return sum(bloom.count for filters in self._buckets.values() for bloom in filters)
@@ -7,31 +7,43 @@ import time
 from collections import OrderedDict
 from typing import Any, Dict, Optional
 
+from ..core.cache_core import estimate_size
+
 logger = logging.getLogger(__name__)
 
 
 class LRUCache:
-    """LRU (Least Recently Used) cache implementation"""
+    """LRU (Least Recently Used) cache implementation
+
+    With ``max_bytes``, values are sized with ``estimate_size`` and the least
+    recently used entries are evicted until the total fits the budget.
+    """
 
-    def __init__(self, max_size: int = 1000, ttl: int = 300):
+    def __init__(self, max_size: int = 1000, ttl: int = 300, max_bytes: Optional[int] = None):
         """Initialize LRU cache
 
         Args:
             max_size: Maximum cache size (default: 1000)
             ttl: Time to live in seconds (default: 300)
+            max_bytes: Maximum estimated size of all values (default: no budget)
 
         Raises:
-            ValueError: If max_size or ttl is invalid
+            ValueError: If max_size, ttl or max_bytes is invalid
         """
         if max_size <= 0:
             raise ValueError("max_size must be positive")
         if ttl <= 0:
             raise ValueError("ttl must be positive")
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
 
         self.max_size = max_size
         self.ttl = ttl
+        self.max_bytes = max_bytes
         self.cache: OrderedDict = OrderedDict()
         self.cache_times: Dict[str, float] = {}
+        self.cache_sizes: Dict[str, int] = {}
+        self.total_bytes = 0
         self.hits = 0
         self.misses = 0
 
@@ -58,8 +70,7 @@ class LRUCache:
         cache_time = self.cache_times.get(key, 0)
         if now - cache_time >= self.ttl:
             # Remove expired entry
-            self.cache.pop(key, None)
-            self.cache_times.pop(key, None)
+            self._remove(key)
             self.misses += 1
             logger.debug(f"Cache expired for key: {key}")
             return None
@@ -82,6 +93,10 @@ class LRUCache:
 
         now = time.time()
 
+        if self.max_bytes is not None:
+            self._set_sized(key, value, now)
+            return
+
         # Update existing key
         if key in self.cache:
             self.cache[key] = value
@@ -103,6 +118,33 @@ class LRUCache:
 
         logger.debug(f"Cache set for key: {key}")
 
+    def _set_sized(self, key: str, value: Any, now: float) -> None:
+        """Set a value under the byte budget, evicting oldest entries until it fits"""
+        self._remove(key)
+        size = estimate_size(value)
+        if size > self.max_bytes:
+            logger.debug(f"Cache skipped key larger than max_bytes: {key}")
+            return
+
+        while self.cache and (
+            len(self.cache) >= self.max_size or self.total_bytes + size > self.max_bytes
+        ):
+            oldest_key = next(iter(self.cache))
+            self._remove(oldest_key)
+            logger.debug(f"Cache evicted oldest key: {oldest_key}")
+
+        self.cache[key] = value
+        self.cache_times[key] = now
+        self.cache_sizes[key] = size
+        self.total_bytes += size
+        logger.debug(f"Cache set for key: {key}")
+
+    def _remove(self, key: str) -> None:
+        """Remove a key and its bookkeeping"""
+        self.cache.pop(key, None)
+        self.cache_times.pop(key, None)
+        self.total_bytes -= self.cache_sizes.pop(key, 0)
+
     def clear(self, pattern: Optional[str] = None) -> None:
         """Clear cache
 
@@ -112,12 +154,13 @@ class LRUCache:
         if pattern is None:
             self.cache.clear()
             self.cache_times.clear()
+            self.cache_sizes.clear()
+            self.total_bytes = 0
             logger.debug("Cache cleared completely")
         else:
             keys_to_delete = [k for k in self.cache.keys() if pattern in k]
             for key in keys_to_delete:
-                self.cache.pop(key, None)
-                self.cache_times.pop(key, None)
+                self._remove(key)
             logger.debug(f"Cache cleared {len(keys_to_delete)} entries matching pattern: {pattern}")
 
     def get_stats(self) -> Dict[str, Any]:
@@ -132,6 +175,8 @@ class LRUCache:
         return {
             "size": len(self.cache),
             "max_size": self.max_size,
+            "bytes": self.total_bytes if self.max_bytes is not None else None,
+            "max_bytes": self.max_bytes,
             "hits": self.hits,
             "misses": self.misses,
             "total": total,
@@ -2,7 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
+import inspect
 import logging
+import os
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, Optional, Union
 
 logger = logging.getLogger(__name__)
 
@@ -14,16 +19,96 @@ except ImportError:
     )
 
 
-class PasswordManager:
-    """Password hashing and verification manager"""
+RehashCallback = Callable[[str], Union[Awaitable[None], None]]
+
+
+# bcrypt work is done by module-level functions so a process pool executor
+# can pickle them; a PasswordManager holds locks and cannot be pickled
+def _hash_password(password: str, rounds: int) -> str:
+    if not password:
+        logger.warning("Attempt to hash empty password")
+        raise ValueError("Password cannot be empty")
+
+    try:
+        # Generate salt and hash password
+        salt = bcrypt.gensalt(rounds=rounds)
+        hashed = bcrypt.hashpw(password.encode("utf-8"), salt)
+        logger.debug("Password hashed successfully")
+        return hashed.decode("utf-8")
+    except Exception as e:
+        logger.error(f"Password hashing failed: {e}")
+        raise
+
+
+def _verify_password(password: str, hashed_password: str) -> bool:
+    if not password or not hashed_password:
+        logger.warning("Attempt to verify with empty password or hash")
+        raise ValueError("Password and hash cannot be empty")
+
+    try:
+        # bcrypt.checkpw uses constant time comparison
+        result = bcrypt.checkpw(
+            password.encode("utf-8"),
+            hashed_password.encode("utf-8"),
+        )
+        if result:
+            logger.debug("Password verification successful")
+        else:
+            logger.debug("Password verification failed - incorrect password")
+        return result
+    except (ValueError, TypeError) as e:
+        # Invalid hash format - still perform dummy operation for timing consistency
+        logger.warning(f"Invalid hash format: {e}")
+        try:
+            dummy_hash = bcrypt.hashpw(b"dummy", bcrypt.gensalt(rounds=4))
+            bcrypt.checkpw(b"dummy", dummy_hash)
+        except Exception:
+            pass
+        return False
+    except Exception as e:
+        # Other errors - perform dummy operation
+        logger.error(f"Password verification error: {e}")
+        try:
+            dummy_hash = bcrypt.hashpw(b"dummy", bcrypt.gensalt(rounds=4))
+            bcrypt.checkpw(b"dummy", dummy_hash)
+        except Exception:
+            pass
+        return False
+
 
-    def __init__(self, rounds: int = 12):
+class PasswordManager:
+    """Password hashing and verification manager
+
+    The ``async_*`` methods run bcrypt on a dedicated thread pool so async
+    routes never block the event loop; bcrypt releases the GIL while hashing.
+    A process pool can be passed as ``executor`` instead.
+    At most ``max_concurrency`` hashes run at once, and callers beyond that
+    wait in a queue whose depth is reported by :meth:`get_stats`.
+    """
+
+    def __init__(
+        self,
+        rounds: int = 12,
+        max_concurrency: Optional[int] = None,
+        executor: Optional[Executor] = None,
+    ):
         """Initialize password manager
 
         Args:
             rounds: Number of bcrypt rounds (default: 12)
+            max_concurrency: Hashes run at once by the async methods
+                (default: CPU count, at most 4)
+            executor: Executor for the async methods (default: a thread pool
+                of ``max_concurrency`` workers, created on first use)
         """
         self.rounds = rounds
+        self.max_concurrency = max_concurrency or min(4, os.cpu_count() or 1)
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._queued = 0
+        self._running = 0
+        self._stats = {"completed": 0, "failed": 0, "peak_queue_depth": 0, "rehashed": 0}
 
     def hash_password(self, password: str) -> str:
         """Hash password using bcrypt
@@ -37,19 +122,7 @@ class PasswordManager:
         Raises:
             ValueError: If password is empty
         """
-        if not password:
-            logger.warning("Attempt to hash empty password")
-            raise ValueError("Password cannot be empty")
-
-        try:
-            # Generate salt and hash password
-            salt = bcrypt.gensalt(rounds=self.rounds)
-            hashed = bcrypt.hashpw(password.encode("utf-8"), salt)
-            logger.debug("Password hashed successfully")
-            return hashed.decode("utf-8")
-        except Exception as e:
-            logger.error(f"Password hashing failed: {e}")
-            raise
+        return _hash_password(password, self.rounds)
 
     def verify_password(self, password: str, hashed_password: str) -> bool:
         """Verify password against hash with constant time comparison
@@ -64,39 +137,7 @@ class PasswordManager:
         Raises:
             ValueError: If password or hash is empty
         """
-        if not password or not hashed_password:
-            logger.warning("Attempt to verify with empty password or hash")
-            raise ValueError("Password and hash cannot be empty")
-
-        try:
-            # bcrypt.checkpw uses constant time comparison
-            result = bcrypt.checkpw(
-                password.encode("utf-8"),
-                hashed_password.encode("utf-8"),
-            )
-            if result:
-                logger.debug("Password verification successful")
-            else:
-                logger.debug("Password verification failed - incorrect password")
-            return result
-        except (ValueError, TypeError) as e:
-            # Invalid hash format - still perform dummy operation for timing consistency
-            logger.warning(f"Invalid hash format: {e}")
-            try:
-                dummy_hash = bcrypt.hashpw(b"dummy", bcrypt.gensalt(rounds=4))
-                bcrypt.checkpw(b"dummy", dummy_hash)
-            except Exception:
-                pass
-            return False
-        except Exception as e:
-            # Other errors - perform dummy operation
-            logger.error(f"Password verification error: {e}")
-            try:
-                dummy_hash = bcrypt.hashpw(b"dummy", bcrypt.gensalt(rounds=4))
-                bcrypt.checkpw(b"dummy", dummy_hash)
-            except Exception:
-                pass
-            return False
+        return _verify_password(password, hashed_password)
 
     def needs_rehash(self, hashed_password: str) -> bool:
         """Check if password hash needs to be rehashed
@@ -118,3 +159,95 @@ class PasswordManager:
             return current_rounds != self.rounds
         except Exception:
             return True
+
+    async def _run_in_pool(self, func: Callable[..., Any], *args: Any) -> Any:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_concurrency, thread_name_prefix="password-hash"
+            )
+
+        self._queued += 1
+        self._stats["peak_queue_depth"] = max(self._stats["peak_queue_depth"], self._queued)
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self._queued -= 1
+
+        self._running += 1
+        try:
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(self._executor, func, *args)
+        except BaseException:
+            self._stats["failed"] += 1
+            raise
+        finally:
+            self._running -= 1
+            self._semaphore.release()
+        self._stats["completed"] += 1
+        return result
+
+    async def async_hash_password(self, password: str) -> str:
+        """Hash password without blocking the event loop
+
+        Args:
+            password: Plain text password
+
+        Returns:
+            Hashed password
+
+        Raises:
+            ValueError: If password is empty
+        """
+        return await self._run_in_pool(_hash_password, password, self.rounds)
+
+    async def async_verify_password(
+        self,
+        password: str,
+        hashed_password: str,
+        on_rehash: Optional[RehashCallback] = None,
+    ) -> bool:
+        """Verify password without blocking the event loop
+
+        When the password matches a hash made with other settings, a new hash
+        is computed and passed to ``on_rehash`` so the caller can store it.
+
+        Args:
+            password: Plain text password
+            hashed_password: Hashed password
+            on_rehash: Called, or awaited, with the upgraded hash
+
+        Returns:
+            True if password matches hash
+
+        Raises:
+            ValueError: If password or hash is empty
+        """
+        verified = await self._run_in_pool(_verify_password, password, hashed_password)
+        if verified and on_rehash is not None and self.needs_rehash(hashed_password):
+            new_hash = await self.async_hash_password(password)
+            result = on_rehash(new_hash)
+            if inspect.isawaitable(result):
+                await result
+            self._stats["rehashed"] += 1
+        return verified
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get async hashing statistics
+
+        Returns:
+            Queue depth, running hashes and counters
+        """
+        return {
+            "max_concurrency": self.max_concurrency,
+            "queue_depth": self._queued,
+            "running": self._running,
+            **self._stats,
+        }
+
+    def close(self) -> None:
+        """Shut down the thread pool created for the async methods"""
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
@@ -6,7 +6,7 @@ import logging
 from contextvars import ContextVar
 from typing import Optional
 
-from fastapi import Depends, Header, HTTPException
+from fastapi import Depends, Header, HTTPException, Request
 
 from .exceptions import (
     InvalidTokenError,
@@ -64,11 +64,16 @@ def get_jwt_auth() -> JWTAuth:
 
 async def get_current_user(
     authorization: Optional[str] = Header(None),
+    request: Request = None,
 ) -> dict:
     """Get current user from JWT token
 
+    The result is memoized on ``request.state``, so a token is verified at
+    most once per request however many dependencies ask for the user.
+
     Args:
         authorization: Authorization header
+        request: Current request, injected by FastAPI
 
     Returns:
         User payload
@@ -85,16 +90,23 @@ async def get_current_user(
         raise HTTPException(status_code=403, detail="Invalid authorization header")
 
     token = parts[1]
+    memo = getattr(request.state, "current_user", None) if request is not None else None
+    if memo is not None and memo[0] == token:
+        return memo[1]
+
     jwt_auth = get_jwt_auth()
 
     try:
         payload = jwt_auth.verify_token(token)
-        return {
+        user = {
             "user_id": payload.sub,
             "roles": payload.roles,
             "permissions": payload.permissions,
             "token_type": payload.type,
         }
+        if request is not None:
+            request.state.current_user = (token, user)
+        return user
     except TokenExpiredError as e:
         logger.warning(f"Token expired: {e}")
         raise HTTPException(status_code=401, detail=str(e))
@@ -111,11 +123,13 @@ async def get_current_user(
 
 async def get_current_user_optional(
     authorization: Optional[str] = Header(None),
+    request: Request = None,
 ) -> Optional[dict]:
     """Get current user from JWT token (optional)
 
     Args:
         authorization: Authorization header (optional)
+        request: Current request, injected by FastAPI
 
     Returns:
         User payload or None
@@ -126,7 +140,7 @@ async def get_current_user_optional(
     if authorization is None:
         return None
 
-    return await get_current_user(authorization)
+    return await get_current_user(authorization, request)
 
 
 def require_role(*roles: str):
@@ -2,33 +2,200 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
 import logging
 import os
 import secrets
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import jwt
 
 logger = logging.getLogger(__name__)
 
+from .bloom_filter import TimePartitionedBloomFilter
 from .exceptions import InvalidTokenError, TokenExpiredError
 from .models import TokenPayload
 
 
 class TokenBlacklist:
-    """JWT token blacklisting mechanism"""
+    """JWT token blacklisting mechanism
 
-    def __init__(self, redis_client=None, backend_storage=None):
+    Tokens are identified by their ``jti`` claim, or by a digest of the token
+    when it has none, so raw tokens are never stored.
+
+    With Redis, each process keeps a time-partitioned Bloom filter of live
+    revocations. It is loaded from Redis by :meth:`start` and fed by the
+    revocation events every process publishes. Once started, a token the
+    filter has never seen is accepted without a Redis round trip; only
+    possible matches are confirmed with ``EXISTS``. Until then, and whenever
+    the event stream is interrupted, every check goes to Redis.
+
+    Revocations stored by earlier versions under ``blacklist:<token>`` are
+    still honoured: checks also look for that key, until the last one found
+    by :meth:`start` has expired.
+
+    Backend storage has no revocation feed, so every check goes to it.
+    """
+
+    def __init__(
+        self,
+        redis_client=None,
+        backend_storage=None,
+        use_filter: bool = True,
+        filter_bucket_seconds: int = 3600,
+        channel: str = "blacklist:events",
+    ):
         """Initialize token blacklist
 
         Args:
             redis_client: Redis client for distributed blacklisting
             backend_storage: Backend storage for persistent blacklisting
+            use_filter: Answer negatives from a local Bloom filter once started
+            filter_bucket_seconds: Expiry range covered by one filter bucket
+            channel: Redis pub/sub channel carrying revocation events
         """
         self.redis_client = redis_client
         self.backend_storage = backend_storage
-        self.memory_blacklist = set()  # Fallback in-memory storage
+        self.use_filter = use_filter
+        self.channel = channel
+        self.revocation_filter = TimePartitionedBloomFilter(bucket_seconds=filter_bucket_seconds)
+        self._filter_ready = False
+        # Legacy keys are checked until then; unknown (always) until synced
+        self._legacy_until: Optional[float] = None
+        self._pubsub = None
+        self._listener: Optional[asyncio.Task] = None
+        # Fallback in-memory storage: token id digest -> expiry (unix time)
+        self.memory_blacklist: Dict[bytes, float] = {}
+        self._memory_purge_at = 1024
+        self.stats = {"checks": 0, "filter_negatives": 0, "confirmed": 0, "false_positives": 0}
+
+    @staticmethod
+    def token_id(token: str) -> str:
+        """Get the identifier a token is blacklisted under
+
+        Args:
+            token: JWT token
+
+        Returns:
+            The token's ``jti``, or a digest of the token without one
+        """
+        try:
+            jti = jwt.decode(token, options={"verify_signature": False}).get("jti")
+        except jwt.PyJWTError:
+            jti = None
+        if jti:
+            return str(jti)
+        return "sha:" + hashlib.blake2b(token.encode(), digest_size=16).hexdigest()
+
+    @staticmethod
+    def _is_legacy_key(suffix: str) -> bool:
+        # Keys of earlier versions hold the raw token: header.payload.signature.
+        # Token ids (jti or "sha:" digest) contain no dots
+        return suffix.count(".") == 2
+
+    @staticmethod
+    def _memory_key(token_id: str) -> bytes:
+        return hashlib.blake2b(token_id.encode(), digest_size=16).digest()
+
+    async def start(self) -> None:
+        """Load live revocations from Redis and follow revocation events
+
+        Subscribes before loading, so no revocation between the two is missed.
+        """
+        if not (self.redis_client and self.use_filter) or self._listener is not None:
+            return
+        try:
+            await self._sync_filter()
+        except Exception:
+            if self._pubsub is not None:
+                await self._pubsub.close()
+                self._pubsub = None
+            raise
+        self._listener = asyncio.create_task(self._follow_revocations())
+
+    async def _sync_filter(self) -> None:
+        self._pubsub = self.redis_client.pubsub(ignore_subscribe_messages=True)
+        await self._pubsub.subscribe(self.channel)
+
+        self.revocation_filter.clear()
+        now = time.time()
+        legacy_until = 0.0
+        cursor = 0
+        while True:
+            cursor, keys = await self.redis_client.scan(cursor, match="blacklist:*", count=500)
+            for key in keys:
+                key = key.decode() if isinstance(key, bytes) else key
+                ttl = await self.redis_client.ttl(key)
+                if ttl <= 0:
+                    continue
+                token_id = key[len("blacklist:") :]
+                if self._is_legacy_key(token_id):
+                    token_id = self.token_id(token_id)
+                    legacy_until = max(legacy_until, now + ttl)
+                self.revocation_filter.add(token_id, now + ttl)
+            if cursor == 0:
+                break
+        self._legacy_until = legacy_until
+        self._filter_ready = True
+        logger.info(f"Token revocation filter loaded with {len(self.revocation_filter)} entries")
+
+    async def _follow_revocations(self) -> None:
+        while True:
+            try:
+                async for message in self._pubsub.listen():
+                    if message.get("type") != "message":
+                        continue
+                    try:
+                        event = json.loads(message["data"])
+                        self.revocation_filter.add(event["id"], event["exp"])
+                    except (ValueError, KeyError, TypeError):
+                        logger.warning("Ignoring malformed token revocation event")
+                raise ConnectionError("revocation event stream ended")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Events may have been missed; confirm every check until resynced
+                self._filter_ready = False
+                logger.warning(f"Token revocation events interrupted: {e!s}")
+                await asyncio.sleep(1)
+                try:
+                    await self._pubsub.close()
+                    await self._sync_filter()
+                except Exception as sync_error:
+                    logger.warning(f"Token revocation filter resync failed: {sync_error!s}")
+
+    async def close(self) -> None:
+        """Stop following revocation events"""
+        self._filter_ready = False
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+        if self._pubsub is not None:
+            await self._pubsub.unsubscribe(self.channel)
+            await self._pubsub.close()
+            self._pubsub = None
+
+    async def _revoke_in_redis(self, token_id: str, ttl: int) -> bool:
+        await self.redis_client.setex(f"blacklist:{token_id}", ttl, "1")
+        expires_at = time.time() + ttl
+        self.revocation_filter.add(token_id, expires_at)
+        try:
+            event = json.dumps({"id": token_id, "exp": expires_at})
+            await self.redis_client.publish(self.channel, event)
+        except Exception as e:
+            # Stored, but other processes' filters will not know until they resync
+            logger.error(f"Failed to publish token revocation: {e}")
+            return False
+        return True
 
     async def blacklist_token(self, token: str, expires_at: datetime) -> bool:
         """Add token to blacklist until expiration
@@ -48,9 +215,7 @@ class TokenBlacklist:
 
             # Use Redis if available
             if self.redis_client:
-                key = f"blacklist:{token}"
-                await self.redis_client.setex(key, ttl, "1")
-                return True
+                return await self._revoke_in_redis(self.token_id(token), ttl)
 
             # Use backend storage if available
             elif self.backend_storage:
@@ -59,14 +224,24 @@ class TokenBlacklist:
 
             # Fallback to memory (not recommended for production)
             else:
-                self.memory_blacklist.add(token)
-                # Note: Memory blacklist doesn't expire automatically
+                if len(self.memory_blacklist) >= self._memory_purge_at:
+                    self._purge_memory()
+                key = self._memory_key(self.token_id(token))
+                self.memory_blacklist[key] = expires_at.timestamp()
                 return True
 
         except Exception as e:
             logger.error(f"Failed to blacklist token: {e}")
             return False
 
+    def _purge_memory(self) -> int:
+        now = time.time()
+        expired = [key for key, expiry in self.memory_blacklist.items() if expiry <= now]
+        for key in expired:
+            del self.memory_blacklist[key]
+        self._memory_purge_at = max(1024, 2 * len(self.memory_blacklist))
+        return len(expired)
+
     async def is_blacklisted(self, token: str) -> bool:
         """Check if token is blacklisted
 
@@ -79,8 +254,19 @@ class TokenBlacklist:
         try:
             # Check Redis
             if self.redis_client:
-                key = f"blacklist:{token}"
-                return bool(await self.redis_client.exists(key))
+                self.stats["checks"] += 1
+                token_id = self.token_id(token)
+                if self._filter_ready and not self.revocation_filter.might_contain(token_id):
+                    self.stats["filter_negatives"] += 1
+                    return False
+
+                keys = [f"blacklist:{token_id}"]
+                if self._legacy_until is None or self._legacy_until > time.time():
+                    keys.append(f"blacklist:{token}")
+                blacklisted = bool(await self.redis_client.exists(*keys))
+                if self._filter_ready:
+                    self.stats["confirmed" if blacklisted else "false_positives"] += 1
+                return blacklisted
 
             # Check backend storage
             elif self.backend_storage:
@@ -88,7 +274,14 @@ class TokenBlacklist:
 
             # Check memory
             else:
-                return token in self.memory_blacklist
+                key = self._memory_key(self.token_id(token))
+                expiry = self.memory_blacklist.get(key)
+                if expiry is None:
+                    return False
+                if expiry <= time.time():
+                    del self.memory_blacklist[key]
+                    return False
+                return True
 
         except Exception as e:
             logger.error(f"Failed to check blacklist status: {e}")
@@ -115,9 +308,11 @@ class TokenBlacklist:
                     if keys:
                         # Add to blacklist
                         for key in keys:
-                            token = key.split(":")[-1]
-                            # Get expiration from token
-                            await self.redis_client.setex(f"blacklist:{token}", 3600, "1")
+                            key = key.decode() if isinstance(key, bytes) else key
+                            jti = key.split(":")[-1]
+                            # Blacklist for the token's remaining lifetime
+                            ttl = await self.redis_client.ttl(key)
+                            await self._revoke_in_redis(jti, ttl if ttl > 0 else 3600)
                             invalidated += 1
 
                     if cursor == 0:
@@ -147,8 +342,9 @@ class TokenBlacklist:
             if self.backend_storage:
                 return await self.backend_storage.cleanup_expired_blacklisted_tokens()
 
-            # Redis handles expiration automatically
-            # Memory cleanup would require additional logic
+            # Redis and the revocation filter expire entries by themselves
+            if not self.redis_client:
+                return self._purge_memory()
             return 0
 
         except Exception as e:
@@ -156,6 +352,115 @@ class TokenBlacklist:
             return 0
 
 
+class VerifiedTokenCache:
+    """Bounded cache of tokens whose signature and claims were already verified
+
+    Entries are keyed by a digest of the token, so raw tokens are never kept,
+    and live until the token's ``exp``. Revocation and key rotation must
+    discard entries, which :class:`EnhancedJWTAuth` does.
+    """
+
+    def __init__(self, max_size: int = 10000):
+        """Initialize cache
+
+        Args:
+            max_size: Maximum number of verified tokens kept
+
+        Raises:
+            ValueError: If max_size is not positive
+        """
+        if max_size <= 0:
+            raise ValueError("max_size must be positive")
+
+        self.max_size = max_size
+        self._entries: OrderedDict[bytes, TokenPayload] = OrderedDict()
+        self._by_subject: Dict[str, Set[bytes]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _digest(token: str) -> bytes:
+        return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+    def get(self, token: str) -> Optional[TokenPayload]:
+        """Get the payload of a verified, unexpired token
+
+        Args:
+            token: JWT token
+
+        Returns:
+            Cached payload or None
+        """
+        digest = self._digest(token)
+        payload = self._entries.get(digest)
+        if payload is None or payload.exp <= time.time():
+            if payload is not None:
+                self._remove(digest)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(digest)
+        self.hits += 1
+        return payload
+
+    def set(self, token: str, payload: TokenPayload) -> None:
+        """Remember a verified token until it expires
+
+        Args:
+            token: JWT token
+            payload: Its verified payload
+        """
+        digest = self._digest(token)
+        if digest in self._entries:
+            self._remove(digest)
+        while len(self._entries) >= self.max_size:
+            self._remove(next(iter(self._entries)))
+
+        self._entries[digest] = payload
+        self._by_subject.setdefault(payload.sub, set()).add(digest)
+
+    def discard(self, token: str) -> None:
+        """Forget a token"""
+        self._remove(self._digest(token))
+
+    def discard_subject(self, subject: str) -> int:
+        """Forget every token issued to a subject
+
+        Returns:
+            Number of tokens forgotten
+        """
+        digests = self._by_subject.pop(subject, set())
+        for digest in digests:
+            self._entries.pop(digest, None)
+        return len(digests)
+
+    def _remove(self, digest: bytes) -> None:
+        payload = self._entries.pop(digest, None)
+        if payload is None:
+            return
+        digests = self._by_subject.get(payload.sub)
+        if digests is not None:
+            digests.discard(digest)
+            if not digests:
+                del self._by_subject[payload.sub]
+
+    def clear(self) -> None:
+        """Forget all tokens"""
+        self._entries.clear()
+        self._by_subject.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        total = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+
 class JWTKeyManager:
     """Manage JWT key rotation and multiple keys"""
 
@@ -271,6 +576,7 @@ class EnhancedJWTAuth:
         audience: Optional[str] = None,
         token_blacklist: Optional[TokenBlacklist] = None,
         require_jti: bool = True,
+        verified_cache_size: int = 10000,
     ):
         """Initialize enhanced JWT auth
 
@@ -284,6 +590,8 @@ class EnhancedJWTAuth:
             audience: Token audience
             token_blacklist: Token blacklist instance
             require_jti: Require JWT ID claim
+            verified_cache_size: Verified tokens kept to skip signature checks
+                (0 disables the cache)
         """
         # Initialize key management
         primary_key = secret_key or os.getenv("JWT_SECRET_KEY")
@@ -300,6 +608,34 @@ class EnhancedJWTAuth:
         self.audience = audience
         self.require_jti = require_jti
         self.token_blacklist = token_blacklist or TokenBlacklist()
+        self.verified_cache = (
+            VerifiedTokenCache(verified_cache_size) if verified_cache_size > 0 else None
+        )
+        # When the blacklist is started lazily; None once started or closed
+        self._blacklist_start_at: Optional[float] = 0.0
+
+    async def start(self) -> None:
+        """Start the blacklist's revocation filter
+
+        Call it from the application's lifespan. Otherwise the first
+        :meth:`verify_token` starts it.
+        """
+        self._blacklist_start_at = None
+        await self.token_blacklist.start()
+
+    async def close(self) -> None:
+        """Stop the blacklist's revocation filter"""
+        self._blacklist_start_at = None
+        await self.token_blacklist.close()
+
+    async def _start_blacklist(self) -> None:
+        self._blacklist_start_at = None
+        try:
+            await self.token_blacklist.start()
+        except Exception as e:
+            # Checks keep going to Redis meanwhile
+            logger.warning(f"Token revocation filter failed to start: {e!s}")
+            self._blacklist_start_at = time.time() + 30
 
     def create_access_token(
         self,
@@ -360,6 +696,7 @@ class EnhancedJWTAuth:
         if self.token_blacklist.redis_client:
             # This needs to be awaited in async context - for now store synchronously
             import asyncio
+
             try:
                 loop = asyncio.get_event_loop()
                 if loop.is_running():
@@ -438,11 +775,20 @@ class EnhancedJWTAuth:
             InvalidTokenError: If token is invalid or blacklisted
             TokenExpiredError: If token is expired
         """
+        if self._blacklist_start_at is not None and time.time() >= self._blacklist_start_at:
+            await self._start_blacklist()
+
         # Check blacklist first
         if await self.token_blacklist.is_blacklisted(token):
             logger.warning("Blacklisted token attempted")
             raise InvalidTokenError("Token has been revoked")
 
+        # Signature and claims of a cached token were checked before
+        if self.verified_cache is not None:
+            cached = self.verified_cache.get(token)
+            if cached is not None:
+                return cached
+
         try:
             # Decode without verification to get key ID
             unverified_header = jwt.get_unverified_header(token)
@@ -494,7 +840,10 @@ class EnhancedJWTAuth:
                 raise InvalidTokenError("Token missing 'jti' claim")
 
             logger.debug(f"Token verified for user: {payload.get('sub')}")
-            return TokenPayload(**payload)
+            token_payload = TokenPayload(**payload)
+            if self.verified_cache is not None:
+                self.verified_cache.set(token, token_payload)
+            return token_payload
 
         except Exception as e:
             if isinstance(e, (InvalidTokenError, TokenExpiredError)):
@@ -546,6 +895,8 @@ class EnhancedJWTAuth:
         Returns:
             True if successfully revoked
         """
+        if self.verified_cache is not None:
+            self.verified_cache.discard(token)
         try:
             # Get expiration from token
             payload = jwt.decode(
@@ -570,6 +921,8 @@ class EnhancedJWTAuth:
         Returns:
             Number of tokens revoked
         """
+        if self.verified_cache is not None:
+            self.verified_cache.discard_subject(user_id)
         return await self.token_blacklist.invalidate_user_tokens(user_id)
 
     def rotate_keys(self) -> str:
@@ -580,6 +933,9 @@ class EnhancedJWTAuth:
         """
         new_key_id = self.key_manager.rotate_key()
         self.key_manager.cleanup_old_keys()
+        # Tokens must be checked against the keys that remain
+        if self.verified_cache is not None:
+            self.verified_cache.clear()
         return new_key_id
 
     async def cleanup_expired_tokens(self) -> int:
@@ -8,11 +8,46 @@ from datetime import datetime, timezone
 from typing import Any, Callable, Dict, List, Optional, Set
 
 from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.middleware.trustedhost import TrustedHostMiddleware
+from starlette.requests import ClientDisconnect
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from .request_body import RequestTooLarge, buffer_body, declared_size, limit_body
+from .validation.json_stream import JSONStringStream
+from .validation.pattern_scanner import get_scanner
 
 logger = logging.getLogger(__name__)
 
+# Default blocked patterns for injection attacks. Each needs a character
+# other than a letter or digit, so such strings are never scanned for them
+DEFAULT_BLOCKED_PATTERNS = (
+    r"<script[^>]*>.*?</script>",  # XSS
+    r"javascript:",  # XSS
+    r"on\w+\s*=",  # Event handlers
+    r"union\s+select",  # SQL injection
+    r"drop\s+table",  # SQL injection
+    r"insert\s+into",  # SQL injection
+    r"delete\s+from",  # SQL injection
+    r"eval\s*\(",  # Code injection
+    r"exec\s*\(",  # Code injection
+    r"system\s*\(",  # Command injection
+    r"\$\{.*\}",  # Template injection
+    r"<\?php.*\?>",  # PHP injection
+    r"@\w+\(",  # C# injection
+)
+# Compile the default scanner at import rather than on the first request
+get_scanner(DEFAULT_BLOCKED_PATTERNS, re.IGNORECASE | re.DOTALL, frozenset())
+
+
+def _is_json(content_type: str) -> bool:
+    """Check whether a content type is one FastAPI parses as JSON"""
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    return media_type == "application/json" or (
+        media_type.startswith("application/") and media_type.endswith("+json")
+    )
+
 
 class SecurityHeadersMiddleware(BaseHTTPMiddleware):
     """Add comprehensive security headers to all responses"""
@@ -96,12 +131,18 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
         return response
 
 
-class InputSanitizationMiddleware(BaseHTTPMiddleware):
-    """Sanitize and validate request inputs to prevent injection attacks"""
+class InputSanitizationMiddleware:
+    """Sanitize and validate request inputs to prevent injection attacks
+
+    A pure ASGI middleware: JSON bodies are tokenized as chunks arrive and
+    the strings completed by each chunk are checked before the next is read,
+    so a malicious or oversize body is rejected without reading the rest. The body is cached in
+    the scope for the application (see ``request_body.BodyCachingRoute``).
+    """
 
     def __init__(
         self,
-        app: FastAPI,
+        app: ASGIApp,
         blocked_patterns: Optional[List[str]] = None,
         max_request_size: int = 10 * 1024 * 1024,  # 10MB
         enabled_paths: Optional[Set[str]] = None,
@@ -109,29 +150,14 @@ class InputSanitizationMiddleware(BaseHTTPMiddleware):
         """Initialize input sanitization middleware
 
         Args:
-            app: FastAPI application
+            app: ASGI application
             blocked_patterns: List of regex patterns to block
             max_request_size: Maximum request size in bytes
             enabled_paths: Paths where middleware is enabled
         """
-        super().__init__(app)
+        self.app = app
 
-        # Default blocked patterns for injection attacks
-        self.blocked_patterns = [
-            r"<script[^>]*>.*?</script>",  # XSS
-            r"javascript:",  # XSS
-            r"on\w+\s*=",  # Event handlers
-            r"union\s+select",  # SQL injection
-            r"drop\s+table",  # SQL injection
-            r"insert\s+into",  # SQL injection
-            r"delete\s+from",  # SQL injection
-            r"eval\s*\(",  # Code injection
-            r"exec\s*\(",  # Code injection
-            r"system\s*\(",  # Command injection
-            r"\$\{.*\}",  # Template injection
-            r"<\?php.*\?>",  # PHP injection
-            r"@\w+\(",  # C# injection
-        ]
+        self.blocked_patterns = list(DEFAULT_BLOCKED_PATTERNS)
 
         # Custom blocked patterns
         if blocked_patterns:
@@ -141,77 +167,87 @@ class InputSanitizationMiddleware(BaseHTTPMiddleware):
         self.compiled_patterns = [
             re.compile(pattern, re.IGNORECASE | re.DOTALL) for pattern in self.blocked_patterns
         ]
+        # All patterns merged for one pass per string; custom patterns may
+        # match plain letters and digits, so they disable that fast path
+        self.scanner = get_scanner(
+            tuple(self.blocked_patterns),
+            re.IGNORECASE | re.DOTALL,
+            None if blocked_patterns else frozenset(),
+        )
 
         self.max_request_size = max_request_size
         self.enabled_paths = enabled_paths or {"/", "/api/"}
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        """Validate and sanitize request inputs"""
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Validate request inputs before passing the request on"""
         # Check if middleware should run for this path
-        if not self._should_process_path(request.url.path):
-            return await call_next(request)
+        if scope["type"] != "http" or not self._should_process_path(scope["path"]):
+            await self.app(scope, receive, send)
+            return
 
-        # Check request size
-        content_length = request.headers.get("content-length")
-        if content_length and int(content_length) > self.max_request_size:
-            raise HTTPException(
-                status_code=413,
-                detail="Request entity too large",
-            )
+        request = Request(scope)
+        try:
+            # Cheap checks first, before any of the body is read
+            declared = declared_size(scope)
+            if declared is not None and declared > self.max_request_size:
+                raise RequestTooLarge()
+            self._validate_query_params(request.query_params)
+            self._validate_headers(request.headers)
+
+            if _is_json(request.headers.get("content-type", "")):
+                receive = await self._validate_json_body(scope, receive)
+            else:
+                receive = limit_body(receive, self.max_request_size)
+        except ClientDisconnect:
+            return
+        except HTTPException as e:
+            response = JSONResponse({"detail": e.detail}, status_code=e.status_code)
+            await response(scope, receive, send)
+            return
 
-        # Validate JSON data
-        if request.headers.get("content-type", "").startswith("application/json"):
-            try:
-                body = await request.body()
-                if body:
-                    import json
-
-                    data = json.loads(body.decode())
-                    self._validate_data(data)
-            except json.JSONDecodeError:
-                pass  # Will be handled by FastAPI
-            except Exception as e:
-                logger.warning(f"Input validation failed: {e}")
-                raise HTTPException(
-                    status_code=400,
-                    detail="Invalid input detected",
-                )
+        await self.app(scope, receive, send)
 
-        # Validate query parameters
-        self._validate_query_params(request.query_params)
+    async def _validate_json_body(self, scope: Scope, receive: Receive) -> Receive:
+        """Check the strings of a JSON body as it arrives"""
+        strings = JSONStringStream()
 
-        # Validate headers
-        self._validate_headers(request.headers)
+        def inspect(chunk: bytes) -> None:
+            self._validate_strings(strings.feed(chunk), "body")
 
-        response = await call_next(request)
-        return response
+        try:
+            _, receive = await buffer_body(scope, receive, self.max_request_size, inspect)
+            self._validate_strings(strings.close(), "body")
+        except ValueError as e:
+            logger.warning(f"Input validation failed: {e}")
+            raise HTTPException(
+                status_code=400,
+                detail="Invalid input detected",
+            )
+        return receive
 
     def _should_process_path(self, path: str) -> bool:
         """Check if middleware should process this path"""
         return any(path.startswith(enabled_path) for enabled_path in self.enabled_paths)
 
-    def _validate_data(self, data: Any, path: str = "") -> None:
-        """Recursively validate data structure"""
-        if isinstance(data, dict):
-            for key, value in data.items():
-                current_path = f"{path}.{key}" if path else key
-                self._validate_data(value, current_path)
-        elif isinstance(data, list):
-            for i, item in enumerate(data):
-                current_path = f"{path}[{i}]" if path else f"[{i}]"
-                self._validate_data(item, current_path)
-        elif isinstance(data, str):
-            self._validate_string(data, path)
-
     def _validate_string(self, value: str, path: str = "") -> None:
         """Validate string for malicious patterns"""
-        for pattern in self.compiled_patterns:
-            if pattern.search(value):
-                logger.warning(f"Malicious input detected at {path}: {pattern.pattern}")
-                raise HTTPException(
-                    status_code=400,
-                    detail="Malicious input detected",
-                )
+        pattern = self.scanner.search(value)
+        if pattern is not None:
+            logger.warning(f"Malicious input detected at {path}: {pattern}")
+            raise HTTPException(
+                status_code=400,
+                detail="Malicious input detected",
+            )
+
+    def _validate_strings(self, values: List[str], path: str = "") -> None:
+        """Validate a batch of strings for malicious patterns"""
+        pattern = self.scanner.search_many(values)
+        if pattern is not None:
+            logger.warning(f"Malicious input detected at {path}: {pattern}")
+            raise HTTPException(
+                status_code=400,
+                detail="Malicious input detected",
+            )
 
     def _validate_query_params(self, params: Dict[str, str]) -> None:
         """Validate query parameters"""
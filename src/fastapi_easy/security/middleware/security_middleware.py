@@ -6,15 +6,18 @@ import logging
 import time
 from typing import Dict, List, Optional, Set
 
-from fastapi import HTTPException, Request, Response, status
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi import HTTPException, Request, status
+from starlette.datastructures import MutableHeaders
+from starlette.requests import ClientDisconnect
 from starlette.responses import JSONResponse
+from starlette.types import Message, Receive, Scope, Send
 
 from ..core.jwt_auth import JWTAuth
 from ..exceptions import (
     AuthenticationError,
     AuthorizationError,
 )
+from ..request_body import buffer_body, declared_size, limit_body
 from ..validation.input_validator import InputValidationError, SecurityValidator
 
 logger = logging.getLogger(__name__)
@@ -23,9 +26,22 @@ logger = logging.getLogger(__name__)
 _rate_limit_store: Dict[str, List[float]] = {}
 _blacklisted_ips: Set[str] = set()
 
+# Error codes for rejected requests, by status
+_ERROR_CODES = {
+    400: "INVALID_INPUT",
+    401: "AUTHENTICATION_FAILED",
+    403: "IP_BLACKLISTED",
+    413: "REQUEST_TOO_LARGE",
+    429: "RATE_LIMIT_EXCEEDED",
+}
 
-class SecurityMiddleware(BaseHTTPMiddleware):
-    """Comprehensive security middleware for FastAPI"""
+
+class SecurityMiddleware:
+    """Comprehensive security middleware for FastAPI
+
+    A pure ASGI middleware, so the request body is read once and the
+    response is not buffered to add headers.
+    """
 
     def __init__(
         self,
@@ -54,7 +70,7 @@ class SecurityMiddleware(BaseHTTPMiddleware):
             enable_cors: Enable CORS headers
             allowed_origins: List of allowed CORS origins
         """
-        super().__init__(app)
+        self.app = app
         self.jwt_auth = jwt_auth
         self.rate_limit_per_minute = rate_limit_per_minute
         self.rate_limit_per_hour = rate_limit_per_hour
@@ -82,73 +98,90 @@ class SecurityMiddleware(BaseHTTPMiddleware):
             "Permissions-Policy": "geolocation=(), microphone=(), camera=()",
         }
 
-    async def dispatch(self, request: Request, call_next) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request with security checks"""
-        try:
-            # Get client IP
-            client_ip = self._get_client_ip(request)
-
-            # Check if IP is blacklisted
-            if client_ip in _blacklisted_ips:
-                logger.warning(f"Blacklisted IP attempted access: {client_ip}")
-                return self._create_error_response(
-                    "Access denied", status.HTTP_403_FORBIDDEN, "IP_BLACKLISTED"
-                )
-
-            # Check rate limiting
-            if not await self._check_rate_limit(client_ip):
-                logger.warning(f"Rate limit exceeded for IP: {client_ip}")
-                return self._create_error_response(
-                    "Rate limit exceeded", status.HTTP_429_TOO_MANY_REQUESTS, "RATE_LIMIT_EXCEEDED"
-                )
-
-            # Check request size
-            content_length = request.headers.get("content-length")
-            if content_length and int(content_length) > self.max_request_size:
-                logger.warning(f"Request too large from IP: {client_ip}, size: {content_length}")
-                return self._create_error_response(
-                    "Request too large",
-                    status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                    "REQUEST_TOO_LARGE",
-                )
-
-            # Add security headers
-            response = await self._process_request(request, call_next)
-
-            # Add security headers to response
-            for header, value in self.security_headers.items():
-                response.headers[header] = value
-
-            # Add CORS headers if enabled
-            if self.enable_cors:
-                self._add_cors_headers(request, response)
-
-            return response
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
+        request = Request(scope)
+        try:
+            receive = await self._check_request(request, receive)
+        except ClientDisconnect:
+            return
+        except HTTPException as e:
+            response = self._create_error_response(
+                str(e.detail),
+                e.status_code,
+                _ERROR_CODES.get(e.status_code, "SECURITY_ERROR"),
+                e.headers,
+            )
+            await response(scope, receive, send)
+            return
         except Exception as e:
             logger.error(f"Security middleware error: {e!s}", exc_info=True)
-            return self._create_error_response(
+            response = self._create_error_response(
                 "Internal security error", status.HTTP_500_INTERNAL_SERVER_ERROR, "SECURITY_ERROR"
             )
+            await response(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                # Add security headers to response
+                for header, value in self.security_headers.items():
+                    headers[header] = value
+
+                # Add CORS headers if enabled
+                if self.enable_cors:
+                    self._add_cors_headers(request, headers)
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
+
+    async def _check_request(self, request: Request, receive: Receive) -> Receive:
+        """Run security checks before the request reaches the application
+
+        Returns:
+            Receive callable to pass to the application
+
+        Raises:
+            HTTPException: If the request is rejected
+        """
+        # Get client IP
+        client_ip = self._get_client_ip(request)
+
+        # Check if IP is blacklisted
+        if client_ip in _blacklisted_ips:
+            logger.warning(f"Blacklisted IP attempted access: {client_ip}")
+            raise HTTPException(status.HTTP_403_FORBIDDEN, "Access denied")
+
+        # Check rate limiting
+        if not await self._check_rate_limit(client_ip):
+            logger.warning(f"Rate limit exceeded for IP: {client_ip}")
+            raise HTTPException(status.HTTP_429_TOO_MANY_REQUESTS, "Rate limit exceeded")
+
+        # Check declared request size; the body itself is counted as it is read
+        content_length = declared_size(request.scope)
+        if content_length is not None and content_length > self.max_request_size:
+            logger.warning(f"Request too large from IP: {client_ip}, size: {content_length}")
+            raise HTTPException(status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, "Request too large")
 
-    async def _process_request(self, request: Request, call_next) -> Response:
-        """Process request with authentication and validation"""
         # Check if authentication is required for this path
-        path = request.url.path
-        requires_auth = self._requires_auth(path)
+        requires_auth = self._requires_auth(request.url.path)
 
         # Validate and sanitize input if enabled
         if self.enable_input_validation and request.method in ["POST", "PUT", "PATCH"]:
-            await self._validate_request_body(request)
+            receive = await self._validate_request_body(request, receive)
+        else:
+            receive = limit_body(receive, self.max_request_size)
 
         # Check authentication if required
         if requires_auth and self.jwt_auth:
             await self._authenticate_request(request)
 
-        # Process the request
-        response = await call_next(request)
-
-        return response
+        return receive
 
     def _get_client_ip(self, request: Request) -> str:
         """Get client IP address with proxy support"""
@@ -208,24 +241,33 @@ class SecurityMiddleware(BaseHTTPMiddleware):
         # Default behavior - require auth for all non-public paths
         return not path.startswith("/public/") and path != "/"
 
-    async def _validate_request_body(self, request: Request) -> None:
-        """Validate and sanitize request body"""
+    async def _validate_request_body(self, request: Request, receive: Receive) -> Receive:
+        """Validate and sanitize request body
+
+        The body is read once, with its size counted as it arrives, and kept
+        in the scope along with the parsed document for the application.
+
+        Returns:
+            Receive callable replaying the body to the application
+        """
+        cached, receive = await buffer_body(request.scope, receive, self.max_request_size)
+        try:
+            body = cached.json()
+        except ValueError:
+            # Non-JSON requests are skipped
+            return receive
+
         try:
-            body = await request.json()
             # Validate and sanitize input
             sanitized = SecurityValidator.comprehensive_validation(body)
+        except InputValidationError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail=f"Invalid input: {e!s}"
+            )
 
-            # Replace request body with sanitized version
-            # Note: In FastAPI, we need to use request.state to store sanitized data
-            request.state.sanitized_body = sanitized
-
-        except Exception as e:
-            if isinstance(e, InputValidationError):
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST, detail=f"Invalid input: {e!s}"
-                )
-            # Non-JSON requests are skipped
-            pass
+        # The parsed body is reused by routes; the sanitized copy is kept apart
+        request.state.sanitized_body = sanitized
+        return receive
 
     async def _authenticate_request(self, request: Request) -> None:
         """Authenticate request using JWT"""
@@ -258,16 +300,16 @@ class SecurityMiddleware(BaseHTTPMiddleware):
                 headers={"WWW-Authenticate": "Bearer"},
             )
 
-    def _add_cors_headers(self, request: Request, response: Response) -> None:
-        """Add CORS headers to response"""
+    def _add_cors_headers(self, request: Request, headers: MutableHeaders) -> None:
+        """Add CORS headers to response headers"""
         origin = request.headers.get("Origin")
 
         # Check if origin is allowed
         if origin and (self.allowed_origins == ["*"] or origin in self.allowed_origins):
-            response.headers["Access-Control-Allow-Origin"] = origin
+            headers["Access-Control-Allow-Origin"] = origin
 
         # Add other CORS headers
-        response.headers.update(
+        headers.update(
             {
                 "Access-Control-Allow-Methods": "GET, POST, PUT, DELETE, OPTIONS",
                 "Access-Control-Allow-Headers": "Authorization, Content-Type, X-Requested-With",
@@ -277,11 +319,16 @@ class SecurityMiddleware(BaseHTTPMiddleware):
         )
 
     def _create_error_response(
-        self, message: str, status_code: int, error_code: str
+        self,
+        message: str,
+        status_code: int,
+        error_code: str,
+        headers: Optional[Dict[str, str]] = None,
     ) -> JSONResponse:
         """Create standardized error response"""
         return JSONResponse(
             status_code=status_code,
+            headers=headers,
             content={
                 "error": message,
                 "error_code": error_code,
@@ -0,0 +1,205 @@
+"""Request bodies read once by ASGI middleware and shared through the scope
+
+A middleware that needs the body reads it with ``buffer_body``, which counts
+bytes as they arrive and stores the result in the ASGI scope. Later
+middleware reuse it from there, and the application receives the buffered
+chunks again. Routes using ``BodyCachingRoute`` take the body, and the JSON
+document if a middleware already parsed it, straight from the scope.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Callable, List, Optional, Tuple
+
+from fastapi import HTTPException, Request, Response
+from fastapi.routing import APIRoute
+from starlette.requests import ClientDisconnect
+from starlette.types import Message, Receive, Scope
+
+BODY_SCOPE_KEY = "fastapi_easy.body"
+
+_UNPARSED = object()
+
+
+class RequestTooLarge(HTTPException):
+    """Request body exceeded the configured size"""
+
+    def __init__(self):
+        super().__init__(status_code=413, detail="Request entity too large")
+
+
+class CachedBody:
+    """Request body buffered as received"""
+
+    def __init__(self, chunks: List[bytes]):
+        """Initialize cached body
+
+        Args:
+            chunks: Body chunks in order
+        """
+        self.chunks = chunks
+        self.size = sum(len(chunk) for chunk in chunks)
+        self._body: Optional[bytes] = None
+        self._json: Any = _UNPARSED
+
+    @property
+    def body(self) -> bytes:
+        """Whole body, joined on first access"""
+        if self._body is None:
+            self._body = b"".join(self.chunks)
+            self.chunks = [self._body] if self._body else []
+        return self._body
+
+    @property
+    def parsed(self) -> bool:
+        """Whether the body has been parsed as JSON"""
+        return self._json is not _UNPARSED
+
+    def json(self) -> Any:
+        """Parse the body as JSON, once
+
+        Raises:
+            ValueError: If the body is not valid JSON
+        """
+        if self._json is _UNPARSED:
+            self._json = json.loads(self.body)
+        return self._json
+
+    def replay(self, receive: Receive) -> Receive:
+        """Build a receive callable that delivers the buffered body again
+
+        Args:
+            receive: Original receive, used once the body is delivered
+
+        Returns:
+            Receive callable for the application
+        """
+        pending = list(self.chunks) or [b""]
+
+        async def replay_receive() -> Message:
+            if not pending:
+                # Body delivered; further calls wait for disconnect
+                return await receive()
+            chunk = pending.pop(0)
+            return {"type": "http.request", "body": chunk, "more_body": bool(pending)}
+
+        return replay_receive
+
+
+def declared_size(scope: Scope) -> Optional[int]:
+    """Get the Content-Length header of a request, if valid"""
+    for name, value in scope.get("headers", ()):
+        if name == b"content-length":
+            try:
+                return int(value)
+            except ValueError:
+                return None
+    return None
+
+
+async def buffer_body(
+    scope: Scope,
+    receive: Receive,
+    max_size: Optional[int] = None,
+    on_chunk: Optional[Callable[[bytes], None]] = None,
+) -> Tuple[CachedBody, Receive]:
+    """Read the request body once and cache it in the scope
+
+    The size limit is enforced on the bytes received, so a missing or false
+    Content-Length does not bypass it. If a previous middleware already read
+    the body, the cached body is checked and reused instead.
+
+    Args:
+        scope: ASGI scope
+        receive: ASGI receive callable
+        max_size: Maximum body size in bytes, or None for no limit
+        on_chunk: Called with each chunk as it arrives; exceptions it raises
+            stop reading
+
+    Returns:
+        The body, and the receive callable to pass to the application
+
+    Raises:
+        RequestTooLarge: If the body exceeds max_size
+        ClientDisconnect: If the client disconnects mid-body
+    """
+    cached = scope.get(BODY_SCOPE_KEY)
+    if cached is not None:
+        if max_size is not None and cached.size > max_size:
+            raise RequestTooLarge()
+        if on_chunk is not None:
+            for chunk in cached.chunks:
+                on_chunk(chunk)
+        return cached, receive
+
+    declared = declared_size(scope)
+    if max_size is not None and declared is not None and declared > max_size:
+        raise RequestTooLarge()
+
+    chunks: List[bytes] = []
+    size = 0
+    while True:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            raise ClientDisconnect()
+        chunk = message.get("body", b"")
+        if chunk:
+            size += len(chunk)
+            if max_size is not None and size > max_size:
+                raise RequestTooLarge()
+            chunks.append(chunk)
+            if on_chunk is not None:
+                on_chunk(chunk)
+        if not message.get("more_body", False):
+            break
+
+    cached = CachedBody(chunks)
+    scope[BODY_SCOPE_KEY] = cached
+    return cached, cached.replay(receive)
+
+
+def limit_body(receive: Receive, max_size: int) -> Receive:
+    """Wrap receive to enforce a body size limit without buffering
+
+    Args:
+        receive: ASGI receive callable
+        max_size: Maximum body size in bytes
+
+    Returns:
+        Receive callable raising RequestTooLarge once the body exceeds max_size
+    """
+    received = 0
+
+    async def limited_receive() -> Message:
+        nonlocal received
+        message = await receive()
+        if message["type"] == "http.request":
+            received += len(message.get("body", b""))
+            if received > max_size:
+                raise RequestTooLarge()
+        return message
+
+    return limited_receive
+
+
+class BodyCachingRoute(APIRoute):
+    """Route that reuses a body already read by middleware
+
+    Usage:
+        app = FastAPI()
+        app.router.route_class = BodyCachingRoute
+    """
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+
+        async def route_handler(request: Request) -> Response:
+            cached = request.scope.get(BODY_SCOPE_KEY)
+            if cached is not None:
+                request._body = cached.body
+                if cached.parsed:
+                    request._json = cached.json()
+            return await handler(request)
+
+        return route_handler
@@ -8,8 +8,19 @@ import re
 from typing import Any, Dict, List, Optional
 from urllib.parse import unquote
 
+from .pattern_scanner import PatternScanner, get_scanner
+
 logger = logging.getLogger(__name__)
 
+# Words the keyword patterns below match; they are the only letter-and-digit
+# strings those patterns can match, which the scanners' fast path relies on
+SQL_KEYWORDS = ("SELECT", "INSERT", "UPDATE", "DELETE", "DROP", "CREATE", "ALTER", "EXEC", "UNION")
+COMMAND_WORDS = (
+    ("curl", "wget", "nc", "netcat", "ssh", "ftp"),
+    ("rm", "mv", "cp", "cat", "ls", "ps", "kill"),
+    ("python", "perl", "ruby", "bash", "sh", "cmd", "powershell"),
+)
+
 
 class InputValidationError(Exception):
     """Input validation error"""
@@ -22,7 +33,7 @@ class SecurityValidator:
 
     # SQL Injection patterns
     SQL_INJECTION_PATTERNS = [
-        r"(\b(SELECT|INSERT|UPDATE|DELETE|DROP|CREATE|ALTER|EXEC|UNION)\b)",
+        rf"(\b({'|'.join(SQL_KEYWORDS)})\b)",
         r"(--|\#|\/\*)",  # SQL comments
         r"(\bOR\b.*=.*\bOR\b)",  # OR 1=1
         r"(\bAND\b.*=.*\bAND\b)",  # AND 1=1
@@ -52,11 +63,22 @@ class SecurityValidator:
     # Command injection patterns
     COMMAND_INJECTION_PATTERNS = [
         r"[;&|`$(){}[\]]",  # Command separators
-        r"\b(curl|wget|nc|netcat|ssh|ftp)\b",
-        r"\b(rm|mv|cp|cat|ls|ps|kill)\b",
-        r"\b(python|perl|ruby|bash|sh|cmd|powershell)\b",
+        *(rf"\b({'|'.join(words)})\b" for words in COMMAND_WORDS),
     ]
 
+    @classmethod
+    def _scanner(cls, kind: str) -> PatternScanner:
+        """Get the compiled scanner for one of the pattern lists
+
+        The letter-and-digit fast path only holds for the default lists, so
+        subclasses overriding a list get a scanner without it.
+        """
+        patterns = tuple(getattr(cls, f"{kind}_PATTERNS"))
+        flags, alnum_matches = _SCANNER_SETTINGS[kind]
+        if patterns != _DEFAULT_PATTERNS[kind]:
+            alnum_matches = None
+        return get_scanner(patterns, flags, alnum_matches)
+
     @classmethod
     def sanitize_string(cls, value: str, max_length: int = 1000) -> str:
         """Sanitize string input
@@ -140,10 +162,9 @@ class SecurityValidator:
         """
         if isinstance(value, str):
             # Check for SQL injection patterns
-            for pattern in cls.SQL_INJECTION_PATTERNS:
-                if re.search(pattern, value, re.IGNORECASE | re.MULTILINE | re.DOTALL):
-                    logger.warning(f"SQL injection attempt detected: {value[:100]}...")
-                    raise InputValidationError("Suspicious input detected")
+            if cls._scanner("SQL_INJECTION").search(value) is not None:
+                logger.warning(f"SQL injection attempt detected: {value[:100]}...")
+                raise InputValidationError("Suspicious input detected")
 
         elif isinstance(value, (list, tuple)):
             # Validate each item in list/tuple
@@ -279,11 +300,7 @@ class SecurityValidator:
         if not isinstance(value, str):
             return False
 
-        for pattern in cls.XSS_PATTERNS:
-            if re.search(pattern, value, re.IGNORECASE | re.MULTILINE | re.DOTALL):
-                return True
-
-        return False
+        return cls._scanner("XSS").search(value) is not None
 
     @classmethod
     def check_path_traversal(cls, path: str) -> bool:
@@ -298,11 +315,7 @@ class SecurityValidator:
         if not isinstance(path, str):
             return False
 
-        for pattern in cls.PATH_TRAVERSAL_PATTERNS:
-            if re.search(pattern, path, re.IGNORECASE):
-                return True
-
-        return False
+        return cls._scanner("PATH_TRAVERSAL").search(path) is not None
 
     @classmethod
     def check_command_injection(cls, value: str) -> bool:
@@ -317,11 +330,7 @@ class SecurityValidator:
         if not isinstance(value, str):
             return False
 
-        for pattern in cls.COMMAND_INJECTION_PATTERNS:
-            if re.search(pattern, value, re.IGNORECASE):
-                return True
-
-        return False
+        return cls._scanner("COMMAND_INJECTION").search(value) is not None
 
     @classmethod
     def comprehensive_validation(cls, data: Any) -> Any:
@@ -366,6 +375,20 @@ class SecurityValidator:
             return cls.validate_sql_value(data)
 
 
+_SCANNER_SETTINGS = {
+    "SQL_INJECTION": (re.IGNORECASE | re.MULTILINE | re.DOTALL, frozenset(SQL_KEYWORDS)),
+    "XSS": (re.IGNORECASE | re.MULTILINE | re.DOTALL, frozenset()),
+    "PATH_TRAVERSAL": (re.IGNORECASE, frozenset()),
+    "COMMAND_INJECTION": (re.IGNORECASE, frozenset(w for words in COMMAND_WORDS for w in words)),
+}
+_DEFAULT_PATTERNS = {
+    kind: tuple(getattr(SecurityValidator, f"{kind}_PATTERNS")) for kind in _SCANNER_SETTINGS
+}
+# Compile the default scanners at import rather than on the first request
+for _kind in _SCANNER_SETTINGS:
+    SecurityValidator._scanner(_kind)
+
+
 # Pydantic validators for easy integration
 def sanitize_string_validator(max_length: int = 1000):
     """Pydantic validator for string sanitization"""
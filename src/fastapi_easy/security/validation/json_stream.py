@@ -0,0 +1,147 @@
+"""Incremental extraction of string values from a JSON body"""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import List, Optional
+
+# Rest of a string literal up to its closing quote or the end of the buffer.
+# Unrolled so it never backtracks; no possessive quantifiers (Python 3.11+)
+_STRING_BODY = re.compile(rb'[^"\\]*(?:\\.[^"\\]*)*', re.DOTALL)
+
+# A string literal, whether it is closed, and whether a colon follows (a key).
+# It matches at every quote, so scanning never resumes inside a string
+_STRING_TOKEN = re.compile(rb'"([^"\\]*(?:\\.[^"\\]*)*)(")?[ \t\n\r]*(:)?', re.DOTALL)
+_QUOTE = 0x22
+_WHITESPACE = b" \t\n\r"
+
+
+class JSONStringStream:
+    """Tokenize a JSON document as it arrives and yield its string values
+
+    Only string literals are tokenized: in valid JSON every quote outside a
+    string opens one, so strings can be found without parsing the document.
+    Object keys (literals followed by ``:``) are skipped. Memory is bounded by
+    the longest string, not by the body.
+
+    Usage:
+        stream = JSONStringStream()
+        for chunk in chunks:
+            for value in stream.feed(chunk):
+                check(value)
+        for value in stream.close():
+            check(value)
+    """
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._start: Optional[int] = None  # Opening quote of an unfinished string
+        self._resume = 0  # Where scanning the unfinished string continues
+        self._encoding_checked = False
+
+    def feed(self, chunk: bytes) -> List[str]:
+        """Add a chunk of the body
+
+        Args:
+            chunk: Next bytes of the body
+
+        Returns:
+            String values completed by this chunk
+
+        Raises:
+            ValueError: If the body is not UTF-8
+        """
+        self._buffer += chunk
+        if not self._encoding_checked and len(self._buffer) >= 4:
+            self._check_encoding()
+        return self._scan(final=False)
+
+    def close(self) -> List[str]:
+        """Finish the body
+
+        Returns:
+            String values completed at the end of the body
+
+        Raises:
+            ValueError: If the body is not UTF-8
+        """
+        if not self._encoding_checked:
+            self._check_encoding()
+        return self._scan(final=True)
+
+    def _check_encoding(self) -> None:
+        # json.loads accepts UTF-16 and UTF-32 bodies, whose strings this
+        # byte-level tokenizer would not see
+        self._encoding_checked = True
+        if json.detect_encoding(bytes(self._buffer[:4])) not in ("utf-8", "utf-8-sig"):
+            raise ValueError("JSON body must be UTF-8 encoded")
+
+    def _scan(self, final: bool) -> List[str]:
+        buffer = self._buffer
+        if self._start is not None:
+            # Look for the end of the unfinished string before tokenizing again
+            end = _STRING_BODY.match(buffer, self._resume).end()
+            if end >= len(buffer) or buffer[end] != _QUOTE:
+                self._resume = end
+                return []
+            self._start = None
+
+        # Escaped quotes are rare; without them splitting on quotes tokenizes
+        if b"\\" in buffer:
+            values = self._tokenize_escaped(buffer, final)
+        else:
+            values = self._tokenize_plain(buffer, final)
+
+        # Drop what has been scanned; keep an unfinished string
+        if self._start is None:
+            del buffer[:]
+        elif self._start:
+            del buffer[: self._start]
+            self._resume -= self._start
+            self._start = 0
+        return values
+
+    def _tokenize_plain(self, buffer: bytearray, final: bool) -> List[str]:
+        # Parts alternate between outside and inside strings
+        parts = bytes(buffer).split(b'"')
+        strings = parts[1::2]
+        following = parts[2::2]
+        if len(parts) % 2 == 0:
+            # The last string is unfinished
+            self._start = len(buffer) - len(parts[-1]) - 1
+            self._resume = len(buffer)
+            strings.pop()
+        elif strings and not final and not following[-1].lstrip(_WHITESPACE):
+            # The next chunk may show the last string is a key
+            self._resume = len(buffer) - len(parts[-1]) - 1
+            self._start = self._resume - len(parts[-2]) - 1
+            strings.pop()
+
+        return [
+            string.decode("utf-8", errors="replace")
+            for string, after in zip(strings, following)
+            if not after.lstrip(_WHITESPACE).startswith(b":")
+        ]
+
+    def _tokenize_escaped(self, buffer: bytearray, final: bool) -> List[str]:
+        values = []
+        for match in _STRING_TOKEN.finditer(buffer):
+            if match.group(2) is None or (match.end() == len(buffer) and not final):
+                # Unfinished, or the next chunk may show it is a key
+                self._start = match.start()
+                self._resume = match.end(1)
+                break
+            if match.group(3) is None:
+                values.append(_decode(match.group(1)))
+        return values
+
+
+def _decode(raw: bytes) -> str:
+    if b"\\" not in raw:
+        return raw.decode("utf-8", errors="replace")
+    try:
+        return json.loads(b'"' + raw + b'"')
+    except ValueError:
+        # Invalid escapes; the route will reject the body as invalid JSON
+        return raw.decode("utf-8", errors="replace")
@@ -0,0 +1,155 @@
+"""Single-pass scanning of strings against many security patterns"""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import FrozenSet, Iterable, List, Optional, Tuple
+
+# Constructs whose meaning depends on group numbering or names, which
+# merging renumbers: backreferences and conditional groups
+_GROUP_DEPENDENT = re.compile(r"\\[1-9]|\(\?P=|\(\?\(")
+
+# Uppercase letters and escapes that can denote letters. Patterns without them
+# match a lowercased ASCII string case-sensitively exactly as they match the
+# original case-insensitively
+_CASE_DEPENDENT = re.compile(r"[A-Z]|\\[xuUN0]")
+
+# Anchors, word boundaries and lookarounds: constructs that see beyond the
+# text they match. Patterns without them that match a string also match any
+# text containing it. Errs on the side of finding them
+_CONTEXT_DEPENDENT = re.compile(r"(?<!\[)\^|(?<!\\)(?:\\\\)*\$|\\[bBAZ]|\(\?<?[=!]")
+
+
+class PatternScanner:
+    """Scan strings against a set of regex patterns in one pass
+
+    The patterns are merged into one alternation and compiled once, so a
+    clean string is scanned once instead of once per pattern; only strings
+    that match are scanned again to name the pattern. Patterns that cannot be
+    merged safely (backreferences, inline global flags) are scanned one by
+    one instead.
+
+    Case-insensitive matching is several times slower in Python's regex
+    engine. If all patterns are lowercase ASCII, ASCII strings are lowercased
+    and scanned case-sensitively instead.
+
+    ``search_many`` scans a batch of strings joined together when no pattern
+    depends on context, and only scans them one by one if the batch matches.
+
+    With ``alnum_matches``, strings of ASCII letters and digits only are
+    checked by a set lookup instead of a scan. It must list every such string
+    the patterns can match; the regex still confirms listed strings.
+    """
+
+    def __init__(
+        self,
+        patterns: Iterable[str],
+        flags: int = 0,
+        alnum_matches: Optional[Iterable[str]] = None,
+    ):
+        """Initialize scanner
+
+        Args:
+            patterns: Regex patterns
+            flags: Regex flags for all patterns
+            alnum_matches: Letter-and-digit strings the patterns can match;
+                None disables the fast path
+        """
+        self.patterns = list(patterns)
+        self.flags = flags
+        if alnum_matches is None:
+            self.alnum_matches: Optional[FrozenSet[str]] = None
+        elif flags & re.IGNORECASE:
+            self.alnum_matches = frozenset(match.lower() for match in alnum_matches)
+        else:
+            self.alnum_matches = frozenset(alnum_matches)
+
+        self._compiled = [re.compile(pattern, flags) for pattern in self.patterns]
+        self._merged: Optional[re.Pattern] = None
+        self._folded: Optional[re.Pattern] = None
+        self._batchable = False
+        if any(_GROUP_DEPENDENT.search(pattern) for pattern in self.patterns):
+            return
+
+        # Non-capturing: group bookkeeping would cost more than it saves
+        merged = "|".join(f"(?:{pattern})" for pattern in self.patterns)
+        try:
+            self._merged = re.compile(merged, flags)
+        except re.error:
+            return
+        if flags & re.IGNORECASE and all(
+            pattern.isascii() and not _CASE_DEPENDENT.search(pattern) for pattern in self.patterns
+        ):
+            self._folded = re.compile(merged, flags & ~re.IGNORECASE)
+        self._batchable = not any(_CONTEXT_DEPENDENT.search(pattern) for pattern in self.patterns)
+
+    def search(self, value: str) -> Optional[str]:
+        """Find a pattern matching anywhere in a string
+
+        Args:
+            value: String to scan
+
+        Returns:
+            The matching pattern, or None if no pattern matches
+        """
+        if self.alnum_matches is not None and value.isascii() and value.isalnum():
+            key = value.lower() if self.flags & re.IGNORECASE else value
+            if key not in self.alnum_matches:
+                return None
+
+        if self._folded is not None and value.isascii():
+            if self._folded.search(value.lower()) is None:
+                return None
+        elif self._merged is not None and self._merged.search(value) is None:
+            return None
+
+        # Rare: some pattern matched, find which one
+        for pattern in self._compiled:
+            if pattern.search(value):
+                return pattern.pattern
+        return None
+
+    def search_many(self, values: List[str]) -> Optional[str]:
+        """Find a pattern matching anywhere in any of several strings
+
+        Args:
+            values: Strings to scan
+
+        Returns:
+            The first matching pattern, or None if no string matches
+        """
+        if self._batchable and len(values) > 1:
+            # A match within a string is a match within the joined text; a
+            # match across strings only costs the one-by-one scan below
+            text = "\n".join(values)
+            if self._folded is not None and text.isascii():
+                if self._folded.search(text.lower()) is None:
+                    return None
+            elif self._merged.search(text) is None:
+                return None
+
+        for value in values:
+            pattern = self.search(value)
+            if pattern is not None:
+                return pattern
+        return None
+
+
+@lru_cache(maxsize=64)
+def get_scanner(
+    patterns: Tuple[str, ...],
+    flags: int = 0,
+    alnum_matches: Optional[FrozenSet[str]] = None,
+) -> PatternScanner:
+    """Get a shared scanner, compiling it on first use
+
+    Args:
+        patterns: Regex patterns
+        flags: Regex flags for all patterns
+        alnum_matches: Letter-and-digit strings the patterns can match
+
+    Returns:
+        Scanner for the patterns
+    """
+    return PatternScanner(patterns, flags, alnum_matches)
@@ -6,6 +6,7 @@ A comprehensive testing suite providing:
 - Intelligent caching mechanisms
 - Advanced performance monitoring
 - Optimized database utilities
+- Query counting to catch N+1 regressions
 - Comprehensive test reporting
 """
 
@@ -42,6 +43,12 @@ from .database_utils import (
     test_data_manager,
 )
 
+from .query_counter import (
+    QueryCounter,
+    assert_num_queries,
+    assert_max_queries,
+)
+
 from .test_reporter import (
     TestTiming,
     TestSuiteReport,
@@ -84,6 +91,11 @@ __all__ = [
     "PerformanceWarning",
     "test_data_manager",
 
+    # Query Counting
+    "QueryCounter",
+    "assert_num_queries",
+    "assert_max_queries",
+
     # Test Reporting
     "TestTiming",
     "TestSuiteReport",
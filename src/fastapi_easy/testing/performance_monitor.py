@@ -207,7 +207,6 @@ class PerformanceMonitor:
         return BenchmarkResult(
             test_name=test_func.__name__,
             metrics=avg_metrics,
-            metrics=avg_metrics,
             iterations=iterations,
             min_duration=min_duration,
             max_duration=max_duration,
@@ -0,0 +1,70 @@
+"""
+Query counting helpers for FastAPI-Easy testing.
+Catches N+1 regressions by asserting how many SQL statements a block executes.
+"""
+
+from contextlib import contextmanager
+from typing import Any, Generator, List
+
+from sqlalchemy import event
+
+
+class QueryCounter:
+    """Record SQL statements executed on an engine
+
+    Accepts a sync ``Engine`` or an ``AsyncEngine``. Use as a context manager;
+    statements are recorded between ``__enter__`` and ``__exit__``.
+    """
+
+    def __init__(self, engine: Any):
+        self.engine = getattr(engine, "sync_engine", engine)
+        self.statements: List[str] = []
+
+    @property
+    def count(self) -> int:
+        """Number of statements recorded"""
+        return len(self.statements)
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        self.statements.append(statement)
+
+    def __enter__(self) -> "QueryCounter":
+        event.listen(self.engine, "before_cursor_execute", self._record)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        event.remove(self.engine, "before_cursor_execute", self._record)
+
+    def format_statements(self) -> str:
+        """Numbered list of recorded statements for assertion messages"""
+        return "\n".join(f"{i}. {statement}" for i, statement in enumerate(self.statements, 1))
+
+
+@contextmanager
+def assert_num_queries(engine: Any, expected: int) -> Generator[QueryCounter, None, None]:
+    """Assert that the block executes exactly ``expected`` SQL statements
+
+    Example:
+        with assert_num_queries(engine, 2):
+            await adapter.get_all({}, {}, {"skip": 0, "limit": 10}, include=["tags"])
+    """
+    with QueryCounter(engine) as counter:
+        yield counter
+
+    if counter.count != expected:
+        raise AssertionError(
+            f"Expected {expected} queries, got {counter.count}:\n{counter.format_statements()}"
+        )
+
+
+@contextmanager
+def assert_max_queries(engine: Any, maximum: int) -> Generator[QueryCounter, None, None]:
+    """Assert that the block executes at most ``maximum`` SQL statements"""
+    with QueryCounter(engine) as counter:
+        yield counter
+
+    if counter.count > maximum:
+        raise AssertionError(
+            f"Expected at most {maximum} queries, got {counter.count}:\n"
+            f"{counter.format_statements()}"
+        )
@@ -3,6 +3,7 @@ Advanced test caching system for FastAPI-Easy.
 Provides intelligent caching of test data, database states, and expensive operations.
 """
 
+import asyncio
 import json
 import pickle
 import hashlib
@@ -16,7 +16,13 @@ from .hot_reload_state import (
     get_state_manager,
     persistent_state,
 )
-from .pagination import PaginationParams, paginate
+from .pagination import (
+    CursorParams,
+    PaginationParams,
+    decode_cursor,
+    encode_cursor,
+    paginate,
+)
 from .query_params import QueryParams, as_query_params
 from .sorters import SortParser
 from .static_files import EnhancedStaticFiles, setup_static_files
@@ -25,6 +31,9 @@ __all__ = [
     # Existing utilities
     "PaginationParams",
     "paginate",
+    "CursorParams",
+    "encode_cursor",
+    "decode_cursor",
     "FilterParser",
     "SortParser",
     # Query parameter utilities
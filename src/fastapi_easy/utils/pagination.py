@@ -2,8 +2,20 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Dict, List, TypeVar
+import base64
+import json
+import uuid
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Tuple, TypeVar
+
+from .sorters import SortParser
+
+try:
+    from bson import ObjectId
+except ImportError:
+    ObjectId = None  # type: ignore
 
 T = TypeVar("T")
 
@@ -42,6 +54,209 @@ class PaginationParams:
         return {"skip": self.skip, "limit": self.limit}
 
 
+@dataclass
+class CursorParams:
+    """Cursor (keyset) pagination parameters
+
+    ``after`` and ``before`` are opaque tokens produced by :func:`encode_cursor`.
+    At most one of them may be set; neither means the first page.
+    """
+
+    after: Optional[str] = None
+    before: Optional[str] = None
+    limit: int = 10
+
+    def validate(self, max_limit: int = 100) -> None:
+        """Validate cursor pagination parameters
+
+        Args:
+            max_limit: Maximum allowed limit
+
+        Raises:
+            ValueError: If parameters are invalid
+        """
+        if self.after and self.before:
+            raise ValueError("after and before cannot be used together")
+
+        if self.limit <= 0:
+            raise ValueError("limit must be > 0")
+
+        if self.limit > max_limit:
+            raise ValueError(f"limit must be <= {max_limit}")
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary"""
+        return {"after": self.after, "before": self.before, "limit": self.limit}
+
+
+@dataclass
+class KeysetPlan:
+    """Adapter-independent description of a keyset page query
+
+    Attributes:
+        ordering: (field, direction) tuples to order the query by
+        terms: Seek predicate as OR-ed lists of AND-ed (field, operator, value);
+            empty for the first page
+        reverse: Whether fetched rows must be reversed (``before`` pages are
+            fetched in inverted order)
+    """
+
+    ordering: List[Tuple[str, str]]
+    terms: List[List[Tuple[str, str, Any]]] = field(default_factory=list)
+    reverse: bool = False
+
+
+def _encode_value(value: Any) -> Any:
+    """Tag values that JSON cannot round-trip"""
+    if isinstance(value, datetime):
+        return {"$dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"$date": value.isoformat()}
+    if isinstance(value, Decimal):
+        return {"$dec": str(value)}
+    if isinstance(value, uuid.UUID):
+        return {"$uuid": str(value)}
+    if ObjectId is not None and isinstance(value, ObjectId):
+        return {"$oid": str(value)}
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    return {"$str": str(value)}
+
+
+def _decode_value(value: Any) -> Any:
+    """Reverse :func:`_encode_value`"""
+    if not isinstance(value, dict):
+        return value
+    if "$dt" in value:
+        return datetime.fromisoformat(value["$dt"])
+    if "$date" in value:
+        return date.fromisoformat(value["$date"])
+    if "$dec" in value:
+        return Decimal(value["$dec"])
+    if "$uuid" in value:
+        return uuid.UUID(value["$uuid"])
+    if "$oid" in value and ObjectId is not None:
+        if not ObjectId.is_valid(value["$oid"]):
+            raise ValueError("Invalid ObjectId in cursor")
+        return ObjectId(value["$oid"])
+    if "$str" in value:
+        return value["$str"]
+    raise ValueError("Unknown cursor value type")
+
+
+def get_item_value(item: Any, field_name: str) -> Any:
+    """Read a field from an ORM instance, Pydantic model or mapping
+
+    Args:
+        item: Result item
+        field_name: Field name
+
+    Returns:
+        Field value
+    """
+    if isinstance(item, dict):
+        return item.get(field_name)
+    return getattr(item, field_name, None)
+
+
+def encode_cursor(item: Any, keyset: List[Tuple[str, str]]) -> str:
+    """Build an opaque cursor token pointing at an item
+
+    Args:
+        item: Item the cursor points at
+        keyset: Keyset ordering from :meth:`SortParser.to_keyset`
+
+    Returns:
+        URL-safe cursor token
+    """
+    payload = {
+        "f": [name for name, _ in keyset],
+        "v": [_encode_value(get_item_value(item, name)) for name, _ in keyset],
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str, keyset: List[Tuple[str, str]]) -> List[Any]:
+    """Decode a cursor token into keyset values
+
+    Args:
+        token: Cursor token from :func:`encode_cursor`
+        keyset: Keyset ordering the token must match
+
+    Returns:
+        Cursor values, one per keyset column
+
+    Raises:
+        ValueError: If the token is malformed or was built for another ordering
+    """
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        payload = json.loads(raw)
+        fields = payload["f"]
+        values = [_decode_value(value) for value in payload["v"]]
+    except (ValueError, TypeError, KeyError) as e:
+        raise ValueError(f"Invalid cursor: {e!s}") from e
+
+    if fields != [name for name, _ in keyset] or len(values) != len(keyset):
+        raise ValueError("Cursor does not match the current sort order")
+
+    return values
+
+
+def plan_keyset(
+    sorts: Dict[str, str],
+    pagination: Dict[str, Any],
+    pk_field: str = "id",
+    nulls_last: bool = False,
+) -> Optional[KeysetPlan]:
+    """Build a keyset plan from adapter pagination arguments
+
+    Cursor mode is selected when ``pagination`` contains an ``after`` or
+    ``before`` key (their values may be ``None`` for the first page).
+
+    Args:
+        sorts: Dictionary of field -> direction mappings
+        pagination: Pagination info passed to ``ORMAdapter.get_all``
+        pk_field: Primary key field name
+        nulls_last: Whether the database sorts NULL last in ascending order,
+            see :meth:`SortParser.seek_terms`
+
+    Returns:
+        KeysetPlan, or None for offset pagination
+
+    Raises:
+        ValueError: If a cursor is invalid or both cursors are given
+    """
+    if "after" not in pagination and "before" not in pagination:
+        return None
+
+    after = pagination.get("after")
+    before = pagination.get("before")
+    if after and before:
+        raise ValueError("after and before cannot be used together")
+
+    keyset = SortParser.to_keyset(sorts, pk_field)
+
+    if after:
+        return KeysetPlan(
+            ordering=keyset,
+            terms=SortParser.seek_terms(keyset, decode_cursor(after, keyset), nulls_last),
+        )
+
+    if before:
+        reversed_keyset = SortParser.reverse(keyset)
+        return KeysetPlan(
+            ordering=reversed_keyset,
+            terms=SortParser.seek_terms(
+                reversed_keyset, decode_cursor(before, keyset), nulls_last
+            ),
+            reverse=True,
+        )
+
+    return KeysetPlan(ordering=keyset)
+
+
 def paginate(
     items: List[T],
     skip: int = 0,
@@ -89,3 +89,96 @@ class SortParser:
             List of (field, direction) tuples
         """
         return list(sorts.items())
+
+    @classmethod
+    def to_keyset(cls, sorts: Dict[str, str], pk_field: str = "id") -> List[Tuple[str, str]]:
+        """Convert sorts into a keyset ordering for cursor pagination
+
+        The primary key is appended as a tie-breaker so that the ordering is
+        total, which is required for a seek predicate to be stable. Columns
+        after the primary key are dropped since they can never break a tie.
+
+        Args:
+            sorts: Dictionary of field -> direction mappings
+            pk_field: Primary key field name
+
+        Returns:
+            List of (field, direction) tuples ending with the primary key
+        """
+        keyset: List[Tuple[str, str]] = []
+
+        for field, direction in sorts.items():
+            keyset.append((field, "desc" if direction == "desc" else "asc"))
+            if field == pk_field:
+                return keyset
+
+        # Tie-break on the primary key in the direction of the last sort column
+        keyset.append((pk_field, keyset[-1][1] if keyset else "asc"))
+        return keyset
+
+    @classmethod
+    def reverse(cls, keyset: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
+        """Flip every direction of a keyset ordering
+
+        Args:
+            keyset: List of (field, direction) tuples
+
+        Returns:
+            List of (field, direction) tuples with inverted directions
+        """
+        return [(field, "asc" if direction == "desc" else "desc") for field, direction in keyset]
+
+    @classmethod
+    def seek_terms(
+        cls, keyset: List[Tuple[str, str]], values: List[Any], nulls_last: bool = False
+    ) -> List[List[Tuple[str, str, Any]]]:
+        """Build the seek predicate that selects rows strictly after a cursor
+
+        For a keyset ``(a asc, b desc, id asc)`` and cursor values
+        ``(va, vb, vid)`` the predicate is::
+
+            a > va
+            OR (a = va AND b < vb)
+            OR (a = va AND b = vb AND id > vid)
+
+        It is returned as a disjunction of conjunctions using the filter
+        operator names understood by the adapters (``exact``, ``gt``, ``lt``,
+        and ``isnull`` with a boolean value).
+
+        NULL compares neither greater nor less than a value, so NULL cursor
+        values and the NULL block of each column are matched with ``isnull``
+        terms placed where the database sorts NULL. The keyset must end with
+        the primary key, which is never NULL.
+
+        Args:
+            keyset: List of (field, direction) tuples
+            values: Cursor values, one per keyset column
+            nulls_last: Whether the database sorts NULL after every value in
+                ascending order (PostgreSQL, Oracle); SQLite, MySQL, SQL
+                Server and MongoDB sort it first
+
+        Returns:
+            List of OR-ed terms, each a list of AND-ed (field, operator, value)
+
+        Raises:
+            ValueError: If the number of values does not match the keyset
+        """
+        if len(values) != len(keyset):
+            raise ValueError("Cursor does not match the current sort order")
+
+        terms: List[List[Tuple[str, str, Any]]] = []
+        prefix: List[Tuple[str, str, Any]] = []
+        for index, ((field, direction), value) in enumerate(zip(keyset, values)):
+            nulls_after = nulls_last != (direction == "desc")
+            if value is None:
+                if not nulls_after:
+                    terms.append(prefix + [(field, "isnull", False)])
+                prefix = prefix + [(field, "isnull", True)]
+                continue
+
+            terms.append(prefix + [(field, "lt" if direction == "desc" else "gt", value)])
+            if nulls_after and index < len(keyset) - 1:
+                terms.append(prefix + [(field, "isnull", True)])
+            prefix = prefix + [(field, "exact", value)]
+
+        return terms
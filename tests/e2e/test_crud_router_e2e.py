@@ -1,17 +1,23 @@
 """End-to-end test for CRUDRouter route generation"""
 
+import csv
+import io
+import json
+
+import httpx
 import pytest
-from typing import Optional
-from fastapi import FastAPI
+from typing import List, Optional
+from fastapi import FastAPI, HTTPException
 from fastapi.testclient import TestClient
 from pydantic import BaseModel
-from sqlalchemy import Column, Integer, String, Float
+from sqlalchemy import Column, Float, ForeignKey, Integer, String, select
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from sqlalchemy.orm import declarative_base
+from sqlalchemy.orm import declarative_base, relationship
 
-from fastapi_easy import CRUDRouter
+from fastapi_easy import CRUDConfig, CRUDRouter
 from fastapi_easy.backends.sqlalchemy import SQLAlchemyAdapter
-
+from fastapi_easy.core.invalidation_bus import InMemoryTransport, InvalidationBus
+from fastapi_easy.middleware import UnitOfWorkMiddleware
 
 # Define test models
 Base = declarative_base()
@@ -26,6 +32,17 @@ class ItemModel(Base):
     name = Column(String(100), nullable=False)
     price = Column(Float, nullable=False)
     description = Column(String(500), nullable=True)
+    reviews = relationship("ReviewModel", order_by="ReviewModel.id")
+
+
+class ReviewModel(Base):
+    """SQLAlchemy model related to items, for eager-loading tests"""
+
+    __tablename__ = "reviews"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    item_id = Column(Integer, ForeignKey("items.id"), nullable=False)
+    text = Column(String(200), nullable=False)
 
 
 class ItemSchema(BaseModel):
@@ -180,6 +197,31 @@ async def test_pagination(app_with_crud_router):
     assert len(items) <= 2
 
 
+@pytest.mark.asyncio
+async def test_sparse_fields(app_with_crud_router):
+    """Test ?fields= trims list and single-item responses"""
+    client = TestClient(app_with_crud_router)
+
+    created = client.post("/items/", json={"name": "Item", "price": 10.0}).json()
+
+    response = client.get("/items/?fields=id,name")
+    assert response.status_code == 200
+    assert response.json() == [{"id": created["id"], "name": "Item"}]
+
+    response = client.get(f"/items/{created['id']}?fields=price")
+    assert response.status_code == 200
+    assert response.json() == {"price": 10.0}
+
+
+@pytest.mark.asyncio
+async def test_sparse_fields_unknown_field(app_with_crud_router):
+    """Test requesting a field outside the schema is rejected"""
+    client = TestClient(app_with_crud_router)
+
+    response = client.get("/items/?fields=id,secret")
+    assert response.status_code == 400
+
+
 @pytest.mark.asyncio
 async def test_openapi_documentation(app_with_crud_router):
     """Test that OpenAPI documentation is generated"""
@@ -200,3 +242,473 @@ async def test_openapi_documentation(app_with_crud_router):
     assert "get" in openapi_spec["paths"]["/items/{id}"]
     assert "put" in openapi_spec["paths"]["/items/{id}"]
     assert "delete" in openapi_spec["paths"]["/items/{id}"]
+
+
+@pytest.fixture
+def app_with_cursor_router(async_db_session):
+    """Create FastAPI app with a cursor-paginated CRUDRouter"""
+    app = FastAPI()
+    adapter = SQLAlchemyAdapter(model=ItemModel, session_factory=async_db_session)
+    router = CRUDRouter(
+        schema=ItemSchema,
+        adapter=adapter,
+        prefix="/items",
+        config=CRUDConfig(pagination_mode="cursor", default_limit=2),
+    )
+    app.include_router(router)
+    return app
+
+
+@pytest.mark.asyncio
+async def test_cursor_pagination(app_with_cursor_router):
+    """Test walking pages with cursor headers"""
+    client = TestClient(app_with_cursor_router)
+
+    for i in range(5):
+        client.post("/items/", json={"name": f"Item {i}", "price": 10.0 - i})
+
+    response = client.get("/items/?sort=price")
+    assert response.status_code == 200
+    assert [item["name"] for item in response.json()] == ["Item 4", "Item 3"]
+    assert "X-Prev-Cursor" not in response.headers
+
+    response = client.get(f"/items/?sort=price&after={response.headers['X-Next-Cursor']}")
+    assert [item["name"] for item in response.json()] == ["Item 2", "Item 1"]
+
+    response = client.get(f"/items/?sort=price&before={response.headers['X-Prev-Cursor']}")
+    assert [item["name"] for item in response.json()] == ["Item 4", "Item 3"]
+
+
+@pytest.mark.asyncio
+async def test_cursor_pagination_invalid_cursor(app_with_cursor_router):
+    """Test invalid or mismatched cursors are rejected with 400"""
+    client = TestClient(app_with_cursor_router)
+    client.post("/items/", json={"name": "Item", "price": 1.0})
+
+    assert client.get("/items/?after=garbage").status_code == 400
+
+    cursor = client.get("/items/?sort=price&limit=1").headers["X-Next-Cursor"]
+    assert client.get(f"/items/?sort=name&after={cursor}").status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_cursor_pagination_with_fields(app_with_cursor_router):
+    """Test cursor pages with a sparse fieldset excluding the sort column"""
+    client = TestClient(app_with_cursor_router)
+
+    for i in range(3):
+        client.post("/items/", json={"name": f"Item {i}", "price": 10.0 - i})
+
+    response = client.get("/items/?sort=price&fields=name")
+    assert response.json() == [{"name": "Item 2"}, {"name": "Item 1"}]
+
+    response = client.get(
+        f"/items/?sort=price&fields=name&after={response.headers['X-Next-Cursor']}"
+    )
+    assert response.json() == [{"name": "Item 0"}]
+
+
+@pytest.mark.asyncio
+async def test_get_all_with_total_header(async_db_session):
+    """Test X-Total-Count is set when with_total is enabled"""
+    app = FastAPI()
+    adapter = SQLAlchemyAdapter(model=ItemModel, session_factory=async_db_session)
+    router = CRUDRouter(
+        schema=ItemSchema,
+        adapter=adapter,
+        prefix="/items",
+        config=CRUDConfig(with_total=True),
+    )
+    app.include_router(router)
+    client = TestClient(app)
+
+    for i in range(3):
+        client.post("/items/", json={"name": f"Item {i}", "price": float(i)})
+
+    response = client.get("/items/?limit=2")
+    assert response.status_code == 200
+    assert len(response.json()) == 2
+    assert response.headers["X-Total-Count"] == "3"
+
+
+@pytest.fixture
+def app_with_export_router(async_db_session):
+    """Create FastAPI app with the export route enabled"""
+    app = FastAPI()
+    adapter = SQLAlchemyAdapter(model=ItemModel, session_factory=async_db_session)
+    router = CRUDRouter(
+        schema=ItemSchema,
+        adapter=adapter,
+        prefix="/items",
+        config=CRUDConfig(enable_export=True, export_batch_size=2),
+    )
+    app.include_router(router)
+    return app
+
+
+@pytest.mark.asyncio
+async def test_export_ndjson(app_with_export_router):
+    """Test exporting all items as NDJSON"""
+    client = TestClient(app_with_export_router)
+    for i in range(5):
+        client.post("/items/", json={"name": f"Item {i}", "price": float(i)})
+
+    response = client.get("/items/export?sort=-price")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row["name"] for row in rows] == [f"Item {i}" for i in range(4, -1, -1)]
+
+
+@pytest.mark.asyncio
+async def test_export_csv(app_with_export_router):
+    """Test exporting all items as CSV with a header row"""
+    client = TestClient(app_with_export_router)
+    client.post("/items/", json={"name": "Widget, large", "price": 2.5})
+
+    response = client.get("/items/export?format=csv")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert rows == [{"id": "1", "name": "Widget, large", "price": "2.5", "description": ""}]
+
+
+@pytest.mark.asyncio
+async def test_export_disabled_by_default(async_db_session):
+    """Test /export is not registered unless enabled"""
+    adapter = SQLAlchemyAdapter(model=ItemModel, session_factory=async_db_session)
+    router = CRUDRouter(schema=ItemSchema, adapter=adapter, prefix="/items")
+    assert "/items/export" not in [route.path for route in router.routes]
+
+
+@pytest.mark.asyncio
+async def test_export_rejects_unknown_format(app_with_export_router):
+    """Test unsupported export formats are rejected"""
+    client = TestClient(app_with_export_router)
+    assert client.get("/items/export?format=xml").status_code == 422
+
+
+@pytest.fixture
+def app_with_bulk_router(async_db_session):
+    """Create FastAPI app with bulk routes enabled"""
+    app = FastAPI()
+    adapter = SQLAlchemyAdapter(model=ItemModel, session_factory=async_db_session)
+    router = CRUDRouter(
+        schema=ItemSchema,
+        adapter=adapter,
+        prefix="/items",
+        config=CRUDConfig(enable_bulk_operations=True, max_bulk_items=3),
+    )
+    app.include_router(router)
+    return app
+
+
+@pytest.mark.asyncio
+async def test_bulk_routes(app_with_bulk_router):
+    """Test bulk create, update and delete"""
+    client = TestClient(app_with_bulk_router)
+
+    response = client.post(
+        "/items/bulk", json=[{"name": "A", "price": 1.0}, {"name": "B", "price": 2.0}]
+    )
+    assert response.status_code == 201
+    created = response.json()
+    assert [item["name"] for item in created] == ["A", "B"]
+
+    ids = [item["id"] for item in created]
+    response = client.patch("/items/bulk", json=[{"id": ids[0], "price": 5.0}])
+    assert response.status_code == 200
+    assert response.json()[0]["price"] == 5.0
+
+    response = client.request("DELETE", "/items/bulk", json=ids + [999])
+    assert response.status_code == 200
+    assert response.json()["success_count"] == 2
+    assert response.json()["failure_count"] == 1
+    assert client.get("/items/").json() == []
+
+
+@pytest.mark.asyncio
+async def test_bulk_routes_validation(app_with_bulk_router):
+    """Test oversized batches and updates without an id are rejected"""
+    client = TestClient(app_with_bulk_router)
+
+    items = [{"name": f"Item {i}", "price": 1.0} for i in range(4)]
+    assert client.post("/items/bulk", json=items).status_code == 413
+    assert client.patch("/items/bulk", json=[{"price": 1.0}]).status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_bulk_routes_disabled_by_default(async_db_session):
+    """Test /bulk is not registered unless enable_bulk_operations is set"""
+    adapter = SQLAlchemyAdapter(model=ItemModel, session_factory=async_db_session)
+    router = CRUDRouter(schema=ItemSchema, adapter=adapter, prefix="/items")
+    assert "/items/bulk" not in [route.path for route in router.routes]
+
+
+class ReviewSchema(BaseModel):
+    """Pydantic schema for nested reviews"""
+
+    id: int
+    text: str
+
+    class Config:
+        from_attributes = True
+
+
+class ItemWithReviewsSchema(ItemSchema):
+    """Item schema with nested related reviews"""
+
+    reviews: List[ReviewSchema] = []
+
+
+async def _add_reviews(session_factory, item_id: int, count: int) -> None:
+    async with session_factory() as session:
+        session.add_all(ReviewModel(item_id=item_id, text=f"review {i}") for i in range(count))
+        await session.commit()
+
+
+@pytest.mark.asyncio
+async def test_include_relationships(async_db_session):
+    """Test ?include= eager-loads allowed relationships into nested schemas"""
+    app = FastAPI()
+    adapter = SQLAlchemyAdapter(model=ItemModel, session_factory=async_db_session)
+    router = CRUDRouter(
+        schema=ItemWithReviewsSchema,
+        adapter=adapter,
+        prefix="/items",
+        config=CRUDConfig(include_fields=["reviews"]),
+    )
+    app.include_router(router)
+    client = TestClient(app)
+
+    item = client.post("/items/", json={"name": "Item", "price": 1.0}).json()
+    await _add_reviews(async_db_session, item["id"], 2)
+
+    response = client.get("/items/?include=reviews")
+    assert response.status_code == 200
+    assert [review["text"] for review in response.json()[0]["reviews"]] == [
+        "review 0",
+        "review 1",
+    ]
+
+    response = client.get(f"/items/{item['id']}?include=reviews")
+    assert len(response.json()["reviews"]) == 2
+
+    response = client.get("/items/?include=owner")
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_eager_load_config(async_db_session):
+    """Test relationships in eager_load are loaded without ?include="""
+    app = FastAPI()
+    adapter = SQLAlchemyAdapter(model=ItemModel, session_factory=async_db_session)
+    router = CRUDRouter(
+        schema=ItemWithReviewsSchema,
+        adapter=adapter,
+        prefix="/items",
+        config=CRUDConfig(eager_load=["reviews"]),
+    )
+    app.include_router(router)
+    client = TestClient(app)
+
+    item = client.post("/items/", json={"name": "Item", "price": 1.0}).json()
+    await _add_reviews(async_db_session, item["id"], 1)
+
+    response = client.get("/items/")
+    assert response.json()[0]["reviews"] == [{"id": 1, "text": "review 0"}]
+
+
+@pytest.mark.asyncio
+async def test_unit_of_work_middleware(async_db_session):
+    """Test hooks write through the request's session and commit with the item"""
+    app = FastAPI()
+    adapter = SQLAlchemyAdapter(model=ItemModel, session_factory=async_db_session)
+    router = CRUDRouter(schema=ItemSchema, adapter=adapter, prefix="/items")
+
+    async def add_review(context):
+        context.session.add(ReviewModel(item_id=context.result.id, text="auto"))
+
+    router.hooks.register("after_create", add_review)
+    app.include_router(router)
+
+    @app.post("/failing")
+    async def failing():
+        await adapter.create({"name": "Discarded", "price": 1.0})
+        raise HTTPException(status_code=400, detail="rejected")
+
+    app.add_middleware(UnitOfWorkMiddleware, session_factory=async_db_session)
+    client = TestClient(app)
+
+    response = client.post("/items/", json={"name": "Item", "price": 1.0})
+    assert response.status_code in (200, 201)
+
+    async with async_db_session() as session:
+        reviews = (await session.execute(select(ReviewModel))).scalars().all()
+    assert [review.text for review in reviews] == ["auto"]
+
+    # Writes made before an error response are rolled back
+    assert client.post("/failing").status_code == 400
+    assert [item["name"] for item in client.get("/items/").json()] == ["Item"]
+
+
+def count_reads(adapter):
+    """Record the adapter reads made by routes"""
+    reads = []
+    for name in ("get_all", "get_all_with_total", "get_one"):
+        method = getattr(adapter, name)
+
+        async def read(*args, _method=method, **kwargs):
+            reads.append(args[0] if args else None)
+            return await _method(*args, **kwargs)
+
+        setattr(adapter, name, read)
+    return reads
+
+
+@pytest.mark.asyncio
+async def test_response_cache(async_db_session):
+    """Test cached reads skip the route, honour ETags and are invalidated by writes"""
+    app = FastAPI()
+    adapter = SQLAlchemyAdapter(model=ItemModel, session_factory=async_db_session)
+    router = CRUDRouter(
+        schema=ItemSchema,
+        adapter=adapter,
+        prefix="/items",
+        config=CRUDConfig(response_cache=True, with_total=True),
+    )
+    reads = count_reads(adapter)
+    app.include_router(router)
+    client = TestClient(app)
+
+    item_id = client.post("/items/", json={"name": "Item", "price": 1.0}).json()["id"]
+
+    first = client.get("/items/")
+    second = client.get("/items/")
+    assert second.content == first.content
+    assert second.headers["ETag"] == first.headers["ETag"]
+    assert second.headers["X-Total-Count"] == "1"
+    assert len(reads) == 1
+
+    not_modified = client.get("/items/", headers={"If-None-Match": first.headers["ETag"]})
+    assert not_modified.status_code == 304
+
+    assert client.get(f"/items/{item_id}").json()["name"] == "Item"
+    assert client.get(f"/items/{item_id}").json()["name"] == "Item"
+    assert len(reads) == 2
+
+    client.put(f"/items/{item_id}", json={"id": item_id, "name": "Renamed", "price": 2.0})
+    assert client.get(f"/items/{item_id}").json()["name"] == "Renamed"
+    refreshed = client.get("/items/")
+    assert refreshed.json()[0]["name"] == "Renamed"
+    assert refreshed.headers["ETag"] != first.headers["ETag"]
+
+    client.post("/items/", json={"name": "Second", "price": 3.0})
+    assert len(client.get("/items/").json()) == 2
+    assert router.response_cache.stats()["hits"] == 3
+
+
+@pytest.mark.asyncio
+async def test_response_cache_remembers_missing_items(async_db_session):
+    """Test repeated reads of a missing id skip the route until it is created"""
+    app = FastAPI()
+    adapter = SQLAlchemyAdapter(model=ItemModel, session_factory=async_db_session)
+    router = CRUDRouter(
+        schema=ItemSchema,
+        adapter=adapter,
+        prefix="/items",
+        config=CRUDConfig(response_cache=True),
+    )
+    reads = count_reads(adapter)
+    app.include_router(router)
+    client = TestClient(app, raise_server_exceptions=False)
+
+    first = client.get("/items/1")
+    second = client.get("/items/1")
+    assert first.status_code == second.status_code != 200
+    assert reads == ["1"]
+
+    client.post("/items/", json={"name": "Item", "price": 1.0})
+    response = client.get("/items/1")
+    assert response.status_code == 200
+    assert response.json()["name"] == "Item"
+    assert reads == ["1", "1"]
+
+
+@pytest.mark.asyncio
+async def test_response_cache_invalidated_across_workers(async_db_session):
+    """Test a write in one worker drops the cached responses of another"""
+    clients = []
+    buses = []
+    for _ in range(2):
+        bus = InvalidationBus(InMemoryTransport("test-router"), flush_interval=0)
+        await bus.start()
+        app = FastAPI()
+        app.include_router(
+            CRUDRouter(
+                schema=ItemSchema,
+                adapter=SQLAlchemyAdapter(model=ItemModel, session_factory=async_db_session),
+                prefix="/items",
+                config=CRUDConfig(response_cache=True),
+                invalidation_bus=bus,
+            )
+        )
+        buses.append(bus)
+        clients.append(
+            httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+        )
+    writer, reader = clients
+
+    assert (await reader.get("/items/")).json() == []
+    await writer.post("/items/", json={"name": "Item", "price": 1.0})
+    await buses[0].flush()
+
+    assert [i["name"] for i in (await reader.get("/items/")).json()] == ["Item"]
+
+    for client in clients:
+        await client.aclose()
+    for bus in buses:
+        await bus.close()
+
+
+@pytest.mark.asyncio
+async def test_response_cache_skipped_for_reads_with_hooks(async_db_session):
+    """Test hooks, e.g. per-user scoping, run on every read even with the cache on"""
+    app = FastAPI()
+    adapter = SQLAlchemyAdapter(model=ItemModel, session_factory=async_db_session)
+    router = CRUDRouter(
+        schema=ItemSchema,
+        adapter=adapter,
+        prefix="/items",
+        config=CRUDConfig(response_cache=True),
+    )
+    scoped = []
+
+    async def scope_to_user(context):
+        scoped.append(context.request.headers["x-user"])
+        context.filters["owner"] = {
+            "field": "name",
+            "operator": "exact",
+            "value": context.request.headers["x-user"],
+        }
+
+    router.hooks.register("before_get_all", scope_to_user)
+    router.hooks.register("before_get_one", scope_to_user)
+    app.include_router(router)
+    client = TestClient(app)
+
+    client.post("/items/", json={"name": "alice", "price": 1.0})
+    client.post("/items/", json={"name": "bob", "price": 2.0})
+
+    assert [i["name"] for i in client.get("/items/", headers={"x-user": "alice"}).json()] == [
+        "alice"
+    ]
+    assert [i["name"] for i in client.get("/items/", headers={"x-user": "bob"}).json()] == [
+        "bob"
+    ]
+    client.get("/items/1", headers={"x-user": "alice"})
+    client.get("/items/1", headers={"x-user": "alice"})
+    assert scoped == ["alice", "bob", "alice", "alice"]
+    assert len(router.response_cache) == 0
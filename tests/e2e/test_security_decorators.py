@@ -1,11 +1,14 @@
 """Unit tests for security decorators"""
 
+from typing import Optional
+
 import pytest
 from fastapi import Depends, FastAPI
 from fastapi.testclient import TestClient
 
 from fastapi_easy.security import (
     get_current_user,
+    get_current_user_optional,
     get_jwt_auth,
     init_jwt_auth,
     require_all_permissions,
@@ -307,3 +310,29 @@ class TestSecurityDecorators:
         assert response.status_code == 200
         data = response.json()
         assert data["roles"] == []
+
+    def test_token_verified_once_per_request(self, app, jwt_auth, monkeypatch):
+        """Test several user dependencies share one verification"""
+        calls = []
+        verify_token = jwt_auth.verify_token
+        monkeypatch.setattr(
+            jwt_auth, "verify_token", lambda token: calls.append(token) or verify_token(token)
+        )
+
+        @app.get("/admin-with-optional")
+        async def admin_with_optional(
+            admin: dict = Depends(require_role("admin")),
+            user: Optional[dict] = Depends(get_current_user_optional),
+        ):
+            return {"same_user": admin["user_id"] == user["user_id"]}
+
+        token = jwt_auth.create_access_token(subject="user123", roles=["admin"])
+        client = TestClient(app)
+        for _ in range(2):
+            response = client.get(
+                "/admin-with-optional",
+                headers={"Authorization": f"Bearer {token}"},
+            )
+            assert response.json() == {"same_user": True}
+
+        assert len(calls) == 2
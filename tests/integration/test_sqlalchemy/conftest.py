@@ -40,6 +40,15 @@ class TransactionItem(Base):
         return f"<TransactionItem(id={self.id}, name={self.name}, price={self.price}, quantity={self.quantity})>"
 
 
+class Note(Base):
+    """Test model with a nullable column"""
+
+    __tablename__ = "notes"
+
+    id = Column(Integer, primary_key=True)
+    title = Column(String(100), nullable=True)
+
+
 @pytest_asyncio.fixture
 async def db_engine():
     """Create test database engine"""
@@ -132,3 +132,53 @@ class TestSQLAlchemyAdapterCoverage:
         assert len(page1) == 2
         assert len(page2) == 2
         assert page1[0].id != page2[0].id
+
+
+@pytest.mark.asyncio
+class TestSQLAlchemyFilterPlan:
+    """Tests for the precompiled per-model filter plan"""
+
+    async def test_plan_resolves_columns(self, sqlalchemy_adapter):
+        """Test every mapped column is compiled once at construction"""
+        plan = sqlalchemy_adapter._filter_plan
+
+        assert set(plan) == {"id", "name", "price"}
+        with pytest.raises(TypeError):
+            plan["extra"] = plan["id"]
+
+    async def test_plan_only_scans_text_columns(self, sqlalchemy_adapter):
+        """Test only text columns keep the SQL injection scan"""
+        plan = sqlalchemy_adapter._filter_plan
+
+        assert plan["name"].scan is True
+        assert plan["price"].scan is False
+        assert plan["id"].scan is False
+
+    async def test_values_coerced_to_column_type(self, sqlalchemy_adapter, sample_items):
+        """Test string values are coerced to the column's Python type"""
+        result = await sqlalchemy_adapter.get_all(
+            filters={
+                "price": {"field": "price", "operator": "gte", "value": "12"},
+                "id": {"field": "id", "operator": "in", "value": "1,2,3,4,5"},
+            },
+            sorts={},
+            pagination={"skip": 0, "limit": 10},
+        )
+
+        assert sorted(item.name for item in result) == ["grape", "mango"]
+
+    async def test_uncoercible_value(self, sqlalchemy_adapter):
+        """Test values that cannot be coerced are rejected"""
+        query = MagicMock()
+        filters = {"price": {"field": "price", "operator": "gt", "value": "cheap"}}
+
+        with pytest.raises(ValueError, match="Invalid filter value for field: price"):
+            sqlalchemy_adapter._apply_filters(query, filters)
+
+    async def test_suspicious_text_value(self, sqlalchemy_adapter):
+        """Test text columns still reject injection patterns"""
+        query = MagicMock()
+        filters = {"name": {"field": "name", "operator": "exact", "value": "x' OR 1=1 --"}}
+
+        with pytest.raises(ValueError, match="Invalid filter value for field: name"):
+            sqlalchemy_adapter._apply_filters(query, filters)
@@ -0,0 +1,182 @@
+"""Integration tests for SQLAlchemy bulk operations"""
+
+import pytest
+from sqlalchemy import event
+
+from fastapi_easy.core.bulk_operations import BulkOperationAdapter
+from fastapi_easy.core.errors import BadRequestError, ConflictError
+
+from .conftest import Item
+
+
+class TestSQLAlchemyBulkCreate:
+    """Test SQLAlchemyAdapter.bulk_create"""
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_returns_items_in_order(self, sqlalchemy_adapter):
+        """Test created rows come back with ids, in input order"""
+        created = await sqlalchemy_adapter.bulk_create(
+            [{"name": f"item{i}", "price": float(i)} for i in range(20)]
+        )
+
+        assert [item.name for item in created] == [f"item{i}" for i in range(20)]
+        assert all(item.id is not None for item in created)
+        assert await sqlalchemy_adapter.count({}) == 20
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_without_returning(
+        self, sqlalchemy_adapter, db_engine, monkeypatch
+    ):
+        """Test the fallback path for dialects without multi-row RETURNING"""
+        monkeypatch.setattr(
+            db_engine.dialect, "insert_executemany_returning_sort_by_parameter_order", False
+        )
+
+        created = await sqlalchemy_adapter.bulk_create(
+            [{"name": "a", "price": 1.0}, {"name": "b", "price": 2.0}]
+        )
+
+        assert [(item.name, item.price) for item in created] == [("a", 1.0), ("b", 2.0)]
+        assert all(item.id is not None for item in created)
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_empty(self, sqlalchemy_adapter):
+        """Test an empty batch is a no-op"""
+        assert await sqlalchemy_adapter.bulk_create([]) == []
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_conflict_rolls_back(self, transaction_adapter):
+        """Test a unique violation raises ConflictError and inserts nothing"""
+        with pytest.raises(ConflictError):
+            await transaction_adapter.bulk_create(
+                [{"name": "dup", "price": 1.0}, {"name": "dup", "price": 2.0}]
+            )
+
+        assert await transaction_adapter.count({}) == 0
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_runs_insert_listeners(self, sqlalchemy_adapter):
+        """Test models with insert listeners are inserted through the ORM"""
+        fired = []
+
+        def on_insert(mapper, connection, target):
+            fired.append(target.name)
+
+        event.listen(Item, "before_insert", on_insert)
+        try:
+            created = await sqlalchemy_adapter.bulk_create(
+                [{"name": "a", "price": 1.0}, {"name": "b", "price": 2.0}]
+            )
+        finally:
+            event.remove(Item, "before_insert", on_insert)
+
+        assert fired == ["a", "b"]
+        assert [item.name for item in created] == ["a", "b"]
+
+
+class TestSQLAlchemyBulkUpdate:
+    """Test SQLAlchemyAdapter.bulk_update"""
+
+    @pytest.mark.asyncio
+    async def test_bulk_update_mixed_groups(self, sqlalchemy_adapter, sample_items):
+        """Test shared-value and per-row updates are both applied"""
+        ids = [item.id for item in sample_items]
+        updated = await sqlalchemy_adapter.bulk_update(
+            [
+                {"id": ids[0], "price": 1.0},
+                {"id": ids[1], "price": 1.0},
+                {"id": ids[2], "name": "kiwi"},
+                {"id": ids[3], "name": "lime", "price": 2.0},
+            ]
+        )
+
+        assert [(item.name, item.price) for item in updated] == [
+            ("apple", 1.0),
+            ("banana", 1.0),
+            ("kiwi", 8.0),
+            ("lime", 2.0),
+        ]
+        untouched = await sqlalchemy_adapter.get_one(ids[4])
+        assert (untouched.name, untouched.price) == ("mango", 12.0)
+
+    @pytest.mark.asyncio
+    async def test_bulk_update_skips_missing_ids(self, sqlalchemy_adapter, sample_items):
+        """Test ids that do not exist are left out of the result"""
+        updated = await sqlalchemy_adapter.bulk_update(
+            [{"id": 999, "price": 1.0}, {"id": sample_items[0].id, "price": 3.0}]
+        )
+
+        assert [item.id for item in updated] == [sample_items[0].id]
+
+    @pytest.mark.asyncio
+    async def test_bulk_update_requires_pk(self, sqlalchemy_adapter):
+        """Test updates without a primary key are rejected"""
+        with pytest.raises(BadRequestError):
+            await sqlalchemy_adapter.bulk_update([{"price": 1.0}])
+
+    @pytest.mark.asyncio
+    async def test_bulk_update_unknown_field(self, sqlalchemy_adapter, sample_items):
+        """Test unknown fields are rejected before anything is written"""
+        with pytest.raises(BadRequestError, match="Unknown field: colour"):
+            await sqlalchemy_adapter.bulk_update(
+                [{"id": sample_items[0].id, "price": 1.0}, {"id": sample_items[1].id, "colour": 1}]
+            )
+
+        item = await sqlalchemy_adapter.get_one(sample_items[0].id)
+        assert item.price == sample_items[0].price
+
+    @pytest.mark.asyncio
+    async def test_bulk_update_runs_update_listeners(self, sqlalchemy_adapter, sample_items):
+        """Test models with update listeners are updated through the ORM"""
+        fired = []
+
+        def on_set(target, value, oldvalue, initiator):
+            fired.append(value)
+
+        event.listen(Item.price, "set", on_set)
+        try:
+            updated = await sqlalchemy_adapter.bulk_update(
+                [{"id": sample_items[1].id, "price": 5.0}, {"id": 999, "price": 6.0}]
+            )
+        finally:
+            event.remove(Item.price, "set", on_set)
+
+        assert fired == [5.0]
+        assert [(item.id, item.price) for item in updated] == [(sample_items[1].id, 5.0)]
+
+
+class TestSQLAlchemyBulkDelete:
+    """Test SQLAlchemyAdapter.bulk_delete"""
+
+    @pytest.mark.asyncio
+    async def test_bulk_delete(self, sqlalchemy_adapter, sample_items):
+        """Test deleting by id counts only existing rows"""
+        ids = [sample_items[0].id, sample_items[1].id, 999]
+
+        assert await sqlalchemy_adapter.bulk_delete(ids) == 2
+        assert await sqlalchemy_adapter.count({}) == 3
+
+
+class TestBulkOperationAdapter:
+    """Test the per-row result reporting BulkOperationAdapter"""
+
+    @pytest.mark.asyncio
+    async def test_bulk_update_reports_missing(self, db_session_factory, sample_items):
+        """Test found rows are updated and missing ids are reported"""
+        adapter = BulkOperationAdapter(Item, db_session_factory)
+        result = await adapter.bulk_update(
+            [{"id": sample_items[0].id, "price": 99.0}, {"id": 999, "price": 1.0}]
+        )
+
+        assert result.success_count == 1
+        assert result.failure_count == 1
+        assert result.errors[0]["index"] == 1
+
+    @pytest.mark.asyncio
+    async def test_bulk_delete_reports_missing(self, db_session_factory, sample_items):
+        """Test found rows are deleted and missing ids are reported"""
+        adapter = BulkOperationAdapter(Item, db_session_factory)
+        result = await adapter.bulk_delete([sample_items[0].id, 999])
+
+        assert result.success_count == 1
+        assert result.failure_count == 1
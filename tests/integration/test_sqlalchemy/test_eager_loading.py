@@ -0,0 +1,143 @@
+"""Integration tests for eager-loading relationships"""
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import ForeignKey, String
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+
+from fastapi_easy.backends.sqlalchemy import SQLAlchemyAdapter
+from fastapi_easy.core.errors import BadRequestError
+from fastapi_easy.testing import assert_num_queries
+
+
+class Base(DeclarativeBase):
+    """Separate metadata so these tables stay out of the shared fixtures"""
+
+
+class Publisher(Base):
+    __tablename__ = "publishers"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(String(100))
+
+
+class Author(Base):
+    __tablename__ = "authors"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(String(100))
+    publisher_id: Mapped[int] = mapped_column(ForeignKey("publishers.id"))
+    publisher: Mapped[Publisher] = relationship()
+    books: Mapped[list["Book"]] = relationship(back_populates="author", order_by="Book.id")
+
+
+class Book(Base):
+    __tablename__ = "books"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    title: Mapped[str] = mapped_column(String(100))
+    author_id: Mapped[int] = mapped_column(ForeignKey("authors.id"))
+    author: Mapped[Author] = relationship(back_populates="books")
+
+
+@pytest_asyncio.fixture
+async def engine():
+    """In-memory database with a few authors and books"""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with session_factory() as session:
+        publisher = Publisher(name="press")
+        for name in ("ann", "bob", "cat"):
+            author = Author(name=name, publisher=publisher)
+            author.books = [Book(title=f"{name}-{i}") for i in range(2)]
+            session.add(author)
+        await session.commit()
+
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+def session_factory(engine):
+    return async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+
+class TestEagerLoading:
+    """Test the include argument of SQLAlchemyAdapter reads"""
+
+    @pytest.mark.asyncio
+    async def test_many_to_one_is_joined(self, engine, session_factory):
+        """Test a many-to-one relationship loads in the same statement"""
+        adapter = SQLAlchemyAdapter(Book, session_factory)
+
+        with assert_num_queries(engine, 1):
+            books = await adapter.get_all({}, {}, {"skip": 0, "limit": 10}, include=["author"])
+
+        assert [book.author.name for book in books] == ["ann"] * 2 + ["bob"] * 2 + ["cat"] * 2
+
+    @pytest.mark.asyncio
+    async def test_collection_is_selectin_loaded(self, engine, session_factory):
+        """Test a collection loads with one extra statement for the whole page"""
+        adapter = SQLAlchemyAdapter(Author, session_factory)
+
+        with assert_num_queries(engine, 2):
+            authors = await adapter.get_all({}, {}, {"skip": 0, "limit": 10}, include=["books"])
+
+        assert [len(author.books) for author in authors] == [2, 2, 2]
+
+    @pytest.mark.asyncio
+    async def test_nested_path(self, engine, session_factory):
+        """Test dotted paths load nested relationships"""
+        adapter = SQLAlchemyAdapter(Book, session_factory)
+
+        with assert_num_queries(engine, 1):
+            books = await adapter.get_all(
+                {}, {}, {"skip": 0, "limit": 2}, include=["author.publisher"]
+            )
+
+        assert {book.author.publisher.name for book in books} == {"press"}
+
+    @pytest.mark.asyncio
+    async def test_get_one(self, engine, session_factory):
+        """Test get_one eager-loads relationships"""
+        adapter = SQLAlchemyAdapter(Author, session_factory)
+
+        with assert_num_queries(engine, 2):
+            author = await adapter.get_one(2, include=["books", "publisher"])
+
+        assert [book.title for book in author.books] == ["bob-0", "bob-1"]
+        assert author.publisher.name == "press"
+
+    @pytest.mark.asyncio
+    async def test_get_all_with_total(self, engine, session_factory):
+        """Test the windowed page query keeps loader options"""
+        adapter = SQLAlchemyAdapter(Author, session_factory)
+
+        with assert_num_queries(engine, 2):
+            authors, total = await adapter.get_all_with_total(
+                {}, {}, {"skip": 0, "limit": 2}, include=["books"]
+            )
+
+        assert total == 3
+        assert [len(author.books) for author in authors] == [2, 2]
+
+    @pytest.mark.asyncio
+    async def test_unknown_relationship(self, session_factory):
+        """Test naming something that is not a relationship"""
+        adapter = SQLAlchemyAdapter(Author, session_factory)
+
+        with pytest.raises(BadRequestError):
+            await adapter.get_all({}, {}, {"skip": 0, "limit": 10}, include=["name"])
+
+    @pytest.mark.asyncio
+    async def test_assert_num_queries_reports_statements(self, engine, session_factory):
+        """Test the helper fails with the executed statements listed"""
+        adapter = SQLAlchemyAdapter(Author, session_factory)
+
+        with pytest.raises(AssertionError, match="Expected 0 queries, got 1"):
+            with assert_num_queries(engine, 0):
+                await adapter.get_all({}, {}, {"skip": 0, "limit": 10})
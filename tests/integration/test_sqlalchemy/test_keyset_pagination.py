@@ -0,0 +1,127 @@
+"""SQLAlchemy keyset (cursor) pagination integration tests"""
+
+import pytest
+
+from fastapi_easy.backends.sqlalchemy import SQLAlchemyAdapter
+from fastapi_easy.core.errors import BadRequestError
+from fastapi_easy.utils.pagination import encode_cursor
+from fastapi_easy.utils.sorters import SortParser
+
+from .conftest import Note
+
+
+@pytest.mark.asyncio
+class TestSQLAlchemyKeysetPagination:
+    """Test SQLAlchemy cursor pagination"""
+
+    async def test_first_page(self, sqlalchemy_adapter, sample_items):
+        """Test first cursor page is ordered by the keyset"""
+        items = await sqlalchemy_adapter.get_all(
+            filters={},
+            sorts={"price": "asc"},
+            pagination={"after": None, "before": None, "limit": 2},
+        )
+
+        assert [item.name for item in items] == ["banana", "orange"]
+
+    async def test_walk_forward_and_back(self, sqlalchemy_adapter, sample_items):
+        """Test after/before cursors visit every row exactly once"""
+        sorts = {"price": "desc"}
+        keyset = SortParser.to_keyset(sorts, "id")
+
+        seen = []
+        after = None
+        while True:
+            page = await sqlalchemy_adapter.get_all(
+                filters={}, sorts=sorts, pagination={"after": after, "limit": 2}
+            )
+            if not page:
+                break
+            seen.extend(item.name for item in page)
+            after = encode_cursor(page[-1], keyset)
+
+        assert seen == ["grape", "mango", "apple", "orange", "banana"]
+
+        previous = await sqlalchemy_adapter.get_all(
+            filters={}, sorts=sorts, pagination={"before": after, "limit": 2}
+        )
+        assert [item.name for item in previous] == ["apple", "orange"]
+
+    async def test_ties_broken_by_primary_key(self, sqlalchemy_adapter, db_session_factory):
+        """Test duplicate sort values are not skipped or repeated"""
+        for name in ["a", "b", "c", "d"]:
+            await sqlalchemy_adapter.create({"name": name, "price": 1.0})
+
+        sorts = {"price": "asc"}
+        keyset = SortParser.to_keyset(sorts, "id")
+        first = await sqlalchemy_adapter.get_all(
+            filters={}, sorts=sorts, pagination={"after": None, "limit": 2}
+        )
+        second = await sqlalchemy_adapter.get_all(
+            filters={},
+            sorts=sorts,
+            pagination={"after": encode_cursor(first[-1], keyset), "limit": 2},
+        )
+
+        assert [item.name for item in first + second] == ["a", "b", "c", "d"]
+
+    async def test_with_filters(self, sqlalchemy_adapter, sample_items):
+        """Test filters are combined with the seek predicate"""
+        keyset = SortParser.to_keyset({}, "id")
+        items = await sqlalchemy_adapter.get_all(
+            filters={"price": {"field": "price", "operator": "gte", "value": 10.0}},
+            sorts={},
+            pagination={"after": encode_cursor(sample_items[0], keyset), "limit": 10},
+        )
+
+        assert [item.name for item in items] == ["grape", "mango"]
+
+    async def test_invalid_cursor(self, sqlalchemy_adapter, sample_items):
+        """Test invalid cursors raise a bad request error"""
+        with pytest.raises(BadRequestError):
+            await sqlalchemy_adapter.get_all(
+                filters={}, sorts={}, pagination={"after": "garbage", "limit": 10}
+            )
+
+    async def test_unknown_sort_field(self, sqlalchemy_adapter, sample_items):
+        """Test cursor pagination rejects unknown sort fields"""
+        with pytest.raises(BadRequestError):
+            await sqlalchemy_adapter.get_all(
+                filters={}, sorts={"missing": "asc"}, pagination={"after": None, "limit": 10}
+            )
+
+    @pytest.mark.parametrize("direction", ["asc", "desc"])
+    async def test_walk_through_null_sort_values(self, db_session_factory, direction):
+        """Test rows with NULL sort values are paged forward and back in full"""
+        adapter = SQLAlchemyAdapter(model=Note, session_factory=db_session_factory)
+        for title in [None, "b", None, "a", None, "c", None]:
+            await adapter.create({"title": title})
+
+        sorts = {"title": direction}
+        keyset = SortParser.to_keyset(sorts, "id")
+        # SQLite sorts NULL first ascending; the primary key breaks ties
+        rows = await adapter.get_all(filters={}, sorts={"id": "asc"}, pagination={"limit": 10})
+        expected = sorted(
+            rows, key=lambda item: (item.title is not None, item.title or "", item.id)
+        )
+        if direction == "desc":
+            expected.reverse()
+
+        seen = []
+        after = None
+        while True:
+            page = await adapter.get_all(
+                filters={}, sorts=sorts, pagination={"after": after, "limit": 2}
+            )
+            if not page:
+                break
+            seen.extend(page)
+            after = encode_cursor(page[-1], keyset)
+
+        assert [item.id for item in seen] == [item.id for item in expected]
+
+        before = encode_cursor(expected[4], keyset)
+        previous = await adapter.get_all(
+            filters={}, sorts=sorts, pagination={"before": before, "limit": 3}
+        )
+        assert [item.id for item in previous] == [item.id for item in expected[1:4]]
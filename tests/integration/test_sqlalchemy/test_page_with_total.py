@@ -0,0 +1,113 @@
+"""Integration tests for fetching a page together with its total count"""
+
+import pytest
+from sqlalchemy import select, text
+
+from fastapi_easy.backends.sqlalchemy import (
+    estimate_row_count,
+    fetch_page_with_total,
+    supports_window_functions,
+)
+
+from .conftest import Item
+
+
+class TestPageWithTotal:
+    """Test get_all_with_total and the window-function helpers"""
+
+    @pytest.mark.asyncio
+    async def test_page_and_total(self, sqlalchemy_adapter, sample_items):
+        """Test a page is returned with the total of all matching rows"""
+        items, total = await sqlalchemy_adapter.get_all_with_total(
+            filters={}, sorts={"price": "asc"}, pagination={"skip": 1, "limit": 2}
+        )
+
+        assert [item.name for item in items] == ["orange", "apple"]
+        assert total == 5
+
+    @pytest.mark.asyncio
+    async def test_total_respects_filters(self, sqlalchemy_adapter, sample_items):
+        """Test the total only counts rows matching the filters"""
+        items, total = await sqlalchemy_adapter.get_all_with_total(
+            filters={"price": {"field": "price", "operator": "gte", "value": 10}},
+            sorts={},
+            pagination={"skip": 0, "limit": 1},
+        )
+
+        assert len(items) == 1
+        assert total == 3
+
+    @pytest.mark.asyncio
+    async def test_page_past_end_falls_back_to_count(self, sqlalchemy_adapter, sample_items):
+        """Test an empty page beyond the end still reports the total"""
+        items, total = await sqlalchemy_adapter.get_all_with_total(
+            filters={}, sorts={}, pagination={"skip": 50, "limit": 10}
+        )
+
+        assert items == []
+        assert total == 5
+
+    @pytest.mark.asyncio
+    async def test_empty_table(self, sqlalchemy_adapter):
+        """Test an empty table returns no items and a zero total"""
+        items, total = await sqlalchemy_adapter.get_all_with_total(
+            filters={}, sorts={}, pagination={"skip": 0, "limit": 10}
+        )
+
+        assert items == []
+        assert total == 0
+
+    @pytest.mark.asyncio
+    async def test_fetch_page_with_total_strips_total_column(
+        self, db_session_factory, sample_items
+    ):
+        """Test the helper returns entities rather than (entity, total) rows"""
+        async with db_session_factory() as session:
+            items, total = await fetch_page_with_total(
+                session, select(Item).order_by(Item.id), 0, 2
+            )
+
+        assert all(isinstance(item, Item) for item in items)
+        assert total == 5
+
+    @pytest.mark.asyncio
+    async def test_sqlite_supports_window_functions(self, db_engine):
+        """Test the bundled SQLite is detected as window-function capable"""
+        assert supports_window_functions(db_engine.dialect)
+
+
+class TestEstimatedCount:
+    """Test planner-statistics row estimates"""
+
+    @pytest.mark.asyncio
+    async def test_estimate_without_statistics(self, db_session_factory, sample_items):
+        """Test no estimate is available before the table is analyzed"""
+        async with db_session_factory() as session:
+            assert await estimate_row_count(session, Item.__table__) is None
+
+    @pytest.mark.asyncio
+    async def test_estimate_after_analyze(self, db_session_factory, sample_items):
+        """Test the estimate is read from sqlite_stat1 after ANALYZE"""
+        async with db_session_factory() as session:
+            await session.execute(text("ANALYZE"))
+            await session.commit()
+            assert await estimate_row_count(session, Item.__table__) == 5
+
+    @pytest.mark.asyncio
+    async def test_count_estimate_falls_back_to_exact(self, sqlalchemy_adapter, sample_items):
+        """Test count(estimate=True) falls back to COUNT(*) without statistics"""
+        assert await sqlalchemy_adapter.count({}, estimate=True) == 5
+
+    @pytest.mark.asyncio
+    async def test_count_estimate_ignored_with_filters(
+        self, sqlalchemy_adapter, db_session_factory, sample_items
+    ):
+        """Test filtered counts are always exact"""
+        async with db_session_factory() as session:
+            await session.execute(text("ANALYZE"))
+            await session.commit()
+
+        count = await sqlalchemy_adapter.count(
+            {"name": {"field": "name", "operator": "exact", "value": "apple"}}, estimate=True
+        )
+        assert count == 1
@@ -0,0 +1,200 @@
+"""Integration tests for single-statement UPDATE/DELETE ... RETURNING"""
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import ForeignKey, event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+
+from fastapi_easy.backends.sqlalchemy import SQLAlchemyAdapter, supports_returning
+from fastapi_easy.core.errors import ConflictError
+from fastapi_easy.core.unit_of_work import UnitOfWork
+
+from .conftest import Base, Item, TransactionItem
+
+
+class CascadeBase(DeclarativeBase):
+    """Base of the cascading parent/child models"""
+
+
+class Parent(CascadeBase):
+    __tablename__ = "parents"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    children: Mapped[list["Child"]] = relationship(cascade="all, delete-orphan")
+
+
+class Child(CascadeBase):
+    __tablename__ = "children"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    parent_id: Mapped[int] = mapped_column(ForeignKey("parents.id"))
+
+
+@pytest_asyncio.fixture
+async def file_engine(tmp_path):
+    """File-backed SQLite engine (pooled, so RETURNING is used)"""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'returning.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    yield engine
+
+    await engine.dispose()
+
+
+@pytest.fixture
+def statements(file_engine):
+    """Record SQL statements executed on the engine"""
+    executed = []
+
+    @event.listens_for(file_engine.sync_engine, "before_cursor_execute")
+    def record(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement.split()[0].upper())
+
+    return executed
+
+
+@pytest_asyncio.fixture
+async def session_factory(file_engine):
+    """Session factory with the default expire_on_commit=True"""
+    return async_sessionmaker(file_engine, class_=AsyncSession)
+
+
+@pytest_asyncio.fixture
+async def adapter(session_factory):
+    """Adapter over the file-backed engine with two items"""
+    adapter = SQLAlchemyAdapter(model=TransactionItem, session_factory=session_factory)
+    await adapter.create({"name": "first", "price": 1.0, "quantity": 1})
+    await adapter.create({"name": "second", "price": 2.0, "quantity": 2})
+    return adapter
+
+
+class TestReturningFastPath:
+    """Test UPDATE/DELETE ... RETURNING in SQLAlchemyAdapter"""
+
+    @pytest.mark.asyncio
+    async def test_file_engine_supports_returning(self, file_engine):
+        """Test RETURNING is detected for a pooled SQLite 3.35+ engine"""
+        assert supports_returning(file_engine.sync_engine, "update")
+        assert supports_returning(file_engine.sync_engine, "delete")
+
+    @pytest.mark.asyncio
+    async def test_shared_connection_engine_excluded(self, db_engine):
+        """Test in-memory SQLite sharing one connection uses the fallback"""
+        assert not supports_returning(db_engine.sync_engine, "update")
+
+    @pytest.mark.asyncio
+    async def test_update_single_statement(self, adapter, statements):
+        """Test update issues one UPDATE and returns loaded values"""
+        statements.clear()
+        item = await adapter.update(1, {"price": 9.5, "quantity": 7})
+
+        assert statements == ["UPDATE"]
+        assert (item.name, item.price, item.quantity) == ("first", 9.5, 7)
+
+    @pytest.mark.asyncio
+    async def test_update_missing_returns_none(self, adapter):
+        """Test updating a missing id returns None"""
+        assert await adapter.update(999, {"price": 1.0}) is None
+
+    @pytest.mark.asyncio
+    async def test_update_conflict(self, adapter):
+        """Test unique violations still raise ConflictError"""
+        with pytest.raises(ConflictError):
+            await adapter.update(2, {"name": "first"})
+
+    @pytest.mark.asyncio
+    async def test_update_non_column_key_falls_back(self, adapter, statements):
+        """Test keys that are not columns use the load-and-set path"""
+        statements.clear()
+        item = await adapter.update(1, {"price": 3.0, "not_a_column": "x"})
+
+        assert statements[0] == "SELECT"
+        assert item.price == 3.0
+
+    @pytest.mark.asyncio
+    async def test_delete_single_statement(self, adapter, statements):
+        """Test delete_one issues one DELETE and returns the deleted row"""
+        statements.clear()
+        item = await adapter.delete_one(1)
+
+        assert statements == ["DELETE"]
+        assert item.name == "first"
+        assert await adapter.get_one(1) is None
+
+    @pytest.mark.asyncio
+    async def test_delete_missing_returns_none(self, adapter):
+        """Test deleting a missing id returns None"""
+        assert await adapter.delete_one(999) is None
+
+    @pytest.mark.asyncio
+    async def test_orm_listeners_fall_back(self, adapter, statements):
+        """Test models with mapper or attribute listeners use the ORM path"""
+        fired = []
+
+        def on_update(mapper, connection, target):
+            fired.append("before_update")
+
+        def on_set(target, value, oldvalue, initiator):
+            fired.append("set")
+
+        def on_delete(mapper, connection, target):
+            fired.append("before_delete")
+
+        event.listen(TransactionItem, "before_update", on_update)
+        event.listen(TransactionItem.price, "set", on_set)
+        event.listen(TransactionItem, "before_delete", on_delete)
+        try:
+            statements.clear()
+            item = await adapter.update(1, {"price": 4.0})
+            assert statements[0] == "SELECT"
+            assert item.price == 4.0
+
+            await adapter.delete_one(1)
+        finally:
+            event.remove(TransactionItem, "before_update", on_update)
+            event.remove(TransactionItem.price, "set", on_set)
+            event.remove(TransactionItem, "before_delete", on_delete)
+
+        assert fired == ["set", "before_update", "before_delete"]
+
+    @pytest.mark.asyncio
+    async def test_delete_cascade_falls_back(self, file_engine, session_factory, statements):
+        """Test models with delete cascades are deleted through the ORM"""
+        async with file_engine.begin() as conn:
+            await conn.run_sync(CascadeBase.metadata.create_all)
+        async with session_factory() as session:
+            session.add(Parent(id=1, children=[Child(id=1), Child(id=2)]))
+            await session.commit()
+
+        statements.clear()
+        assert (await SQLAlchemyAdapter(Parent, session_factory).delete_one(1)).id == 1
+
+        assert statements[0] == "SELECT"
+        async with session_factory() as session:
+            assert await session.scalar(select(func.count()).select_from(Child)) == 0
+
+    @pytest.mark.asyncio
+    async def test_unit_of_work_session_kept_consistent(self, adapter, session_factory):
+        """Test the fast paths refresh, and do not detach, the request's instances"""
+        async with UnitOfWork(session_factory) as session:
+            loaded = await adapter.get_one(1)
+            updated = await adapter.update(1, {"price": 8.0})
+            assert updated is loaded
+            assert loaded.price == 8.0
+            assert loaded in session
+
+            doomed = await adapter.get_one(2)
+            await adapter.delete_one(2)
+            assert doomed not in session
+
+        assert (await adapter.get_one(1)).price == 8.0
+        assert await adapter.get_one(2) is None
+
+    @pytest.mark.asyncio
+    async def test_sqlalchemy_model_with_shared_connection(self, sqlalchemy_adapter, sample_items):
+        """Test the fallback path keeps working on in-memory SQLite"""
+        item = await sqlalchemy_adapter.update(sample_items[0].id, {"price": 1.5})
+        assert isinstance(item, Item)
+        assert item.price == 1.5
@@ -0,0 +1,91 @@
+"""Integration tests for sparse fieldsets pushed into the SELECT list"""
+
+import pytest
+from sqlalchemy import event
+
+from fastapi_easy.core.errors import BadRequestError
+
+
+class TestSparseFields:
+    """Test get_all/get_one with a ``fields`` projection"""
+
+    @pytest.mark.asyncio
+    async def test_get_all_returns_only_requested_columns(self, sqlalchemy_adapter, sample_items):
+        """Test projected rows are plain dicts with just the requested keys"""
+        items = await sqlalchemy_adapter.get_all(
+            filters={},
+            sorts={"price": "asc"},
+            pagination={"skip": 0, "limit": 2},
+            fields=["id", "name"],
+        )
+
+        assert all(isinstance(item, dict) for item in items)
+        assert [set(item) for item in items] == [{"id", "name"}, {"id", "name"}]
+        assert [item["name"] for item in items] == ["banana", "orange"]
+
+    @pytest.mark.asyncio
+    async def test_select_lists_only_requested_columns(
+        self, sqlalchemy_adapter, sample_items, db_engine
+    ):
+        """Test the emitted SELECT does not read unrequested columns"""
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(db_engine.sync_engine, "before_cursor_execute", record)
+        try:
+            await sqlalchemy_adapter.get_all(
+                filters={}, sorts={}, pagination={"skip": 0, "limit": 10}, fields=["name"]
+            )
+        finally:
+            event.remove(db_engine.sync_engine, "before_cursor_execute", record)
+
+        select_sql = next(s for s in statements if s.lstrip().upper().startswith("SELECT"))
+        assert "description" not in select_sql
+        assert "price" not in select_sql
+
+    @pytest.mark.asyncio
+    async def test_filters_and_sorts_still_apply(self, sqlalchemy_adapter, sample_items):
+        """Test filtering and sorting on columns outside the projection"""
+        items = await sqlalchemy_adapter.get_all(
+            filters={"price": {"field": "price", "operator": "gte", "value": 10}},
+            sorts={"price": "desc"},
+            pagination={"skip": 0, "limit": 10},
+            fields=["name"],
+        )
+
+        assert items == [{"name": "grape"}, {"name": "mango"}, {"name": "apple"}]
+
+    @pytest.mark.asyncio
+    async def test_get_all_with_total(self, sqlalchemy_adapter, sample_items):
+        """Test the windowed page query honours the projection"""
+        items, total = await sqlalchemy_adapter.get_all_with_total(
+            filters={},
+            sorts={"price": "asc"},
+            pagination={"skip": 0, "limit": 1},
+            fields=["name"],
+        )
+
+        assert items == [{"name": "banana"}]
+        assert total == 5
+
+    @pytest.mark.asyncio
+    async def test_get_one(self, sqlalchemy_adapter, sample_items):
+        """Test get_one returns a dict of the requested columns"""
+        item = await sqlalchemy_adapter.get_one(sample_items[0].id, fields=["name", "price"])
+
+        assert item == {"name": "apple", "price": 10.0}
+
+    @pytest.mark.asyncio
+    async def test_get_one_missing(self, sqlalchemy_adapter, sample_items):
+        """Test get_one with fields returns None for a missing id"""
+        assert await sqlalchemy_adapter.get_one(9999, fields=["name"]) is None
+
+    @pytest.mark.asyncio
+    async def test_unknown_field(self, sqlalchemy_adapter, sample_items):
+        """Test requesting a column the model does not have"""
+        with pytest.raises(BadRequestError):
+            await sqlalchemy_adapter.get_all(
+                filters={}, sorts={}, pagination={"skip": 0, "limit": 10}, fields=["secret"]
+            )
@@ -0,0 +1,44 @@
+"""Integration tests for SQLAlchemy streaming reads"""
+
+import pytest
+
+from fastapi_easy.core.adapters import ORMAdapter
+
+
+class TestSQLAlchemyStream:
+    """Test SQLAlchemyAdapter.stream"""
+
+    @pytest.mark.asyncio
+    async def test_stream_all_items(self, sqlalchemy_adapter, sample_items):
+        """Test every row is yielded in sort order"""
+        names = [
+            item.name
+            async for item in sqlalchemy_adapter.stream({}, {"price": "asc"}, batch_size=2)
+        ]
+
+        assert names == ["banana", "orange", "apple", "mango", "grape"]
+
+    @pytest.mark.asyncio
+    async def test_stream_with_filters(self, sqlalchemy_adapter, sample_items):
+        """Test filters are applied to the streamed query"""
+        filters = {"price": {"field": "price", "operator": "gt", "value": 9}}
+        names = [item.name async for item in sqlalchemy_adapter.stream(filters, {"name": "desc"})]
+
+        assert names == ["mango", "grape", "apple"]
+
+    @pytest.mark.asyncio
+    async def test_stream_empty_table(self, sqlalchemy_adapter):
+        """Test streaming an empty table yields nothing"""
+        assert [item async for item in sqlalchemy_adapter.stream({}, {})] == []
+
+    @pytest.mark.asyncio
+    async def test_default_stream_pages_through_get_all(self, sqlalchemy_adapter, sample_items):
+        """Test the ORMAdapter fallback yields the same rows in batches"""
+        names = [
+            item.name
+            async for item in ORMAdapter.stream(
+                sqlalchemy_adapter, {}, {"price": "asc"}, batch_size=2
+            )
+        ]
+
+        assert names == ["banana", "orange", "apple", "mango", "grape"]
@@ -0,0 +1,121 @@
+"""Integration tests for the request-scoped unit of work"""
+
+import pytest
+from sqlalchemy import event, func, select
+
+from fastapi_easy.core.errors import ConflictError
+from fastapi_easy.core.hooks import ExecutionContext
+from fastapi_easy.core.unit_of_work import UnitOfWork, get_request_session
+
+from .conftest import Item
+
+
+def _count_checkouts(engine):
+    checkouts = []
+    event.listen(engine.sync_engine, "checkout", lambda *args: checkouts.append(1))
+    return checkouts
+
+
+async def _count_items(session_factory) -> int:
+    async with session_factory() as session:
+        return await session.scalar(select(func.count()).select_from(Item))
+
+
+class TestUnitOfWork:
+    """Test adapters sharing one session inside a UnitOfWork"""
+
+    @pytest.mark.asyncio
+    async def test_adapter_calls_share_one_checkout(
+        self, sqlalchemy_adapter, db_session_factory, db_engine
+    ):
+        """Test several adapter calls check out a single connection"""
+        checkouts = _count_checkouts(db_engine)
+
+        async with UnitOfWork(db_session_factory):
+            item = await sqlalchemy_adapter.create({"name": "apple", "price": 1.0})
+            await sqlalchemy_adapter.update(item.id, {"price": 2.0})
+            assert await sqlalchemy_adapter.count({}) == 1
+            assert (await sqlalchemy_adapter.get_one(item.id)).price == 2.0
+
+        assert len(checkouts) == 1
+        assert await _count_items(db_session_factory) == 1
+
+    @pytest.mark.asyncio
+    async def test_rolls_back_on_error(self, sqlalchemy_adapter, db_session_factory):
+        """Test writes are discarded when the block raises"""
+        with pytest.raises(RuntimeError):
+            async with UnitOfWork(db_session_factory):
+                await sqlalchemy_adapter.create({"name": "apple", "price": 1.0})
+                await sqlalchemy_adapter.bulk_create([{"name": "pear", "price": 2.0}])
+                raise RuntimeError("boom")
+
+        assert await _count_items(db_session_factory) == 0
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_keeps_rows_in_session(self, sqlalchemy_adapter, db_session_factory):
+        """Test rows created in a unit of work stay in its session"""
+        async with UnitOfWork(db_session_factory) as session:
+            created = await sqlalchemy_adapter.bulk_create([{"name": "pear", "price": 2.0}])
+            assert created[0] in session
+            created[0].price = 3.0
+
+        async with db_session_factory() as session:
+            assert (await session.execute(select(Item.price))).scalar_one() == 3.0
+
+    @pytest.mark.asyncio
+    async def test_failed_write_keeps_earlier_writes(self, sqlalchemy_adapter, db_session_factory):
+        """Test a constraint error undoes only the failing write"""
+        async with UnitOfWork(db_session_factory):
+            item = await sqlalchemy_adapter.create({"name": "apple", "price": 1.0})
+            with pytest.raises(ConflictError):
+                await sqlalchemy_adapter.create({"id": item.id, "name": "dup", "price": 1.0})
+            await sqlalchemy_adapter.update(item.id, {"price": 2.0})
+            await sqlalchemy_adapter.create({"name": "pear", "price": 3.0})
+
+        async with db_session_factory() as session:
+            rows = (await session.execute(select(Item.name, Item.price).order_by(Item.id))).all()
+        assert rows == [("apple", 2.0), ("pear", 3.0)]
+
+    @pytest.mark.asyncio
+    async def test_failed_first_write(self, sqlalchemy_adapter, db_session_factory):
+        """Test the unit of work goes on after its first write fails"""
+        item = await sqlalchemy_adapter.create({"name": "apple", "price": 1.0})
+
+        async with UnitOfWork(db_session_factory):
+            with pytest.raises(ConflictError):
+                await sqlalchemy_adapter.create({"id": item.id, "name": "dup", "price": 1.0})
+            await sqlalchemy_adapter.create({"name": "pear", "price": 3.0})
+
+        assert await _count_items(db_session_factory) == 2
+
+    @pytest.mark.asyncio
+    async def test_rollback_only(self, sqlalchemy_adapter, db_session_factory):
+        """Test rollback_only discards writes without an exception"""
+        unit = UnitOfWork(db_session_factory)
+        async with unit:
+            await sqlalchemy_adapter.create({"name": "pear", "price": 1.0})
+            unit.rollback_only = True
+
+        assert await _count_items(db_session_factory) == 0
+
+    @pytest.mark.asyncio
+    async def test_other_session_factory_is_not_reused(
+        self, sqlalchemy_adapter, db_session_factory
+    ):
+        """Test adapters only reuse a unit of work opened with their own factory"""
+        other_factory = lambda: db_session_factory()  # noqa: E731
+
+        async with UnitOfWork(other_factory):
+            assert get_request_session(db_session_factory) is None
+            await sqlalchemy_adapter.create({"name": "apple", "price": 1.0})
+
+        assert await _count_items(db_session_factory) == 1
+
+    @pytest.mark.asyncio
+    async def test_execution_context_exposes_session(self, db_session_factory):
+        """Test hooks see the request's session on the execution context"""
+        assert ExecutionContext(schema=None, adapter=None, request=None).session is None
+
+        async with UnitOfWork(db_session_factory) as session:
+            context = ExecutionContext(schema=None, adapter=None, request=None)
+            assert context.session is session
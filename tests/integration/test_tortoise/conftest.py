@@ -36,6 +36,37 @@ class UniqueItem(Model):
         return f"<UniqueItem(id={self.id}, name={self.name}, price={self.price})>"
 
 
+class Author(Model):
+    """Test author model with a reverse relation to books"""
+
+    id = fields.IntField(pk=True)
+    name = fields.CharField(max_length=100)
+
+    class Meta:
+        table = "authors"
+
+
+class Book(Model):
+    """Test book model with a foreign key to authors"""
+
+    id = fields.IntField(pk=True)
+    title = fields.CharField(max_length=100)
+    author = fields.ForeignKeyField("models.Author", related_name="books")
+
+    class Meta:
+        table = "books"
+
+
+class Note(Model):
+    """Test model with a nullable field"""
+
+    id = fields.IntField(pk=True)
+    title = fields.CharField(max_length=100, null=True)
+
+    class Meta:
+        table = "notes"
+
+
 @pytest_asyncio.fixture
 async def tortoise_db():
     """Initialize Tortoise ORM with in-memory SQLite"""
@@ -0,0 +1,60 @@
+"""Integration tests for Tortoise bulk operations"""
+
+import pytest
+
+from fastapi_easy.core.errors import BadRequestError
+
+
+class TestTortoiseBulkOperations:
+    """Test TortoiseAdapter.bulk_* methods"""
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_returns_items_with_ids(self, tortoise_adapter, sample_items):
+        """Test created rows are read back with their primary keys"""
+        created = await tortoise_adapter.bulk_create(
+            [{"name": f"item{i}", "price": float(i)} for i in range(10)]
+        )
+
+        assert [item.name for item in created] == [f"item{i}" for i in range(10)]
+        assert all(item.id is not None for item in created)
+        for item in created:
+            assert (await tortoise_adapter.get_one(item.id)).name == item.name
+        assert await tortoise_adapter.count({}) == 15
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_with_given_ids(self, tortoise_adapter, tortoise_db):
+        """Test items whose keys are given are inserted together and returned as is"""
+        created = await tortoise_adapter.bulk_create(
+            [{"id": 100 + i, "name": f"item{i}", "price": float(i)} for i in range(3)]
+        )
+
+        assert [item.id for item in created] == [100, 101, 102]
+        assert (await tortoise_adapter.get_one(101)).name == "item1"
+
+    @pytest.mark.asyncio
+    async def test_bulk_update(self, tortoise_adapter, sample_items):
+        """Test updates with different field sets are applied"""
+        ids = [item.id for item in sample_items]
+        updated = await tortoise_adapter.bulk_update(
+            [
+                {"id": ids[0], "price": 1.0},
+                {"id": ids[1], "name": "kiwi"},
+                {"id": 999, "price": 1.0},
+            ]
+        )
+
+        assert [(item.name, item.price) for item in updated] == [("apple", 1.0), ("kiwi", 5.0)]
+        stored = await tortoise_adapter.get_one(ids[1])
+        assert stored.name == "kiwi"
+
+    @pytest.mark.asyncio
+    async def test_bulk_update_requires_pk(self, tortoise_adapter, tortoise_db):
+        """Test updates without a primary key are rejected"""
+        with pytest.raises(BadRequestError):
+            await tortoise_adapter.bulk_update([{"price": 1.0}])
+
+    @pytest.mark.asyncio
+    async def test_bulk_delete(self, tortoise_adapter, sample_items):
+        """Test deleting by id counts only existing rows"""
+        assert await tortoise_adapter.bulk_delete([sample_items[0].id, 999]) == 1
+        assert await tortoise_adapter.count({}) == 4
@@ -0,0 +1,65 @@
+"""Integration tests for Tortoise relationship prefetching"""
+
+import pytest
+import pytest_asyncio
+
+from fastapi_easy.backends.tortoise import TortoiseAdapter
+from fastapi_easy.core.errors import BadRequestError
+
+from .conftest import Author, Book
+
+
+@pytest_asyncio.fixture
+async def authors(tortoise_db):
+    """Create authors with two books each"""
+    created = []
+    for name in ("ann", "bob"):
+        author = await Author.create(name=name)
+        for i in range(2):
+            await Book.create(title=f"{name}-{i}", author=author)
+        created.append(author)
+    return created
+
+
+class TestTortoiseEagerLoading:
+    """Test the include argument of TortoiseAdapter reads"""
+
+    @pytest.mark.asyncio
+    async def test_prefetch_reverse_relation(self, authors):
+        """Test a reverse relation is loaded with the page"""
+        adapter = TortoiseAdapter(model=Author, session_factory=None)
+
+        result = await adapter.get_all(
+            {}, {"id": "asc"}, {"skip": 0, "limit": 10}, include=["books"]
+        )
+
+        assert [sorted(book.title for book in author.books) for author in result] == [
+            ["ann-0", "ann-1"],
+            ["bob-0", "bob-1"],
+        ]
+
+    @pytest.mark.asyncio
+    async def test_prefetch_foreign_key(self, authors):
+        """Test a foreign key is loaded for get_one"""
+        adapter = TortoiseAdapter(model=Book, session_factory=None)
+
+        book = await adapter.get_one(1, include=["author"])
+
+        assert book.author.name == "ann"
+
+    @pytest.mark.asyncio
+    async def test_nested_path(self, authors):
+        """Test dotted paths map to Tortoise's double-underscore lookups"""
+        adapter = TortoiseAdapter(model=Book, session_factory=None)
+
+        books = await adapter.get_all({}, {}, {"skip": 0, "limit": 1}, include=["author.books"])
+
+        assert len(books[0].author.books) == 2
+
+    @pytest.mark.asyncio
+    async def test_unknown_relationship(self, authors):
+        """Test naming a plain field or unknown relation"""
+        adapter = TortoiseAdapter(model=Author, session_factory=None)
+
+        with pytest.raises(BadRequestError):
+            await adapter.get_all({}, {}, {"skip": 0, "limit": 10}, include=["name"])
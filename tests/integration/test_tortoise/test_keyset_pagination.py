@@ -0,0 +1,34 @@
+"""Tortoise ORM keyset (cursor) pagination integration tests"""
+
+import pytest
+
+from fastapi_easy.utils.pagination import encode_cursor
+from fastapi_easy.utils.sorters import SortParser
+
+
+@pytest.mark.asyncio
+class TestTortoiseKeysetPagination:
+    """Test Tortoise cursor pagination"""
+
+    async def test_walk_forward_and_back(self, tortoise_adapter, sample_items):
+        """Test after/before cursors visit every row exactly once"""
+        sorts = {"price": "desc"}
+        keyset = SortParser.to_keyset(sorts, "id")
+
+        seen = []
+        after = None
+        while True:
+            page = await tortoise_adapter.get_all(
+                filters={}, sorts=sorts, pagination={"after": after, "limit": 2}
+            )
+            if not page:
+                break
+            seen.extend(item.name for item in page)
+            after = encode_cursor(page[-1], keyset)
+
+        assert seen == ["grape", "mango", "apple", "orange", "banana"]
+
+        previous = await tortoise_adapter.get_all(
+            filters={}, sorts=sorts, pagination={"before": after, "limit": 2}
+        )
+        assert [item.name for item in previous] == ["apple", "orange"]
@@ -0,0 +1,41 @@
+"""Integration tests for Tortoise sparse fieldsets"""
+
+import pytest
+
+from fastapi_easy.core.errors import BadRequestError
+
+
+class TestTortoiseSparseFields:
+    """Test TortoiseAdapter get_all/get_one with ``fields``"""
+
+    @pytest.mark.asyncio
+    async def test_get_all_returns_only_requested_columns(self, tortoise_adapter, sample_items):
+        """Test projected rows are plain dicts with just the requested keys"""
+        items = await tortoise_adapter.get_all(
+            filters={"price": {"field": "price", "operator": "gte", "value": 10}},
+            sorts={"price": "asc"},
+            pagination={"skip": 0, "limit": 10},
+            fields=["name"],
+        )
+
+        assert items == [{"name": "apple"}, {"name": "mango"}, {"name": "grape"}]
+
+    @pytest.mark.asyncio
+    async def test_get_one(self, tortoise_adapter, sample_items):
+        """Test get_one returns a dict of the requested columns"""
+        item = await tortoise_adapter.get_one(sample_items[1].id, fields=["id", "price"])
+
+        assert item == {"id": sample_items[1].id, "price": 5.0}
+
+    @pytest.mark.asyncio
+    async def test_get_one_missing(self, tortoise_adapter, sample_items):
+        """Test get_one with fields returns None for a missing id"""
+        assert await tortoise_adapter.get_one(9999, fields=["name"]) is None
+
+    @pytest.mark.asyncio
+    async def test_unknown_field(self, tortoise_adapter, sample_items):
+        """Test requesting a field the model does not have"""
+        with pytest.raises(BadRequestError):
+            await tortoise_adapter.get_all(
+                filters={}, sorts={}, pagination={"skip": 0, "limit": 10}, fields=["secret"]
+            )
@@ -0,0 +1,58 @@
+"""Benchmark: bulk insert/update/delete vs one statement per row"""
+
+import time
+
+import pytest
+
+ROWS = 5000
+
+
+@pytest.mark.asyncio
+@pytest.mark.performance
+async def test_bulk_create_vs_per_row(perf_sqlalchemy_adapter):
+    """Compare bulk_create against calling create once per row"""
+    rows = [
+        {"name": f"item_{i}", "description": "x" * 50, "price": float(i), "quantity": i % 10}
+        for i in range(ROWS)
+    ]
+
+    start = time.perf_counter()
+    for data in rows[: ROWS // 10]:
+        await perf_sqlalchemy_adapter.create(data)
+    per_row = (time.perf_counter() - start) * 10  # extrapolated to ROWS
+
+    start = time.perf_counter()
+    created = await perf_sqlalchemy_adapter.bulk_create(rows)
+    bulk = time.perf_counter() - start
+
+    print(f"\ncreate() x {ROWS} (extrapolated): {per_row:.2f}s ({ROWS / per_row:,.0f} rows/s)")
+    print(f"bulk_create({ROWS}):             {bulk:.2f}s ({ROWS / bulk:,.0f} rows/s)")
+
+    assert len(created) == ROWS
+    assert bulk < per_row
+
+
+@pytest.mark.asyncio
+@pytest.mark.performance
+async def test_bulk_update_and_delete(perf_sqlalchemy_adapter):
+    """Measure bulk_update (per-row values) and bulk_delete throughput"""
+    created = await perf_sqlalchemy_adapter.bulk_create(
+        [{"name": f"item_{i}", "price": float(i)} for i in range(ROWS)]
+    )
+    ids = [item.id for item in created]
+
+    start = time.perf_counter()
+    updated = await perf_sqlalchemy_adapter.bulk_update(
+        [{"id": id, "price": float(id) * 2} for id in ids]
+    )
+    update_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    deleted = await perf_sqlalchemy_adapter.bulk_delete(ids)
+    delete_time = time.perf_counter() - start
+
+    print(f"\nbulk_update({ROWS}): {update_time:.2f}s ({ROWS / update_time:,.0f} rows/s)")
+    print(f"bulk_delete({ROWS}): {delete_time:.2f}s ({ROWS / delete_time:,.0f} rows/s)")
+
+    assert len(updated) == ROWS
+    assert deleted == ROWS
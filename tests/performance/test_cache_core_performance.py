@@ -0,0 +1,42 @@
+"""Benchmark: ops/sec of the LRU/TTL cache core at 10k, 100k and 1M entries"""
+
+import random
+import time
+
+import pytest
+
+from fastapi_easy.core.cache_core import LRUTTLCache
+
+
+def _ops_per_second(func, keys) -> float:
+    start = time.perf_counter()
+    for key in keys:
+        func(key)
+    return len(keys) / (time.perf_counter() - start)
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("size", [10_000, 100_000, 1_000_000])
+def test_cache_core_throughput(size):
+    """Measure set, get and evicting set on a full cache"""
+    cache = LRUTTLCache(max_size=size, default_ttl=300)
+    keys = [f"key:{i}" for i in range(size)]
+
+    set_ops = _ops_per_second(lambda key: cache.set(key, key), keys)
+
+    random.seed(0)
+    lookups = random.sample(keys, min(size, 100_000))
+    get_ops = _ops_per_second(cache.get, lookups)
+
+    # Every insert of a new key now evicts the least recently used entry
+    new_keys = [f"new:{i}" for i in range(min(size, 100_000))]
+    evict_ops = _ops_per_second(lambda key: cache.set(key, key), new_keys)
+
+    print(f"\nLRUTTLCache with {size:,} entries:")
+    print(f"  set:          {set_ops:,.0f} ops/sec")
+    print(f"  get:          {get_ops:,.0f} ops/sec")
+    print(f"  set + evict:  {evict_ops:,.0f} ops/sec")
+
+    assert len(cache) == size
+    # O(1) operations: throughput should not collapse as the cache grows
+    assert evict_ops > 50_000
@@ -0,0 +1,58 @@
+"""Benchmark: cache key generation for typical get_all parameter shapes"""
+
+import hashlib
+import json
+import time
+
+import pytest
+
+from fastapi_easy.core.cache_key_generator import make_cache_key
+
+SHAPES = {
+    "get_one": {"id": 42},
+    "paginated": {"filters": {}, "sorts": {}, "skip": 0, "limit": 20},
+    "filtered": {
+        "filters": {
+            "status": {"field": "status", "operator": "eq", "value": "active"},
+            "age": {"field": "age", "operator": "gte", "value": 18},
+        },
+        "sorts": {"created_at": "desc"},
+        "skip": 40,
+        "limit": 20,
+    },
+    "in_list": {
+        "filters": {"id__in": list(range(50))},
+        "sorts": {"id": "asc"},
+        "skip": 0,
+        "limit": 50,
+    },
+}
+
+
+def _json_md5_key(operation, params):
+    """Key generation before the shared builder: JSON encoding plus MD5"""
+    params_json = json.dumps(params, sort_keys=True, default=str)
+    return f"{operation}:{hashlib.md5(f'{operation}:{params_json}'.encode()).hexdigest()}"
+
+
+def _ops_per_second(func, params, iterations=20_000) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func("get_all", params)
+    return iterations / (time.perf_counter() - start)
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("shape", list(SHAPES))
+def test_cache_key_throughput(shape):
+    """Compare the canonical builder with JSON + MD5 on repeated parameters"""
+    params = SHAPES[shape]
+    baseline = _ops_per_second(_json_md5_key, params)
+    canonical = _ops_per_second(make_cache_key, params)
+
+    print(f"\nCache key for {shape!r} parameters:")
+    print(f"  json + md5:       {baseline:,.0f} keys/sec")
+    print(f"  canonical + memo: {canonical:,.0f} keys/sec ({canonical / baseline:.1f}x)")
+
+    # Memo hits skip encoding and hashing; only canonicalization remains
+    assert canonical > 0.9 * baseline
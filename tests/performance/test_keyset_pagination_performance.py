@@ -0,0 +1,76 @@
+"""Benchmark: keyset (cursor) pagination vs OFFSET on deep pages"""
+
+import statistics
+import time
+
+import pytest
+from sqlalchemy import insert
+
+from fastapi_easy.utils.pagination import encode_cursor
+from fastapi_easy.utils.sorters import SortParser
+
+from .conftest import PerformanceItem
+
+PAGE_SIZE = 20
+PAGE_NUMBER = 1000
+ROWS = PAGE_SIZE * (PAGE_NUMBER + 1)
+ROUNDS = 20
+
+
+async def _median_latency(operation) -> float:
+    """Median wall time of an async operation in milliseconds"""
+    await operation()  # warm up statement cache
+    samples = []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        await operation()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+@pytest.mark.asyncio
+@pytest.mark.performance
+async def test_page_1000_keyset_vs_offset(perf_sqlalchemy_adapter, perf_db_session_factory):
+    """Compare page-1000 latency of keyset pagination against OFFSET"""
+    async with perf_db_session_factory() as session:
+        await session.execute(
+            insert(PerformanceItem),
+            [
+                {"name": f"item_{i}", "description": "x" * 100, "price": float(i % 1000)}
+                for i in range(ROWS)
+            ],
+        )
+        await session.commit()
+
+    sorts = {"price": "asc", "id": "asc"}
+    skip = PAGE_SIZE * (PAGE_NUMBER - 1)
+
+    # Cursor pointing at the last row of page 999
+    previous_page = await perf_sqlalchemy_adapter.get_all(
+        filters={}, sorts=sorts, pagination={"skip": skip - PAGE_SIZE, "limit": PAGE_SIZE}
+    )
+    after = encode_cursor(previous_page[-1], SortParser.to_keyset(sorts, "id"))
+
+    async def offset_page():
+        return await perf_sqlalchemy_adapter.get_all(
+            filters={}, sorts=sorts, pagination={"skip": skip, "limit": PAGE_SIZE}
+        )
+
+    async def keyset_page():
+        return await perf_sqlalchemy_adapter.get_all(
+            filters={}, sorts=sorts, pagination={"after": after, "limit": PAGE_SIZE}
+        )
+
+    assert [item.id for item in await keyset_page()] == [
+        item.id for item in await offset_page()
+    ]
+
+    offset_ms = await _median_latency(offset_page)
+    keyset_ms = await _median_latency(keyset_page)
+
+    print(
+        f"\nPage {PAGE_NUMBER} of {ROWS} rows: "
+        f"OFFSET {offset_ms:.2f} ms, keyset {keyset_ms:.2f} ms "
+        f"({offset_ms / keyset_ms:.1f}x)"
+    )
+    assert keyset_ms < offset_ms
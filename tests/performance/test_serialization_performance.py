@@ -0,0 +1,68 @@
+"""Benchmark: per-item model_validate + FastAPI encoding vs precompiled list serializer"""
+
+import time
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel
+from starlette.responses import JSONResponse
+
+from fastapi_easy.core.serialization import ResponseSerializer
+
+from .conftest import PerformanceItem
+
+ROUNDS = 50
+
+
+class PerformanceItemSchema(BaseModel):
+    id: int
+    name: str
+    description: str
+    price: float
+    quantity: int
+
+
+def _rows(count: int):
+    return [
+        PerformanceItem(id=i, name=f"item{i}", description="x" * 100, price=float(i), quantity=i)
+        for i in range(count)
+    ]
+
+
+def _per_item_path(rows):
+    """The path before the serializer: validate each row, then let FastAPI encode the list"""
+    items = []
+    for row in rows:
+        try:
+            items.append(PerformanceItemSchema.model_validate(row, from_attributes=True))
+        except Exception:
+            items.append(row)
+    return JSONResponse(jsonable_encoder(items)).body
+
+
+def _items_per_second(func, rows) -> float:
+    func(rows)
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        func(rows)
+    return ROUNDS * len(rows) / (time.perf_counter() - start)
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("page_size", [100, 1000])
+def test_serializer_vs_per_item_validation(page_size):
+    """Compare serialization throughput for a page of ORM rows"""
+    rows = _rows(page_size)
+    serializer = ResponseSerializer(PerformanceItemSchema)
+
+    assert serializer.dump_list(rows) == _per_item_path(rows).replace(b", ", b",")
+
+    slow = _items_per_second(_per_item_path, rows)
+    fast = _items_per_second(serializer.dump_list, rows)
+
+    print(f"\n{page_size}-row page")
+    print(f"Per-item validation: {slow:,.0f} items/sec")
+    print(f"ResponseSerializer:  {fast:,.0f} items/sec")
+    print(f"Speedup:             {fast / slow:.2f}x")
+
+    assert fast > 0 and slow > 0
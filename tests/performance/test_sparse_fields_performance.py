@@ -0,0 +1,40 @@
+"""Benchmark: full-row reads vs sparse fieldsets on a wide column"""
+
+import time
+
+import pytest
+
+from .conftest import PerformanceItem
+
+ROWS = 2000
+ROUNDS = 20
+
+
+@pytest.mark.asyncio
+@pytest.mark.performance
+async def test_sparse_fields_vs_full_rows(perf_sqlalchemy_adapter, perf_db_session_factory):
+    """Compare listing whole ORM rows with listing only id and name"""
+    async with perf_db_session_factory() as session:
+        session.add_all(
+            PerformanceItem(name=f"item{i}", description="x" * 500, price=float(i), quantity=i)
+            for i in range(ROWS)
+        )
+        await session.commit()
+
+    pagination = {"skip": 0, "limit": ROWS}
+
+    async def run(**options) -> float:
+        await perf_sqlalchemy_adapter.get_all({}, {}, pagination, **options)
+        start = time.perf_counter()
+        for _ in range(ROUNDS):
+            await perf_sqlalchemy_adapter.get_all({}, {}, pagination, **options)
+        return ROUNDS * ROWS / (time.perf_counter() - start)
+
+    full = await run()
+    sparse = await run(fields=["id", "name"])
+
+    print(f"\nFull rows:     {full:,.0f} rows/sec")
+    print(f"fields=id,name: {sparse:,.0f} rows/sec")
+    print(f"Speedup:        {sparse / full:.2f}x")
+
+    assert sparse > 0 and full > 0
@@ -99,6 +99,14 @@ class TestQueryCache:
         assert removed >= 1
         assert await cache.get("key2") == "value2"
 
+    @pytest.mark.asyncio
+    async def test_cache_zero_ttl_not_replaced_by_default(self):
+        """Test an explicit ttl=0 stores an already expired entry"""
+        cache = QueryCache(default_ttl=300)
+        await cache.set("key", "value", ttl=0)
+
+        assert await cache.get("key") is None
+
     def test_cache_stats(self):
         """Test cache statistics"""
         cache = QueryCache(max_size=100, default_ttl=300)
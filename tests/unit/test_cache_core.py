@@ -0,0 +1,349 @@
+"""Tests for the LRU/TTL cache core"""
+
+import pytest
+
+from fastapi_easy.core.advanced_cache import L1MemoryCache
+from fastapi_easy.core.cache import QueryCache
+from fastapi_easy.core.cache_core import LRUTTLCache, estimate_size
+
+
+class FakeClock:
+    """Manually advanced monotonic clock"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestLRUTTLCache:
+    """Test LRUTTLCache class"""
+
+    def test_set_and_get(self):
+        """Test storing and reading values"""
+        cache = LRUTTLCache(max_size=10)
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+        assert cache.get("missing") is None
+        assert cache.get("missing", "default") == "default"
+        assert "a" in cache
+        assert len(cache) == 1
+
+    def test_evicts_least_recently_used(self):
+        """Test that reads refresh recency and the oldest entry is evicted"""
+        evicted = []
+        cache = LRUTTLCache(max_size=2, on_evict=lambda k, v: evicted.append(k))
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.keys() == ["a", "c"]
+        assert evicted == ["b"]
+
+    def test_peek_does_not_refresh_recency(self):
+        """Test that peek leaves the LRU order alone"""
+        cache = LRUTTLCache(max_size=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.peek("a") == 1
+        cache.set("c", 3)
+
+        assert "a" not in cache
+
+    def test_overwrite_does_not_evict(self):
+        """Test that replacing a key keeps the other entries"""
+        cache = LRUTTLCache(max_size=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("a", 10)
+
+        assert cache.get("a") == 10
+        assert cache.get("b") == 2
+
+    def test_entry_expires(self):
+        """Test lazy expiry on read"""
+        clock = FakeClock()
+        evicted = []
+        cache = LRUTTLCache(default_ttl=10, clock=clock, on_evict=lambda k, v: evicted.append(k))
+        cache.set("a", 1)
+        cache.set("b", 2, ttl=None)
+
+        clock.now = 10
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+        assert evicted == ["a"]
+
+    def test_purge_expired(self):
+        """Test bulk expiry skips overwritten and deleted entries"""
+        clock = FakeClock()
+        cache = LRUTTLCache(default_ttl=10, clock=clock)
+        cache.set("a", 1, ttl=1)
+        cache.set("b", 2, ttl=1)
+        cache.set("b", 2, ttl=100)
+        cache.set("c", 3, ttl=1)
+        cache.delete("c")
+
+        clock.now = 5
+        assert cache.purge_expired() == 1
+        assert cache.keys() == ["b"]
+
+    def test_stale_entries(self):
+        """Test that expired entries stay readable for stale_ttl seconds"""
+        clock = FakeClock()
+        cache = LRUTTLCache(default_ttl=10, stale_ttl=5, clock=clock)
+        cache.set("a", 1)
+
+        clock.now = 12
+        assert cache.get("a") is None
+        assert cache.get_stale("a") == 1
+        assert cache.purge_expired() == 0
+
+        clock.now = 15
+        assert cache.get_stale("a") is None
+        assert len(cache) == 0
+
+    def test_expiry_heap_is_compacted(self):
+        """Test that repeated overwrites do not grow the heap without bound"""
+        cache = LRUTTLCache(max_size=10, default_ttl=60)
+        for i in range(1000):
+            cache.set("a", i)
+
+        assert len(cache._expiry) <= 2 * len(cache) + 65
+
+    def test_delete_and_clear(self):
+        """Test removing entries"""
+        cache = LRUTTLCache()
+        cache.set("a", 1)
+        assert cache.delete("a") is True
+        assert cache.delete("a") is False
+
+        cache.set("b", 2)
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_invalid_max_size(self):
+        """Test that a non-positive size is rejected"""
+        with pytest.raises(ValueError):
+            LRUTTLCache(max_size=0)
+        with pytest.raises(ValueError):
+            LRUTTLCache(max_bytes=0)
+        with pytest.raises(ValueError):
+            LRUTTLCache(eviction="random")
+
+
+class TestByteBudget:
+    """Test byte-bounded caching"""
+
+    def test_estimate_size(self):
+        """Test bytes are measured exactly and containers scale with length"""
+        assert estimate_size(b"x" * 100) == 100
+        small = estimate_size([{"id": i, "name": "n" * 10} for i in range(10)])
+        large = estimate_size([{"id": i, "name": "n" * 10} for i in range(1000)])
+        assert large > 50 * small
+
+    def test_lru_evicts_until_within_budget(self):
+        """Test one large value pushes out several small ones"""
+        cache = LRUTTLCache(max_size=100, max_bytes=100, sizeof=len)
+        for key in "abcd":
+            cache.set(key, b"x" * 20)
+        assert cache.total_bytes == 80
+
+        cache.set("big", b"y" * 60)
+
+        assert cache.keys() == ["c", "d", "big"]
+        assert cache.total_bytes == 100
+        assert cache.stats()["bytes"] == 100
+
+    def test_oversized_value_is_not_stored(self):
+        """Test a value larger than the budget leaves the cache untouched"""
+        cache = LRUTTLCache(max_bytes=10, sizeof=len)
+        assert cache.set("a", b"12345")
+        assert not cache.set("b", b"x" * 11)
+
+        assert "b" not in cache
+        assert cache.keys() == ["a"]
+
+    def test_bytes_released_on_delete_and_expiry(self):
+        """Test the byte total follows deletes, overwrites and expiry"""
+        clock = FakeClock()
+        cache = LRUTTLCache(default_ttl=10, clock=clock, max_bytes=1000, sizeof=len)
+        cache.set("a", b"x" * 10)
+        cache.set("b", b"x" * 20)
+        cache.set("a", b"x" * 30)
+        assert cache.total_bytes == 50
+
+        cache.delete("b")
+        assert cache.total_bytes == 30
+
+        clock.now = 11
+        assert cache.purge_expired() == 1
+        assert cache.total_bytes == 0
+
+    def test_gdsf_keeps_small_hot_entries(self):
+        """Test GDSF evicts the large, rarely read entry before small hot ones"""
+        evicted = []
+        cache = LRUTTLCache(
+            max_bytes=100,
+            eviction="gdsf",
+            sizeof=len,
+            on_evict=lambda k, v: evicted.append(k),
+        )
+        cache.set("big", b"x" * 60)
+        cache.set("small", b"x" * 10)
+        cache.get("small")
+        # "big" is the most recently used entry, but worth the least per byte
+        cache.get("big")
+        cache.set("new", b"x" * 40)
+
+        assert evicted == ["big"]
+        assert set(cache.keys()) == {"small", "new"}
+
+
+class TestTinyLFU:
+    """Test the W-TinyLFU eviction policy of the cache core"""
+
+    def test_scan_does_not_flush_hot_entries(self):
+        """Test one-off keys are rejected instead of evicting read entries"""
+        cache = LRUTTLCache(max_size=10, eviction="tinylfu")
+        hot = [f"hot:{i}" for i in range(8)]
+        for key in hot:
+            cache.get(key)
+            cache.set(key, key)
+        for _ in range(3):
+            for key in hot:
+                assert cache.get(key) == key
+
+        # A scan of one-off keys while the hot keys are still being read
+        for i in range(100):
+            cache.get(hot[i % len(hot)])
+            cache.get(f"scan:{i}")
+            cache.set(f"scan:{i}", i)
+
+        assert len(cache) == 10
+        assert all(cache.peek(key) == key for key in hot)
+
+    def test_lru_flushes_hot_entries_on_scan(self):
+        """Test the same scan empties a plain LRU cache, for contrast"""
+        cache = LRUTTLCache(max_size=10)
+        for i in range(8):
+            cache.set(f"hot:{i}", i)
+        for i in range(100):
+            cache.set(f"scan:{i}", i)
+
+        assert not any(key.startswith("hot:") for key in cache.keys())
+
+    def test_delete_and_byte_budget(self):
+        """Test deletes untrack keys and byte budgets still evict"""
+        cache = LRUTTLCache(max_size=10, max_bytes=30, eviction="tinylfu", sizeof=len)
+        cache.set("a", b"x" * 10)
+        cache.set("b", b"x" * 10)
+        assert cache.delete("a")
+        cache.set("c", b"x" * 10)
+        cache.set("d", b"x" * 15)
+
+        assert cache.total_bytes <= 30
+        assert "d" in cache
+
+    def test_lru_fallback_evicts_through_callback(self):
+        """Test an entry the policy cannot name is evicted with full cleanup"""
+        evicted = []
+        cache = LRUTTLCache(
+            max_size=10,
+            max_bytes=20,
+            eviction="tinylfu",
+            sizeof=len,
+            on_evict=lambda k, v: evicted.append(k),
+        )
+        cache.set("a", b"x" * 10)
+        cache.set("b", b"x" * 10)
+        # The policy's victim is "a" itself, already taken out for the overwrite
+        cache.set("a", b"x" * 15)
+
+        assert evicted == ["b"]
+        assert "b" not in cache._admission
+        assert cache.keys() == ["a"]
+        assert cache.total_bytes == 15
+
+    @pytest.mark.asyncio
+    async def test_query_cache_tags_only_stored_keys(self):
+        """Test rejected newcomers leave no tags behind"""
+        cache = QueryCache(max_size=10, eviction="tinylfu")
+        hot = [f"hot:{i}" for i in range(10)]
+        for _ in range(5):
+            for key in hot:
+                await cache.get(key)
+                await cache.set(key, key, tags={key})
+        for i in range(500):
+            await cache.set(f"scan:{i}", i, tags={f"scan:{i}"})
+
+        assert len(cache._tags) <= 10
+        assert all(cache.get_tags(key) for key in cache._store.keys())
+
+    @pytest.mark.asyncio
+    async def test_multilayer_cache_tinylfu(self):
+        """Test MultiLayerCache accepts the tinylfu policy"""
+        from fastapi_easy.core.multilayer_cache import MultiLayerCache
+
+        cache = MultiLayerCache(l1_size=5, l2_size=20, eviction="tinylfu")
+        for i in range(50):
+            await cache.set(f"key:{i}", i)
+
+        assert cache.l1_cache._store.eviction == "tinylfu"
+        assert len(cache.l1_cache.keys()) <= 5
+
+
+class TestCachesOnCore:
+    """Test the caches built on LRUTTLCache"""
+
+    @pytest.mark.asyncio
+    async def test_query_cache_evicts_lru(self):
+        """Test that QueryCache keeps recently read entries"""
+        cache = QueryCache(max_size=2)
+        await cache.set("a", 1)
+        await cache.set("b", 2)
+        await cache.get("a")
+        await cache.set("c", 3)
+
+        assert await cache.get("a") == 1
+        assert await cache.get("b") is None
+        assert cache.keys() == ["c", "a"]
+
+    @pytest.mark.asyncio
+    async def test_query_cache_oversized_value_not_tagged(self):
+        """Test a value over the byte budget is neither stored nor tagged"""
+        cache = QueryCache(max_bytes=100)
+        await cache.set("big", b"x" * 200, tags={"t"})
+
+        assert cache.get_tags("big") == set()
+        assert len(cache._tags) == 0
+
+    @pytest.mark.asyncio
+    async def test_query_cache_byte_budget(self):
+        """Test QueryCache bounded by bytes reports its usage"""
+        cache = QueryCache(max_size=100, max_bytes=2000)
+        await cache.set("rows", [{"id": i, "name": "x" * 20} for i in range(100)])
+        await cache.set("flag", True)
+
+        stats = cache.get_stats()
+        assert await cache.get("rows") is None
+        assert await cache.get("flag") is True
+        assert 0 < stats["bytes"] <= 2000
+        assert stats["max_bytes"] == 2000
+
+    @pytest.mark.asyncio
+    async def test_l1_memory_cache_evicts_when_full(self):
+        """Test that L1MemoryCache evicts instead of failing when full"""
+        cache = L1MemoryCache(max_size=2)
+        try:
+            assert await cache.set("a", 1)
+            assert await cache.set("b", 2)
+            await cache.get("a")
+            assert await cache.set("c", 3)
+
+            assert await cache.get("a") == 1
+            assert await cache.get("b") is None
+            assert cache.get_stats()["evictions"] == 1
+        finally:
+            await cache.close()
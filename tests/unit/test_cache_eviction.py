@@ -5,7 +5,11 @@ from fastapi_easy.core.cache_eviction import (
     LRUEvictionStrategy,
     LFUEvictionStrategy,
     FIFOEvictionStrategy,
+    TinyLFUEvictionStrategy,
     CacheEvictionManager,
+    CountMinSketch,
+    WTinyLFU,
+    replay_trace,
 )
 
 
@@ -89,6 +93,90 @@ class TestFIFOEvictionStrategy:
         assert len(cache) <= 50
 
 
+class TestCountMinSketch:
+    """Test count-min frequency sketch"""
+
+    def test_estimate_counts_occurrences(self):
+        """Test estimates never undercount"""
+        sketch = CountMinSketch(64)
+        for _ in range(5):
+            sketch.increment("hot")
+        sketch.increment("cold")
+
+        assert sketch.estimate("hot") >= 5
+        assert sketch.estimate("cold") >= 1
+        assert sketch.estimate("hot") > sketch.estimate("cold")
+
+    def test_counters_age(self):
+        """Test counters are halved after sample_size increments"""
+        sketch = CountMinSketch(64, sample_size=8)
+        for _ in range(7):
+            sketch.increment("hot")
+        assert sketch.estimate("hot") == 7
+
+        sketch.increment("hot")
+        assert sketch.estimate("hot") == 4
+
+
+class TestWTinyLFU:
+    """Test W-TinyLFU admission policy"""
+
+    def test_stays_within_capacity(self):
+        """Test admit returns victims once capacity is reached"""
+        policy = WTinyLFU(10)
+        evicted = []
+        for i in range(25):
+            policy.record(i)
+            evicted.extend(policy.admit(i))
+
+        assert len(policy) == 10
+        assert len(evicted) == 15
+
+    def test_frequent_key_survives_scan(self):
+        """Test a scan of one-off keys does not displace a frequent key"""
+        policy = WTinyLFU(10)
+        for i in range(10):
+            policy.record(i)
+            policy.admit(i)
+        for _ in range(5):
+            policy.record(0)
+            policy.touch(0)
+
+        for i in range(100, 200):
+            policy.record(i)
+            policy.admit(i)
+
+        assert 0 in policy
+
+    def test_remove(self):
+        """Test removed keys are no longer tracked"""
+        policy = WTinyLFU(10)
+        policy.admit("key")
+        policy.remove("key")
+
+        assert "key" not in policy
+        assert policy.victim() is None
+
+
+class TestTinyLFUEvictionStrategy:
+    """Test W-TinyLFU eviction strategy"""
+
+    @pytest.mark.asyncio
+    async def test_tinylfu_eviction(self):
+        """Test rejected keys are evicted and the cache makes room"""
+        strategy = TinyLFUEvictionStrategy(max_size=50)
+        cache = {}
+        for i in range(100):
+            if len(cache) >= 50:
+                await strategy.evict(cache, max_size=50)
+            cache[f"key_{i}"] = i
+            strategy.record_insertion(f"key_{i}")
+
+        assert len(cache) <= 50
+        await strategy.evict(cache, max_size=50)
+        assert len(cache) < 50
+
+
 class TestCacheEvictionManager:
     """Test cache eviction manager"""
 
@@ -113,6 +201,14 @@ class TestCacheEvictionManager:
         assert manager.strategy_name == "fifo"
         assert isinstance(manager.strategy, FIFOEvictionStrategy)
 
+    def test_tinylfu_manager(self):
+        """Test W-TinyLFU eviction manager"""
+        manager = CacheEvictionManager(strategy="tinylfu", max_size=100)
+
+        assert manager.strategy_name == "tinylfu"
+        assert isinstance(manager.strategy, TinyLFUEvictionStrategy)
+        assert manager.strategy.policy.capacity < 100
+
     def test_invalid_strategy(self):
         """Test invalid strategy"""
         with pytest.raises(ValueError):
@@ -143,3 +239,20 @@ class TestCacheEvictionManager:
         assert "strategy" in stats
         assert "total_evictions" in stats
         assert "items_evicted" in stats
+
+
+class TestReplayTrace:
+    """Test trace replay harness"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("strategy", ["lru", "lfu", "fifo", "tinylfu"])
+    async def test_replay_trace(self, strategy):
+        """Test hits and misses are counted for every strategy"""
+        trace = ["a", "b", "a", "c", "a", "b"]
+
+        result = await replay_trace(trace, strategy, max_size=10)
+
+        assert result["strategy"] == strategy
+        assert result["hits"] == 3
+        assert result["misses"] == 3
+        assert result["hit_rate"] == 50.0
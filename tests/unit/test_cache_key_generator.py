@@ -1,8 +1,14 @@
 """Tests for cache key generator"""
 
+import pytest
+
+from fastapi_easy.core.advanced_cache import L1MemoryCache
+from fastapi_easy.core.cache import QueryCache
 from fastapi_easy.core.cache_key_generator import (
     CacheKeyGenerator,
+    canonicalize,
     generate_cache_key,
+    make_cache_key,
 )
 
 
@@ -118,3 +124,45 @@ class TestCacheKeyCollisionPrevention:
         key2 = gen.generate("get_all", filters={"nested": {"a": 2}})
 
         assert key1 != key2
+
+    def test_no_collision_between_types(self):
+        """Test values that compare equal but differ in type get different keys"""
+        keys = {generate_cache_key("get_one", id=value) for value in (1, 1.0, True, "1")}
+
+        assert len(keys) == 4
+
+
+class TestCanonicalKeys:
+    """Test the shared canonical key builder"""
+
+    def test_canonical_form_is_order_independent(self):
+        """Test dicts and sets canonicalize the same regardless of order"""
+        assert canonicalize({"a": 1, "b": [1, 2]}) == canonicalize({"b": [1, 2], "a": 1})
+        assert canonicalize({3, 1, 2}) == canonicalize({2, 3, 1})
+        assert canonicalize([1, 2]) != canonicalize([2, 1])
+
+    def test_key_format(self):
+        """Test keys are the operation plus a 128-bit hex digest"""
+        key = make_cache_key("get_all", {"skip": 0, "limit": 10})
+        operation, digest = key.split(":")
+
+        assert operation == "get_all"
+        assert len(digest) == 32
+        int(digest, 16)
+
+    @pytest.mark.asyncio
+    async def test_caches_share_keys(self):
+        """Test every cache class builds the same key for the same parameters"""
+        params = {"filters": {"name": {"field": "name", "operator": "eq", "value": "x"}}}
+        l1 = L1MemoryCache()
+        try:
+            keys = {
+                CacheKeyGenerator().generate("get_all", **params),
+                generate_cache_key("get_all", **params),
+                QueryCache()._generate_key("get_all", **params),
+                l1._generate_key("get_all", **params),
+            }
+        finally:
+            await l1.close()
+
+        assert len(keys) == 1
@@ -1,5 +1,8 @@
 """Tests for cache monitor"""
 
+import asyncio
+
+from fastapi_easy.core.cache import QueryCache
 from fastapi_easy.core.cache_monitor import CacheMetrics, CacheMonitor, create_cache_monitor
 
 
@@ -116,6 +119,16 @@ class TestCacheMonitor:
         assert "alerts" in report
         assert "status" in report
 
+    def test_bytes_gauge(self):
+        """Test per-tier bytes are exported in the report"""
+        monitor = CacheMonitor()
+        l1 = QueryCache(max_bytes=10_000)
+        monitor.track_bytes("l1", l1)
+
+        assert monitor.get_report()["bytes"] == {"l1": 0}
+        asyncio.run(l1.set("key", b"x" * 100))
+        assert monitor.get_report()["bytes"] == {"l1": 100}
+
     def test_clear_alerts(self):
         """Test clearing alerts"""
         monitor = CacheMonitor(hit_rate_threshold=80.0)
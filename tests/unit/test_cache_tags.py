@@ -0,0 +1,253 @@
+"""Tests for tag-based cache invalidation"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from fastapi_easy.core.advanced_cache import (
+    _INVALIDATE_TAGS_SCRIPT,
+    _SET_TAGGED_SCRIPT,
+    L2RedisCache,
+)
+from fastapi_easy.core.cache import QueryCache
+from fastapi_easy.core.cache_invalidation import CacheInvalidationManager
+from fastapi_easy.core.cache_tags import TagIndex, field_tag, item_tag, list_tag, query_tags
+from fastapi_easy.core.multilayer_cache import MultiLayerCache
+from fastapi_easy.core.optimized_adapter import OptimizedSQLAlchemyAdapter
+
+
+class FakeRedis:
+    """Just enough of redis.asyncio.Redis for tag storage"""
+
+    def __init__(self):
+        self.values = {}
+        self.sets = {}
+        self.ttls = {}
+
+    async def eval(self, script, numkeys, *keys_and_args):
+        keys, args = keys_and_args[:numkeys], keys_and_args[numkeys:]
+        if script == _SET_TAGGED_SCRIPT:
+            ttl, data = args
+            await self.setex(keys[0], ttl, data)
+            for tag_key in keys[1:]:
+                self.sets.setdefault(tag_key, set()).add(keys[0])
+                if self.ttls.get(tag_key, -1) < ttl:
+                    self.ttls[tag_key] = ttl
+            return 1
+        if script == _INVALIDATE_TAGS_SCRIPT:
+            members = set().union(*(self.sets.get(key, set()) for key in keys))
+            deleted = await self.delete(*members)
+            await self.delete(*keys)
+            return deleted
+        raise NotImplementedError(script)
+
+    async def setex(self, key, ttl, data):
+        self.values[key] = data
+        self.ttls[key] = ttl
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def delete(self, *keys):
+        deleted = 0
+        for key in keys:
+            self.ttls.pop(key, None)
+            deleted += (self.values.pop(key, None) is not None) + (
+                self.sets.pop(key, None) is not None
+            )
+        return deleted
+
+
+class TestTagIndex:
+    """Test TagIndex class"""
+
+    def test_add_and_lookup(self):
+        """Test reverse lookup of keys by tag"""
+        index = TagIndex()
+        index.add("k1", {"a", "b"})
+        index.add("k2", {"b"})
+
+        assert index.keys_for({"a"}) == {"k1"}
+        assert index.keys_for({"b"}) == {"k1", "k2"}
+        assert index.tags_for("k1") == {"a", "b"}
+
+    def test_add_replaces_tags(self):
+        """Test that re-adding a key drops its old tags"""
+        index = TagIndex()
+        index.add("k1", {"a"})
+        index.add("k1", {"b"})
+
+        assert index.keys_for({"a"}) == set()
+        assert len(index) == 1
+
+    def test_discard(self):
+        """Test that discarding a key removes empty tags"""
+        index = TagIndex()
+        index.add("k1", {"a"})
+        index.discard("k1")
+        index.discard("missing")
+
+        assert index.keys_for({"a"}) == set()
+        assert len(index) == 0
+
+
+class TestQueryTags:
+    """Test query_tags helper"""
+
+    def test_filter_and_sort_fields(self):
+        """Test tags for filter, sort and returned item ids"""
+        tags = query_tags(
+            "Item",
+            filters={"name": {"field": "name", "operator": "exact", "value": "x"}, "price__gt": 1},
+            sorts={"created": "desc"},
+            item_ids=[1, None, 2],
+        )
+
+        assert tags == {
+            list_tag("Item"),
+            field_tag("Item", "name"),
+            field_tag("Item", "price"),
+            field_tag("Item", "created"),
+            item_tag("Item", 1),
+            item_tag("Item", 2),
+        }
+
+
+class TestTaggedCaches:
+    """Test invalidate_by_tags on the cache classes"""
+
+    @pytest.mark.asyncio
+    async def test_query_cache_invalidates_exact_keys(self):
+        """Test that item 1 does not match item 10"""
+        cache = QueryCache()
+        await cache.set("one", 1, tags={item_tag("Item", 1)})
+        await cache.set("ten", 10, tags={item_tag("Item", 10)})
+        await cache.set("list", [1, 10], tags={item_tag("Item", 1), item_tag("Item", 10)})
+
+        removed = await cache.invalidate_by_tags({item_tag("Item", 1)})
+
+        assert removed == 2
+        assert await cache.get("one") is None
+        assert await cache.get("list") is None
+        assert await cache.get("ten") == 10
+
+    @pytest.mark.asyncio
+    async def test_query_cache_eviction_drops_tags(self):
+        """Test that evicted keys leave the tag index"""
+        cache = QueryCache(max_size=1)
+        await cache.set("a", 1, tags={"t"})
+        await cache.set("b", 2)
+
+        assert cache.get_tags("a") == set()
+        assert await cache.invalidate_by_tags({"t"}) == 0
+
+    @pytest.mark.asyncio
+    async def test_multilayer_promotion_keeps_tags(self):
+        """Test that L2 hits promoted to L1 are still invalidated by tag"""
+        cache = MultiLayerCache()
+        await cache.set("k", "v", tier="l2", tags={"t"})
+        assert await cache.get("k") == "v"
+
+        removed = await cache.invalidate_by_tags({"t"})
+
+        assert removed == 2
+        assert await cache.get("k") is None
+
+    @pytest.mark.asyncio
+    async def test_l2_redis_cache_tag_sets(self):
+        """Test that Redis tags are stored as sets and invalidated together"""
+        cache = L2RedisCache(key_prefix="t:")
+        cache._redis = FakeRedis()
+        await cache.set("a", 1, tags={"x"})
+        await cache.set("b", 2, tags={"x", "y"})
+        await cache.set("c", 3)
+
+        assert cache._redis.sets["t:tag:x"] == {"t:a", "t:b"}
+        assert cache._redis.ttls["t:tag:x"] == cache.default_ttl
+        assert await cache.get_with_tags("b") == (2, {"x", "y"})
+
+        removed = await cache.invalidate_by_tags({"y"})
+
+        assert removed == 1
+        assert await cache.get("b") is None
+        assert await cache.get("a") == 1
+        assert await cache.get("c") == 3
+
+    @pytest.mark.asyncio
+    async def test_l2_redis_tag_sets_outlive_their_members(self):
+        """Test that a tag set expires with its longest-lived member"""
+        cache = L2RedisCache(key_prefix="t:")
+        cache._redis = FakeRedis()
+        await cache.set("long", 1, ttl=600, tags={"x"})
+        await cache.set("short", 2, ttl=60, tags={"x"})
+
+        assert cache._redis.ttls["t:tag:x"] == 600
+
+    @pytest.mark.asyncio
+    async def test_invalidation_manager_uses_tags(self):
+        """Test that the manager invalidates by tag when given a model"""
+        manager = CacheInvalidationManager()
+        cache = QueryCache()
+        await cache.set("one", 1, tags={item_tag("Item", 1)})
+        await cache.set("ten", 10, tags={item_tag("Item", 10)})
+        await cache.set("by_name", [], tags={field_tag("Item", "name")})
+
+        assert await manager.invalidate_item_cache(cache, 1, model="Item") == 1
+        assert await manager.invalidate_by_filter(cache, "name", model="Item") == 1
+        assert await cache.get("ten") == 10
+        assert manager.get_invalidation_stats()["by_type"] == {"tags": 2}
+
+
+class TestOptimizedAdapterTags:
+    """Test precise invalidation in OptimizedSQLAlchemyAdapter"""
+
+    @pytest.fixture
+    def base_adapter(self):
+        adapter = AsyncMock()
+        adapter.model = MagicMock()
+        adapter.model.__name__ = "Item"
+        adapter.pk_field = "id"
+        adapter.get_one.side_effect = lambda id: {"id": id}
+        adapter.get_all.return_value = [{"id": 1}, {"id": 2}]
+        return adapter
+
+    @pytest.mark.asyncio
+    async def test_update_keeps_unrelated_entries(self, base_adapter):
+        """Test that updating item 1 keeps item 10 and unrelated lists cached"""
+        optimized = OptimizedSQLAlchemyAdapter(base_adapter)
+        await optimized.get_one(1)
+        await optimized.get_one(10)
+        await optimized.get_all({}, {}, {"skip": 0, "limit": 10})
+        base_adapter.get_all.return_value = [{"id": 3}]
+        await optimized.get_all({}, {}, {"skip": 10, "limit": 10})
+        await optimized.get_all({}, {"name": "asc"}, {"skip": 10, "limit": 10})
+
+        await optimized.update(1, {"name": "new"})
+
+        await optimized.get_one(10)
+        assert base_adapter.get_one.call_count == 2
+        await optimized.get_one(1)
+        assert base_adapter.get_one.call_count == 3
+
+        # Page 1 returned item 1; page 2 did not and is not sorted by name
+        await optimized.get_all({}, {}, {"skip": 10, "limit": 10})
+        assert base_adapter.get_all.call_count == 3
+        await optimized.get_all({}, {}, {"skip": 0, "limit": 10})
+        await optimized.get_all({}, {"name": "asc"}, {"skip": 10, "limit": 10})
+        assert base_adapter.get_all.call_count == 5
+
+    @pytest.mark.asyncio
+    async def test_create_invalidates_lists_only(self, base_adapter):
+        """Test that creating an item keeps single-item reads cached"""
+        base_adapter.create.return_value = {"id": 3}
+        base_adapter.count.return_value = 2
+        optimized = OptimizedSQLAlchemyAdapter(base_adapter)
+        await optimized.get_one(1)
+        await optimized.count({})
+
+        await optimized.create({"name": "new"})
+
+        await optimized.get_one(1)
+        await optimized.count({})
+        assert base_adapter.get_one.call_count == 1
+        assert base_adapter.count.call_count == 2
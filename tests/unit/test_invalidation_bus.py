@@ -0,0 +1,297 @@
+"""Tests for the cross-process cache invalidation bus"""
+
+import asyncio
+import json
+import os
+import socket
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from fastapi_easy.core.advanced_cache import AdvancedCacheManager
+from fastapi_easy.core.cache import QueryCache
+from fastapi_easy.core.invalidation_bus import (
+    InMemoryTransport,
+    InvalidationBus,
+    InvalidationTransport,
+    UnixSocketTransport,
+)
+from fastapi_easy.core.multilayer_cache import MultiLayerCache
+from fastapi_easy.core.optimized_adapter import OptimizedSQLAlchemyAdapter
+from fastapi_easy.core.response_cache import ResponseCache
+
+
+class RecordingTransport(InvalidationTransport):
+    """Keeps published payloads instead of delivering them"""
+
+    def __init__(self):
+        self.payloads = []
+
+    async def start(self, handler):
+        pass
+
+    async def publish(self, payload):
+        self.payloads.append(json.loads(payload))
+
+    async def close(self):
+        pass
+
+
+async def make_worker(channel: str):
+    cache = QueryCache()
+    bus = InvalidationBus(InMemoryTransport(channel), flush_interval=0)
+    bus.subscribe(cache)
+    await bus.start()
+    return cache, bus
+
+
+class TestInvalidationBus:
+    """Test batching and delivery"""
+
+    @pytest.mark.asyncio
+    async def test_burst_is_batched_and_deduplicated(self):
+        """Test repeated invalidations in one window become one message"""
+        transport = RecordingTransport()
+        bus = InvalidationBus(transport, flush_interval=0.01)
+        for _ in range(3):
+            bus.publish(keys=["a", "b"], tags=["list:user"])
+        await asyncio.sleep(0.05)
+
+        assert len(transport.payloads) == 1
+        assert transport.payloads[0]["keys"] == ["a", "b"]
+        assert transport.payloads[0]["tags"] == ["list:user"]
+        assert bus.stats["deduplicated"] == 6
+
+    @pytest.mark.asyncio
+    async def test_large_batches_are_split(self):
+        """Test a full buffer is sent right away in chunks of max_batch"""
+        transport = RecordingTransport()
+        bus = InvalidationBus(transport, flush_interval=10, max_batch=4)
+        bus.publish(keys=[f"k{i}" for i in range(10)])
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        assert [len(p["keys"]) for p in transport.payloads] == [4, 4, 2]
+        await bus.close()
+
+    @pytest.mark.asyncio
+    async def test_remote_workers_apply_invalidations(self):
+        """Test keys and tags are dropped in other workers but not re-applied locally"""
+        cache_a, bus_a = await make_worker("test-remote")
+        cache_b, bus_b = await make_worker("test-remote")
+        for cache in (cache_a, cache_b):
+            await cache.set("user:1", 1, tags={"item:user:1"})
+            await cache.set("users", [1], tags={"list:user"})
+
+        bus_a.publish(keys=["user:1"], tags=["list:user"])
+        await bus_a.flush()
+
+        assert await cache_b.get("user:1") is None
+        assert await cache_b.get("users") is None
+        # The publisher handles its own cache locally
+        assert await cache_a.get("user:1") == 1
+        assert bus_b.stats["received"] == 1
+        assert bus_a.stats["received"] == 0
+
+        await bus_a.close()
+        await bus_b.close()
+
+    @pytest.mark.asyncio
+    async def test_clear_supersedes_keys(self):
+        """Test a queued clear empties remote caches"""
+        cache_a, bus_a = await make_worker("test-clear")
+        cache_b, bus_b = await make_worker("test-clear")
+        await cache_b.set("x", 1)
+
+        bus_a.publish(keys=["y"], clear=True)
+        await bus_a.flush()
+
+        assert await cache_b.get("x") is None
+        await bus_a.close()
+        await bus_b.close()
+
+
+def make_bus(channel: str) -> InvalidationBus:
+    return InvalidationBus(InMemoryTransport(channel), flush_interval=0)
+
+
+class TestCachesOnBus:
+    """Test caches given an invalidation bus publish and subscribe"""
+
+    @pytest.mark.asyncio
+    async def test_query_cache_invalidations_reach_other_worker(self):
+        """Test deletes and tag invalidations are applied without being echoed"""
+        buses = [make_bus("test-query-cache") for _ in range(2)]
+        caches = [QueryCache(invalidation_bus=bus) for bus in buses]
+        for bus, cache in zip(buses, caches):
+            await bus.start()
+            await cache.set("user:1", 1, tags={"item:user:1"})
+            await cache.set("users", [1], tags={"list:user"})
+
+        await caches[0].delete("user:1")
+        await caches[0].invalidate_by_tags({"list:user"})
+        await buses[0].flush()
+
+        assert await caches[1].get("user:1") is None
+        assert await caches[1].get("users") is None
+        assert buses[0].stats["published"] == 1
+        assert buses[1].stats["published"] == 0
+        assert buses[1].stats["received"] == 1
+
+        for bus in buses:
+            await bus.close()
+
+    @pytest.mark.asyncio
+    async def test_multilayer_cache_clear_reaches_other_worker(self):
+        """Test a clear empties both layers of the other worker's cache"""
+        buses = [make_bus("test-multilayer") for _ in range(2)]
+        caches = [MultiLayerCache(invalidation_bus=bus) for bus in buses]
+        for bus in buses:
+            await bus.start()
+        await caches[1].set("x", 1)
+
+        await caches[0].clear()
+        await buses[0].flush()
+
+        assert await caches[1].l1_cache.get("x") is None
+        assert await caches[1].l2_cache.get("x") is None
+        assert buses[1].stats["published"] == 0
+
+        for bus in buses:
+            await bus.close()
+
+    @pytest.mark.asyncio
+    async def test_response_cache_invalidations_reach_other_worker(self):
+        """Test tag invalidations drop the other worker's cached responses"""
+        buses = [make_bus("test-response") for _ in range(2)]
+        caches = [ResponseCache(invalidation_bus=bus) for bus in buses]
+        for bus, cache in zip(buses, caches):
+            await bus.start()
+            cache.set("GET /users", b"[]", tags={"list:user"})
+
+        caches[0].invalidate({"list:user"})
+        await buses[0].flush()
+
+        assert len(caches[1]) == 0
+        assert buses[1].stats["published"] == 0
+
+        for bus in buses:
+            await bus.close()
+
+    @pytest.mark.asyncio
+    async def test_adapter_write_reaches_other_worker(self):
+        """Test a create through one adapter drops the other's cached lists"""
+        base_adapter = AsyncMock()
+        base_adapter.model = MagicMock()
+        base_adapter.model.__name__ = "Item"
+        base_adapter.pk_field = "id"
+        base_adapter.get_all.return_value = [{"id": 1}]
+        base_adapter.create.return_value = {"id": 2}
+        buses = [make_bus("test-adapter") for _ in range(2)]
+        adapters = [
+            OptimizedSQLAlchemyAdapter(base_adapter, invalidation_bus=bus) for bus in buses
+        ]
+        for bus in buses:
+            await bus.start()
+        for adapter in adapters:
+            await adapter.get_all({}, {}, {"skip": 0, "limit": 10})
+        assert base_adapter.get_all.call_count == 2
+
+        await adapters[0].create({"name": "new"})
+        await buses[0].flush()
+
+        base_adapter.get_all.return_value = [{"id": 1}, {"id": 2}]
+        assert await adapters[1].get_all({}, {}, {"skip": 0, "limit": 10}) == [
+            {"id": 1},
+            {"id": 2},
+        ]
+        assert base_adapter.get_all.call_count == 3
+
+        for bus in buses:
+            await bus.close()
+
+
+class TestUnixSocketTransport:
+    """Test the local datagram transport"""
+
+    @pytest.mark.asyncio
+    async def test_delivers_to_other_sockets(self, tmp_path):
+        """Test a payload reaches every other worker's socket"""
+        received = asyncio.Queue()
+
+        async def handler(payload):
+            await received.put(payload)
+
+        sender = UnixSocketTransport(str(tmp_path))
+        receiver = UnixSocketTransport(str(tmp_path))
+        await sender.start(handler)
+        await receiver.start(handler)
+        try:
+            await sender.publish(b"hello")
+            assert await asyncio.wait_for(received.get(), 1) == b"hello"
+            assert received.empty()
+        finally:
+            await sender.close()
+            await receiver.close()
+
+    @pytest.mark.asyncio
+    async def test_removes_stale_sockets(self, tmp_path):
+        """Test a socket file without a listener is cleaned up"""
+        stale = tmp_path / "dead.sock"
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        sock.bind(str(stale))
+        sock.close()
+
+        sender = UnixSocketTransport(str(tmp_path))
+        await sender.start(lambda payload: None)
+        await sender.publish(b"hello")
+        await sender.close()
+
+        assert not stale.exists()
+
+    @pytest.mark.asyncio
+    async def test_unsafe_directory_refused(self, tmp_path):
+        """Test a directory other users can write or reach is not used"""
+        shared = tmp_path / "shared"
+        shared.mkdir()
+        os.chmod(shared, 0o777)
+        with pytest.raises(PermissionError):
+            await UnixSocketTransport(str(shared)).start(lambda payload: None)
+
+        link = tmp_path / "link"
+        link.symlink_to(tmp_path)
+        with pytest.raises(PermissionError):
+            await UnixSocketTransport(str(link)).start(lambda payload: None)
+
+
+class TestAdvancedCacheManagerBus:
+    """Test AdvancedCacheManager publishes and subscribes"""
+
+    @pytest.mark.asyncio
+    async def test_delete_reaches_other_worker_l1(self):
+        """Test a delete in one manager drops the entry from another's L1"""
+        managers = [
+            AdvancedCacheManager(
+                enable_l2=False,
+                invalidation_bus=InvalidationBus(
+                    InMemoryTransport("test-manager"), flush_interval=0
+                ),
+            )
+            for _ in range(2)
+        ]
+        for manager in managers:
+            await manager.start()
+            await manager.set("user:1", {"id": 1}, tags={"item:user:1"})
+            await manager.set("users", [1], tags={"list:user"})
+
+        await managers[0].delete("user:1")
+        await managers[0].invalidate_by_tags({"list:user"})
+        await managers[0].invalidation_bus.flush()
+
+        assert await managers[1].get("user:1") is None
+        assert await managers[1].get("users") is None
+        assert managers[0].get_comprehensive_stats()["invalidation_bus"]["published"] == 1
+
+        for manager in managers:
+            await manager.close()
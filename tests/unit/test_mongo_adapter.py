@@ -1,6 +1,7 @@
 import pytest
 from unittest.mock import MagicMock, AsyncMock
 from fastapi_easy.backends.mongo import MongoAdapter
+from fastapi_easy.core.errors import BadRequestError
 
 
 @pytest.fixture
@@ -85,6 +86,108 @@ async def test_get_one(mock_collection):
     mock_collection.find_one.assert_called_with({"_id": "123"})
 
 
+@pytest.mark.asyncio
+async def test_get_all_with_fields(mock_collection):
+    adapter = MongoAdapter(collection=mock_collection)
+
+    cursor = MagicMock()
+    cursor.skip = MagicMock(return_value=cursor)
+    cursor.limit = MagicMock(return_value=cursor)
+    cursor.to_list = AsyncMock(return_value=[{"name": "John"}])
+    mock_collection.find.return_value = cursor
+
+    result = await adapter.get_all(
+        filters={}, sorts={}, pagination={"skip": 0, "limit": 10}, fields=["name"]
+    )
+
+    assert result == [{"name": "John"}]
+    mock_collection.find.assert_called_with({}, projection={"name": 1, "_id": 0})
+
+
+@pytest.mark.asyncio
+async def test_get_one_with_fields(mock_collection):
+    adapter = MongoAdapter(collection=mock_collection)
+    mock_collection.find_one.return_value = {"_id": "123", "name": "John"}
+
+    await adapter.get_one("123", fields=["_id", "name"])
+
+    mock_collection.find_one.assert_called_with({"_id": "123"}, projection={"_id": 1, "name": 1})
+
+
+@pytest.mark.asyncio
+async def test_get_all_with_include(mock_collection):
+    adapter = MongoAdapter(
+        collection=mock_collection,
+        relations={
+            "author": {"from": "authors", "localField": "author_id", "foreignField": "_id"},
+            "tags": {"from": "tags", "localField": "tag_ids", "foreignField": "_id", "many": True},
+        },
+    )
+    cursor = MagicMock()
+    cursor.to_list = AsyncMock(return_value=[{"title": "a", "author": {"name": "ann"}}])
+    mock_collection.aggregate = MagicMock(return_value=cursor)
+
+    result = await adapter.get_all(
+        filters={},
+        sorts={"title": "asc"},
+        pagination={"skip": 5, "limit": 10},
+        include=["author", "tags"],
+    )
+
+    assert result == [{"title": "a", "author": {"name": "ann"}}]
+    mock_collection.aggregate.assert_called_with(
+        [
+            {"$match": {}},
+            {"$sort": {"title": 1}},
+            {"$skip": 5},
+            {"$limit": 10},
+            {
+                "$lookup": {
+                    "from": "authors",
+                    "localField": "author_id",
+                    "foreignField": "_id",
+                    "as": "author",
+                }
+            },
+            {"$unwind": {"path": "$author", "preserveNullAndEmptyArrays": True}},
+            {
+                "$lookup": {
+                    "from": "tags",
+                    "localField": "tag_ids",
+                    "foreignField": "_id",
+                    "as": "tags",
+                }
+            },
+        ]
+    )
+    mock_collection.find.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_one_with_include(mock_collection):
+    adapter = MongoAdapter(
+        collection=mock_collection,
+        relations={"author": {"from": "authors", "localField": "author_id", "foreignField": "_id"}},
+    )
+    cursor = MagicMock()
+    cursor.to_list = AsyncMock(return_value=[])
+    mock_collection.aggregate = MagicMock(return_value=cursor)
+
+    assert await adapter.get_one("123", include=["author"]) is None
+    pipeline = mock_collection.aggregate.call_args[0][0]
+    assert pipeline[:2] == [{"$match": {"_id": "123"}}, {"$limit": 1}]
+
+
+@pytest.mark.asyncio
+async def test_get_all_with_unknown_include(mock_collection):
+    adapter = MongoAdapter(collection=mock_collection)
+
+    with pytest.raises(BadRequestError):
+        await adapter.get_all(
+            filters={}, sorts={}, pagination={"skip": 0, "limit": 10}, include=["author"]
+        )
+
+
 @pytest.mark.asyncio
 async def test_create(mock_collection):
     adapter = MongoAdapter(collection=mock_collection)
@@ -397,3 +500,140 @@ async def test_count_error_handling(mock_collection):
 
     with pytest.raises(AppError, match="Database error"):
         await adapter.count(filters={})
+
+
+@pytest.mark.asyncio
+async def test_get_all_with_cursor(mock_collection):
+    from fastapi_easy.utils.pagination import encode_cursor
+
+    adapter = MongoAdapter(collection=mock_collection)
+
+    cursor = MagicMock()
+    cursor.sort = MagicMock()
+    cursor.skip = MagicMock(return_value=cursor)
+    cursor.limit = MagicMock(return_value=cursor)
+    cursor.to_list = AsyncMock(return_value=[{"_id": 3, "name": "b"}, {"_id": 2, "name": "b"}])
+    mock_collection.find.return_value = cursor
+
+    token = encode_cursor({"_id": 1, "name": "b"}, [("name", "asc"), ("_id", "asc")])
+    result = await adapter.get_all(
+        filters={"age": {"field": "age", "operator": "gt", "value": 18}},
+        sorts={"name": "asc"},
+        pagination={"before": token, "limit": 2},
+    )
+
+    # before pages are fetched in inverted order and flipped back
+    assert result == [{"_id": 2, "name": "b"}, {"_id": 3, "name": "b"}]
+    mock_collection.find.assert_called_with(
+        {
+            "$and": [
+                {"age": {"$gt": 18}},
+                {
+                    "$or": [
+                        {"name": {"$lt": "b"}},
+                        # null sorts first, so it comes before any name
+                        {"name": None},
+                        {"name": "b", "_id": {"$lt": 1}},
+                    ]
+                },
+            ]
+        }
+    )
+    cursor.sort.assert_called_with([("name", -1), ("_id", -1)])
+    cursor.skip.assert_not_called()
+    cursor.limit.assert_called_with(2)
+
+
+@pytest.mark.asyncio
+async def test_stream(mock_collection):
+    adapter = MongoAdapter(collection=mock_collection)
+
+    documents = [{"_id": 1, "name": "a"}, {"_id": 2, "name": "b"}]
+
+    class Cursor:
+        def __init__(self):
+            self.sort = MagicMock()
+            self.batch_size = MagicMock()
+
+        async def __aiter__(self):
+            for document in documents:
+                yield document
+
+    cursor = Cursor()
+    mock_collection.find.return_value = cursor
+
+    result = [
+        document
+        async for document in adapter.stream(
+            {"age": {"field": "age", "operator": "gt", "value": 18}},
+            {"name": "desc"},
+            batch_size=500,
+        )
+    ]
+
+    assert result == documents
+    mock_collection.find.assert_called_with({"age": {"$gt": 18}})
+    cursor.sort.assert_called_with([("name", -1)])
+    cursor.batch_size.assert_called_with(500)
+
+
+@pytest.mark.asyncio
+async def test_bulk_create(mock_collection):
+    adapter = MongoAdapter(collection=mock_collection)
+    mock_collection.bulk_write = AsyncMock()
+
+    items = [{"name": "a"}, {"name": "b"}]
+    result = await adapter.bulk_create(items)
+
+    assert result == items
+    operations = mock_collection.bulk_write.call_args[0][0]
+    assert len(operations) == 2
+    assert mock_collection.bulk_write.call_args[1] == {"ordered": True}
+
+
+@pytest.mark.asyncio
+async def test_bulk_update(mock_collection):
+    adapter = MongoAdapter(collection=mock_collection, pk_field="id")
+    mock_collection.bulk_write = AsyncMock()
+
+    cursor = MagicMock()
+    cursor.to_list = AsyncMock(return_value=[{"id": 2, "name": "y"}, {"id": 1, "name": "x"}])
+    mock_collection.find.return_value = cursor
+
+    result = await adapter.bulk_update(
+        [{"id": 1, "name": "x"}, {"id": 2, "name": "y"}, {"id": 3, "name": "z"}]
+    )
+
+    # Returned in input order, missing ids skipped
+    assert result == [{"id": 1, "name": "x"}, {"id": 2, "name": "y"}]
+    assert len(mock_collection.bulk_write.call_args[0][0]) == 3
+    mock_collection.find.assert_called_with({"id": {"$in": [1, 2, 3]}})
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_maps_only_duplicate_keys_to_conflict(mock_collection):
+    """Test bulk update raises 409 for duplicate keys and 500 for other write errors"""
+    from fastapi_easy.core.errors import AppError, ConflictError
+    from pymongo.errors import BulkWriteError
+
+    adapter = MongoAdapter(collection=mock_collection, pk_field="id")
+    mock_collection.bulk_write = AsyncMock(
+        side_effect=BulkWriteError({"writeErrors": [{"code": 11000, "errmsg": "duplicate"}]})
+    )
+    with pytest.raises(ConflictError, match="Update conflict"):
+        await adapter.bulk_update([{"id": 1, "name": "x"}])
+
+    mock_collection.bulk_write.side_effect = BulkWriteError(
+        {"writeErrors": [{"code": 121, "errmsg": "Document failed validation"}]}
+    )
+    with pytest.raises(AppError, match="Database error") as exc_info:
+        await adapter.bulk_update([{"id": 1, "name": "x"}])
+    assert exc_info.value.status_code == 500
+
+@pytest.mark.asyncio
+async def test_bulk_delete(mock_collection):
+    adapter = MongoAdapter(collection=mock_collection)
+    mock_collection.delete_many.return_value = MagicMock(deleted_count=2)
+
+    assert await adapter.bulk_delete([1, 2, 3]) == 2
+    mock_collection.delete_many.assert_called_with({"_id": {"$in": [1, 2, 3]}})
@@ -106,6 +106,37 @@ class TestOptimizedAdapter:
         assert len(result2) == 2
         assert call_count == 2  # Called twice
 
+    @pytest.mark.asyncio
+    async def test_get_one_caches_not_found(self, mock_adapter):
+        """Test a missing id is answered from a tombstone until it is created"""
+        mock_adapter.get_one.return_value = None
+        mock_adapter.create.return_value = {"id": 5, "name": "new"}
+
+        optimized = OptimizedSQLAlchemyAdapter(mock_adapter, enable_cache=True)
+
+        assert await optimized.get_one(5) is None
+        assert await optimized.get_one(5) is None
+        assert mock_adapter.get_one.call_count == 1
+
+        await optimized.create({"name": "new"})
+        mock_adapter.get_one.return_value = {"id": 5, "name": "new"}
+
+        assert await optimized.get_one(5) == {"id": 5, "name": "new"}
+        assert mock_adapter.get_one.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_negative_cache_disabled(self, mock_adapter):
+        """Test negative_ttl=0 queries missing ids every time"""
+        mock_adapter.get_one.return_value = None
+
+        optimized = OptimizedSQLAlchemyAdapter(
+            mock_adapter, enable_cache=True, cache_config={"negative_ttl": 0}
+        )
+
+        await optimized.get_one(5)
+        await optimized.get_one(5)
+        assert mock_adapter.get_one.call_count == 2
+
     @pytest.mark.asyncio
     async def test_cache_clear_on_delete_all(self, mock_adapter):
         """Test cache clear on delete_all"""
@@ -1,10 +1,13 @@
 """Tests for query projection module"""
 
+import pytest
+
 from fastapi_easy.core.query_projection import (
     QueryProjection,
     ProjectionBuilder,
     create_projection,
     create_projection_builder,
+    parse_fields,
 )
 
 
@@ -140,3 +143,21 @@ class TestFactoryFunctions:
         builder = create_projection_builder()
         assert isinstance(builder, ProjectionBuilder)
         assert builder.fields == []
+
+
+class TestParseFields:
+    """Test parse_fields"""
+
+    def test_parse_fields(self):
+        """Test names are stripped and de-duplicated in request order"""
+        assert parse_fields(" name, id ,name", ["id", "name", "price"]) == ["name", "id"]
+
+    def test_parse_fields_empty(self):
+        """Test a missing or blank value means no projection"""
+        assert parse_fields(None, ["id"]) is None
+        assert parse_fields(" , ", ["id"]) is None
+
+    def test_parse_fields_unknown(self):
+        """Test unknown field names are rejected"""
+        with pytest.raises(ValueError, match="Unknown fields: secret"):
+            parse_fields("id,secret", ["id", "name"])
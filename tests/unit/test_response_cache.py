@@ -0,0 +1,141 @@
+"""Tests for the response-level cache"""
+
+import asyncio
+
+from starlette.requests import Request
+
+from fastapi_easy.core.advanced_cache import L1MemoryCache
+from fastapi_easy.core.cache import NOT_FOUND
+from fastapi_easy.core.cache_tags import item_tag, list_tag
+from fastapi_easy.core.response_cache import (
+    CachedResponse,
+    ResponseCache,
+    etag_matches,
+    make_etag,
+)
+
+
+def make_request(path: str, query: str = "") -> Request:
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": path,
+            "query_string": query.encode(),
+            "headers": [],
+        }
+    )
+
+
+class TestCachedResponse:
+    """Test CachedResponse"""
+
+    def test_etag_computed_once(self):
+        """Test the ETag is derived from the body and reused"""
+        entry = CachedResponse(b'[{"id":1}]')
+
+        assert entry.etag == make_etag(b'[{"id":1}]')
+        assert entry.nbytes == len(b'[{"id":1}]')
+
+    def test_render(self):
+        """Test a hit replays the body with its ETag and extra headers"""
+        entry = CachedResponse(b"[]", headers=((b"x-total-count", b"0"),))
+
+        response = entry.render()
+
+        assert response.body == b"[]"
+        assert response.headers["etag"] == entry.etag
+        assert response.headers["x-total-count"] == "0"
+        assert response.media_type == "application/json"
+
+    def test_render_not_modified(self):
+        """Test a matching If-None-Match yields an empty 304"""
+        entry = CachedResponse(b"[]")
+
+        response = entry.render(f'"other", W/{entry.etag}')
+
+        assert response.status_code == 304
+        assert response.body == b""
+
+    def test_etag_matches(self):
+        """Test If-None-Match parsing"""
+        assert etag_matches('"a"', "*")
+        assert etag_matches('"a"', '"b", "a"')
+        assert not etag_matches('"a"', '"b"')
+        assert not etag_matches('"a"', None)
+
+
+class TestResponseCache:
+    """Test ResponseCache"""
+
+    def test_make_key_ignores_query_order(self):
+        """Test equivalent query strings share a key"""
+        first = ResponseCache.make_key(make_request("/items/", "limit=2&skip=0"))
+        second = ResponseCache.make_key(make_request("/items/", "skip=0&limit=2"))
+
+        assert first == second
+        assert first != ResponseCache.make_key(make_request("/items/", "skip=2&limit=2"))
+
+    def test_get_set(self):
+        """Test hits and misses are counted"""
+        cache = ResponseCache()
+
+        assert cache.get("k") is None
+        cache.set("k", b"[1]")
+        assert cache.get("k").body == b"[1]"
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["bytes"] == 3
+
+    def test_invalidate_by_tags(self):
+        """Test only responses registered under the tags are dropped"""
+        cache = ResponseCache()
+        cache.set("list", b"[]", {list_tag("Item"), item_tag("Item", 1)})
+        cache.set("one", b"{}", {item_tag("Item", 1)})
+        cache.set("two", b"{}", {item_tag("Item", 2)})
+
+        assert cache.invalidate({item_tag("Item", 1)}) == 2
+        assert cache.get("list") is None
+        assert cache.get("two") is not None
+
+    def test_not_found_tombstone(self):
+        """Test cached misses are returned as NOT_FOUND and dropped by their tag"""
+        cache = ResponseCache()
+        cache.set_not_found("missing", [item_tag("Item", 7)], ttl=5)
+
+        assert cache.get("missing") is NOT_FOUND
+        assert cache.stats()["bytes"] == 0
+
+        cache.invalidate([item_tag("Item", 7)])
+        assert cache.get("missing") is None
+
+    def test_eviction_drops_tags(self):
+        """Test evicted responses are removed from the tag index"""
+        cache = ResponseCache(max_size=1)
+        cache.set("a", b"1", {"t"})
+        cache.set("b", b"2", {"t"})
+
+        assert len(cache) == 1
+        assert cache.invalidate({"t"}) == 1
+
+
+async def test_l1_measures_bytes_without_pickling(monkeypatch):
+    """Test L1 size accounting uses len() for bytes and cached responses"""
+    cache = L1MemoryCache(max_size=10)
+    try:
+
+        def fail(value):
+            raise AssertionError("value was pickled")
+
+        monkeypatch.setattr(cache, "_serialize_value", fail)
+
+        assert await cache.set("raw", b"x" * 100)
+        assert await cache.set("response", CachedResponse(b"y" * 2048))
+        assert cache._cache.get("raw").size_bytes == 100
+        assert cache._cache.get("response").size_bytes == 2048
+    finally:
+        cache._cleanup_task.cancel()
+        cache._stats_task.cancel()
+        await asyncio.sleep(0)
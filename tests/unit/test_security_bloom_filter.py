@@ -0,0 +1,73 @@
+"""Unit tests for Bloom filters"""
+
+import time
+from unittest.mock import patch
+
+import pytest
+
+from fastapi_easy.security.bloom_filter import BloomFilter, TimePartitionedBloomFilter
+
+
+class TestBloomFilter:
+    """Test the fixed-size Bloom filter"""
+
+    def test_no_false_negatives(self):
+        """Test every added item is reported present"""
+        bloom = BloomFilter(capacity=1000)
+        items = [f"jti-{i}" for i in range(1000)]
+        for item in items:
+            bloom.add(item)
+
+        assert all(item in bloom for item in items)
+        assert bloom.is_full
+
+    def test_false_positive_rate(self):
+        """Test the false positive rate stays near its target at capacity"""
+        bloom = BloomFilter(capacity=1000, false_positive_rate=0.01)
+        for i in range(1000):
+            bloom.add(f"jti-{i}")
+
+        false_positives = sum(f"other-{i}" in bloom for i in range(10000))
+        assert false_positives < 300
+
+    def test_invalid_arguments(self):
+        """Test capacity and rate are validated"""
+        with pytest.raises(ValueError):
+            BloomFilter(capacity=0)
+        with pytest.raises(ValueError):
+            BloomFilter(false_positive_rate=1.5)
+
+
+class TestTimePartitionedBloomFilter:
+    """Test expiry-partitioned filters"""
+
+    def test_items_expire_with_their_bucket(self):
+        """Test items are forgotten once their bucket's expiries have passed"""
+        bloom = TimePartitionedBloomFilter(bucket_seconds=60)
+        now = time.time()
+        bloom.add("short", now + 30)
+        bloom.add("long", now + 3600)
+
+        assert bloom.might_contain("short")
+        with patch("fastapi_easy.security.bloom_filter.time.time", return_value=now + 120):
+            assert not bloom.might_contain("short")
+            assert bloom.might_contain("long")
+            assert len(bloom) == 1
+
+    def test_expired_items_not_added(self):
+        """Test an already expired item is ignored"""
+        bloom = TimePartitionedBloomFilter()
+        bloom.add("old", time.time() - 1)
+
+        assert not bloom.might_contain("old")
+        assert len(bloom) == 0
+
+    def test_full_bucket_grows(self):
+        """Test a full bucket keeps items past its filter's capacity"""
+        bloom = TimePartitionedBloomFilter(bucket_capacity=10)
+        expires_at = time.time() + 60
+        for i in range(50):
+            bloom.add(f"jti-{i}", expires_at)
+
+        assert len(bloom) == 50
+        assert all(bloom.might_contain(f"jti-{i}") for i in range(50))
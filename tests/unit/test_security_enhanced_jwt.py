@@ -0,0 +1,356 @@
+"""Unit tests for enhanced JWT authentication"""
+
+import asyncio
+import fnmatch
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import jwt
+import pytest
+
+from fastapi_easy.security import InvalidTokenError, TokenExpiredError, TokenPayload
+from fastapi_easy.security.enhanced_jwt import (
+    EnhancedJWTAuth,
+    TokenBlacklist,
+    VerifiedTokenCache,
+)
+
+
+def make_payload(sub: str = "user123", exp_in: float = 60) -> TokenPayload:
+    now = int(time.time())
+    return TokenPayload(sub=sub, exp=int(now + exp_in), iat=now)
+
+
+class FakePubSub:
+    """Pub/sub handle of FakeRedis"""
+
+    def __init__(self, server):
+        self.server = server
+        self.queue = asyncio.Queue()
+
+    async def subscribe(self, channel):
+        self.server.subscribers.setdefault(channel, []).append(self.queue)
+
+    async def listen(self):
+        while True:
+            yield await self.queue.get()
+
+    async def unsubscribe(self, channel):
+        self.server.subscribers[channel].remove(self.queue)
+
+    async def close(self):
+        pass
+
+
+class FakeRedis:
+    """In-process stand-in for the Redis commands TokenBlacklist uses"""
+
+    def __init__(self):
+        self.data = {}
+        self.subscribers = {}
+        self.exists_calls = 0
+
+    async def setex(self, key, ttl, value):
+        self.data[key] = (value, time.time() + ttl)
+
+    async def exists(self, *keys):
+        self.exists_calls += 1
+        self.exists_keys = list(keys)
+        return sum(key in self.data and self.data[key][1] > time.time() for key in keys)
+
+    async def ttl(self, key):
+        return int(self.data[key][1] - time.time()) if key in self.data else -2
+
+    async def scan(self, cursor, match="*", count=10):
+        return 0, [key for key in self.data if fnmatch.fnmatch(key, match)]
+
+    async def publish(self, channel, message):
+        for queue in self.subscribers.get(channel, []):
+            await queue.put({"type": "message", "data": message})
+
+    def pubsub(self, ignore_subscribe_messages=False):
+        return FakePubSub(self)
+
+
+def in_an_hour() -> datetime:
+    return datetime.now(timezone.utc) + timedelta(hours=1)
+
+
+class TestVerifiedTokenCache:
+    """Test the verified-token cache"""
+
+    def test_get_and_set(self):
+        """Test a stored payload is returned for the same token only"""
+        cache = VerifiedTokenCache(max_size=10)
+        payload = make_payload()
+        cache.set("token-a", payload)
+
+        assert cache.get("token-a") is payload
+        assert cache.get("token-b") is None
+        assert cache.get_stats()["hits"] == 1
+        assert cache.get_stats()["misses"] == 1
+
+    def test_entries_expire_with_token(self):
+        """Test an entry is dropped once the token's exp has passed"""
+        cache = VerifiedTokenCache()
+        cache.set("token", make_payload(exp_in=-1))
+
+        assert cache.get("token") is None
+        assert cache.get_stats()["size"] == 0
+
+    def test_bounded_lru(self):
+        """Test the least recently used token is evicted when full"""
+        cache = VerifiedTokenCache(max_size=2)
+        cache.set("a", make_payload())
+        cache.set("b", make_payload())
+        cache.get("a")
+        cache.set("c", make_payload())
+
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+        assert cache.get("c") is not None
+
+    def test_discard_subject(self):
+        """Test all tokens of a subject are forgotten together"""
+        cache = VerifiedTokenCache()
+        cache.set("a1", make_payload("alice"))
+        cache.set("a2", make_payload("alice"))
+        cache.set("b1", make_payload("bob"))
+
+        assert cache.discard_subject("alice") == 2
+        assert cache.get("a1") is None
+        assert cache.get("a2") is None
+        assert cache.get("b1") is not None
+
+    def test_invalid_max_size(self):
+        """Test max_size must be positive"""
+        with pytest.raises(ValueError):
+            VerifiedTokenCache(max_size=0)
+
+
+class TestEnhancedJWTAuthVerifiedCache:
+    """Test EnhancedJWTAuth skips repeated verification"""
+
+    @pytest.fixture
+    def auth(self):
+        return EnhancedJWTAuth(secret_key="test-secret-key")
+
+    @pytest.mark.asyncio
+    async def test_token_decoded_once(self, auth):
+        """Test a second verification is served from the cache"""
+        token, _ = auth.create_access_token("user123", roles=["admin"])
+
+        with patch(
+            "fastapi_easy.security.enhanced_jwt.jwt.get_unverified_header",
+            wraps=jwt.get_unverified_header,
+        ) as parse_header:
+            first = await auth.verify_token(token)
+            second = await auth.verify_token(token)
+
+        assert parse_header.call_count == 1
+        assert second is first
+        assert second.roles == ["admin"]
+
+    @pytest.mark.asyncio
+    async def test_invalid_tokens_not_cached(self, auth):
+        """Test failures are not remembered"""
+        token, _ = auth.create_access_token("user123", expires_delta=timedelta(seconds=-1))
+
+        for _ in range(2):
+            with pytest.raises(TokenExpiredError):
+                await auth.verify_token(token)
+        assert auth.verified_cache.get_stats()["size"] == 0
+
+    @pytest.mark.asyncio
+    async def test_revoke_token(self, auth):
+        """Test a revoked token is rejected despite being cached"""
+        token, _ = auth.create_access_token("user123")
+        await auth.verify_token(token)
+
+        assert await auth.revoke_token(token)
+        assert auth.verified_cache.get(token) is None
+        with pytest.raises(InvalidTokenError):
+            await auth.verify_token(token)
+
+    @pytest.mark.asyncio
+    async def test_revoke_user_tokens(self, auth):
+        """Test revoking a user's tokens drops them from the cache"""
+        token, _ = auth.create_access_token("user123")
+        other, _ = auth.create_access_token("other")
+        await auth.verify_token(token)
+        await auth.verify_token(other)
+
+        await auth.revoke_user_tokens("user123")
+
+        assert auth.verified_cache.get(token) is None
+        assert auth.verified_cache.get(other) is not None
+
+    @pytest.mark.asyncio
+    async def test_key_rotation_clears_cache(self, auth):
+        """Test tokens signed with a removed key fail after rotation"""
+        token, _ = auth.create_access_token("user123")
+        await auth.verify_token(token)
+
+        for _ in range(3):
+            auth.rotate_keys()
+
+        assert auth.verified_cache.get_stats()["size"] == 0
+        with pytest.raises(InvalidTokenError):
+            await auth.verify_token(token)
+
+    @pytest.mark.asyncio
+    async def test_cache_disabled(self, auth):
+        """Test a cache size of 0 verifies every time"""
+        auth = EnhancedJWTAuth(secret_key="test-secret-key", verified_cache_size=0)
+        token, _ = auth.create_access_token("user123")
+
+        with patch(
+            "fastapi_easy.security.enhanced_jwt.jwt.get_unverified_header",
+            wraps=jwt.get_unverified_header,
+        ) as parse_header:
+            await auth.verify_token(token)
+            await auth.verify_token(token)
+
+        assert auth.verified_cache is None
+        assert parse_header.call_count == 2
+
+
+class TestTokenBlacklist:
+    """Test the blacklist and its revocation filter"""
+
+    @pytest.fixture
+    def auth(self):
+        return EnhancedJWTAuth(secret_key="test-secret-key")
+
+    @pytest.mark.asyncio
+    async def test_memory_stores_digests_with_expiry(self, auth):
+        """Test memory mode keeps jti digests, not tokens, and expires them"""
+        blacklist = TokenBlacklist()
+        token, jti = auth.create_access_token("user123")
+        assert await blacklist.blacklist_token(token, in_an_hour())
+
+        assert await blacklist.is_blacklisted(token)
+        assert all(isinstance(key, bytes) for key in blacklist.memory_blacklist)
+        assert token.encode() not in blacklist.memory_blacklist
+
+        with patch("fastapi_easy.security.enhanced_jwt.time.time", return_value=time.time() + 7200):
+            assert not await blacklist.is_blacklisted(token)
+        assert not blacklist.memory_blacklist
+
+    @pytest.mark.asyncio
+    async def test_unstarted_filter_asks_redis(self, auth):
+        """Test every check goes to Redis until the filter is loaded"""
+        redis = FakeRedis()
+        blacklist = TokenBlacklist(redis_client=redis)
+        token, _ = auth.create_access_token("user123")
+
+        assert not await blacklist.is_blacklisted(token)
+        assert redis.exists_calls == 1
+
+    @pytest.mark.asyncio
+    async def test_negatives_skip_redis(self, auth):
+        """Test only possible matches are confirmed with Redis once started"""
+        redis = FakeRedis()
+        blacklist = TokenBlacklist(redis_client=redis)
+        await blacklist.start()
+        revoked, _ = auth.create_access_token("user123")
+        await blacklist.blacklist_token(revoked, in_an_hour())
+
+        for _ in range(100):
+            valid, _ = auth.create_access_token("user123")
+            assert not await blacklist.is_blacklisted(valid)
+        assert await blacklist.is_blacklisted(revoked)
+
+        assert redis.exists_calls < 5
+        assert blacklist.stats["filter_negatives"] > 95
+        assert blacklist.stats["confirmed"] == 1
+        await blacklist.close()
+
+    @pytest.mark.asyncio
+    async def test_start_loads_and_follows_other_processes(self, auth):
+        """Test revocations made elsewhere, before and after start, are seen"""
+        redis = FakeRedis()
+        other = TokenBlacklist(redis_client=redis)
+        before, _ = auth.create_access_token("user123")
+        after, _ = auth.create_access_token("user123")
+        await other.blacklist_token(before, in_an_hour())
+
+        blacklist = TokenBlacklist(redis_client=redis)
+        await blacklist.start()
+        await other.blacklist_token(after, in_an_hour())
+        await asyncio.sleep(0)
+
+        assert await blacklist.is_blacklisted(before)
+        assert await blacklist.is_blacklisted(after)
+        await blacklist.close()
+
+    @pytest.mark.asyncio
+    async def test_legacy_raw_token_keys_honoured(self, auth):
+        """Test revocations stored under the raw token by earlier versions"""
+        redis = FakeRedis()
+        revoked, _ = auth.create_access_token("user123")
+        await redis.setex(f"blacklist:{revoked}", 3600, "1")
+
+        blacklist = TokenBlacklist(redis_client=redis)
+        assert await blacklist.is_blacklisted(revoked)
+        await blacklist.start()
+        assert await blacklist.is_blacklisted(revoked)
+        await blacklist.close()
+
+    @pytest.mark.asyncio
+    async def test_legacy_keys_not_checked_once_expired(self, auth):
+        """Test the legacy lookup stops after the last legacy key expires"""
+        redis = FakeRedis()
+        legacy, _ = auth.create_access_token("user123")
+        await redis.setex(f"blacklist:{legacy}", 60, "1")
+        blacklist = TokenBlacklist(redis_client=redis)
+        await blacklist.start()
+        revoked, _ = auth.create_access_token("user123")
+        await blacklist.blacklist_token(revoked, in_an_hour())
+
+        assert await blacklist.is_blacklisted(revoked)
+        assert len(redis.exists_keys) == 2
+        with patch("fastapi_easy.security.enhanced_jwt.time.time", return_value=time.time() + 120):
+            assert await blacklist.is_blacklisted(revoked)
+        assert redis.exists_keys == [f"blacklist:{blacklist.token_id(revoked)}"]
+        await blacklist.close()
+
+    @pytest.mark.asyncio
+    async def test_auth_starts_filter_on_first_verify(self):
+        """Test EnhancedJWTAuth starts the filter without a manual start"""
+        redis = FakeRedis()
+        auth = EnhancedJWTAuth(
+            secret_key="test-secret-key",
+            token_blacklist=TokenBlacklist(redis_client=redis),
+            verified_cache_size=0,
+        )
+        revoked, _ = auth.create_access_token("user123")
+        await auth.revoke_token(revoked)
+
+        for _ in range(20):
+            token, _ = auth.create_access_token("user123")
+            await auth.verify_token(token)
+        with pytest.raises(InvalidTokenError):
+            await auth.verify_token(revoked)
+
+        assert auth.token_blacklist.stats["filter_negatives"] == 20
+        assert redis.exists_calls == 1
+        await auth.close()
+
+    @pytest.mark.asyncio
+    async def test_revoke_user_tokens(self):
+        """Test a user's issued tokens are rejected after revoking them"""
+        redis = FakeRedis()
+        auth = EnhancedJWTAuth(
+            secret_key="test-secret-key", token_blacklist=TokenBlacklist(redis_client=redis)
+        )
+        await auth.token_blacklist.start()
+        token, _ = auth.create_access_token("user123")
+        await asyncio.sleep(0)
+        await auth.verify_token(token)
+
+        assert await auth.revoke_user_tokens("user123") == 1
+        with pytest.raises(InvalidTokenError):
+            await auth.verify_token(token)
+        await auth.token_blacklist.close()
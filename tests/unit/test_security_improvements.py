@@ -102,6 +102,20 @@ class TestLRUCache:
         assert stats["total"] == 2
         assert "50.00%" in stats["hit_rate"]
 
+    def test_lru_cache_max_bytes(self):
+        """Test LRU cache bounded by bytes"""
+        cache = LRUCache(max_size=10, max_bytes=100)
+        cache.set("key1", b"x" * 40)
+        cache.set("key2", b"x" * 40)
+        cache.set("key3", b"x" * 40)
+
+        assert cache.get("key1") is None
+        assert cache.get("key3") == b"x" * 40
+        assert cache.get_stats()["bytes"] == 80
+
+        cache.clear(pattern="key2")
+        assert cache.total_bytes == 40
+
 
 # ============================================================================
 # LRUCachedPermissionLoader Tests
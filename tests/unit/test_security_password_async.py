@@ -0,0 +1,128 @@
+"""Unit tests for non-blocking password hashing"""
+
+import asyncio
+import time
+from concurrent.futures import ProcessPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from fastapi_easy.security import password as password_module
+
+
+class SlowBcrypt:
+    """bcrypt stand-in that takes a fixed time per hash, like real rounds do"""
+
+    delay = 0.05
+
+    @staticmethod
+    def gensalt(rounds=12):
+        return f"$2b${rounds:02d}$salt".encode()
+
+    @classmethod
+    def hashpw(cls, password, salt):
+        time.sleep(cls.delay)
+        return salt[:11] + password[::-1]
+
+    @classmethod
+    def checkpw(cls, password, hashed):
+        return cls.hashpw(password, hashed[:11]) == hashed
+
+
+@pytest.fixture
+def manager():
+    """Password manager hashing with SlowBcrypt"""
+    with patch.object(password_module, "bcrypt", SlowBcrypt):
+        manager = password_module.PasswordManager(rounds=10, max_concurrency=2)
+        yield manager
+        manager.close()
+
+
+class TestAsyncPasswordManager:
+    """Test the async password methods"""
+
+    @pytest.mark.asyncio
+    async def test_hash_and_verify(self, manager):
+        """Test async results match the sync methods"""
+        hashed = await manager.async_hash_password("secret-password")
+
+        assert await manager.async_verify_password("secret-password", hashed)
+        assert not await manager.async_verify_password("wrong-password", hashed)
+        with pytest.raises(ValueError):
+            await manager.async_hash_password("")
+
+    @pytest.mark.asyncio
+    async def test_event_loop_not_blocked(self, manager):
+        """Test other coroutines run while a hash is computed"""
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.005)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        await manager.async_hash_password("secret-password")
+        task.cancel()
+
+        assert ticks >= 3
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_capped(self, manager):
+        """Test hashes beyond max_concurrency queue and are counted"""
+        start = time.perf_counter()
+        await asyncio.gather(*(manager.async_hash_password(f"password-{i}") for i in range(6)))
+        elapsed = time.perf_counter() - start
+
+        stats = manager.get_stats()
+        # Six hashes two at a time take three rounds of SlowBcrypt.delay
+        assert elapsed >= 3 * SlowBcrypt.delay * 0.9
+        assert stats["peak_queue_depth"] == 4
+        assert stats["completed"] == 6
+        assert stats["queue_depth"] == stats["running"] == 0
+
+    @pytest.mark.asyncio
+    async def test_failures_counted_separately(self, manager):
+        """Test a hash that raises is not counted as completed"""
+        with pytest.raises(ValueError):
+            await manager.async_hash_password("")
+        await manager.async_hash_password("secret-password")
+
+        stats = manager.get_stats()
+        assert stats["completed"] == 1
+        assert stats["failed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_rehash_on_login(self, manager):
+        """Test a hash made with other rounds is upgraded after a successful login"""
+        old_hash = SlowBcrypt.hashpw(b"secret-password", SlowBcrypt.gensalt(rounds=8)).decode()
+        stored = []
+
+        async def store(new_hash):
+            stored.append(new_hash)
+
+        assert await manager.async_verify_password("secret-password", old_hash, on_rehash=store)
+        assert len(stored) == 1
+        assert not manager.needs_rehash(stored[0])
+
+        # Wrong passwords and current hashes are left alone
+        assert not await manager.async_verify_password("wrong", old_hash, on_rehash=store)
+        assert await manager.async_verify_password("secret-password", stored[0], on_rehash=store)
+        assert len(stored) == 1
+        assert manager.get_stats()["rehashed"] == 1
+
+
+class TestProcessPoolExecutor:
+    """Test the async methods on a process pool"""
+
+    @pytest.mark.asyncio
+    async def test_hash_and_verify(self):
+        """Test work submitted to a process pool can be pickled"""
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            manager = password_module.PasswordManager(rounds=4, executor=executor)
+            hashed = await manager.async_hash_password("secret-password")
+
+            assert await manager.async_verify_password("secret-password", hashed)
+            assert not await manager.async_verify_password("wrong-password", hashed)
+            assert manager.get_stats()["completed"] == 3
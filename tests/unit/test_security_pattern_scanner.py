@@ -0,0 +1,135 @@
+"""Unit tests for the merged security pattern scanner"""
+
+import re
+
+import pytest
+from fastapi import FastAPI, HTTPException
+
+from fastapi_easy.security.enhanced_middleware import InputSanitizationMiddleware
+from fastapi_easy.security.validation.input_validator import (
+    InputValidationError,
+    SecurityValidator,
+)
+from fastapi_easy.security.validation.pattern_scanner import PatternScanner
+
+SAMPLES = [
+    "",
+    "plain",
+    "Customer 42",
+    "customer42@example.com",
+    "<SCRIPT>alert(1)</script>",
+    "JavaScript:void(0)",
+    "img onError = x",
+    "1 UNION\tSELECT password",
+    "${jndi:ldap}",
+    "KK",
+    "ſelect",
+]
+
+
+class TestPatternScanner:
+    """Test scanning against merged patterns"""
+
+    @pytest.mark.parametrize(
+        "patterns",
+        [
+            ["<script[^>]*>.*?</script>", "javascript:", r"on\w+\s*=", r"union\s+select"],
+            [r"\bSELECT\b", r"(\w)\1\1"],  # Uppercase and a backreference
+            ["(?i)abc", "x"],  # Inline global flag cannot be merged
+        ],
+    )
+    def test_matches_per_pattern_search(self, patterns):
+        """Test the scanner agrees with searching each pattern in turn"""
+        flags = re.IGNORECASE | re.DOTALL
+        scanner = PatternScanner(patterns, flags)
+        compiled = [re.compile(pattern, flags) for pattern in patterns]
+
+        for value in SAMPLES + ["aaa", "ABC"]:
+            expected = next((p.pattern for p in compiled if p.search(value)), None)
+            assert scanner.search(value) == expected, value
+
+    def test_case_folding_only_for_lowercase_ascii_patterns(self):
+        """Test case-sensitive scanning of lowercased input is used only when exact"""
+        assert PatternScanner(["union", r"on\w+="], re.IGNORECASE)._folded is not None
+        assert PatternScanner(["UNION"], re.IGNORECASE)._folded is None
+        assert PatternScanner([r"\x41"], re.IGNORECASE)._folded is None
+        assert PatternScanner(["ſ"], re.IGNORECASE)._folded is None
+
+    def test_alnum_fast_path(self):
+        """Test letter-and-digit strings are only scanned if listed"""
+        scanner = PatternScanner([r"\bdrop\b", ";"], re.IGNORECASE, alnum_matches={"DROP"})
+
+        assert scanner.search("Drop") == r"\bdrop\b"
+        assert scanner.search("dropped") is None
+        assert scanner.search("x; y") == ";"
+
+    @pytest.mark.parametrize(
+        "patterns",
+        [
+            ["<script[^>]*>.*?</script>", "javascript:", r"on\w+\s*=", r"\$\{.*\}"],
+            [r"^forbidden$", r"\bselect\b"],  # Context-dependent: scanned one by one
+        ],
+    )
+    def test_search_many_matches_search(self, patterns):
+        """Test a batch matches exactly when one of its strings does"""
+        scanner = PatternScanner(patterns, re.IGNORECASE | re.DOTALL)
+
+        assert scanner.search_many(["plain", "Customer 42", "é"]) is None
+        # Matches across string boundaries are not reported
+        assert scanner.search_many(["a <script>", "</script>", "${", "}", "on", "= 1"]) is None
+        for value in SAMPLES + ["forbidden", "x SELECT y"]:
+            assert scanner.search_many(["plain", value, "é"]) == scanner.search(value), value
+
+    def test_search_many_batches_only_context_free_patterns(self):
+        """Test anchors, boundaries and lookarounds disable joined scanning"""
+        assert PatternScanner([r"[^>]*", r"\$\{", r"on\w+"])._batchable
+        for pattern in [r"^x", r"x$", r"\bx", r"(?=x)", r"(?<!x)y"]:
+            assert not PatternScanner([pattern])._batchable, pattern
+
+
+class TestSecurityValidatorScanner:
+    """Test SecurityValidator checks use the scanner"""
+
+    def test_sql_keywords_and_specials(self):
+        """Test keywords and special characters are rejected, plain values pass"""
+        for value in ["select", "UNION", "a'b", "x -- y"]:
+            with pytest.raises(InputValidationError):
+                SecurityValidator.validate_sql_value(value)
+        for value in ["selection", "SKU000042", "alice"]:
+            assert SecurityValidator.validate_sql_value(value) == value
+
+    def test_command_words(self):
+        """Test command words are found as whole strings and in text"""
+        assert SecurityValidator.check_command_injection("curl")
+        assert SecurityValidator.check_command_injection("then curl it")
+        assert not SecurityValidator.check_command_injection("curling")
+
+    def test_overridden_patterns(self):
+        """Test subclass pattern lists are honoured without the fast path"""
+
+        class StrictValidator(SecurityValidator):
+            SQL_INJECTION_PATTERNS = [r"^admin$"]
+
+        with pytest.raises(InputValidationError):
+            StrictValidator.validate_sql_value("admin")
+        assert StrictValidator.validate_sql_value("select") == "select"
+
+
+class TestInputSanitizationMiddlewareScanner:
+    """Test the middleware's string validation"""
+
+    def test_default_patterns(self):
+        """Test malicious strings are rejected and ordinary ones pass"""
+        middleware = InputSanitizationMiddleware(FastAPI())
+        for value in ("Customer 42", "a", "SKU000042"):
+            middleware._validate_string(value, "body")
+
+        with pytest.raises(HTTPException):
+            middleware._validate_string("<script>x</script>", "body")
+
+    def test_custom_patterns_checked_on_plain_words(self):
+        """Test custom patterns are applied to letter-and-digit strings too"""
+        middleware = InputSanitizationMiddleware(FastAPI(), blocked_patterns=[r"^forbidden$"])
+
+        with pytest.raises(HTTPException):
+            middleware._validate_string("forbidden", "query.q")
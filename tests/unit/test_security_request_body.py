@@ -0,0 +1,225 @@
+"""Tests for streaming body inspection and the shared body cache"""
+
+import json
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from fastapi_easy.security.enhanced_middleware import InputSanitizationMiddleware
+from fastapi_easy.security.request_body import (
+    BODY_SCOPE_KEY,
+    BodyCachingRoute,
+    RequestTooLarge,
+    buffer_body,
+)
+from fastapi_easy.security.validation.json_stream import JSONStringStream
+
+
+def split(data: bytes, size: int):
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+def stream_strings(data: bytes, size: int):
+    stream = JSONStringStream()
+    values = []
+    for chunk in split(data, size):
+        values.extend(stream.feed(chunk))
+    return values + stream.close()
+
+
+def make_receive(chunks):
+    """ASGI receive delivering chunks, counting how many were read"""
+    messages = [
+        {"type": "http.request", "body": chunk, "more_body": i < len(chunks) - 1}
+        for i, chunk in enumerate(chunks)
+    ]
+
+    async def receive():
+        receive.calls += 1
+        if messages:
+            return messages.pop(0)
+        return {"type": "http.disconnect"}
+
+    receive.calls = 0
+    return receive
+
+
+def http_scope(path="/api/items", headers=()):
+    return {
+        "type": "http",
+        "method": "POST",
+        "path": path,
+        "query_string": b"",
+        "headers": [(b"content-type", b"application/json"), *headers],
+    }
+
+
+async def call(app, scope, receive):
+    """Call an ASGI app, returning the response status"""
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    await app(scope, receive, send)
+    return messages[0]["status"]
+
+
+class TestJSONStringStream:
+    """Test string extraction across chunk boundaries"""
+
+    @pytest.mark.parametrize("size", [1, 2, 3, 7, 1000])
+    def test_values_match_parsed_document(self, size):
+        """Test the values found are those json.loads sees, in order, without keys"""
+        document = {
+            "name": 'say "hi"\\ there',
+            "tags": ["a", "", "é", "\U0001f600"],
+            "nested": {"key": "value", "n": 1, "ok": True, "esc": "\\u003cscript\u003e"},
+            "spaced": "x",
+        }
+        data = json.dumps(document, ensure_ascii=size % 2 == 0, indent=2).encode()
+
+        assert stream_strings(data, size) == [
+            'say "hi"\\ there',
+            "a",
+            "",
+            "é",
+            "\U0001f600",
+            "value",
+            "\\u003cscript\u003e",
+            "x",
+        ]
+
+    def test_escaped_payload_decoded(self):
+        """Test unicode escapes are decoded before matching"""
+        data = b'{"note": "\\u003cscript\\u003e"}'
+        assert stream_strings(data, 5) == ["<script>"]
+
+    def test_key_detected_across_chunks(self):
+        """Test a string is held until the next chunk shows whether it is a key"""
+        stream = JSONStringStream()
+        assert stream.feed(b'{"<script>"') == []
+        assert stream.feed(b' : "v"}') == ["v"]
+        assert stream.close() == []
+
+    def test_long_escaped_string_across_chunks(self):
+        """Test a string of escapes split mid-escape is found once, whole"""
+        value = '\\"' * 5000 + "end"
+        data = json.dumps({"v": value}).encode()
+        assert stream_strings(data, 3) == [value]
+
+    def test_top_level_string(self):
+        """Test a document that is a single string"""
+        assert stream_strings(b'"payload"', 3) == ["payload"]
+
+    def test_non_utf8_rejected(self):
+        """Test UTF-16 bodies, which json.loads would accept, are refused"""
+        stream = JSONStringStream()
+        with pytest.raises(ValueError):
+            stream.feed('{"a": "b"}'.encode("utf-16-le"))
+
+
+class TestBufferBody:
+    """Test reading and caching the body"""
+
+    @pytest.mark.asyncio
+    async def test_size_counted_without_content_length(self):
+        """Test the limit applies to bytes received, stopping at the first excess chunk"""
+        receive = make_receive([b"x" * 10] * 10)
+
+        with pytest.raises(RequestTooLarge):
+            await buffer_body(http_scope(), receive, max_size=25)
+        assert receive.calls == 3
+
+    @pytest.mark.asyncio
+    async def test_cached_and_replayed(self):
+        """Test the body is cached in the scope and replayed to the application"""
+        scope = http_scope()
+        cached, replay = await buffer_body(scope, make_receive([b'{"a": ', b"1}"]))
+
+        assert scope[BODY_SCOPE_KEY] is cached
+        assert cached.json() == {"a": 1}
+        assert cached.parsed
+        assert await replay() == {"type": "http.request", "body": b'{"a": ', "more_body": True}
+        assert await replay() == {"type": "http.request", "body": b"1}", "more_body": False}
+        assert (await replay())["type"] == "http.disconnect"
+
+        # A second reader gets the cache without receiving again
+        again, passed = await buffer_body(scope, replay)
+        assert again is cached
+        assert passed is replay
+
+
+class TestInputSanitizationMiddleware:
+    """Test the pure ASGI middleware"""
+
+    @pytest.fixture
+    def app(self):
+        app = FastAPI()
+        app.router.route_class = BodyCachingRoute
+
+        @app.post("/api/items")
+        async def create_item(item: dict, request: Request):
+            return {"item": item, "cached": BODY_SCOPE_KEY in request.scope}
+
+        @app.post("/api/upload")
+        async def upload(request: Request):
+            return {"size": len(await request.body())}
+
+        app.add_middleware(InputSanitizationMiddleware, max_request_size=1024)
+        return app
+
+    def test_clean_body_passes_intact(self, app):
+        """Test a clean body reaches the route from the cache"""
+        client = TestClient(app)
+        body = {"name": "Customer 42", "tags": ["a", "b"], "n": 3}
+        response = client.post("/api/items", json=body)
+
+        assert response.status_code == 200
+        assert response.json() == {"item": body, "cached": True}
+
+    def test_malicious_body_rejected(self, app):
+        """Test a malicious string value is rejected with 400"""
+        client = TestClient(app)
+        response = client.post("/api/items", json={"items": [{"note": "<script>x</script>"}]})
+
+        assert response.status_code == 400
+        assert response.json() == {"detail": "Malicious input detected"}
+
+    def test_malicious_query_rejected(self, app):
+        """Test query parameters are checked"""
+        client = TestClient(app)
+        response = client.post("/api/items?q=javascript:alert(1)", json={})
+
+        assert response.status_code == 400
+
+    def test_oversize_rejected(self, app):
+        """Test bodies over the limit are rejected, with or without Content-Length"""
+        client = TestClient(app)
+        assert client.post("/api/items", json={"a": "x" * 2000}).status_code == 413
+
+        chunks = (b"x" * 100 for _ in range(20))
+        response = client.post(
+            "/api/upload", content=chunks, headers={"content-type": "text/plain"}
+        )
+        assert response.status_code == 413
+
+    @pytest.mark.asyncio
+    async def test_rejected_before_rest_of_body_read(self):
+        """Test a malicious value in the first chunk stops reading"""
+        middleware = InputSanitizationMiddleware(FastAPI())
+        first = b'[{"note": "<script>x</script>"}, '
+        receive = make_receive([first] + [b'{"note": "ok"}, '] * 50 + [b"{}]"])
+
+        assert await call(middleware, http_scope(), receive) == 400
+        assert receive.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_false_content_length_not_trusted(self):
+        """Test a body larger than its declared length is still counted"""
+        middleware = InputSanitizationMiddleware(FastAPI(), max_request_size=64)
+        scope = http_scope(headers=[(b"content-length", b"10")])
+        receive = make_receive([b'["' + b"x" * 40, b"x" * 40 + b'"]'])
+
+        assert await call(middleware, scope, receive) == 413
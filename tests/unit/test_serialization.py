@@ -0,0 +1,85 @@
+"""Tests for the fast-path response serializer"""
+
+import json
+from types import SimpleNamespace
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from fastapi_easy.core.serialization import ResponseSerializer
+
+
+class ItemSchema(BaseModel):
+    id: int
+    name: str
+    price: Optional[float] = None
+
+
+class AliasedSchema(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+
+    id: int
+    full_name: str = Field(alias="fullName")
+
+
+class TestResponseSerializer:
+    """Test ResponseSerializer"""
+
+    def test_dump_list_from_attributes(self):
+        """Test ORM-style objects are read by attribute and dumped to JSON bytes"""
+        serializer = ResponseSerializer(ItemSchema)
+        rows = [SimpleNamespace(id=1, name="a", price=1.5, secret="x")]
+
+        content = serializer.dump_list(rows)
+
+        assert isinstance(content, bytes)
+        assert json.loads(content) == [{"id": 1, "name": "a", "price": 1.5}]
+
+    def test_aliases_used_like_fastapi(self):
+        """Test fields are written under their aliases, as FastAPI encodes them"""
+        serializer = ResponseSerializer(AliasedSchema)
+        row = SimpleNamespace(id=1, full_name="x")
+
+        assert json.loads(serializer.dump_list([row])) == [{"id": 1, "fullName": "x"}]
+        assert json.loads(serializer.dump_one(row)) == {"id": 1, "fullName": "x"}
+
+    def test_dump_list_empty(self):
+        """Test an empty page serializes to an empty array"""
+        assert ResponseSerializer(ItemSchema).dump_list([]) == b"[]"
+
+    def test_dump_list_schema_instances(self):
+        """Test rows that are already schema instances"""
+        serializer = ResponseSerializer(ItemSchema)
+
+        content = serializer.dump_list([ItemSchema(id=1, name="a")])
+
+        assert json.loads(content) == [{"id": 1, "name": "a", "price": None}]
+
+    def test_dump_list_falls_back_for_dicts(self):
+        """Test dict rows are left to the slow path so extra keys survive"""
+        serializer = ResponseSerializer(ItemSchema)
+
+        assert serializer.dump_list([{"_id": "x", "id": 1, "name": "a"}]) is None
+
+    def test_dump_list_falls_back_on_invalid_rows(self):
+        """Test rows that do not match the schema are left to the slow path"""
+        serializer = ResponseSerializer(ItemSchema)
+        rows = [SimpleNamespace(id=1, name="a"), SimpleNamespace(id="bad", name="b")]
+
+        assert serializer.dump_list(rows) is None
+
+    def test_dump_one(self):
+        """Test a single object is dumped to JSON bytes"""
+        serializer = ResponseSerializer(ItemSchema)
+
+        content = serializer.dump_one(SimpleNamespace(id=2, name="b", price=None))
+
+        assert json.loads(content) == {"id": 2, "name": "b", "price": None}
+
+    def test_dump_one_falls_back(self):
+        """Test None, dicts and invalid objects are left to the slow path"""
+        serializer = ResponseSerializer(ItemSchema)
+
+        assert serializer.dump_one(None) is None
+        assert serializer.dump_one({"id": 1, "name": "a"}) is None
+        assert serializer.dump_one(SimpleNamespace(name="no id")) is None
@@ -0,0 +1,182 @@
+"""Tests for the shared-memory cache tier"""
+
+import asyncio
+import multiprocessing
+import os
+import sys
+import time
+
+import pytest
+
+from fastapi_easy.core.advanced_cache import AdvancedCacheManager
+from fastapi_easy.core.shared_memory_cache import SharedMemoryCache
+
+pytestmark = pytest.mark.skipif(
+    not sys.platform.startswith("linux"), reason="shared memory tier is Linux-only"
+)
+
+
+@pytest.fixture
+def shm_path(tmp_path):
+    return str(tmp_path / "cache.shm")
+
+
+@pytest.fixture
+def caches(shm_path):
+    """Two handles on one file, as two worker processes would have"""
+    first = SharedMemoryCache(shm_path, slots=64, arena_bytes=64 * 1024, tag_slots=64)
+    second = SharedMemoryCache(shm_path, slots=64, arena_bytes=64 * 1024, tag_slots=64)
+    yield first, second
+    first.close()
+    second.close(unlink=True)
+
+
+def _write_from_child(path: str) -> None:
+    cache = SharedMemoryCache(path, slots=64, arena_bytes=64 * 1024, tag_slots=64)
+    asyncio.run(cache.set("child", b"from another process", tags={"list:user"}))
+    cache.close()
+
+
+class TestSharedMemoryCache:
+    """Test storage shared between handles and processes"""
+
+    @pytest.mark.asyncio
+    async def test_shared_between_handles(self, caches):
+        """Test a value written through one handle is read through another"""
+        first, second = caches
+        assert await first.set("user:1", b"alice", tags={"item:user:1"})
+
+        assert await second.get("user:1") == b"alice"
+        assert await second.get_with_tags("user:1") == (b"alice", {"item:user:1"})
+        assert await second.get("user:2") is None
+
+    @pytest.mark.asyncio
+    async def test_shared_between_processes(self, shm_path):
+        """Test a value written by another process is visible"""
+        cache = SharedMemoryCache(shm_path, slots=64, arena_bytes=64 * 1024, tag_slots=64)
+        try:
+            process = multiprocessing.get_context("fork").Process(
+                target=_write_from_child, args=(shm_path,)
+            )
+            process.start()
+            process.join(10)
+
+            assert process.exitcode == 0
+            assert await cache.get_with_tags("child") == (b"from another process", {"list:user"})
+        finally:
+            cache.close(unlink=True)
+
+    @pytest.mark.asyncio
+    async def test_overwrite_delete_and_clear(self, caches):
+        """Test overwrites replace values and deletes are seen by all handles"""
+        first, second = caches
+        await first.set("key", b"v1")
+        await second.set("key", b"v2")
+        assert await first.get("key") == b"v2"
+
+        assert await second.delete("key")
+        assert await first.get("key") is None
+        assert not await first.delete("key")
+
+        await first.set("other", b"x")
+        await second.clear()
+        assert await first.get("other") is None
+
+    @pytest.mark.asyncio
+    async def test_ttl(self, caches):
+        """Test entries expire"""
+        first, second = caches
+        await first.set("short", b"x", ttl=0.01)
+        await first.set("forever", b"y", ttl=0)
+        time.sleep(0.02)
+
+        assert await second.get("short") is None
+        assert await second.get("forever") == b"y"
+
+    @pytest.mark.asyncio
+    async def test_invalidate_by_tags(self, caches):
+        """Test bumping a tag version hides entries stored under it"""
+        first, second = caches
+        await first.set("users", b"[1]", tags={"list:user"})
+        await first.set("posts", b"[2]", tags={"list:post"})
+
+        await second.invalidate_by_tags({"list:user"})
+
+        assert await first.get("users") is None
+        assert await first.get("posts") == b"[2]"
+        # Entries written after the bump are valid again
+        await first.set("users", b"[1, 3]", tags={"list:user"})
+        assert await second.get("users") == b"[1, 3]"
+
+    @pytest.mark.asyncio
+    async def test_arena_wraps_over_old_entries(self, caches):
+        """Test old entries whose arena bytes were reused read as misses"""
+        first, second = caches
+        value = b"x" * 4000
+        for i in range(40):
+            await first.set(f"key:{i}", value)
+
+        assert await second.get("key:0") is None
+        assert await second.get("key:39") == value
+        assert second.get_stats()["entries"] < 40
+
+    @pytest.mark.asyncio
+    async def test_oversize_and_layout_mismatch(self, caches, shm_path):
+        """Test oversized values are refused and geometry is checked"""
+        first, _ = caches
+        assert not await first.set("big", b"x" * 20000)
+
+        with pytest.raises(ValueError):
+            SharedMemoryCache(shm_path, slots=128, arena_bytes=64 * 1024, tag_slots=64)
+
+    def test_unsafe_files_refused(self, tmp_path):
+        """Test symlinks and files others can write are not mapped"""
+        target = tmp_path / "target"
+        target.write_bytes(b"")
+        os.chmod(target, 0o600)
+        link = tmp_path / "link"
+        link.symlink_to(target)
+        with pytest.raises(OSError):
+            SharedMemoryCache(str(link), slots=64, arena_bytes=64 * 1024, tag_slots=64)
+
+        os.chmod(target, 0o666)
+        with pytest.raises(PermissionError):
+            SharedMemoryCache(str(target), slots=64, arena_bytes=64 * 1024, tag_slots=64)
+
+    def test_created_owner_only(self, shm_path):
+        """Test a new file is created with mode 0600 whatever the umask"""
+        umask = os.umask(0)
+        try:
+            cache = SharedMemoryCache(shm_path, slots=64, arena_bytes=64 * 1024, tag_slots=64)
+        finally:
+            os.umask(umask)
+        cache.close()
+
+        assert os.stat(shm_path).st_mode & 0o777 == 0o600
+        os.unlink(shm_path)
+
+
+class TestAdvancedCacheManagerSharedTier:
+    """Test the shared tier between L1 and L2"""
+
+    @pytest.mark.asyncio
+    async def test_worker_reads_other_workers_entries(self, shm_path):
+        """Test an entry set by one manager is served to another from shared memory"""
+        config = {"path": shm_path, "slots": 64, "arena_bytes": 64 * 1024, "tag_slots": 64}
+        writer = AdvancedCacheManager(enable_l2=False, enable_shared=True, shared_config=config)
+        reader = AdvancedCacheManager(enable_l2=False, enable_shared=True, shared_config=config)
+        try:
+            await writer.set("user:1", {"id": 1}, tags={"item:user:1"})
+
+            assert await reader.get("user:1") == {"id": 1}
+            # Promoted to the reader's L1 with its tags
+            assert await reader.l1_cache.get("user:1") == {"id": 1}
+            assert reader.get_comprehensive_stats()["shared"]["hits"] == 1
+
+            await writer.invalidate_by_tags({"item:user:1"})
+            await reader.l1_cache.delete("user:1")
+            assert await reader.get("user:1") is None
+        finally:
+            await writer.close()
+            await reader.close()
+            SharedMemoryCache(**config).close(unlink=True)
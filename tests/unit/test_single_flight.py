@@ -0,0 +1,190 @@
+"""Tests for single-flight loading and stale-while-revalidate"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from fastapi_easy.core.multilayer_cache import MultiLayerCache
+from fastapi_easy.core.optimized_adapter import OptimizedSQLAlchemyAdapter
+from fastapi_easy.core.single_flight import SingleFlight
+
+
+class FakeClock:
+    """Manually advanced monotonic clock"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def use_clock(cache: MultiLayerCache, clock: FakeClock) -> None:
+    cache.l1_cache._store._clock = clock
+    cache.l2_cache._store._clock = clock
+
+
+class SlowLoader:
+    """Counts calls and returns after yielding to other tasks"""
+
+    def __init__(self, value="value"):
+        self.calls = 0
+        self.value = value
+        self.release = asyncio.Event()
+
+    async def __call__(self):
+        self.calls += 1
+        await self.release.wait()
+        return f"{self.value}-{self.calls}"
+
+
+class TestSingleFlight:
+    """Test SingleFlight class"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_result(self):
+        """Test that concurrent callers for one key run the function once"""
+        flight = SingleFlight()
+        loader = SlowLoader()
+
+        tasks = [asyncio.create_task(flight.do("k", loader)) for _ in range(10)]
+        await asyncio.sleep(0)
+        loader.release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert loader.calls == 1
+        assert results == ["value-1"] * 10
+        assert flight.stats() == {"in_flight": 0, "coalesced": 9}
+
+    @pytest.mark.asyncio
+    async def test_exception_is_shared(self):
+        """Test that every caller sees the failure and the key is released"""
+        flight = SingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            flight.do("k", fail), flight.do("k", fail), return_exceptions=True
+        )
+
+        assert all(isinstance(result, ValueError) for result in results)
+        assert len(flight) == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelling_a_caller_keeps_the_call(self):
+        """Test that the shared call survives a cancelled caller"""
+        flight = SingleFlight()
+        loader = SlowLoader()
+
+        first = asyncio.create_task(flight.do("k", loader))
+        second = asyncio.create_task(flight.do("k", loader))
+        await asyncio.sleep(0)
+        first.cancel()
+        loader.release.set()
+
+        assert await second == "value-1"
+        assert first.cancelled()
+
+
+class TestMultiLayerGetOrLoad:
+    """Test MultiLayerCache.get_or_load"""
+
+    @pytest.mark.asyncio
+    async def test_misses_are_coalesced(self):
+        """Test that concurrent misses run the loader once and cache the value"""
+        cache = MultiLayerCache()
+        loader = SlowLoader()
+
+        tasks = [asyncio.create_task(cache.get_or_load("k", loader)) for _ in range(5)]
+        await asyncio.sleep(0)
+        loader.release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert results == ["value-1"] * 5
+        assert await cache.get_or_load("k", loader) == "value-1"
+        assert loader.calls == 1
+        assert cache.get_stats()["coalesced"] == 4
+
+    @pytest.mark.asyncio
+    async def test_tags_callable_can_skip_caching(self):
+        """Test that a tags callable returning None leaves the value uncached"""
+        cache = MultiLayerCache()
+
+        async def loader():
+            return []
+
+        await cache.get_or_load("k", loader, tags=lambda value: None)
+
+        assert await cache.get("k") is None
+
+    @pytest.mark.asyncio
+    async def test_stale_value_served_while_refreshing(self):
+        """Test stale-while-revalidate with one background refresh"""
+        clock = FakeClock()
+        cache = MultiLayerCache(l1_ttl=10, l2_ttl=10, stale_ttl=30)
+        use_clock(cache, clock)
+        loader = SlowLoader()
+        loader.release.set()
+        assert await cache.get_or_load("k", loader) == "value-1"
+
+        clock.now = 15
+        loader.release.clear()
+        results = await asyncio.gather(*[cache.get_or_load("k", loader) for _ in range(3)])
+        assert results == ["value-1"] * 3
+
+        loader.release.set()
+        await asyncio.sleep(0.01)
+        assert loader.calls == 2
+        assert await cache.get("k") == "value-2"
+        assert cache.get_stats()["stale_hits"] == 3
+
+    @pytest.mark.asyncio
+    async def test_too_stale_value_is_reloaded(self):
+        """Test that entries past the stale window are loaded in the foreground"""
+        clock = FakeClock()
+        cache = MultiLayerCache(l1_ttl=10, l2_ttl=10, stale_ttl=5)
+        use_clock(cache, clock)
+        loader = SlowLoader()
+        loader.release.set()
+        await cache.get_or_load("k", loader)
+
+        clock.now = 20
+        assert await cache.get_or_load("k", loader) == "value-2"
+
+
+class TestOptimizedAdapterSingleFlight:
+    """Test request coalescing in OptimizedSQLAlchemyAdapter"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_get_one_runs_one_query(self):
+        """Test that a burst of reads for a cold key queries once"""
+        base_adapter = AsyncMock()
+        base_adapter.model = MagicMock()
+
+        async def get_one(id):
+            await asyncio.sleep(0.01)
+            return {"id": id}
+
+        base_adapter.get_one.side_effect = get_one
+        optimized = OptimizedSQLAlchemyAdapter(base_adapter)
+
+        results = await asyncio.gather(*[optimized.get_one(1) for _ in range(20)])
+
+        assert results == [{"id": 1}] * 20
+        assert base_adapter.get_one.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_missing_item_is_cached_once(self):
+        """Test that concurrent reads of a missing item share one query"""
+        base_adapter = AsyncMock()
+        base_adapter.model = MagicMock()
+        base_adapter.get_one.return_value = None
+        optimized = OptimizedSQLAlchemyAdapter(base_adapter)
+
+        results = await asyncio.gather(*[optimized.get_one(404) for _ in range(5)])
+        assert results == [None] * 5
+        assert await optimized.get_one(404) is None
+        assert base_adapter.get_one.call_count == 1
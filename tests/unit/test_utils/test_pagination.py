@@ -1,7 +1,18 @@
 """Tests for pagination utilities"""
 
+import uuid
+from datetime import datetime
+from decimal import Decimal
+
 import pytest
-from fastapi_easy.utils.pagination import PaginationParams, paginate
+from fastapi_easy.utils.pagination import (
+    CursorParams,
+    PaginationParams,
+    decode_cursor,
+    encode_cursor,
+    paginate,
+    plan_keyset,
+)
 
 
 class TestPaginationParams:
@@ -130,3 +141,109 @@ class TestPaginate:
         assert result["data"] == list(range(1, 6))
         assert result["total"] == 5
         assert result["pages"] == 1
+
+
+class TestCursorParams:
+    """Test cursor pagination parameters"""
+
+    def test_validation_both_cursors(self):
+        """Test after and before are mutually exclusive"""
+        params = CursorParams(after="a", before="b")
+
+        with pytest.raises(ValueError, match="cannot be used together"):
+            params.validate()
+
+    def test_validation_limit_exceeds_max(self):
+        """Test validation when limit exceeds max"""
+        params = CursorParams(limit=200)
+
+        with pytest.raises(ValueError, match="limit must be <= 100"):
+            params.validate(max_limit=100)
+
+    def test_to_dict(self):
+        """Test converting to dictionary"""
+        params = CursorParams(after="abc", limit=5)
+
+        assert params.to_dict() == {"after": "abc", "before": None, "limit": 5}
+
+
+class TestCursorTokens:
+    """Test cursor token encoding"""
+
+    def test_round_trip(self):
+        """Test cursor values survive encoding"""
+        keyset = [("created_at", "desc"), ("price", "asc"), ("uid", "asc"), ("id", "asc")]
+        item = {
+            "created_at": datetime(2024, 1, 2, 3, 4, 5),
+            "price": Decimal("9.99"),
+            "uid": uuid.UUID(int=7),
+            "id": 42,
+        }
+
+        token = encode_cursor(item, keyset)
+
+        assert decode_cursor(token, keyset) == [
+            datetime(2024, 1, 2, 3, 4, 5),
+            Decimal("9.99"),
+            uuid.UUID(int=7),
+            42,
+        ]
+
+    def test_reads_attributes(self):
+        """Test cursors can be built from objects"""
+
+        class Row:
+            name = "apple"
+            id = 1
+
+        keyset = [("name", "asc"), ("id", "asc")]
+
+        assert decode_cursor(encode_cursor(Row(), keyset), keyset) == ["apple", 1]
+
+    def test_invalid_token(self):
+        """Test malformed tokens are rejected"""
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            decode_cursor("not-a-cursor", [("id", "asc")])
+
+    def test_sort_mismatch(self):
+        """Test tokens built for another ordering are rejected"""
+        token = encode_cursor({"id": 1}, [("id", "asc")])
+
+        with pytest.raises(ValueError, match="does not match"):
+            decode_cursor(token, [("name", "asc"), ("id", "asc")])
+
+
+class TestPlanKeyset:
+    """Test keyset plan construction"""
+
+    def test_offset_mode(self):
+        """Test plain skip/limit pagination is left alone"""
+        assert plan_keyset({}, {"skip": 0, "limit": 10}) is None
+
+    def test_first_page(self):
+        """Test first cursor page has no seek predicate"""
+        plan = plan_keyset({"name": "asc"}, {"after": None, "before": None, "limit": 10})
+
+        assert plan.ordering == [("name", "asc"), ("id", "asc")]
+        assert plan.terms == []
+        assert plan.reverse is False
+
+    def test_after(self):
+        """Test after cursor seeks forward"""
+        token = encode_cursor({"id": 5}, [("id", "asc")])
+
+        plan = plan_keyset({}, {"after": token, "limit": 10})
+
+        assert plan.ordering == [("id", "asc")]
+        assert plan.terms == [[("id", "gt", 5)]]
+        assert plan.reverse is False
+
+    def test_before(self):
+        """Test before cursor seeks backward in inverted order"""
+        token = encode_cursor({"id": 5}, [("id", "asc")])
+
+        plan = plan_keyset({}, {"before": token, "limit": 10})
+
+        assert plan.ordering == [("id", "desc")]
+        assert plan.terms == [[("id", "lt", 5)]]
+        assert plan.reverse is True
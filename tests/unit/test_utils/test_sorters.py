@@ -1,5 +1,7 @@
 """Tests for sort utilities"""
 
+import pytest
+
 from fastapi_easy.utils.sorters import SortParser
 
 
@@ -120,3 +122,58 @@ class TestSortParser:
         assert sorts["updated_at"] == "desc"
         assert sorts["name"] == "asc"
         assert sorts["status"] == "asc"
+
+    def test_to_keyset_appends_primary_key(self):
+        """Test keyset ordering is made total with the primary key"""
+        keyset = SortParser.to_keyset({"name": "asc", "price": "desc"}, "id")
+
+        assert keyset == [("name", "asc"), ("price", "desc"), ("id", "desc")]
+
+    def test_to_keyset_empty_sorts(self):
+        """Test keyset ordering without sorts uses the primary key"""
+        assert SortParser.to_keyset({}, "id") == [("id", "asc")]
+
+    def test_to_keyset_truncates_after_primary_key(self):
+        """Test columns after the primary key are dropped"""
+        keyset = SortParser.to_keyset({"id": "desc", "name": "asc"}, "id")
+
+        assert keyset == [("id", "desc")]
+
+    def test_reverse(self):
+        """Test reversing a keyset ordering"""
+        keyset = SortParser.reverse([("name", "asc"), ("id", "desc")])
+
+        assert keyset == [("name", "desc"), ("id", "asc")]
+
+    def test_seek_terms(self):
+        """Test seek predicate for a mixed-direction keyset"""
+        terms = SortParser.seek_terms([("name", "asc"), ("id", "desc")], ["b", 5])
+
+        assert terms == [
+            [("name", "gt", "b")],
+            [("name", "exact", "b"), ("id", "lt", 5)],
+        ]
+
+    def test_seek_terms_with_nulls(self):
+        """Test NULL cursor values and NULL blocks are matched with isnull"""
+        keyset = [("name", "asc"), ("id", "asc")]
+
+        # NULLs sort first: rows after a NULL are the rest of the block and all values
+        assert SortParser.seek_terms(keyset, [None, 5]) == [
+            [("name", "isnull", False)],
+            [("name", "isnull", True), ("id", "gt", 5)],
+        ]
+        # NULLs sort last: rows after a value include the whole NULL block
+        assert SortParser.seek_terms(keyset, ["b", 5], nulls_last=True) == [
+            [("name", "gt", "b")],
+            [("name", "isnull", True)],
+            [("name", "exact", "b"), ("id", "gt", 5)],
+        ]
+        assert SortParser.seek_terms(keyset, [None, 5], nulls_last=True) == [
+            [("name", "isnull", True), ("id", "gt", 5)],
+        ]
+
+    def test_seek_terms_length_mismatch(self):
+        """Test seek predicate rejects values that do not match the keyset"""
+        with pytest.raises(ValueError):
+            SortParser.seek_terms([("id", "asc")], [1, 2])